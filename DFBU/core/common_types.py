@@ -10,7 +10,7 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 11-01-2025
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
@@ -37,7 +37,7 @@ Classes:
     - BackupPreviewDict: TypedDict for backup preview result (v1.1.0)
 """
 
-from typing import Required, TypedDict
+from typing import NotRequired, Required, TypedDict
 
 
 class PathsDict(TypedDict):
@@ -77,6 +77,24 @@ class OptionsDict(TypedDict):
     size_warning_threshold_mb: int
     size_alert_threshold_mb: int
     size_critical_threshold_mb: int
+    # Performance options (v1.3.0)
+    copy_workers: NotRequired[int]
+    mirror_index: NotRequired[bool]
+    hardlink_snapshots: NotRequired[bool]
+    delta_sync_threshold_mb: NotRequired[int]
+    change_journal: NotRequired[bool]
+    incremental_archives: NotRequired[bool]
+    verify_workers: NotRequired[int]
+    hash_cache: NotRequired[bool]
+    strict_compare: NotRequired[bool]
+    verify_sample_percent: NotRequired[int]
+    verify_sample_budget_mb: NotRequired[int]
+    merkle_tree: NotRequired[bool]
+    verify_failures_only: NotRequired[bool]
+    verify_results_file: NotRequired[bool]
+    scan_snapshot_ttl: NotRequired[int]
+    size_cache: NotRequired[bool]
+    size_probe: NotRequired[bool]
 
 
 class SettingsDict(TypedDict):
@@ -189,7 +207,14 @@ class VerificationReportDict(TypedDict):
         verified_ok: Number of files that passed verification
         verified_failed: Number of files that failed verification
         hash_verified: Whether SHA-256 hash verification was performed
-        results: List of individual file verification results
+        results: List of individual file verification results (failed files
+            only when failures_only is set)
+        hash_checked: Number of files hashed when sampling or a Merkle tree
+            limited hashing to some files
+        coverage_percent: Percentage of files hash-verified since they last
+            changed (sampling only)
+        failures_only: True when results of passed files were not kept
+        results_file: JSONL file holding every per-file result
     """
 
     timestamp: str
@@ -200,6 +225,10 @@ class VerificationReportDict(TypedDict):
     verified_failed: int
     hash_verified: bool
     results: list[VerificationResultDict]
+    hash_checked: NotRequired[int]
+    coverage_percent: NotRequired[float]
+    failures_only: NotRequired[bool]
+    results_file: NotRequired[str]
 
 
 # =============================================================================
@@ -265,6 +294,19 @@ class OperationResultDict(TypedDict):
 # =============================================================================
 
 
+class SizeEntryDict(TypedDict):
+    """
+    Type definition for one file or subdirectory inside a large item.
+
+    Fields:
+        path: Absolute path to the file or subdirectory
+        size_bytes: Apparent size in bytes
+    """
+
+    path: str
+    size_bytes: int
+
+
 class SizeItemDict(TypedDict):
     """
     Type definition for individual file/directory size entry.
@@ -278,6 +320,11 @@ class SizeItemDict(TypedDict):
         level: Threshold level ("info", "warning", "alert", "critical")
         is_dir: Whether the path is a directory
         application: Name of the dotfile application this belongs to
+        allocated_bytes: Disk space in bytes (st_blocks), smaller for sparse files
+        largest_files: Largest files under a directory item, largest first
+        largest_dirs: Heaviest top-level subdirectories of a directory item
+        truncated: Sizing stopped at the critical threshold (probe mode);
+            the sizes and largest entries are those found so far
     """
 
     path: str
@@ -286,6 +333,10 @@ class SizeItemDict(TypedDict):
     level: str  # "info", "warning", "alert", "critical"
     is_dir: bool
     application: str
+    allocated_bytes: NotRequired[int]
+    largest_files: NotRequired[list[SizeEntryDict]]
+    largest_dirs: NotRequired[list[SizeEntryDict]]
+    truncated: NotRequired[bool]
 
 
 class SizeReportDict(TypedDict):
@@ -305,6 +356,9 @@ class SizeReportDict(TypedDict):
         has_alert: Whether any item exceeds alert threshold
         has_warning: Whether any item exceeds warning threshold
         excluded_patterns: List of patterns from .dfbuignore that were applied
+        total_allocated_bytes: Total disk space in bytes (hardlinks counted once)
+        truncated: Whether any entry was only probed up to the critical
+            threshold, making the totals lower bounds
     """
 
     timestamp: str
@@ -317,6 +371,8 @@ class SizeReportDict(TypedDict):
     has_alert: bool
     has_warning: bool
     excluded_patterns: list[str]
+    total_allocated_bytes: NotRequired[int]
+    truncated: NotRequired[bool]
 
 
 # =============================================================================
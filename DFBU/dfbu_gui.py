@@ -11,7 +11,7 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 10-18-2025
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
@@ -280,6 +280,8 @@ class Application:
 
     def cleanup(self) -> None:
         """Perform cleanup when application exits."""
+        # Stop the change watcher thread (v1.3.0)
+        self.model.stop_change_watcher()
 
 
 def main() -> int:
@@ -0,0 +1,562 @@
+"""
+DFBU ArchiveCompression - Pluggable Multi-Threaded Archive Compression
+
+Description:
+    Compression backends for archive backups. The archive_format and
+    archive_compression_level options select gzip, xz, bz2, or zstd at the
+    configured level. gzip and zstd compress independent blocks of the tar
+    stream on a thread pool (pigz-style), so large archives use every core
+    instead of one; xz and bz2 use the single-threaded stdlib compressors.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - gzip, xz, bz2, and zstd (stdlib compression.zstd, Python 3.14+)
+    - "dedup" format name for chunk-store archives (see gui.chunk_store)
+    - Configured compression level clamped to each codec's range
+    - Block-parallel gzip producing one standard gzip stream, like pigz:
+      each block is primed with the previous 32 KiB as a preset dictionary
+    - Block-parallel zstd producing concatenated zstd frames
+    - Restartable mode (one gzip member per block) with recorded restart
+      points, feeding the seekable archive index
+    - Bounded in-flight blocks so memory stays flat for huge archives
+    - Unknown or unavailable formats fall back to tar.gz with a warning
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features (compression.zstd)
+    - Standard library: tarfile, zlib, concurrent.futures
+
+Classes:
+    - ParallelCompressor: Write-only stream compressing blocks on a thread pool
+    - ParallelGzipWriter: pigz-style or block-restartable gzip stream writer
+    - ParallelZstdWriter: Concatenated-frame zstd stream writer
+
+Functions:
+    - zstd_available: Check whether the zstd codec can be used
+    - resolve_archive_format: Map the archive_format option to a supported format
+    - archive_suffix: File suffix for an archive format
+    - archive_format_of: Archive format of an archive file from its name
+    - open_archive_writer: Open a tarfile writer for a format and level
+"""
+
+import abc
+import gzip
+import io
+import logging
+import os
+import struct
+import tarfile
+import time
+import zlib
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Final
+
+from gui.archive_index import ArchiveIndex, IndexingTarFile
+
+
+try:
+    from compression import zstd
+except ImportError:
+    # compression.zstd is new in Python 3.14
+    zstd = None  # type: ignore[assignment]
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Manifest-only archives backed by the deduplicating chunk store
+DEDUP_ARCHIVE_FORMAT: Final[str] = "dedup"
+
+# archive_format option value -> archive file suffix
+ARCHIVE_SUFFIXES: Final[dict[str, str]] = {
+    "tar.gz": ".tar.gz",
+    "tar.xz": ".tar.xz",
+    "tar.bz2": ".tar.bz2",
+    "tar.zst": ".tar.zst",
+    DEDUP_ARCHIVE_FORMAT: ".dedup.json",
+}
+
+DEFAULT_ARCHIVE_FORMAT: Final[str] = "tar.gz"
+DEFAULT_COMPRESSION_LEVEL: Final[int] = 6
+
+# Uncompressed bytes per parallel compression block
+COMPRESSION_BLOCK_SIZE: Final[int] = 1024 * 1024
+
+# Default compression threads (CPU bound, one per core)
+DEFAULT_COMPRESSION_WORKERS: Final[int] = os.cpu_count() or 1
+
+# Number of blocks allowed in flight per worker before output must be written
+PENDING_BLOCKS_PER_WORKER: Final[int] = 2
+
+# Deflate window carried between gzip blocks as a preset dictionary
+_DEFLATE_WINDOW: Final[int] = 32 * 1024
+
+# gzip member header fields (RFC 1952): magic, deflate, no flags
+_GZIP_MAGIC: Final[bytes] = b"\x1f\x8b\x08\x00"
+_GZIP_OS_UNIX: Final[int] = 3
+
+
+# =============================================================================
+# Format Helpers
+# =============================================================================
+
+
+def zstd_available() -> bool:
+    """
+    Check whether the zstd codec can be used.
+
+    Returns:
+        True if compression.zstd is importable (Python 3.14+)
+    """
+    return zstd is not None
+
+
+def resolve_archive_format(archive_format: str) -> str:
+    """
+    Map the archive_format option to a supported format.
+
+    Args:
+        archive_format: Configured format (e.g., "tar.gz", "tar.zst")
+
+    Returns:
+        The format itself, or tar.gz if it is unknown or unavailable
+    """
+    if archive_format not in ARCHIVE_SUFFIXES:
+        logger.warning(
+            "Unknown archive format %r, using %s",
+            archive_format,
+            DEFAULT_ARCHIVE_FORMAT,
+        )
+        return DEFAULT_ARCHIVE_FORMAT
+    if archive_format == "tar.zst" and not zstd_available():
+        logger.warning(
+            "zstd compression requires Python 3.14+, using %s", DEFAULT_ARCHIVE_FORMAT
+        )
+        return DEFAULT_ARCHIVE_FORMAT
+    return archive_format
+
+
+def archive_suffix(archive_format: str) -> str:
+    """
+    File suffix for an archive format.
+
+    Args:
+        archive_format: Supported archive format
+
+    Returns:
+        Suffix including the leading dot (e.g., ".tar.gz")
+    """
+    return ARCHIVE_SUFFIXES[archive_format]
+
+
+def archive_format_of(archive: Path) -> str | None:
+    """
+    Archive format of an archive file from its name.
+
+    Args:
+        archive: Archive file path (e.g., dotfiles-....incr.tar.gz)
+
+    Returns:
+        Archive format, or None if the suffix is not a known format
+    """
+    for archive_format, suffix in ARCHIVE_SUFFIXES.items():
+        if archive.name.endswith(suffix):
+            return archive_format
+    return None
+
+
+@contextmanager
+def open_archive_writer(
+    path: Path,
+    archive_format: str = DEFAULT_ARCHIVE_FORMAT,
+    level: int = DEFAULT_COMPRESSION_LEVEL,
+    workers: int = DEFAULT_COMPRESSION_WORKERS,
+    index: ArchiveIndex | None = None,
+) -> Iterator[tarfile.TarFile]:
+    """
+    Open a tarfile writer for a format and level.
+
+    gzip and zstd archives are written as a tar stream into a parallel
+    block compressor; xz and bz2 use tarfile's own compressors. With an
+    index, every member is recorded in it and gzip blocks are written as
+    independent members so each block is a restart point; xz and bz2
+    streams can only be decompressed from the start.
+
+    Args:
+        path: Archive file to create
+        archive_format: Supported tar archive format (not dedup)
+        level: Compression level (0-9, clamped to the codec's range)
+        workers: Compression threads for block-parallel formats
+        index: ArchiveIndex to fill while writing, or None
+
+    Yields:
+        TarFile open for writing
+    """
+    if archive_format in {"tar.xz", "tar.bz2"}:
+        # The per-codec constructors take a plain int level, unlike open()
+        if archive_format == "tar.xz":
+            tar = IndexingTarFile.xzopen(path, "w", preset=max(0, min(level, 9)))
+        else:
+            tar = IndexingTarFile.bz2open(
+                path, "w", compresslevel=max(1, min(level, 9))
+            )
+        tar.index = index
+        with tar:
+            yield tar
+        if index is not None:
+            index.restart_points = [(0, 0)]
+        return
+
+    with path.open("wb") as raw:
+        writer: ParallelCompressor
+        if archive_format == "tar.zst":
+            writer = ParallelZstdWriter(raw, level, workers)
+        else:
+            writer = ParallelGzipWriter(
+                raw, level, workers, restartable=index is not None
+            )
+        try:
+            # Stream mode: tarfile never seeks, so blocks can be written in order
+            with IndexingTarFile.open(fileobj=writer, mode="w|") as tar:
+                tar.index = index
+                yield tar
+        finally:
+            writer.close()
+    if index is not None:
+        index.restart_points = writer.restart_points
+
+
+# =============================================================================
+# ParallelCompressor Class
+# =============================================================================
+
+
+class ParallelCompressor(io.RawIOBase, abc.ABC):
+    """
+    Write-only stream compressing blocks on a thread pool.
+
+    Incoming data is cut into COMPRESSION_BLOCK_SIZE blocks that are
+    compressed concurrently and written to the underlying file in order.
+    zlib and zstd release the GIL while compressing, so threads scale
+    across cores. Subclasses provide the per-block codec and any
+    header or trailer. Subclasses whose blocks decode on their own set
+    restartable, and the start of every block is recorded as a restart point.
+
+    Attributes:
+        level: Codec compression level
+        workers: Number of compression threads
+        restartable: Whether each block can be decompressed independently
+        restart_points: (uncompressed offset, compressed offset) of each
+            non-empty block when restartable
+
+    Public methods:
+        write: Buffer data and submit full blocks for compression
+        close: Compress the final block and finish the stream
+
+    Private methods:
+        _header: Bytes written before the first block
+        _trailer: Bytes written after the last block
+        _compress_block: Compress one block (runs on a worker thread)
+        _submit: Queue one block and write finished blocks in order
+        _pending_result: Wait for the oldest in-flight block
+        _emit: Write compressed output and record restart points
+    """
+
+    restartable: bool = False
+
+    def __init__(self, raw: BinaryIO, level: int, workers: int) -> None:
+        """
+        Initialize ParallelCompressor.
+
+        Args:
+            raw: Binary file receiving the compressed stream
+            level: Codec compression level
+            workers: Number of compression threads (at least 1)
+        """
+        super().__init__()
+        self._raw = raw
+        self.level = level
+        self.workers = max(1, workers)
+        self.restart_points: list[tuple[int, int]] = []
+        self._buffer = bytearray()
+        self._previous_tail = b""
+        # (uncompressed offset or None for an empty block, compressed block)
+        self._pending: deque[tuple[int | None, Future[bytes]]] = deque()
+        self._uncompressed_offset = 0
+        self._compressed_offset = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="dfbu-compress"
+        )
+        self._emit(self._header())
+
+    def writable(self) -> bool:
+        """Return True; the stream is write-only."""
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        """
+        Buffer data and submit full blocks for compression.
+
+        Args:
+            data: Uncompressed bytes
+
+        Returns:
+            Number of bytes accepted (always all of data)
+        """
+        self._buffer += data
+        while len(self._buffer) >= COMPRESSION_BLOCK_SIZE:
+            block = bytes(self._buffer[:COMPRESSION_BLOCK_SIZE])
+            del self._buffer[:COMPRESSION_BLOCK_SIZE]
+            self._submit(block, final=False)
+        return len(data)
+
+    def close(self) -> None:
+        """Compress the final block, write the trailer, and stop the pool."""
+        if self.closed:
+            return
+        try:
+            self._submit(bytes(self._buffer), final=True)
+            self._buffer.clear()
+            while self._pending:
+                self._emit(*self._pending_result())
+            self._emit(self._trailer())
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            super().close()
+
+    def _submit(self, block: bytes, final: bool) -> None:
+        """
+        Queue one block and write finished blocks in order.
+
+        Args:
+            block: Uncompressed block
+            final: Whether this is the last block of the stream
+        """
+        self._pending.append(
+            (
+                self._uncompressed_offset if block else None,
+                self._executor.submit(
+                    self._compress_block, block, self._previous_tail, final
+                ),
+            )
+        )
+        self._uncompressed_offset += len(block)
+        self._previous_tail = block[-_DEFLATE_WINDOW:]
+        # Drain the oldest block once the in-flight window is full
+        while len(self._pending) >= self.workers * PENDING_BLOCKS_PER_WORKER:
+            self._emit(*self._pending_result())
+
+    def _pending_result(self) -> tuple[bytes, int | None]:
+        """Wait for the oldest block and return (output, block offset)."""
+        block_offset, future = self._pending.popleft()
+        return future.result(), block_offset
+
+    def _emit(self, data: bytes, block_offset: int | None = None) -> None:
+        """
+        Write compressed output and record restart points.
+
+        Args:
+            data: Compressed bytes
+            block_offset: Uncompressed offset of the block data encodes, if any
+        """
+        if self.restartable and block_offset is not None and data:
+            self.restart_points.append((block_offset, self._compressed_offset))
+        self._raw.write(data)
+        self._compressed_offset += len(data)
+
+    def _header(self) -> bytes:
+        """Bytes written before the first block."""
+        return b""
+
+    def _trailer(self) -> bytes:
+        """Bytes written after the last block."""
+        return b""
+
+    @abc.abstractmethod
+    def _compress_block(self, block: bytes, previous_tail: bytes, final: bool) -> bytes:
+        """
+        Compress one block (runs on a worker thread).
+
+        Args:
+            block: Uncompressed block
+            previous_tail: Last bytes of the preceding block
+            final: Whether this is the last block of the stream
+
+        Returns:
+            Compressed bytes for the block
+        """
+
+
+# =============================================================================
+# ParallelGzipWriter Class
+# =============================================================================
+
+
+class ParallelGzipWriter(ParallelCompressor):
+    """
+    pigz-style or block-restartable gzip stream writer.
+
+    By default each block is raw-deflated with the previous 32 KiB as a
+    preset dictionary and ends on a byte boundary (Z_SYNC_FLUSH), so the
+    blocks concatenate into one deflate stream inside a single gzip member
+    that any gzip reader accepts. The CRC-32 is computed in order on the
+    writing thread, which is far cheaper than compression.
+
+    When restartable, each block is a complete gzip member instead (gzip
+    readers decode concatenated members as one stream), so decompression
+    can start at any block at the cost of a slightly worse ratio.
+
+    Attributes:
+        level: zlib compression level (0-9)
+        workers: Number of compression threads
+        restartable: Whether each block is an independent gzip member
+
+    Public methods:
+        write: Buffer data and submit full blocks for compression
+
+    Private methods:
+        _header: gzip member header
+        _trailer: CRC-32 and size trailer
+        _compress_block: Raw-deflate one block
+    """
+
+    def __init__(
+        self, raw: BinaryIO, level: int, workers: int, restartable: bool = False
+    ) -> None:
+        """
+        Initialize ParallelGzipWriter.
+
+        Args:
+            raw: Binary file receiving the gzip stream
+            level: Compression level (clamped to 0-9)
+            workers: Number of compression threads
+            restartable: Write each block as an independent gzip member
+        """
+        self.restartable = restartable
+        self._crc = 0
+        self._size = 0
+        self._mtime = int(time.time())
+        super().__init__(raw, max(0, min(level, 9)), workers)
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        """
+        Update the checksum and buffer data for compression.
+
+        Args:
+            data: Uncompressed bytes
+
+        Returns:
+            Number of bytes accepted
+        """
+        if not self.restartable:
+            self._crc = zlib.crc32(data, self._crc)
+            self._size += len(data)
+        return super().write(data)
+
+    def _header(self) -> bytes:
+        """gzip member header with the current time and compression hint."""
+        if self.restartable:
+            return b""
+        extra_flags = 2 if self.level == 9 else 4 if self.level == 1 else 0
+        return _GZIP_MAGIC + struct.pack(
+            "<IBB", int(time.time()), extra_flags, _GZIP_OS_UNIX
+        )
+
+    def _trailer(self) -> bytes:
+        """CRC-32 and uncompressed size modulo 2**32."""
+        if self.restartable:
+            return b""
+        return struct.pack("<II", self._crc, self._size & 0xFFFFFFFF)
+
+    def _compress_block(self, block: bytes, previous_tail: bytes, final: bool) -> bytes:
+        """
+        Raw-deflate one block.
+
+        Args:
+            block: Uncompressed block
+            previous_tail: Last 32 KiB of the preceding block
+            final: Whether to finish the deflate stream
+
+        Returns:
+            Deflate data ending on a byte boundary (or the final block), or
+            a complete gzip member when restartable
+        """
+        if self.restartable:
+            return gzip.compress(block, compresslevel=self.level, mtime=self._mtime)
+        if previous_tail:
+            compressor = zlib.compressobj(
+                self.level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=previous_tail
+            )
+        else:
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        flush_mode = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        return compressor.compress(block) + compressor.flush(flush_mode)
+
+
+# =============================================================================
+# ParallelZstdWriter Class
+# =============================================================================
+
+
+class ParallelZstdWriter(ParallelCompressor):
+    """
+    Concatenated-frame zstd stream writer.
+
+    Each block becomes an independent zstd frame; zstd readers decode
+    concatenated frames as one stream, and every frame is a restart point.
+
+    Attributes:
+        level: zstd compression level (1-22)
+        workers: Number of compression threads
+        restartable: Always True; frames decode independently
+
+    Public methods:
+        write: Buffer data and submit full blocks for compression
+
+    Private methods:
+        _compress_block: Compress one block into a zstd frame
+    """
+
+    restartable = True
+
+    def __init__(self, raw: BinaryIO, level: int, workers: int) -> None:
+        """
+        Initialize ParallelZstdWriter.
+
+        Args:
+            raw: Binary file receiving the zstd stream
+            level: Compression level (clamped to 1-22)
+            workers: Number of compression threads
+        """
+        super().__init__(raw, max(1, min(level, 22)), workers)
+
+    def _compress_block(self, block: bytes, previous_tail: bytes, final: bool) -> bytes:
+        """
+        Compress one block into a zstd frame.
+
+        Args:
+            block: Uncompressed block
+            previous_tail: Unused; frames are independent
+            final: Unused; every frame is complete
+
+        Returns:
+            One zstd frame (empty for an empty final block)
+        """
+        if not block or zstd is None:
+            return b""
+        return zstd.compress(block, level=self.level)
@@ -0,0 +1,459 @@
+"""
+DFBU ArchiveIndex - Seekable Member Index for Compressed Archives
+
+Description:
+    Sidecar index (<archive>.idx) written while an archive is created. It
+    records each member's path, size, mtime, SHA-256, and tar offset, plus
+    the restart points of the compressed stream (independent gzip members
+    or zstd frames). Restoring one file seeks to the restart point nearest
+    its header and decompresses at most one block of unrelated data instead
+    of the whole archive up to the member.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - Member offsets and SHA-256 digests captured in the same pass as tar.add
+    - (uncompressed, compressed) restart points from block-restartable writers
+    - Single-member extraction that seeks to the nearest restart point
+    - Digest check of the restored file against the index
+    - Falls back to a sequential archive scan when the index is missing or stale
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features (compression.zstd)
+    - Standard library: tarfile, gzip, hashlib, json, bisect
+
+Classes:
+    - IndexEntry: Location and metadata of one archive member
+    - ArchiveIndex: Member table and restart points of one archive
+    - IndexingTarFile: TarFile recording an index entry for every member
+
+Functions:
+    - index_path: Sidecar index path for an archive
+    - extract_member: Restore one member of an archive
+    - decompressor: Decompressing reader for an archive format
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import hashlib
+import io
+import json
+import logging
+import lzma
+import os
+import shutil
+import tarfile
+import tempfile
+import zlib
+from bisect import bisect_right
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Final, NamedTuple
+
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsRead
+
+
+try:
+    from compression import zstd
+except ImportError:
+    # compression.zstd is new in Python 3.14
+    zstd = None  # type: ignore[assignment]
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Suffix appended to the archive file name for its index
+INDEX_SUFFIX: Final[str] = ".idx"
+
+ARCHIVE_INDEX_VERSION: Final[int] = 1
+
+# Exceptions reading a corrupt or truncated compressed tar stream can raise
+ARCHIVE_READ_ERRORS: Final[tuple[type[Exception], ...]] = (
+    tarfile.TarError,
+    OSError,
+    EOFError,
+    ValueError,
+    lzma.LZMAError,
+    zlib.error,
+    *((zstd.ZstdError,) if zstd is not None else ()),
+)
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+
+class IndexEntry(NamedTuple):
+    """
+    Location and metadata of one archive member.
+
+    Attributes:
+        name: Member name (absolute path without the leading slash)
+        offset: Offset of the member's first header in the tar stream
+        size: Member data size in bytes
+        mtime: Modification time in seconds
+        digest: SHA-256 of the member data (None for non-regular members)
+    """
+
+    name: str
+    offset: int
+    size: int
+    mtime: int
+    digest: str | None
+
+
+@dataclass(slots=True)
+class ArchiveIndex:
+    """
+    Member table and restart points of one archive.
+
+    Attributes:
+        archive_format: Archive format the archive was written with
+        restart_points: (uncompressed offset, compressed offset) pairs where
+            decompression can start, ascending
+        members: Index entries by member name
+        archive_size: Archive file size the index was written for
+
+    Public methods:
+        load: Read the sidecar index of an archive
+        save: Write the sidecar index atomically
+        add: Record one member
+        restart_point: Nearest restart point at or before a tar offset
+    """
+
+    archive_format: str
+    restart_points: list[tuple[int, int]] = field(default_factory=list)
+    members: dict[str, IndexEntry] = field(default_factory=dict)
+    archive_size: int = 0
+
+    @classmethod
+    def load(cls, archive: Path) -> ArchiveIndex | None:
+        """
+        Read the sidecar index of an archive.
+
+        Args:
+            archive: Archive file path
+
+        Returns:
+            Loaded index, or None if missing, unreadable, or stale
+        """
+        sidecar = index_path(archive)
+        try:
+            data = json.loads(sidecar.read_text(encoding="utf-8"))
+            if data.get("version") != ARCHIVE_INDEX_VERSION:
+                return None
+            index = cls(
+                archive_format=data["format"],
+                restart_points=[(int(u), int(c)) for u, c in data["restart_points"]],
+                members={entry[0]: IndexEntry(*entry) for entry in data["members"]},
+                archive_size=int(data["archive_size"]),
+            )
+            if archive.stat().st_size != index.archive_size:
+                logger.warning("Ignoring stale archive index %s", sidecar)
+                return None
+            return index
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable archive index %s: %s", sidecar, e)
+            return None
+
+    def save(self, archive: Path) -> None:
+        """
+        Write the sidecar index atomically.
+
+        Args:
+            archive: Archive file the index describes (must be complete)
+
+        Raises:
+            OSError: If the archive cannot be stat'd or the index written
+        """
+        self.archive_size = archive.stat().st_size
+        sidecar = index_path(archive)
+        tmp_file = sidecar.with_name(f"{sidecar.name}.tmp")
+        data = {
+            "version": ARCHIVE_INDEX_VERSION,
+            "format": self.archive_format,
+            "archive_size": self.archive_size,
+            "restart_points": self.restart_points,
+            "members": list(self.members.values()),
+        }
+        tmp_file.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp_file.replace(sidecar)
+
+    def add(self, entry: IndexEntry) -> None:
+        """
+        Record one member; a later member with the same name replaces it.
+
+        Args:
+            entry: Index entry of the member
+        """
+        self.members[entry.name] = entry
+
+    def restart_point(self, offset: int) -> tuple[int, int]:
+        """
+        Nearest restart point at or before a tar offset.
+
+        Args:
+            offset: Offset in the uncompressed tar stream
+
+        Returns:
+            (uncompressed offset, compressed offset); (0, 0) if there are none
+        """
+        position = bisect_right(self.restart_points, (offset, float("inf")))
+        if position == 0:
+            return (0, 0)
+        return self.restart_points[position - 1]
+
+
+# =============================================================================
+# IndexingTarFile Class
+# =============================================================================
+
+
+class _HashingReader:
+    """File object wrapper hashing the data tarfile copies into the archive."""
+
+    def __init__(self, fileobj: SupportsRead[bytes]) -> None:
+        self._fileobj = fileobj
+        self.hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.hash.update(data)
+        return data
+
+
+class IndexingTarFile(tarfile.TarFile):
+    """
+    TarFile recording an index entry for every member.
+
+    Entries are captured in addfile, so tar.add, filters, and recursion
+    behave exactly as in TarFile. Without an index it is a plain TarFile;
+    open it with TarFile.open and set index before adding members.
+
+    Attributes:
+        index: ArchiveIndex receiving entries, or None
+
+    Public methods:
+        addfile: Write a member and record its offset, size, mtime, and digest
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize IndexingTarFile without an index.
+
+        Args:
+            *args: Positional TarFile arguments
+            **kwargs: Keyword TarFile arguments
+        """
+        super().__init__(*args, **kwargs)
+        self.index: ArchiveIndex | None = None
+
+    def addfile(
+        self, tarinfo: tarfile.TarInfo, fileobj: SupportsRead[bytes] | None = None
+    ) -> None:
+        """
+        Write a member and record its offset, size, mtime, and digest.
+
+        Args:
+            tarinfo: Member header
+            fileobj: Member data for regular files
+        """
+        if self.index is None:
+            super().addfile(tarinfo, fileobj)
+            return
+
+        # Offset of the first header block (including any pax/GNU headers)
+        offset = self.offset
+        digest = None
+        if fileobj is not None and tarinfo.isreg():
+            reader = _HashingReader(fileobj)
+            super().addfile(tarinfo, reader)
+            digest = reader.hash.hexdigest()
+        else:
+            super().addfile(tarinfo, fileobj)
+        self.index.add(
+            IndexEntry(tarinfo.name, offset, tarinfo.size, int(tarinfo.mtime), digest)
+        )
+
+
+# =============================================================================
+# Restore Functions
+# =============================================================================
+
+
+def index_path(archive: Path) -> Path:
+    """
+    Sidecar index path for an archive.
+
+    Args:
+        archive: Archive file path
+
+    Returns:
+        Path of the index (e.g., dotfiles-....tar.gz.idx)
+    """
+    return archive.with_name(f"{archive.name}{INDEX_SUFFIX}")
+
+
+def extract_member(archive: Path, name: str | Path, dest_root: Path) -> Path:
+    """
+    Restore one member of an archive.
+
+    With a current index, decompression starts at the restart point nearest
+    the member's header; otherwise the archive is scanned from the start.
+    A regular file is written to a temporary file next to its destination,
+    checked against the index's SHA-256 when one exists, and only then
+    renamed over the destination, so a stale index or corrupt archive never
+    replaces the existing file.
+
+    Args:
+        archive: Archive file path
+        name: Member name or the original absolute path
+        dest_root: Directory the member path is recreated under
+
+    Returns:
+        Path of the restored file
+
+    Raises:
+        KeyError: If the archive has no such member
+        ValueError: If the index disagrees with the archive contents
+        OSError: If the archive cannot be read or the file written
+        tarfile.TarError: If the archive is corrupt or the member unsafe
+    """
+    member_name = str(name).lstrip("/")
+    index = ArchiveIndex.load(archive)
+    entry = index.members.get(member_name) if index is not None else None
+    if index is not None and entry is None:
+        raise KeyError(member_name)
+
+    with ExitStack() as stack:
+        if index is not None and entry is not None:
+            tar = stack.enter_context(_open_at(archive, index, entry.offset))
+            member = tar.next()
+            if member is None or member.name != member_name:
+                raise ValueError(f"Archive index for {archive} is out of date")
+        else:
+            tar = stack.enter_context(tarfile.open(archive))
+            member = tar.getmember(member_name)
+        if not member.isreg():
+            # Links and directories carry no content to verify
+            tar.extract(member, path=dest_root, filter="data")
+            return dest_root / member_name
+
+        # Rejects absolute or escaping names and strips unsafe mode bits
+        safe = tarfile.data_filter(member, os.fspath(dest_root))
+        data = tar.extractfile(member)
+        if data is None:
+            raise ValueError(f"Cannot read {member_name} from {archive}")
+        restored = dest_root / safe.name
+        restored.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp picks an unused name with O_EXCL, so an existing file or
+        # symlink beside the destination is never opened or removed
+        fd, tmp_name = tempfile.mkstemp(
+            dir=restored.parent, prefix=f".{restored.name}.", suffix=".dfbu-tmp"
+        )
+        tmp_file = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(data, f)
+            digest = entry.digest if entry is not None else None
+            if digest is not None and _file_digest(tmp_file) != digest:
+                raise ValueError(
+                    f"Archived {member_name} does not match its recorded digest"
+                )
+            if safe.mode is not None:
+                tmp_file.chmod(safe.mode)
+            os.utime(tmp_file, (safe.mtime, safe.mtime))
+            tmp_file.replace(restored)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+    return restored
+
+
+@contextmanager
+def _open_at(
+    archive: Path, index: ArchiveIndex, offset: int
+) -> Iterator[tarfile.TarFile]:
+    """
+    Open a tar stream positioned at a member header.
+
+    Args:
+        archive: Archive file path
+        index: Index of the archive
+        offset: Tar offset of the member header
+
+    Yields:
+        TarFile in stream mode whose next() returns the member
+    """
+    uncompressed, compressed = index.restart_point(offset)
+    with archive.open("rb") as raw:
+        raw.seek(compressed)
+        with decompressor(raw, index.archive_format) as stream:
+            # Decompressed readers emulate forward seeks by reading
+            stream.seek(offset - uncompressed)
+            with tarfile.open(fileobj=stream, mode="r|") as tar:
+                yield tar
+
+
+def decompressor(raw: BinaryIO, archive_format: str) -> io.BufferedIOBase:
+    """
+    Decompressing reader starting at the current position of raw.
+
+    Unlike tarfile's own stream mode, the gzip reader continues across
+    gzip members, so block-restartable archives read to the end.
+
+    Args:
+        raw: Archive file positioned at a restart point
+        archive_format: Archive format of the file
+
+    Returns:
+        Binary file object yielding uncompressed tar data
+
+    Raises:
+        ValueError: If the format is unknown or its codec is unavailable
+    """
+    match archive_format:
+        case "tar.zst" if zstd is not None:
+            return zstd.ZstdFile(raw)
+        case "tar.xz":
+            return lzma.LZMAFile(raw)
+        case "tar.bz2":
+            return bz2.BZ2File(raw)
+        case "tar.gz":
+            return gzip.GzipFile(fileobj=raw, mode="rb")
+    raise ValueError(f"Unsupported archive format: {archive_format}")
+
+
+def _file_digest(path: Path) -> str:
+    """
+    SHA-256 of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -0,0 +1,307 @@
+"""
+DFBU ArchiveSnapshot - Snapshot Metadata for Incremental Archives
+
+Description:
+    Records the (size, mtime_ns, inode) signature of every archived file
+    so the next archive backup can hold only what changed, like GNU tar's
+    listed-incremental snapshot file. Archives form chains: a full base
+    archive followed by incremental archives, each storing changed files
+    plus a tombstone list of deleted paths in an embedded metadata member.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - Per-archive-directory snapshot state (.dfbu-archive-state.json)
+    - Change detection from (size, mtime_ns, inode) signatures
+    - Tombstones for files deleted since the previous archive
+    - Embedded metadata member naming each archive's base and parent
+    - Chain grouping for retention that never orphans an incremental
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: json, tarfile, dataclasses
+
+Classes:
+    - ArchiveSnapshot: Snapshot state after the most recent archive
+    - SnapshotDelta: Files changed and deleted since the previous snapshot
+
+Functions:
+    - is_incremental_archive: Check whether an archive file is incremental
+    - group_archive_chains: Split archives into base-plus-incrementals chains
+    - read_archive_metadata: Read the metadata member of an archive
+    - file_signature: Build the change signature of a file
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import tarfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Final
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Snapshot state file stored next to the archives
+SNAPSHOT_STATE_NAME: Final[str] = ".dfbu-archive-state.json"
+
+# Metadata member appended to every archive written with snapshot tracking
+SNAPSHOT_MEMBER_NAME: Final[str] = ".dfbu-snapshot.json"
+
+# Filename marker between timestamp and suffix for incremental archives
+INCREMENTAL_MARKER: Final[str] = ".incr"
+
+SNAPSHOT_VERSION: Final[int] = 1
+
+ARCHIVE_TYPE_FULL: Final[str] = "full"
+ARCHIVE_TYPE_INCREMENTAL: Final[str] = "incremental"
+
+# (size, mtime_ns, inode) of a file when it was archived
+type FileSignature = tuple[int, int, int]
+
+
+# =============================================================================
+# Data Classes
+# =============================================================================
+
+
+@dataclass(slots=True)
+class SnapshotDelta:
+    """
+    Files changed and deleted since the previous snapshot.
+
+    Attributes:
+        changed: Paths that are new or whose signature changed
+        deleted: Paths archived previously that no longer exist
+    """
+
+    changed: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ArchiveSnapshot:
+    """
+    Snapshot state after the most recent archive.
+
+    Attributes:
+        archive: File name of the most recent archive, or None
+        base: File name of the full archive starting the current chain
+        chain_length: Number of archives in the current chain
+        archive_format: Archive format the chain was written with
+        files: Signature of every archived file by absolute path
+
+    Public methods:
+        load: Read the snapshot state from an archive directory
+        save: Write the snapshot state atomically
+        diff: Compare current file signatures with the snapshot
+        metadata_member: Build the metadata member for a new archive
+    """
+
+    archive: str | None = None
+    base: str | None = None
+    chain_length: int = 0
+    archive_format: str = ""
+    files: dict[str, FileSignature] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, archive_base: Path) -> ArchiveSnapshot:
+        """
+        Read the snapshot state from an archive directory.
+
+        Args:
+            archive_base: Directory holding the archives
+
+        Returns:
+            Loaded snapshot, or an empty one if missing or unreadable
+        """
+        state_file = archive_base / SNAPSHOT_STATE_NAME
+        try:
+            data = json.loads(state_file.read_text(encoding="utf-8"))
+            if data.get("version") != SNAPSHOT_VERSION:
+                return cls()
+            return cls(
+                archive=data["archive"],
+                base=data["base"],
+                chain_length=int(data["chain_length"]),
+                archive_format=data["archive_format"],
+                files={
+                    path: (sig[0], sig[1], sig[2])
+                    for path, sig in data["files"].items()
+                },
+            )
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+            logger.warning("Ignoring unreadable archive snapshot %s: %s", state_file, e)
+            return cls()
+
+    def save(self, archive_base: Path) -> None:
+        """
+        Write the snapshot state atomically.
+
+        Args:
+            archive_base: Directory holding the archives
+
+        Raises:
+            OSError: If the state file cannot be written
+        """
+        state_file = archive_base / SNAPSHOT_STATE_NAME
+        tmp_file = state_file.with_name(f"{state_file.name}.tmp")
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "archive": self.archive,
+            "base": self.base,
+            "chain_length": self.chain_length,
+            "archive_format": self.archive_format,
+            "files": self.files,
+        }
+        tmp_file.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp_file.replace(state_file)
+
+    def diff(self, current: dict[str, FileSignature]) -> SnapshotDelta:
+        """
+        Compare current file signatures with the snapshot.
+
+        Args:
+            current: Signature of every file that would be archived now
+
+        Returns:
+            SnapshotDelta with changed paths and tombstones, both sorted
+        """
+        previous = self.files
+        return SnapshotDelta(
+            changed=sorted(
+                path for path, sig in current.items() if previous.get(path) != sig
+            ),
+            deleted=sorted(path for path in previous if path not in current),
+        )
+
+    def metadata_member(
+        self, archive_type: str, parent: str | None, deleted: list[str]
+    ) -> tuple[tarfile.TarInfo, io.BytesIO]:
+        """
+        Build the metadata member for a new archive.
+
+        Called after the snapshot fields describe the new archive.
+
+        Args:
+            archive_type: ARCHIVE_TYPE_FULL or ARCHIVE_TYPE_INCREMENTAL
+            parent: Archive the new one is a delta against (None for full)
+            deleted: Tombstones for paths deleted since the parent archive
+
+        Returns:
+            Tuple of (TarInfo, file object) for TarFile.addfile
+        """
+        payload = json.dumps(
+            {
+                "version": SNAPSHOT_VERSION,
+                "type": archive_type,
+                "base": self.base,
+                "parent": parent,
+                "deleted": deleted,
+            },
+            indent=1,
+        ).encode()
+        info = tarfile.TarInfo(SNAPSHOT_MEMBER_NAME)
+        info.size = len(payload)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        return info, io.BytesIO(payload)
+
+
+# =============================================================================
+# Archive Chain Functions
+# =============================================================================
+
+
+def is_incremental_archive(archive: Path) -> bool:
+    """
+    Check whether an archive file is incremental.
+
+    Args:
+        archive: Archive file path
+
+    Returns:
+        True if the file name carries the incremental marker
+    """
+    return f"{INCREMENTAL_MARKER}.tar." in archive.name
+
+
+def group_archive_chains(archives: list[Path]) -> list[list[Path]]:
+    """
+    Split archives into base-plus-incrementals chains.
+
+    A chain starts at each full archive and holds the incrementals that
+    follow it. Incrementals before the first full archive (their base was
+    removed) form a chain of their own.
+
+    Args:
+        archives: Archive paths sorted oldest first
+
+    Returns:
+        Chains in the same order, each oldest first
+    """
+    chains: list[list[Path]] = []
+    for archive in archives:
+        if not chains or not is_incremental_archive(archive):
+            chains.append([archive])
+        else:
+            chains[-1].append(archive)
+    return chains
+
+
+def read_archive_metadata(archive: Path) -> dict[str, Any] | None:
+    """
+    Read the metadata member of an archive.
+
+    The member is the last one written, so the whole archive is read.
+
+    Args:
+        archive: Archive file path
+
+    Returns:
+        Parsed metadata, or None if the archive has none or it is not an
+        object
+    """
+    try:
+        with tarfile.open(archive) as tar:
+            member = tar.getmember(SNAPSHOT_MEMBER_NAME)
+            extracted = tar.extractfile(member)
+            if extracted is None:
+                return None
+            metadata = json.loads(extracted.read())
+    except KeyError, OSError, ValueError, tarfile.TarError:
+        return None
+    # A member of the same name written by another tool may hold any JSON
+    return metadata if isinstance(metadata, dict) else None
+
+
+def file_signature(st: os.stat_result) -> FileSignature:
+    """
+    Build the change signature of a file.
+
+    Args:
+        st: Stat result of the file
+
+    Returns:
+        Tuple of (size, mtime_ns, inode)
+    """
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
@@ -12,11 +12,13 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 11-01-2025
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
     - Mirror backup orchestration with identical file skipping
+    - Persistent mirror index loaded for each mirror backup
+    - Hardlink snapshots for dated mirrors
     - Archive backup creation with compression
     - Restore operation coordination with path reconstruction
     - Progress tracking and statistics collection
@@ -58,6 +60,7 @@ from core.common_types import DotFileDict, OptionsDict, VerificationReportDict
 if TYPE_CHECKING:
     from gui.file_operations import FileOperations
     from gui.restore_backup_manager import RestoreBackupManager
+    from gui.scan_snapshot import ScanSnapshot
     from gui.statistics_tracker import StatisticsTracker
     from gui.verification_manager import VerificationManager
 
@@ -85,6 +88,7 @@ class BackupOrchestrator:
         execute_mirror_backup: Execute mirror backup for all enabled dotfiles
         execute_archive_backup: Create compressed archive of dotfiles
         execute_restore: Restore files from backup directory
+        restore_archive_member: Restore one archived file with safety backup
         validate_dotfile_paths: Validate all dotfile paths exist
 
     Private methods:
@@ -121,13 +125,14 @@ class BackupOrchestrator:
         self._last_backup_files: list[tuple[Path, Path]] = []  # (source, backup) pairs
 
     def validate_dotfile_paths(
-        self, dotfiles: list[DotFileDict]
+        self, dotfiles: list[DotFileDict], snapshot: ScanSnapshot | None = None
     ) -> dict[int, tuple[bool, bool, str]]:
         """
         Validate all dotfile paths exist and determine their types.
 
         Args:
             dotfiles: List of dotfile configurations
+            snapshot: Fresh scan snapshot answering for the paths it covers
 
         Returns:
             Dict mapping dotfile index to (exists, is_dir, type_str) tuple
@@ -147,9 +152,15 @@ class BackupOrchestrator:
                     continue
 
                 path = self.file_ops.expand_path(path_str)
-                if path.exists():
+                root = snapshot.get(path) if snapshot is not None else None
+                if root is not None:
+                    exists, is_dir = root.exists, root.is_dir
+                else:
+                    exists = path.exists()
+                    is_dir = exists and path.is_dir()
+                if exists:
                     any_exists = True
-                    if path.is_dir():
+                    if is_dir:
                         any_is_dir = True
 
             # Determine type string for display
@@ -200,63 +211,86 @@ class BackupOrchestrator:
         processed_count = 0  # Tracks individual files processed
         completed_items = 0  # Tracks dotfile entries completed
 
-        # Process each dotfile entry in configuration
-        for dotfile in dotfiles:
-            # Skip disabled dotfiles
-            if not dotfile.get("enabled", True):
-                continue
+        # Load the mirror index so unchanged files skip destination stats
+        if options.get("mirror_index", True):
+            self.file_ops.open_mirror_index(
+                self.mirror_base_dir, options["hostname_subdir"]
+            )
 
-            # Process each path in dotfile entry
-            for path_str in dotfile.get("paths", []):
-                # Skip empty path strings
-                if not path_str:
+        # Dated mirrors hard-link unchanged files from the previous snapshot
+        if options["date_subdir"] and options.get("hardlink_snapshots", True):
+            self.file_ops.open_snapshot_link(
+                self.mirror_base_dir, options["hostname_subdir"]
+            )
+
+        try:
+            # Process each dotfile entry in configuration
+            for dotfile in dotfiles:
+                # Skip disabled dotfiles
+                if not dotfile.get("enabled", True):
                     continue
 
-                # Expand path with environment variables and user home directory
-                src_path = self.file_ops.expand_path(path_str)
+                # Process each path in dotfile entry
+                for path_str in dotfile.get("paths", []):
+                    # Skip empty path strings
+                    if not path_str:
+                        continue
 
-                # Skip non-existent paths
-                if not src_path.exists():
-                    continue
+                    # Expand path with environment variables and user home directory
+                    src_path = self.file_ops.expand_path(path_str)
+
+                    # Skip non-existent paths
+                    if not src_path.exists():
+                        continue
 
-                # Determine if path is directory or file
-                is_dir = src_path.is_dir()
+                    # Determine if path is directory or file
+                    is_dir = src_path.is_dir()
 
-                # Build destination path with hostname and date subdirectories
-                dest_path = self.file_ops.assemble_dest_path(
-                    self.mirror_base_dir,
-                    src_path,
-                    options["hostname_subdir"],
-                    options["date_subdir"],
-                )
+                    # Build destination path with hostname and date subdirectories
+                    dest_path = self.file_ops.assemble_dest_path(
+                        self.mirror_base_dir,
+                        src_path,
+                        options["hostname_subdir"],
+                        options["date_subdir"],
+                    )
 
-                # Process based on file type (directory vs file)
-                if is_dir:
-                    file_count = self._process_directory_backup(
+                    # Paths matching .dfbuignore are not backed up at all
+                    if self.file_ops.is_excluded(src_path, is_dir):
+                        if item_skipped_callback:
+                            item_skipped_callback(
+                                str(src_path), "Excluded by .dfbuignore"
+                            )
+                    # Process based on file type (directory vs file)
+                    elif is_dir:
+                        file_count = self._process_directory_backup(
+                            src_path,
+                            dest_path,
+                            skip_identical=True,
+                            item_processed_callback=item_processed_callback,
+                            item_skipped_callback=item_skipped_callback,
+                        )
+                        if file_count > 0:
+                            processed_count += file_count
+                    elif self._process_file_backup(
                         src_path,
                         dest_path,
                         skip_identical=True,
                         item_processed_callback=item_processed_callback,
                         item_skipped_callback=item_skipped_callback,
-                    )
-                    if file_count > 0:
-                        processed_count += file_count
-                elif self._process_file_backup(
-                    src_path,
-                    dest_path,
-                    skip_identical=True,
-                    item_processed_callback=item_processed_callback,
-                    item_skipped_callback=item_skipped_callback,
-                ):
-                    processed_count += 1
-
-                # Increment completed items counter for progress tracking
-                completed_items += 1
-
-                # Update progress based on completed items (not files processed)
-                if progress_callback and total_items > 0:
-                    progress = int((completed_items / total_items) * 100)
-                    progress_callback(progress)
+                    ):
+                        processed_count += 1
+
+                    # Increment completed items counter for progress tracking
+                    completed_items += 1
+
+                    # Update progress based on completed items (not files processed)
+                    if progress_callback and total_items > 0:
+                        progress = int((completed_items / total_items) * 100)
+                        progress_callback(progress)
+        finally:
+            # Persist index updates even if the backup was interrupted
+            self.file_ops.close_snapshot_link()
+            self.file_ops.close_mirror_index()
 
         return processed_count, total_items
 
@@ -389,6 +423,41 @@ class BackupOrchestrator:
 
         return processed_count, total_items
 
+    def restore_archive_member(
+        self,
+        archive_path: Path,
+        member_path: Path,
+        dest_root: Path,
+        pre_restore_enabled: bool = True,
+    ) -> Path | None:
+        """
+        Restore one file from an archive with pre-restore safety backup.
+
+        Args:
+            archive_path: Archive file to restore from
+            member_path: Original absolute path of the file
+            dest_root: Directory the original path is recreated under
+            pre_restore_enabled: Whether to back up an existing file first
+
+        Returns:
+            Path of the restored file, or None if restore failed
+        """
+        if pre_restore_enabled and self._restore_backup_manager is not None:
+            target = dest_root / str(member_path).lstrip("/")
+            success, error, _ = self._restore_backup_manager.backup_before_restore(
+                files_to_overwrite=[target],
+                source_backup_path=str(archive_path),
+            )
+            if not success:
+                logger.error(f"Pre-restore backup failed: {error}")
+                return None
+
+            self._restore_backup_manager.cleanup_old_backups()
+
+        return self.file_ops.restore_archive_member(
+            archive_path, member_path, dest_root
+        )
+
     def verify_last_backup(self) -> VerificationReportDict | None:
         """
         Verify the integrity of the last mirror backup operation.
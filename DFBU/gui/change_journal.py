@@ -0,0 +1,806 @@
+"""
+DFBU ChangeJournal - Watcher-Driven Change Journal for Incremental Mirrors
+
+Description:
+    Watches the paths behind enabled dotfile entries and appends every
+    changed path to an in-memory journal. A mirror backup can then copy only
+    the journaled paths instead of re-walking every configured tree. The
+    journal is only trusted when the watcher has run continuously since the
+    last full walk into the same mirror; otherwise, and after an overflow,
+    the backup falls back to a full walk. Nothing is persisted: changes
+    made while DFBU is not running are never seen, so the first backup
+    after startup always walks everything.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - Linux inotify through ctypes on a background thread
+    - QFileSystemWatcher fallback where inotify is unavailable
+    - Recursive directory watches, new subdirectories watched as they appear
+    - Initial watch pass off the GUI thread; not ready until it completes
+    - Single-file dotfiles watched through their parent directory
+    - Overflow (kernel queue, watch limit, entry cap) forces a full walk
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - PySide6 for the QFileSystemWatcher fallback
+    - Standard library: ctypes, select, struct, threading
+
+Classes:
+    - ChangeJournal: In-memory set of changed paths with sync state
+    - InotifyWatcher: Feeds the journal from Linux inotify events
+    - QtChangeWatcher: Feeds the journal from QFileSystemWatcher signals
+
+Functions:
+    - inotify_available: Check whether inotify can be used via ctypes
+    - create_change_watcher: Create the best available watcher for a journal
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import threading
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+from typing import Final
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, Qt, Signal
+
+from gui.fs_walker import walk_tree
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Beyond this many pending paths a full walk is cheaper than replaying them
+MAX_JOURNAL_ENTRIES: Final[int] = 50_000
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY: Final[int] = 0x00000002
+IN_ATTRIB: Final[int] = 0x00000004
+IN_CLOSE_WRITE: Final[int] = 0x00000008
+IN_MOVED_TO: Final[int] = 0x00000080
+IN_CREATE: Final[int] = 0x00000100
+IN_DELETE_SELF: Final[int] = 0x00000400
+IN_MOVE_SELF: Final[int] = 0x00000800
+IN_Q_OVERFLOW: Final[int] = 0x00004000
+IN_IGNORED: Final[int] = 0x00008000
+IN_ONLYDIR: Final[int] = 0x01000000
+IN_ISDIR: Final[int] = 0x40000000
+IN_NONBLOCK: Final[int] = os.O_NONBLOCK
+IN_CLOEXEC: Final[int] = os.O_CLOEXEC
+
+# Events that can change what a mirror backup would copy
+WATCH_MASK: Final[int] = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+# struct inotify_event header: int wd; uint32_t mask, cookie, len
+_EVENT_HEADER: Final[struct.Struct] = struct.Struct("iIII")
+_READ_BUFFER_SIZE: Final[int] = 64 * 1024
+
+
+# =============================================================================
+# ChangeJournal Class
+# =============================================================================
+
+
+class ChangeJournal:
+    """
+    In-memory set of changed paths with sync state.
+
+    The journal is "synced" for a scope (the mirror root) once a full walk
+    into that mirror has started while a ready watcher was running. From
+    then on the pending paths are exactly what changed since the last
+    backup. A watcher restart or overflow clears the synced state so the
+    next backup walks everything again.
+
+    Public methods:
+        reset: Start an unsynced, empty journal (watcher start)
+        append: Record a changed path
+        mark_overflow: Record that changes were lost
+        checkpoint: Take the pending paths and start a new synced journal
+        restore: Return paths from an interrupted backup to the journal
+    """
+
+    def __init__(self, max_entries: int = MAX_JOURNAL_ENTRIES) -> None:
+        """
+        Initialize ChangeJournal.
+
+        Args:
+            max_entries: Pending path count that triggers an overflow
+        """
+        self._max_entries: int = max_entries
+        self._pending: set[str] = set()
+        self._scope: str | None = None
+        self._overflowed: bool = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of pending paths."""
+        return len(self._pending)
+
+    @property
+    def overflowed(self) -> bool:
+        """Whether changes were lost since the last checkpoint."""
+        return self._overflowed
+
+    def is_synced(self, scope: str) -> bool:
+        """
+        Check whether the pending paths are complete for a scope.
+
+        Args:
+            scope: Mirror root the journal must have been synced against
+
+        Returns:
+            True if a journaled backup into scope is safe
+        """
+        return self._scope == scope and not self._overflowed
+
+    def reset(self) -> None:
+        """Start an unsynced, empty journal (changes before now are unknown)."""
+        with self._lock:
+            self._pending.clear()
+            self._scope = None
+            self._overflowed = False
+
+    def append(self, path: str) -> None:
+        """
+        Record a changed path.
+
+        Safe to call from watcher threads.
+
+        Args:
+            path: Absolute path of the changed file or directory
+        """
+        with self._lock:
+            if self._overflowed or path in self._pending:
+                return
+            if len(self._pending) >= self._max_entries:
+                self._overflowed = True
+                return
+            self._pending.add(path)
+
+    def mark_overflow(self) -> None:
+        """Record that changes were lost; the next backup walks everything."""
+        with self._lock:
+            self._overflowed = True
+
+    def checkpoint(self, scope: str) -> set[str] | None:
+        """
+        Take the pending paths and start a new synced journal.
+
+        Changes recorded after this call belong to the next backup. The
+        caller must call restore() if the backup does not complete.
+
+        Args:
+            scope: Mirror root the backup writes to
+
+        Returns:
+            Pending paths if the journal was synced for scope, None if the
+            backup must walk every configured path
+        """
+        with self._lock:
+            synced = self._scope == scope and not self._overflowed
+            pending = self._pending
+            self._pending = set()
+            self._scope = scope
+            self._overflowed = False
+        return pending if synced else None
+
+    def restore(self, paths: Iterable[str] | None) -> None:
+        """
+        Return paths from an interrupted or partly failed backup.
+
+        Args:
+            paths: Paths to journal again, or None if a full walk failed
+        """
+        if paths is None:
+            self.mark_overflow()
+            return
+        for path in paths:
+            self.append(path)
+
+
+# =============================================================================
+# inotify Watcher
+# =============================================================================
+
+
+@cache
+def _libc() -> ctypes.CDLL | None:
+    """Load libc with the inotify entry points, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except OSError, AttributeError:
+        return None
+    return libc
+
+
+def inotify_available() -> bool:
+    """
+    Check whether inotify can be used via ctypes.
+
+    Returns:
+        True if libc exposes the inotify system calls
+    """
+    return _libc() is not None
+
+
+class InotifyWatcher:
+    """
+    Feeds a ChangeJournal from Linux inotify events.
+
+    Directory roots are watched recursively. File roots are watched through
+    their parent directory with a name filter, which also catches editors
+    that replace files by rename. Missing roots are picked up when they are
+    created inside an existing parent. The initial recursive watch pass
+    runs on the reader thread; until it completes the watcher is not ready
+    and its journal must not be trusted.
+
+    Attributes:
+        journal: ChangeJournal receiving changed paths
+        roots: Configured dotfile paths being watched
+
+    Public methods:
+        start: Start the reader thread, which adds the watches
+        stop: Stop the reader thread and close the inotify instance
+        is_running: Whether the reader thread is active
+        is_ready: Whether the initial watch pass has completed
+
+    Private methods:
+        _add_watch: Watch one directory, recording its name filter
+        _add_tree: Watch a directory and all of its subdirectories
+        _add_roots: Initial watch pass over the configured roots
+        _run: Reader thread loop
+        _handle_events: Decode a buffer of inotify events
+    """
+
+    def __init__(self, journal: ChangeJournal, roots: Iterable[Path]) -> None:
+        """
+        Initialize InotifyWatcher.
+
+        Args:
+            journal: ChangeJournal receiving changed paths
+            roots: Configured dotfile paths (files or directories)
+        """
+        self.journal: ChangeJournal = journal
+        self.roots: tuple[Path, ...] = tuple(roots)
+        self._root_names: frozenset[str] = frozenset(map(os.fspath, self.roots))
+        self._fd: int = -1
+        # Watch descriptor -> (directory, names to report or None for all)
+        self._watches: dict[int, tuple[str, set[str] | None]] = {}
+        self._recursive_roots: set[str] = set()
+        self._stop_r: int = -1
+        self._stop_w: int = -1
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._stopping = threading.Event()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the reader thread is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether every configured root is watched."""
+        return self._ready.is_set() and self.is_running
+
+    def start(self) -> bool:
+        """
+        Start the reader thread, which adds the watches.
+
+        Returns immediately; walking large trees happens on the reader
+        thread. The journal is reset first: changes made before the watches
+        existed are unknown, so the next backup walks everything.
+
+        Returns:
+            True if the watcher is running
+        """
+        libc = _libc()
+        if libc is None or self.is_running:
+            return self.is_running
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            logger.warning("inotify_init1 failed: %s", os.strerror(ctypes.get_errno()))
+            return False
+        self._fd = fd
+        self.journal.reset()
+        self._ready.clear()
+        self._stopping.clear()
+
+        self._stop_r, self._stop_w = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run, name="dfbu-inotify", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop the reader thread and close the inotify instance."""
+        if self._thread is not None:
+            self._stopping.set()
+            os.write(self._stop_w, b"x")
+            self._thread.join()
+            self._thread = None
+        self._ready.clear()
+        for fd in (self._fd, self._stop_r, self._stop_w):
+            if fd >= 0:
+                os.close(fd)
+        self._fd = self._stop_r = self._stop_w = -1
+        self._watches.clear()
+        self._recursive_roots.clear()
+
+    def _add_watch(self, directory: str, name: str | None = None) -> None:
+        """
+        Watch one directory, recording its name filter.
+
+        Args:
+            directory: Directory to watch
+            name: Only report this entry name, or None to report every entry
+        """
+        libc = _libc()
+        if libc is None:
+            return
+        wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                # fs.inotify.max_user_watches reached: coverage is incomplete
+                logger.warning("inotify watch limit reached at %s", directory)
+                self.journal.mark_overflow()
+            return
+
+        # The same directory returns the same descriptor: merge the filters
+        _dir, names = self._watches.get(wd, (directory, set()))
+        if name is None or names is None:
+            self._watches[wd] = (directory, None)
+        else:
+            names.add(name)
+            self._watches[wd] = (directory, names)
+
+    def _add_tree(self, root: Path) -> None:
+        """
+        Watch a directory and all of its subdirectories.
+
+        Args:
+            root: Directory to watch recursively
+        """
+        self._add_watch(os.fspath(root))
+        for entry in walk_tree(root, include_dirs=True):
+            if self._stopping.is_set():
+                return
+            if entry.is_dir:
+                self._add_watch(os.fspath(entry.path))
+
+    def _add_roots(self) -> None:
+        """Initial watch pass over the configured roots (reader thread)."""
+        for root in self.roots:
+            if self._stopping.is_set():
+                return
+            if root.is_dir():
+                self._recursive_roots.add(os.fspath(root))
+                self._add_tree(root)
+            elif root.parent.is_dir():
+                self._add_watch(os.fspath(root.parent), root.name)
+        # Events queued meanwhile are read below; the kernel flags overflow
+        self._ready.set()
+        logger.info("Watching %d directories for changes", len(self._watches))
+
+    def _run(self) -> None:
+        """Reader thread loop."""
+        self._add_roots()
+        while True:
+            try:
+                readable, _w, _x = select.select([self._fd, self._stop_r], [], [])
+            except OSError:
+                break
+            if self._stop_r in readable:
+                break
+            try:
+                data = os.read(self._fd, _READ_BUFFER_SIZE)
+            except BlockingIOError:
+                continue
+            except OSError:
+                logger.exception("Reading inotify events failed")
+                self.journal.mark_overflow()
+                break
+            self._handle_events(data)
+
+    def _handle_events(self, data: bytes) -> None:
+        """
+        Decode a buffer of inotify events and journal the changed paths.
+
+        Args:
+            data: Raw bytes read from the inotify descriptor
+        """
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                logger.warning("inotify queue overflowed; next backup walks all")
+                self.journal.mark_overflow()
+                continue
+            watch = self._watches.get(wd)
+            if watch is None:
+                continue
+            directory, names = watch
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                if directory in self._recursive_roots:
+                    # A watched root went away: later changes would be missed
+                    self.journal.mark_overflow()
+                continue
+
+            # Events on the directory itself (e.g. chmod) change no file
+            if not raw_name:
+                continue
+            name = os.fsdecode(raw_name)
+            if names is not None and name not in names:
+                continue
+            path = f"{directory}{os.sep}{name}"
+            self.journal.append(path)
+
+            # New directories inside a recursive watch (or a root appearing)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                if path in self._root_names:
+                    self._recursive_roots.add(path)
+                    self._add_tree(Path(path))
+                elif names is None:
+                    self._add_tree(Path(path))
+
+
+# =============================================================================
+# QFileSystemWatcher Fallback
+# =============================================================================
+
+
+# Watchable entries of one directory: name -> (inode, is_dir)
+type DirListing = dict[str, tuple[int, bool]]
+
+
+class _RootScanner(QObject):
+    """Carries the paths collected off the GUI thread back to it."""
+
+    # (paths to watch, listing of every watched directory)
+    scanned = Signal(object)
+
+
+def _list_directory(directory: str) -> DirListing:
+    """
+    List the entries of one directory that QtChangeWatcher watches.
+
+    Subdirectories (not followed through symlinks) and files (including
+    symlinks to files) are listed; other entries are ignored.
+
+    Args:
+        directory: Directory path
+
+    Returns:
+        Listing by entry name, empty if the directory cannot be read
+    """
+    listing: DirListing = {}
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        listing[entry.name] = (entry.inode(), True)
+                    elif entry.is_file():
+                        listing[entry.name] = (entry.inode(), False)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return listing
+
+
+def _collect_tree(root: str, listings: dict[str, DirListing]) -> list[str]:
+    """
+    Collect a directory and everything below it, recording each listing.
+
+    Args:
+        root: Directory to collect
+        listings: Listing by directory path, updated in place
+
+    Returns:
+        root followed by every watchable path under it
+    """
+    paths = [root]
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        listing = _list_directory(directory)
+        listings[directory] = listing
+        for name, (_inode, is_dir) in listing.items():
+            path = f"{directory}{os.sep}{name}"
+            paths.append(path)
+            if is_dir:
+                stack.append(path)
+    return paths
+
+
+class QtChangeWatcher:
+    """
+    Feeds a ChangeJournal from QFileSystemWatcher signals.
+
+    Used where inotify is unavailable. QFileSystemWatcher reports the
+    directory whose entries changed rather than the entry itself, so
+    directory changes journal the whole directory. Must be created on the
+    GUI thread. The initial tree walk runs on a helper thread and the paths
+    are registered back on the GUI thread; until then the watcher is not
+    ready. Each watched directory's listing is kept, so a directory change
+    lists only that directory and walks only subdirectories that are new.
+
+    Attributes:
+        journal: ChangeJournal receiving changed paths
+        roots: Configured dotfile paths being watched
+
+    Public methods:
+        start: Start collecting the paths to register
+        stop: Remove all watched paths
+        is_running: Whether paths are being watched
+        is_ready: Whether the initial paths have been registered
+
+    Private methods:
+        _scan_roots: Collect the paths under every root (helper thread)
+        _on_roots_scanned: Register the collected paths (GUI thread)
+        _watch_new_entries: Watch entries created since a directory was listed
+        _forget_tree: Drop the listings of a removed directory
+        _on_file_changed: Journal a changed file
+        _on_directory_changed: Journal a changed directory and watch new entries
+    """
+
+    def __init__(self, journal: ChangeJournal, roots: Iterable[Path]) -> None:
+        """
+        Initialize QtChangeWatcher.
+
+        Args:
+            journal: ChangeJournal receiving changed paths
+            roots: Configured dotfile paths (files or directories)
+        """
+        self.journal: ChangeJournal = journal
+        self.roots: tuple[Path, ...] = tuple(roots)
+        self._watcher: QFileSystemWatcher | None = None
+        self._scanner: _RootScanner | None = None
+        self._ready: bool = False
+        self._listings: dict[str, DirListing] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """Whether paths are being watched."""
+        return self._watcher is not None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether every configured root is watched."""
+        return self._ready and self._watcher is not None
+
+    def start(self) -> bool:
+        """
+        Start collecting the paths to register with QFileSystemWatcher.
+
+        Returns immediately; the watcher becomes ready once the GUI event
+        loop delivers the collected paths.
+
+        Returns:
+            True if the watcher is running
+        """
+        if self._watcher is not None:
+            return True
+        self._watcher = QFileSystemWatcher()
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self.journal.reset()
+        self._ready = False
+
+        # Queued: the slot runs on the GUI thread the scanner was created on
+        self._scanner = _RootScanner()
+        self._scanner.scanned.connect(
+            self._on_roots_scanned, Qt.ConnectionType.QueuedConnection
+        )
+        threading.Thread(
+            target=self._scan_roots,
+            args=(self._scanner,),
+            name="dfbu-watch-scan",
+            daemon=True,
+        ).start()
+        return True
+
+    def stop(self) -> None:
+        """Remove all watched paths."""
+        if self._scanner is not None:
+            # A scan still running reports into a disconnected signal
+            self._scanner.scanned.disconnect(self._on_roots_scanned)
+            self._scanner = None
+        self._ready = False
+        self._listings = {}
+        if self._watcher is None:
+            return
+        self._watcher.fileChanged.disconnect(self._on_file_changed)
+        self._watcher.directoryChanged.disconnect(self._on_directory_changed)
+        self._watcher.deleteLater()
+        self._watcher = None
+
+    def _scan_roots(self, scanner: _RootScanner) -> None:
+        """
+        Collect the paths under every root (helper thread).
+
+        Args:
+            scanner: Signal carrier delivering the paths to the GUI thread
+        """
+        paths: list[str] = []
+        listings: dict[str, DirListing] = {}
+        for root in self.roots:
+            if root.is_dir():
+                paths.extend(_collect_tree(os.fspath(root), listings))
+            elif root.exists():
+                paths.append(os.fspath(root))
+        scanner.scanned.emit((paths, listings))
+
+    def _on_roots_scanned(self, scan: tuple[list[str], dict[str, DirListing]]) -> None:
+        """
+        Register the collected paths (GUI thread).
+
+        Args:
+            scan: Roots and everything below them, and each directory's listing
+        """
+        self._scanner = None
+        if self._watcher is None:
+            return
+        paths, self._listings = scan
+        if paths:
+            failed = self._watcher.addPaths(paths)
+            if failed:
+                logger.warning("Could not watch %d paths", len(failed))
+                self.journal.mark_overflow()
+        self._ready = True
+        logger.info("Watching %d paths for changes", len(paths))
+
+    def _watch_new_entries(self, directory: str) -> None:
+        """
+        Watch entries created since a directory was last listed.
+
+        Only the changed directory is listed. Entries whose inode changed
+        were replaced and are watched again; new subdirectories are walked.
+
+        Args:
+            directory: Directory reported as changed
+        """
+        if self._watcher is None:
+            return
+        previous = self._listings.get(directory)
+        listing = _list_directory(directory)
+        if not listing and not Path(directory).is_dir():
+            self._forget_tree(directory)
+            return
+        paths: list[str] = [] if previous is not None else [directory]
+        for name, (inode, is_dir) in listing.items():
+            known = previous.get(name) if previous is not None else None
+            if known == (inode, is_dir):
+                continue
+            path = f"{directory}{os.sep}{name}"
+            if known is not None and known[1]:
+                self._forget_tree(path)
+            if is_dir:
+                paths.extend(_collect_tree(path, self._listings))
+            else:
+                paths.append(path)
+        for name, (_inode, is_dir) in (previous or {}).items():
+            if is_dir and name not in listing:
+                self._forget_tree(f"{directory}{os.sep}{name}")
+        self._listings[directory] = listing
+        if not paths:
+            return
+        failed = self._watcher.addPaths(paths)
+        if failed:
+            # addPaths also reports paths that are already watched
+            watched = {*self._watcher.files(), *self._watcher.directories()}
+            missed = [path for path in failed if path not in watched]
+            if missed:
+                logger.warning(
+                    "Could not watch %d paths under %s", len(missed), directory
+                )
+                self.journal.mark_overflow()
+
+    def _forget_tree(self, directory: str) -> None:
+        """
+        Drop the listings of a removed directory and its subdirectories.
+
+        Args:
+            directory: Directory that no longer exists at its path
+        """
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            listing = self._listings.pop(current, None)
+            if listing is None:
+                continue
+            stack.extend(
+                f"{current}{os.sep}{name}"
+                for name, (_inode, is_dir) in listing.items()
+                if is_dir
+            )
+
+    def _on_file_changed(self, path: str) -> None:
+        """
+        Journal a changed file.
+
+        Args:
+            path: Path reported by QFileSystemWatcher
+        """
+        self.journal.append(path)
+        # Files replaced by rename drop out of the watch list
+        if self._watcher is not None and Path(path).exists():
+            self._watcher.addPath(path)
+
+    def _on_directory_changed(self, path: str) -> None:
+        """
+        Journal a changed directory and watch its new entries.
+
+        Args:
+            path: Directory reported by QFileSystemWatcher
+        """
+        self.journal.append(path)
+        self._watch_new_entries(path)
+
+
+# =============================================================================
+# Factory Function
+# =============================================================================
+
+
+def create_change_watcher(
+    journal: ChangeJournal, roots: Iterable[Path]
+) -> InotifyWatcher | QtChangeWatcher:
+    """
+    Create the best available watcher for a journal.
+
+    Args:
+        journal: ChangeJournal receiving changed paths
+        roots: Configured dotfile paths to watch
+
+    Returns:
+        InotifyWatcher on Linux, QtChangeWatcher otherwise
+    """
+    if inotify_available():
+        return InotifyWatcher(journal, roots)
+    return QtChangeWatcher(journal, roots)
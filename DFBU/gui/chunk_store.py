@@ -0,0 +1,604 @@
+"""
+DFBU ChunkStore - Content-Defined Chunking Deduplicating Archive Store
+
+Description:
+    Backing store for the "dedup" archive format. Files are split into
+    variable-size chunks at boundaries chosen by their content, so an
+    edit only changes the chunks around it. Each chunk is stored once,
+    zlib-compressed, under its SHA-256 in a chunk directory next to the
+    archives, and each archive is a small JSON manifest listing every
+    file's chunks. Storage and cloud upload volume grow with what changed,
+    not with the total size of the dotfiles.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - Content-defined chunking (2 KiB min, ~8 KiB average, 64 KiB max)
+    - Cut candidates found by a bytes-level scan, confirmed by a 64-byte
+      window checksum, so no Python code runs per byte
+    - Streaming chunker with bounded memory for large files
+    - Files chunked in parallel (hashlib and zlib release the GIL)
+    - Unchanged files (size and mtime) reuse the previous manifest's chunks
+    - Immutable chunk files named by SHA-256, written atomically
+    - Chunk hashes verified on every read
+    - Manifests as archives: path, size, mode, mtime_ns, and chunk list per file
+    - Garbage collection from reference counts over the surviving manifests
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: hashlib, zlib, json
+
+Classes:
+    - ManifestEntry: One file recorded in a manifest
+    - DedupManifest: File list of one deduplicated archive
+    - ChunkStore: Content-addressed store of compressed chunks
+
+Functions:
+    - iter_chunks: Split a binary stream into content-defined chunks
+    - extract_manifest_member: Restore one file from a deduplicated archive
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Final
+
+from gui.hash_cache import RACY_WINDOW_NS
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Chunk directory stored next to the manifests
+CHUNK_STORE_DIR: Final[str] = ".dfbu-chunks"
+
+MANIFEST_VERSION: Final[int] = 1
+
+# Content-defined chunk size bounds
+CHUNK_MIN_SIZE: Final[int] = 2 * 1024
+CHUNK_MAX_SIZE: Final[int] = 64 * 1024
+
+# Bytes of content deciding whether a position is a cut
+_HASH_WINDOW: Final[int] = 64
+
+# A candidate ends a run of 7 clear-bit bytes (1 in 2**8 positions), and
+# 1 in 2**5 candidates passes the window checksum: ~8 KiB past the minimum
+_CANDIDATE_RUN: Final[int] = 7
+_CUT_BITS: Final[int] = 5
+_CUT_THRESHOLD: Final[int] = 1 << (32 - _CUT_BITS)
+
+# Read size when streaming files through the chunker
+_READ_SIZE: Final[int] = 1024 * 1024
+
+# Fixed pseudo-random bit per byte value, derived from SHA-256 so chunk
+# boundaries never change between versions or platforms. NUL always has
+# its bit set, so zero-filled regions end in maximum-size chunks.
+_CANDIDATE_BITS: Final[bytes] = bytes(
+    1 if value == 0 else hashlib.sha256(bytes([value])).digest()[0] & 1
+    for value in range(256)
+)
+_CANDIDATE_PATTERN: Final[bytes] = b"\x01" + b"\x00" * _CANDIDATE_RUN
+
+
+# =============================================================================
+# Chunking Functions
+# =============================================================================
+
+
+def _cut_length(data: bytes, start: int, end: int) -> int:
+    """
+    Length of the next chunk starting at start.
+
+    Mapping each byte to its candidate bit with bytes.translate lets
+    bytes.find locate candidate cuts (the end of a run of clear bits) at C
+    speed; only candidates are checked in Python, against the CRC-32 of
+    the 64 bytes ending there. A cut depends only on those 64 bytes, so
+    boundaries resynchronize after an insertion or deletion.
+
+    Args:
+        data: Buffer holding the data
+        start: Offset of the chunk start
+        end: End of available data
+
+    Returns:
+        Chunk length in bytes
+    """
+    available = end - start
+    if available <= CHUNK_MIN_SIZE:
+        return available
+    limit = start + min(available, CHUNK_MAX_SIZE)
+    # The earliest pattern match puts its last byte on the minimum size
+    base = start + CHUNK_MIN_SIZE - _CANDIDATE_RUN
+    bits = data[base:limit].translate(_CANDIDATE_BITS)
+    found = bits.find(_CANDIDATE_PATTERN)
+    while found >= 0:
+        position = base + found + _CANDIDATE_RUN
+        window = data[position + 1 - _HASH_WINDOW : position + 1]
+        if zlib.crc32(window) < _CUT_THRESHOLD:
+            return position - start + 1
+        found = bits.find(_CANDIDATE_PATTERN, found + 1)
+    return limit - start
+
+
+def iter_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    """
+    Split a binary stream into content-defined chunks.
+
+    Args:
+        stream: Binary file object opened for reading
+
+    Yields:
+        Chunks of CHUNK_MIN_SIZE to CHUNK_MAX_SIZE bytes (the last may be
+        shorter); nothing for an empty stream
+    """
+    buffer = b""
+    position = 0
+    eof = False
+    while True:
+        # Keep a full maximum-size chunk available so cuts are stream-independent
+        if not eof and len(buffer) - position < CHUNK_MAX_SIZE:
+            data = stream.read(_READ_SIZE)
+            if data:
+                buffer = buffer[position:] + data
+                position = 0
+            else:
+                eof = True
+            continue
+        if position >= len(buffer):
+            return
+        length = _cut_length(buffer, position, len(buffer))
+        yield buffer[position : position + length]
+        position += length
+
+
+# =============================================================================
+# Manifest Classes
+# =============================================================================
+
+
+@dataclass(slots=True)
+class ManifestEntry:
+    """
+    One file recorded in a manifest.
+
+    Attributes:
+        path: Absolute path of the original file
+        size: File size in bytes
+        mode: Permission bits
+        mtime_ns: Modification time in nanoseconds
+        chunks: SHA-256 of each chunk, in file order
+    """
+
+    path: str
+    size: int
+    mode: int
+    mtime_ns: int
+    chunks: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DedupManifest:
+    """
+    File list of one deduplicated archive.
+
+    Attributes:
+        created: Creation time (seconds since the epoch)
+        entries: Recorded files by absolute path
+
+    Public methods:
+        load: Read a manifest file
+        save: Write the manifest atomically
+        add: Record one file
+        chunk_ids: Every chunk reference, with repeats
+        unchanged_chunks: Chunks of a file that has not changed since
+    """
+
+    created: float = field(default_factory=time.time)
+    entries: dict[str, ManifestEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> DedupManifest:
+        """
+        Read a manifest file.
+
+        Args:
+            path: Manifest file path
+
+        Returns:
+            Loaded manifest
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a supported manifest
+        """
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version in {path}")
+        try:
+            entries = [ManifestEntry(**entry) for entry in data["files"]]
+            return cls(
+                created=float(data["created"]),
+                entries={entry.path: entry for entry in entries},
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed manifest {path}: {e}") from e
+
+    def save(self, path: Path) -> None:
+        """
+        Write the manifest atomically.
+
+        Args:
+            path: Manifest file path
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        data = {
+            "version": MANIFEST_VERSION,
+            "created": self.created,
+            "files": [
+                {
+                    "path": entry.path,
+                    "size": entry.size,
+                    "mode": entry.mode,
+                    "mtime_ns": entry.mtime_ns,
+                    "chunks": entry.chunks,
+                }
+                for entry in self.entries.values()
+            ],
+        }
+        tmp_file = path.with_name(f"{path.name}.tmp")
+        tmp_file.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp_file.replace(path)
+
+    def add(self, entry: ManifestEntry) -> None:
+        """
+        Record one file.
+
+        Args:
+            entry: Manifest entry of the file
+        """
+        self.entries[entry.path] = entry
+
+    def chunk_ids(self) -> Iterator[str]:
+        """Every chunk reference, with repeats."""
+        for entry in self.entries.values():
+            yield from entry.chunks
+
+    def unchanged_chunks(self, path: str, st: os.stat_result) -> list[str] | None:
+        """
+        Chunks of a file that has not changed since this manifest.
+
+        Size and mtime must match, and the recorded mtime must be older than
+        the manifest by RACY_WINDOW_NS: a file written just before the
+        archive could change again without a visible mtime step.
+
+        Args:
+            path: Absolute path of the file
+            st: Current stat of the file
+
+        Returns:
+            Recorded chunk ids, or None if the file must be chunked again
+        """
+        entry = self.entries.get(path)
+        if (
+            entry is None
+            or entry.size != st.st_size
+            or entry.mtime_ns != st.st_mtime_ns
+            or entry.mtime_ns > int(self.created * 1e9) - RACY_WINDOW_NS
+        ):
+            return None
+        return entry.chunks
+
+
+# =============================================================================
+# ChunkStore Class
+# =============================================================================
+
+
+class ChunkStore:
+    """
+    Content-addressed store of compressed chunks.
+
+    Chunks live at <root>/<first two hex digits>/<sha256>, so no directory
+    grows too large. Chunk files are immutable: an existing chunk is never
+    rewritten, which keeps sync clients from re-uploading it. put and
+    store_file may run on several threads at once.
+
+    Attributes:
+        root: Chunk directory
+        level: zlib compression level for new chunks
+
+    Public methods:
+        chunk_path: File path of a chunk
+        put: Store a chunk unless it already exists
+        get: Read and verify a chunk
+        has_chunks: Whether every chunk is stored
+        store_file: Chunk and store one file
+        restore_file: Reassemble a file from its chunks
+        reference_counts: Count chunk references across manifests
+        collect_garbage: Delete chunks no surviving manifest references
+
+    Private methods:
+        _known_chunks: Lazily scanned set of stored chunk ids
+    """
+
+    def __init__(self, root: Path, level: int = 6) -> None:
+        """
+        Initialize ChunkStore.
+
+        Args:
+            root: Chunk directory (created on first write)
+            level: zlib compression level (clamped to 0-9)
+        """
+        self.root = root
+        self.level = max(0, min(level, 9))
+        self._known: set[str] | None = None
+        self._lock = threading.Lock()
+
+    def chunk_path(self, chunk_id: str) -> Path:
+        """
+        File path of a chunk.
+
+        Args:
+            chunk_id: SHA-256 hex digest of the chunk data
+
+        Returns:
+            Path of the chunk file
+        """
+        return self.root / chunk_id[:2] / chunk_id
+
+    def put(self, data: bytes) -> tuple[str, int]:
+        """
+        Store a chunk unless it already exists.
+
+        Args:
+            data: Uncompressed chunk data
+
+        Returns:
+            Tuple of (chunk id, compressed bytes written; 0 if deduplicated)
+
+        Raises:
+            OSError: If the chunk cannot be written
+        """
+        chunk_id = hashlib.sha256(data).hexdigest()
+        known = self._known_chunks()
+        with self._lock:
+            if chunk_id in known:
+                return chunk_id, 0
+
+        path = self.chunk_path(chunk_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zlib.compress(data, self.level)
+        # Unique temp name: two workers may store the same new chunk at once
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f"{chunk_id}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        with self._lock:
+            if chunk_id in known:
+                return chunk_id, 0
+            known.add(chunk_id)
+        return chunk_id, len(compressed)
+
+    def get(self, chunk_id: str) -> bytes:
+        """
+        Read and verify a chunk.
+
+        Args:
+            chunk_id: SHA-256 hex digest of the chunk data
+
+        Returns:
+            Uncompressed chunk data
+
+        Raises:
+            OSError: If the chunk is missing or unreadable
+            ValueError: If the chunk is corrupt
+        """
+        try:
+            data = zlib.decompress(self.chunk_path(chunk_id).read_bytes())
+        except zlib.error as e:
+            raise ValueError(f"Corrupt chunk {chunk_id}: {e}") from e
+        if hashlib.sha256(data).hexdigest() != chunk_id:
+            raise ValueError(f"Chunk {chunk_id} does not match its hash")
+        return data
+
+    def has_chunks(self, chunk_ids: Iterable[str]) -> bool:
+        """
+        Whether every chunk is stored.
+
+        Args:
+            chunk_ids: SHA-256 hex digests to look up
+
+        Returns:
+            True if no chunk is missing from the store
+        """
+        known = self._known_chunks()
+        with self._lock:
+            return all(chunk_id in known for chunk_id in chunk_ids)
+
+    def store_file(self, path: Path) -> tuple[list[str], int]:
+        """
+        Chunk and store one file.
+
+        Args:
+            path: File to store
+
+        Returns:
+            Tuple of (chunk ids in file order, compressed bytes newly written)
+
+        Raises:
+            OSError: If the file cannot be read or a chunk written
+        """
+        chunk_ids: list[str] = []
+        written = 0
+        with path.open("rb") as f:
+            for chunk in iter_chunks(f):
+                chunk_id, stored = self.put(chunk)
+                chunk_ids.append(chunk_id)
+                written += stored
+        return chunk_ids, written
+
+    def restore_file(self, entry: ManifestEntry, dest: Path) -> None:
+        """
+        Reassemble a file from its chunks.
+
+        The file is assembled beside dest and renamed over it only once
+        every chunk has been read, so a missing or corrupt chunk leaves an
+        existing file untouched.
+
+        Args:
+            entry: Manifest entry of the file
+            dest: Destination file path
+
+        Raises:
+            OSError: If a chunk is missing or the file cannot be written
+            ValueError: If a chunk is corrupt
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # A unique O_EXCL name never clobbers a restored or user <dest>.tmp
+        fd, tmp_name = tempfile.mkstemp(
+            dir=dest.parent, prefix=f".{dest.name}.", suffix=".dfbu-tmp"
+        )
+        tmp_file = Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk_id in entry.chunks:
+                    f.write(self.get(chunk_id))
+            tmp_file.chmod(entry.mode)
+            os.utime(tmp_file, ns=(entry.mtime_ns, entry.mtime_ns))
+            tmp_file.replace(dest)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def reference_counts(manifests: Iterable[Path]) -> Counter[str]:
+        """
+        Count chunk references across manifests.
+
+        Args:
+            manifests: Manifest files
+
+        Returns:
+            Number of references to each chunk id
+
+        Raises:
+            OSError: If a manifest cannot be read
+            ValueError: If a manifest is malformed
+        """
+        counts: Counter[str] = Counter()
+        for manifest in manifests:
+            counts.update(DedupManifest.load(manifest).chunk_ids())
+        return counts
+
+    def collect_garbage(self, manifests: Iterable[Path]) -> tuple[int, int]:
+        """
+        Delete chunks no surviving manifest references.
+
+        Nothing is deleted if any manifest cannot be read, since its chunks
+        would be indistinguishable from garbage.
+
+        Args:
+            manifests: Every manifest that is kept
+
+        Returns:
+            Tuple of (chunks deleted, bytes freed)
+        """
+        try:
+            counts = self.reference_counts(manifests)
+        except (OSError, ValueError) as e:
+            logger.warning("Skipping chunk garbage collection: %s", e)
+            return 0, 0
+
+        deleted = 0
+        freed = 0
+        for chunk_id in sorted(self._known_chunks()):
+            if counts[chunk_id] > 0:
+                continue
+            path = self.chunk_path(chunk_id)
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError as e:
+                logger.warning("Cannot delete chunk %s: %s", path, e)
+                continue
+            self._known_chunks().discard(chunk_id)
+            deleted += 1
+            freed += size
+        return deleted, freed
+
+    def _known_chunks(self) -> set[str]:
+        """Lazily scanned set of stored chunk ids."""
+        with self._lock:
+            if self._known is None:
+                known: set[str] = set()
+                try:
+                    for bucket in self.root.iterdir():
+                        if bucket.is_dir():
+                            known.update(
+                                path.name
+                                for path in bucket.iterdir()
+                                if not path.name.endswith(".tmp")
+                            )
+                except FileNotFoundError:
+                    pass
+                self._known = known
+            return self._known
+
+
+# =============================================================================
+# Restore Functions
+# =============================================================================
+
+
+def extract_manifest_member(manifest: Path, name: str | Path, dest_root: Path) -> Path:
+    """
+    Restore one file from a deduplicated archive.
+
+    Args:
+        manifest: Manifest file path (chunks are in its CHUNK_STORE_DIR sibling)
+        name: Original absolute path or member name of the file
+        dest_root: Directory the original path is recreated under
+
+    Returns:
+        Path of the restored file
+
+    Raises:
+        KeyError: If the manifest has no such file
+        ValueError: If the manifest or a chunk is corrupt
+        OSError: If a chunk is missing or the file cannot be written
+    """
+    member_name = str(name).lstrip("/")
+    entry = DedupManifest.load(manifest).entries[f"/{member_name}"]
+    restored = dest_root / member_name
+    ChunkStore(manifest.parent / CHUNK_STORE_DIR).restore_file(entry, restored)
+    return restored
@@ -10,7 +10,7 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 11-01-2025
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
@@ -41,6 +41,7 @@ from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Final
 
 
 # Local imports - import from parent DFBU directory
@@ -48,8 +49,38 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.common_types import DotFileDict, LegacyDotFileDict, OptionsDict, SettingsDict
 from core.yaml_config import YAMLConfigLoader
 
+from gui.copy_engine import DEFAULT_COPY_WORKERS
+from gui.delta_sync import DEFAULT_DELTA_THRESHOLD_MB
 from gui.input_validation import InputValidator
 from gui.restore_backup_manager import DEFAULT_BACKUP_DIR
+from gui.scan_snapshot import DEFAULT_SCAN_TTL_SECONDS
+from gui.verification_manager import DEFAULT_SAMPLE_PERCENT, DEFAULT_VERIFY_WORKERS
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Optional performance options filled from defaults when missing from settings.yaml
+PERFORMANCE_OPTION_KEYS: Final[tuple[str, ...]] = (
+    "copy_workers",
+    "mirror_index",
+    "hardlink_snapshots",
+    "delta_sync_threshold_mb",
+    "change_journal",
+    "incremental_archives",
+    "verify_workers",
+    "hash_cache",
+    "strict_compare",
+    "verify_sample_percent",
+    "verify_sample_budget_mb",
+    "merkle_tree",
+    "verify_failures_only",
+    "verify_results_file",
+    "scan_snapshot_ttl",
+    "size_cache",
+    "size_probe",
+)
 
 
 # =============================================================================
@@ -217,6 +248,12 @@ class ConfigManager:
             self.options = settings["options"]
             paths = settings["paths"]
 
+            # Older settings files predate the performance options (v1.3.0)
+            default_options = self._get_default_options()
+            for key in PERFORMANCE_OPTION_KEYS:
+                if key not in self.options:
+                    self.options[key] = default_options[key]  # type: ignore[literal-required]
+
             # Set base directories from settings
             self.mirror_base_dir = self.expand_path(paths["mirror_dir"])
             self.archive_base_dir = self.expand_path(paths["archive_dir"])
@@ -581,6 +618,40 @@ class ConfigManager:
                 self.options["verify_after_backup"] = bool(value)
             elif key == "hash_verification":
                 self.options["hash_verification"] = bool(value)
+            elif key == "copy_workers":
+                self.options["copy_workers"] = int(value)
+            elif key == "mirror_index":
+                self.options["mirror_index"] = bool(value)
+            elif key == "hardlink_snapshots":
+                self.options["hardlink_snapshots"] = bool(value)
+            elif key == "delta_sync_threshold_mb":
+                self.options["delta_sync_threshold_mb"] = int(value)
+            elif key == "change_journal":
+                self.options["change_journal"] = bool(value)
+            elif key == "incremental_archives":
+                self.options["incremental_archives"] = bool(value)
+            elif key == "verify_workers":
+                self.options["verify_workers"] = int(value)
+            elif key == "hash_cache":
+                self.options["hash_cache"] = bool(value)
+            elif key == "strict_compare":
+                self.options["strict_compare"] = bool(value)
+            elif key == "verify_sample_percent":
+                self.options["verify_sample_percent"] = int(value)
+            elif key == "verify_sample_budget_mb":
+                self.options["verify_sample_budget_mb"] = int(value)
+            elif key == "merkle_tree":
+                self.options["merkle_tree"] = bool(value)
+            elif key == "verify_failures_only":
+                self.options["verify_failures_only"] = bool(value)
+            elif key == "verify_results_file":
+                self.options["verify_results_file"] = bool(value)
+            elif key == "scan_snapshot_ttl":
+                self.options["scan_snapshot_ttl"] = int(value)
+            elif key == "size_cache":
+                self.options["size_cache"] = bool(value)
+            elif key == "size_probe":
+                self.options["size_probe"] = bool(value)
             return True
         return False
 
@@ -783,6 +854,23 @@ class ConfigManager:
             "size_warning_threshold_mb": 1000,
             "size_alert_threshold_mb": 5000,
             "size_critical_threshold_mb": 10000,
+            "copy_workers": DEFAULT_COPY_WORKERS,
+            "mirror_index": True,
+            "hardlink_snapshots": True,
+            "delta_sync_threshold_mb": DEFAULT_DELTA_THRESHOLD_MB,
+            "change_journal": False,
+            "incremental_archives": False,
+            "verify_workers": DEFAULT_VERIFY_WORKERS,
+            "hash_cache": True,
+            "strict_compare": False,
+            "verify_sample_percent": DEFAULT_SAMPLE_PERCENT,
+            "verify_sample_budget_mb": 0,
+            "merkle_tree": True,
+            "verify_failures_only": False,
+            "verify_results_file": False,
+            "scan_snapshot_ttl": DEFAULT_SCAN_TTL_SECONDS,
+            "size_cache": True,
+            "size_probe": False,
         }
 
     def _path_to_tilde_notation(self, path: Path) -> str:
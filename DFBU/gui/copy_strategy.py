@@ -0,0 +1,376 @@
+"""
+DFBU CopyStrategy - Kernel-Accelerated File Copy Layer
+
+Description:
+    Copies file data with the fastest mechanism the source and destination
+    filesystems support: a reflink clone (FICLONE ioctl) on btrfs/XFS, then
+    os.copy_file_range, then os.sendfile, and finally a buffered userspace
+    copy. The working strategy is detected once per (source device,
+    destination device) pair and cached for the rest of the session.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - Reflink clones share extents with the source (no data copied)
+    - In-kernel copy_file_range/sendfile avoid userspace buffers
+    - Per device-pair capability cache, safe for parallel copy workers
+    - Metadata (mode, timestamps, flags, xattrs) preserved like Path.copy()
+    - Hashing copy computing SHA-256/BLAKE2b of the bytes as they stream
+      through, so verification need not re-read the source
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: os, fcntl, errno, hashlib, shutil, threading
+
+Classes:
+    - KernelCopier: Copies files using the best cached strategy per device pair
+
+Functions:
+    None
+"""
+
+import errno
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Strategy names reported in backup statistics
+STRATEGY_REFLINK: Final[str] = "reflink"
+STRATEGY_COPY_FILE_RANGE: Final[str] = "copy_file_range"
+STRATEGY_SENDFILE: Final[str] = "sendfile"
+STRATEGY_USERSPACE: Final[str] = "userspace"
+STRATEGY_HASHED: Final[str] = "hashed"
+
+# Fastest first; the userspace copy always works and ends the chain
+STRATEGY_ORDER: Final[tuple[str, ...]] = (
+    STRATEGY_REFLINK,
+    STRATEGY_COPY_FILE_RANGE,
+    STRATEGY_SENDFILE,
+    STRATEGY_USERSPACE,
+)
+
+# FICLONE ioctl request number from <linux/fs.h> (_IOW(0x94, 9, int))
+FICLONE: Final[int] = 0x40049409
+
+# Bytes requested per copy_file_range/sendfile call
+KERNEL_COPY_CHUNK_SIZE: Final[int] = 64 * 1024 * 1024
+
+# Buffer size for the userspace fallback copy
+USERSPACE_BUFFER_SIZE: Final[int] = 1024 * 1024
+
+# Hash algorithms accepted by copy_hashed (hashlib names)
+COPY_HASH_ALGORITHMS: Final[tuple[str, ...]] = ("sha256", "blake2b")
+DEFAULT_COPY_HASH_ALGORITHM: Final[str] = "sha256"
+
+# errno values meaning "this mechanism is not available here", not "copy failed"
+_UNSUPPORTED_ERRNOS: Final[frozenset[int]] = frozenset(
+    {
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.ENOTTY,
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOSYS,
+        errno.EBADF,
+        errno.EPERM,
+    }
+)
+
+
+# =============================================================================
+# KernelCopier Class
+# =============================================================================
+
+
+class KernelCopier:
+    """
+    Copies files using the best cached strategy per device pair.
+
+    The first copy between two devices walks STRATEGY_ORDER until one
+    succeeds; later copies between the same devices start at that strategy.
+    A strategy only falls through to the next one when it fails before any
+    data was written, so real I/O errors are still raised.
+
+    Attributes:
+        None
+
+    Public methods:
+        copy: Copy file data and metadata, returning the strategy used
+        copy_hashed: Copy file data and metadata while hashing the data
+        cached_strategy: Get the cached strategy for a device pair
+
+    Private methods:
+        _copy_data: Try strategies in order on open file descriptors
+        _reflink: Clone the file with the FICLONE ioctl
+        _copy_file_range: Copy in-kernel with os.copy_file_range
+        _sendfile: Copy in-kernel with os.sendfile
+        _userspace: Copy through a userspace buffer
+        _pump: Move bytes between descriptors, optionally hashing them
+    """
+
+    def __init__(self) -> None:
+        """Initialize KernelCopier with an empty device-pair cache."""
+        self._pair_strategy: dict[tuple[int, int], int] = {}
+        self._lock = threading.Lock()
+        self._copiers: dict[str, Callable[[int, int, int], bool]] = {
+            STRATEGY_REFLINK: self._reflink,
+            STRATEGY_COPY_FILE_RANGE: self._copy_file_range,
+            STRATEGY_SENDFILE: self._sendfile,
+            STRATEGY_USERSPACE: self._userspace,
+        }
+
+    def copy(self, src_path: Path, dest_path: Path) -> str:
+        """
+        Copy file data and metadata, returning the strategy used.
+
+        Args:
+            src_path: Source file path (symlinks are followed)
+            dest_path: Destination file path (parent must exist)
+
+        Returns:
+            Name of the strategy that copied the data
+
+        Raises:
+            OSError: If the file could not be copied
+        """
+        # Unbuffered: only the raw file descriptors are used
+        with (
+            src_path.open("rb", buffering=0) as fsrc,
+            dest_path.open("wb", buffering=0) as fdst,
+        ):
+            strategy = self._copy_data(fsrc.fileno(), fdst.fileno())
+
+        # Same metadata Path.copy(preserve_metadata=True) keeps
+        shutil.copystat(src_path, dest_path)
+        return strategy
+
+    def copy_hashed(
+        self,
+        src_path: Path,
+        dest_path: Path,
+        algorithm: str = DEFAULT_COPY_HASH_ALGORITHM,
+    ) -> tuple[str, str]:
+        """
+        Copy file data and metadata while hashing the data.
+
+        The data passes through a userspace buffer once and is hashed on the
+        way, so verifying the copy only needs to hash the destination. Where
+        reflinks work the file is cloned instead and the source is hashed,
+        which still reads it only once.
+
+        Args:
+            src_path: Source file path (symlinks are followed)
+            dest_path: Destination file path (parent must exist)
+            algorithm: hashlib algorithm name (see COPY_HASH_ALGORITHMS)
+
+        Returns:
+            Tuple of (strategy name, hex digest of the copied data)
+
+        Raises:
+            OSError: If the file could not be copied
+            ValueError: If the algorithm is not supported
+        """
+        if algorithm not in COPY_HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported copy hash algorithm: {algorithm}")
+        digest = hashlib.new(algorithm)
+
+        with (
+            src_path.open("rb", buffering=0) as fsrc,
+            dest_path.open("wb", buffering=0) as fdst,
+        ):
+            src_fd, dest_fd = fsrc.fileno(), fdst.fileno()
+            key = (os.fstat(src_fd).st_dev, os.fstat(dest_fd).st_dev)
+            cloned = False
+            if self._pair_strategy.get(key, 0) == 0:
+                cloned = self._reflink(src_fd, dest_fd, 0)
+                with self._lock:
+                    self._pair_strategy[key] = 0 if cloned else 1
+            # A clone shares the source's extents, so hashing the source covers it
+            self._pump(src_fd, None if cloned else dest_fd, digest.update)
+
+        shutil.copystat(src_path, dest_path)
+        return (STRATEGY_REFLINK if cloned else STRATEGY_HASHED), digest.hexdigest()
+
+    def cached_strategy(self, src_dev: int, dest_dev: int) -> str | None:
+        """
+        Get the cached strategy for a device pair.
+
+        Args:
+            src_dev: Source st_dev
+            dest_dev: Destination st_dev
+
+        Returns:
+            Strategy name, or None if the pair has not been probed yet
+        """
+        idx = self._pair_strategy.get((src_dev, dest_dev))
+        return None if idx is None else STRATEGY_ORDER[idx]
+
+    def _copy_data(self, src_fd: int, dest_fd: int) -> str:
+        """
+        Try strategies in order on open file descriptors.
+
+        Args:
+            src_fd: Source file descriptor opened for reading
+            dest_fd: Destination file descriptor opened for writing
+
+        Returns:
+            Name of the strategy that copied the data
+
+        Raises:
+            OSError: If copying failed for a reason other than lack of support
+        """
+        src_stat = os.fstat(src_fd)
+        key = (src_stat.st_dev, os.fstat(dest_fd).st_dev)
+        start = self._pair_strategy.get(key, 0)
+
+        for idx in range(start, len(STRATEGY_ORDER)):
+            name = STRATEGY_ORDER[idx]
+            if self._copiers[name](src_fd, dest_fd, src_stat.st_size):
+                if idx != start or key not in self._pair_strategy:
+                    with self._lock:
+                        self._pair_strategy[key] = idx
+                    logger.debug("Copy strategy for devices %s: %s", key, name)
+                return name
+
+        # Unreachable: the userspace copy never reports "unsupported"
+        raise OSError(errno.EIO, "No copy strategy succeeded")
+
+    def _reflink(self, src_fd: int, dest_fd: int, size: int) -> bool:
+        """
+        Clone the file with the FICLONE ioctl.
+
+        Args:
+            src_fd: Source file descriptor
+            dest_fd: Destination file descriptor
+            size: Source size in bytes (unused, clones are all-or-nothing)
+
+        Returns:
+            True if cloned, False if reflinks are unsupported
+        """
+        try:
+            fcntl.ioctl(dest_fd, FICLONE, src_fd)
+        except OSError as e:
+            if e.errno in _UNSUPPORTED_ERRNOS:
+                return False
+            raise
+        return True
+
+    def _copy_file_range(self, src_fd: int, dest_fd: int, size: int) -> bool:
+        """
+        Copy in-kernel with os.copy_file_range.
+
+        Args:
+            src_fd: Source file descriptor
+            dest_fd: Destination file descriptor
+            size: Source size in bytes
+
+        Returns:
+            True if copied, False if copy_file_range is unsupported
+        """
+        if not hasattr(os, "copy_file_range"):
+            return False
+
+        copied = 0
+        while True:
+            try:
+                sent = os.copy_file_range(src_fd, dest_fd, KERNEL_COPY_CHUNK_SIZE)
+            except OSError as e:
+                if copied == 0 and e.errno in _UNSUPPORTED_ERRNOS:
+                    return False
+                raise
+            if sent == 0:
+                break
+            copied += sent
+
+        # Some filesystems report success while copying nothing
+        return copied > 0 or size == 0
+
+    def _sendfile(self, src_fd: int, dest_fd: int, size: int) -> bool:
+        """
+        Copy in-kernel with os.sendfile.
+
+        Args:
+            src_fd: Source file descriptor
+            dest_fd: Destination file descriptor
+            size: Source size in bytes
+
+        Returns:
+            True if copied, False if sendfile is unsupported
+        """
+        offset = 0
+        while True:
+            try:
+                sent = os.sendfile(dest_fd, src_fd, offset, KERNEL_COPY_CHUNK_SIZE)
+            except OSError as e:
+                if offset == 0 and e.errno in _UNSUPPORTED_ERRNOS:
+                    return False
+                raise
+            if sent == 0:
+                break
+            offset += sent
+
+        return offset > 0 or size == 0
+
+    def _userspace(self, src_fd: int, dest_fd: int, size: int) -> bool:
+        """
+        Copy through a userspace buffer.
+
+        Args:
+            src_fd: Source file descriptor
+            dest_fd: Destination file descriptor
+            size: Source size in bytes (unused)
+
+        Returns:
+            Always True (errors are raised)
+        """
+        # Earlier strategies wrote nothing, but rewind to be safe
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dest_fd, 0, os.SEEK_SET)
+        os.ftruncate(dest_fd, 0)
+        self._pump(src_fd, dest_fd)
+        return True
+
+    @staticmethod
+    def _pump(
+        src_fd: int,
+        dest_fd: int | None,
+        update: Callable[[bytes], object] | None = None,
+    ) -> None:
+        """
+        Move bytes between descriptors, optionally hashing them.
+
+        Args:
+            src_fd: Source file descriptor, read to EOF
+            dest_fd: Destination file descriptor, or None to only hash
+            update: Hash update function called with every chunk read
+        """
+        while chunk := os.read(src_fd, USERSPACE_BUFFER_SIZE):
+            if update is not None:
+                update(chunk)
+            if dest_fd is None:
+                continue
+            view = memoryview(chunk)
+            while view:
+                written = os.write(dest_fd, view)
+                view = view[written:]
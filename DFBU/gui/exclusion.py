@@ -0,0 +1,325 @@
+"""
+DFBU Exclusion - Compiled gitignore-Style Exclusion Matcher
+
+Description:
+    Compiles every .dfbuignore pattern into one regular expression so a path
+    is tested against the whole pattern list in a single match instead of a
+    per-pattern fnmatch loop. Directory tests are cheap enough to run for
+    every directory the walker meets, which lets excluded trees such as
+    ~/.config/*/Cache or node_modules be pruned before they are traversed.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - gitignore semantics: *, ?, [...], ** at any position, trailing / for
+      directory-only patterns, leading or middle / for anchored patterns
+    - ! negation with last-match-wins ordering, like git
+    - ~/ expands to the user's home directory
+    - One compiled regex for directories and one for files
+    - Ancestor check so a path inside an excluded directory is excluded
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: os, re, functools, pathlib
+
+Classes:
+    - ExclusionMatcher: Compiled matcher for a list of gitignore-style patterns
+
+Functions:
+    - compile_exclusions: Return a cached ExclusionMatcher for a pattern tuple
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import Final
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Name of the exclusion file looked up in the configuration directory
+IGNORE_FILE_NAME: Final[str] = ".dfbuignore"
+
+# Regex for a ** segment that is followed by more segments ("**/" in a pattern)
+_ANY_DIRS: Final[str] = "(?:.*/)?"
+
+
+# =============================================================================
+# Pattern Translation
+# =============================================================================
+
+
+def _translate_segment(segment: str) -> str:
+    """
+    Translate one glob path segment into a regex fragment.
+
+    Args:
+        segment: Pattern segment without slashes (never "**")
+
+    Returns:
+        Regex fragment matching the segment within a single path component
+    """
+    parts: list[str] = []
+    i, n = 0, len(segment)
+    while i < n:
+        char = segment[i]
+        i += 1
+        if char == "*":
+            # Consecutive stars inside a segment behave like a single star
+            while i < n and segment[i] == "*":
+                i += 1
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "\\" and i < n:
+            parts.append(re.escape(segment[i]))
+            i += 1
+        elif char == "[":
+            end = i
+            if end < n and segment[end] in "!^":
+                end += 1
+            if end < n and segment[end] == "]":
+                end += 1
+            end = segment.find("]", end)
+            if end == -1:
+                # Unterminated class is a literal bracket, as in fnmatch
+                parts.append(re.escape(char))
+                continue
+            body = segment[i:end].replace("\\", "\\\\")
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+def _translate_pattern(raw: str) -> tuple[str, bool, bool] | None:
+    """
+    Translate one gitignore-style pattern into a regex.
+
+    Paths are matched as absolute paths with the leading slash removed.
+    A pattern without a slash (other than a trailing one) matches the name
+    at any depth; any other pattern is anchored to the filesystem root.
+
+    Args:
+        raw: Pattern line from .dfbuignore
+
+    Returns:
+        Tuple of (regex, negated, dir_only), or None for an empty pattern
+    """
+    pattern = raw.strip()
+    negated = pattern.startswith("!")
+    # Drop the ! marker, or the backslash escaping a literal leading ! or #
+    if negated or pattern.startswith(("\\!", "\\#")):
+        pattern = pattern[1:]
+
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if pattern == "~" or pattern.startswith("~/"):
+        pattern = Path.home().as_posix() + pattern[1:]
+    if not pattern:
+        return None
+
+    anchored = "/" in pattern
+    segments = pattern.lstrip("/").split("/")
+    regex = "" if anchored else _ANY_DIRS
+    last = len(segments) - 1
+
+    for index, segment in enumerate(segments):
+        if segment == "**":
+            # Trailing ** matches everything inside; elsewhere zero or more dirs
+            regex += ".*" if index == last else _ANY_DIRS
+        else:
+            regex += _translate_segment(segment)
+            if index != last:
+                regex += "/"
+
+    return regex, negated, dir_only
+
+
+def _compile_alternation(
+    rules: list[tuple[str, bool, bool]],
+) -> tuple[re.Pattern[str] | None, tuple[bool, ...]]:
+    """
+    Combine translated rules into one regex with one group per rule.
+
+    Rules are joined in reverse order so the first alternative that matches
+    is the last matching pattern in the file, which is the one git uses.
+
+    Args:
+        rules: Translated (regex, negated, dir_only) tuples in file order
+
+    Returns:
+        Tuple of (compiled regex or None if no rules, negated flag per group)
+    """
+    if not rules:
+        return None, ()
+    ordered = rules[::-1]
+    regex = re.compile("|".join(f"({rule[0]})" for rule in ordered), re.DOTALL)
+    return regex, tuple(rule[1] for rule in ordered)
+
+
+# =============================================================================
+# ExclusionMatcher Class
+# =============================================================================
+
+
+class ExclusionMatcher:
+    """
+    Compiled matcher for a list of gitignore-style exclusion patterns.
+
+    Attributes:
+        patterns: Pattern lines the matcher was built from
+
+    Public methods:
+        matches: Check a single path against the patterns
+        is_excluded: Check a path and all of its parent directories
+        from_file: Build a matcher from a .dfbuignore file
+
+    Private methods:
+        _search: Run one compiled regex and apply negation
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()) -> None:
+        """
+        Initialize ExclusionMatcher.
+
+        Args:
+            patterns: gitignore-style pattern lines (blank lines and comments
+                are ignored)
+        """
+        self.patterns: tuple[str, ...] = tuple(
+            line.strip()
+            for line in patterns
+            if line.strip() and not line.strip().startswith("#")
+        )
+        rules = [
+            rule
+            for rule in (_translate_pattern(line) for line in self.patterns)
+            if rule is not None
+        ]
+
+        # Directories match every rule; files skip directory-only rules
+        self._dir_regex, self._dir_negated = _compile_alternation(rules)
+        self._file_regex, self._file_negated = _compile_alternation(
+            [rule for rule in rules if not rule[2]]
+        )
+
+    def __bool__(self) -> bool:
+        """Return True if the matcher can exclude anything."""
+        return self._dir_regex is not None
+
+    def __repr__(self) -> str:
+        """Return a debug representation listing the patterns."""
+        return f"ExclusionMatcher({list(self.patterns)!r})"
+
+    @classmethod
+    def from_file(cls, ignore_file: Path) -> ExclusionMatcher:
+        """
+        Build a matcher from a .dfbuignore file.
+
+        Args:
+            ignore_file: Path to the exclusion file
+
+        Returns:
+            ExclusionMatcher for the file's patterns (empty if unreadable)
+        """
+        try:
+            return cls(ignore_file.read_text(encoding="utf-8").splitlines())
+        except OSError:
+            return cls()
+
+    def matches(self, path: str | os.PathLike[str], is_dir: bool) -> bool:
+        """
+        Check a single path against the patterns.
+
+        Parent directories are not considered; the tree walker calls this
+        for each directory before descending, so excluded trees are pruned
+        and never reach their children.
+
+        Args:
+            path: Absolute path to check
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path is excluded, False otherwise
+        """
+        relative = os.fspath(path).lstrip("/")
+        if is_dir:
+            return self._search(self._dir_regex, self._dir_negated, relative)
+        return self._search(self._file_regex, self._file_negated, relative)
+
+    def is_excluded(self, path: str | os.PathLike[str], is_dir: bool = False) -> bool:
+        """
+        Check a path and all of its parent directories.
+
+        A path inside an excluded directory is excluded even if a later
+        negation pattern matches it, as in git.
+
+        Args:
+            path: Absolute path to check
+            is_dir: Whether the path itself is a directory
+
+        Returns:
+            True if the path or any parent directory is excluded
+        """
+        if self._dir_regex is None:
+            return False
+        relative = os.fspath(path).strip("/")
+        position = relative.find("/")
+        while position != -1:
+            if self._search(self._dir_regex, self._dir_negated, relative[:position]):
+                return True
+            position = relative.find("/", position + 1)
+        return self.matches(relative, is_dir)
+
+    @staticmethod
+    def _search(
+        regex: re.Pattern[str] | None, negated: tuple[bool, ...], relative: str
+    ) -> bool:
+        """
+        Run one compiled regex and apply negation.
+
+        Args:
+            regex: Compiled alternation or None if there are no rules
+            negated: Negation flag per capture group
+            relative: Path with the leading slash removed
+
+        Returns:
+            True if the last matching pattern excludes the path
+        """
+        if regex is None:
+            return False
+        match = regex.fullmatch(relative)
+        # Every alternative is a capture group, so a match always sets lastindex
+        if match is None or match.lastindex is None:
+            return False
+        return not negated[match.lastindex - 1]
+
+
+@lru_cache(maxsize=32)
+def compile_exclusions(patterns: tuple[str, ...]) -> ExclusionMatcher:
+    """
+    Return a cached ExclusionMatcher for a pattern tuple.
+
+    Args:
+        patterns: gitignore-style pattern lines
+
+    Returns:
+        Compiled matcher, shared between callers with the same patterns
+    """
+    return ExclusionMatcher(patterns)
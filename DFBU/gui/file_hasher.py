@@ -0,0 +1,242 @@
+"""
+DFBU FileHasher - Buffer-Pooled and Memory-Mapped File Hashing
+
+Description:
+    Hashes file contents with as few interpreter round-trips as possible.
+    Files at or above MMAP_HASH_THRESHOLD are memory-mapped and fed to
+    hashlib in large slices, so a multi-GB file costs a few hundred
+    update() calls and no copies into Python bytes objects. Smaller files
+    are read with readinto() into buffers taken from a shared pool, so
+    parallel verification workers reuse a handful of allocations instead
+    of creating a new bytes object per 64 KB chunk.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - mmap path with MADV_SEQUENTIAL read-ahead above a size threshold
+    - Thread-safe pool of reusable readinto() buffers for smaller files,
+      read through unbuffered file objects (no intermediate copy)
+    - Falls back to the buffered path when a file cannot be mapped
+    - Mapping is opt-in per call: files another program may truncate while
+      they are hashed (sources) must not be mapped, since touching a page
+      past the new end of file raises SIGBUS
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: hashlib, mmap, threading, io
+
+Classes:
+    - BufferPool: Bounded pool of reusable read buffers
+
+Functions:
+    - digest_open_file: Hex digest of an open file from its current position
+    - file_digest: Hex digest of a file
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import threading
+from io import BufferedIOBase, RawIOBase
+from pathlib import Path
+from typing import Final
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Files at least this large are hashed through a memory mapping
+MMAP_HASH_THRESHOLD: Final[int] = 64 * 1024 * 1024
+
+# Bytes passed to hashlib per update() call on a mapping
+MMAP_HASH_SLICE: Final[int] = 16 * 1024 * 1024
+
+# Size of each pooled read buffer (hashlib releases the GIL on large updates)
+HASH_BUFFER_SIZE: Final[int] = 1024 * 1024
+
+# Idle buffers kept for reuse; more are allocated when workers need them
+HASH_BUFFER_POOL_SIZE: Final[int] = 8
+
+
+# =============================================================================
+# BufferPool Class
+# =============================================================================
+
+
+class BufferPool:
+    """
+    Bounded pool of reusable read buffers.
+
+    Buffers are handed out one per concurrent reader. At most max_idle
+    buffers are kept after release, so memory stays bounded even after a
+    burst of parallel hashing.
+
+    Attributes:
+        buffer_size: Size of each buffer in bytes
+        max_idle: Number of released buffers kept for reuse
+
+    Public methods:
+        acquire: Borrow a buffer
+        release: Return a borrowed buffer to the pool
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = HASH_BUFFER_SIZE,
+        max_idle: int = HASH_BUFFER_POOL_SIZE,
+    ) -> None:
+        """
+        Initialize BufferPool.
+
+        Args:
+            buffer_size: Size of each buffer in bytes
+            max_idle: Number of released buffers kept for reuse
+        """
+        self.buffer_size: int = buffer_size
+        self.max_idle: int = max_idle
+        self._idle: list[memoryview] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> memoryview:
+        """
+        Borrow a buffer; pair every call with release() in a finally block.
+
+        Plain methods rather than a context manager keep the per-file cost
+        low when thousands of small files are hashed.
+
+        Returns:
+            Writable memoryview over a buffer of buffer_size bytes
+        """
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return memoryview(bytearray(self.buffer_size))
+
+    def release(self, view: memoryview) -> None:
+        """
+        Return a borrowed buffer to the pool.
+
+        Args:
+            view: Buffer obtained from acquire()
+        """
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(view)
+
+
+# Shared by every hashing caller in the process
+_BUFFER_POOL: Final[BufferPool] = BufferPool()
+
+
+# =============================================================================
+# Hashing Functions
+# =============================================================================
+
+
+def digest_open_file(
+    f: RawIOBase | BufferedIOBase,
+    algorithm: str = "sha256",
+    size: int | None = None,
+    *,
+    allow_mmap: bool = False,
+) -> str:
+    """
+    Hex digest of an open file from its current position.
+
+    Args:
+        f: File opened in binary mode, positioned at the start; unbuffered
+            files (buffering=0) avoid a copy through the read buffer
+        algorithm: hashlib algorithm name (default: SHA-256)
+        size: File size if already known from a stat (saves an fstat)
+        allow_mmap: Map files at or above MMAP_HASH_THRESHOLD; only safe for
+            files no other program truncates while they are hashed
+
+    Returns:
+        Hex digest of the remaining file contents
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the algorithm is unknown
+    """
+    if allow_mmap and f.tell() == 0:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_HASH_THRESHOLD:
+            digest = _mapped_digest(f, algorithm)
+            if digest is not None:
+                return digest
+
+    file_hash = hashlib.new(algorithm)
+    view = _BUFFER_POOL.acquire()
+    try:
+        while count := f.readinto(view):
+            file_hash.update(view[:count])
+    finally:
+        _BUFFER_POOL.release(view)
+    return file_hash.hexdigest()
+
+
+def file_digest(
+    file_path: Path, algorithm: str = "sha256", *, allow_mmap: bool = False
+) -> str:
+    """
+    Hex digest of a file.
+
+    Args:
+        file_path: File to hash
+        algorithm: hashlib algorithm name (default: SHA-256)
+        allow_mmap: Map large files (see digest_open_file)
+
+    Returns:
+        Hex digest of the file
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the algorithm is unknown
+    """
+    with file_path.open("rb", buffering=0) as f:
+        return digest_open_file(f, algorithm, allow_mmap=allow_mmap)
+
+
+def _mapped_digest(f: RawIOBase | BufferedIOBase, algorithm: str) -> str | None:
+    """
+    Hex digest of a whole file read through a read-only mapping.
+
+    Args:
+        f: File opened in binary mode
+        algorithm: hashlib algorithm name
+
+    Returns:
+        Hex digest, or None if the file cannot be mapped (e.g., special
+        files or filesystems without mmap support)
+
+    Raises:
+        ValueError: If the algorithm is unknown
+    """
+    file_hash = hashlib.new(algorithm)
+    try:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        logger.debug("Cannot map file, hashing with reads: %s", e)
+        return None
+
+    with mapping:
+        if hasattr(mapping, "madvise"):
+            mapping.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mapping) as view:
+            for offset in range(0, len(view), MMAP_HASH_SLICE):
+                with view[offset : offset + MMAP_HASH_SLICE] as chunk:
+                    file_hash.update(chunk)
+    return file_hash.hexdigest()
@@ -11,21 +11,32 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 11-01-2025
-Date Changed: 11-01-2025
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
     - Path expansion and validation
     - File identity comparison using metadata
     - File and directory copying with metadata preservation
-    - Archive creation and rotation (TAR.GZ format)
+    - Parallel directory copying on a bounded worker pool
+    - Single-pass scandir traversal with cached stat results
+    - Shared scan snapshot reused by size, preview, validation, and copy
+    - Persistent mirror index for skip-unchanged without destination stats
+    - Merkle tree of directory digests stored with the mirror
+    - Kernel-accelerated copies (reflink, copy_file_range, sendfile)
+    - Hardlink snapshots for dated mirrors (rsync --link-dest style)
+    - Block-level delta updates for large changed files
+    - Hash-while-copy digests so verification reads only the backup
+    - Archive creation and rotation (gzip, xz, bz2, or zstd compressed tar)
+    - Seekable archive index sidecars for single-file restore
+    - Deduplicating chunk-store archives with reference-counted cleanup
     - Restore file discovery and path reconstruction
-    - Size calculation for files and directories
+    - Parallel du-style size calculation (apparent and allocated, hardlinks once)
     - Clean separation from configuration and business logic
 
 Requirements:
     - Linux environment
-    - Python 3.14+ for Path.copy() with metadata preservation
+    - Python 3.14+ for latest language features
     - Standard library: pathlib, os, shutil, tarfile, time
     - No external dependencies
 
@@ -38,15 +49,70 @@ Functions:
     - get_backup_files: Find all backup files for a source file
 """
 
+import filecmp
 import logging
 import os
+import re
 import shutil
+import stat
 import tarfile
 import time
+from collections.abc import Iterator
+from contextlib import suppress
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Final
 
+from gui.archive_compression import (
+    ARCHIVE_SUFFIXES,
+    DEDUP_ARCHIVE_FORMAT,
+    DEFAULT_ARCHIVE_FORMAT,
+    DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_COMPRESSION_WORKERS,
+    archive_suffix,
+    open_archive_writer,
+    resolve_archive_format,
+)
+from gui.archive_index import ArchiveIndex, extract_member, index_path
+from gui.archive_snapshot import (
+    ARCHIVE_TYPE_FULL,
+    ARCHIVE_TYPE_INCREMENTAL,
+    INCREMENTAL_MARKER,
+    SNAPSHOT_STATE_NAME,
+    ArchiveSnapshot,
+    FileSignature,
+    SnapshotDelta,
+    file_signature,
+    group_archive_chains,
+    is_incremental_archive,
+    read_archive_metadata,
+)
+from gui.chunk_store import (
+    CHUNK_STORE_DIR,
+    ChunkStore,
+    DedupManifest,
+    ManifestEntry,
+    extract_manifest_member,
+)
+from gui.copy_engine import DEFAULT_COPY_WORKERS, CopyEngine
+from gui.copy_strategy import DEFAULT_COPY_HASH_ALGORITHM, KernelCopier
+from gui.delta_sync import DEFAULT_DELTA_THRESHOLD_MB, delta_update
+from gui.exclusion import ExclusionMatcher
+from gui.fs_walker import (
+    ExcludeFunc,
+    WalkEntry,
+    stat_is_readable,
+    walk_files,
+    walk_tree,
+)
+from gui.hash_cache import HashCache
+from gui.merkle_tree import MERKLE_FILENAME, MERKLE_HASH_ALGORITHM, MerkleTree
+from gui.mirror_index import INDEX_FILENAME, MirrorIndex
+from gui.scan_snapshot import ScanCache, ScanRoot, ScanSnapshot
+from gui.size_cache import DirSizeCache
+from gui.size_calculator import DiskUsage, disk_usage
+from gui.statistics_tracker import StatisticsTracker
+
 
 # Setup logger for this module
 logger = logging.getLogger(__name__)
@@ -67,6 +133,18 @@ ARCHIVE_TIMESTAMP_FORMAT: Final[str] = (
     "%Y-%m-%d_%H-%M-%S"  # ISO 8601 compatible timestamp for archives
 )
 
+# Directory names produced by DATE_FORMAT, used to find previous snapshots
+SNAPSHOT_DIR_PATTERN: Final[re.Pattern[str]] = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Copy strategy name reported for files hard-linked from a previous snapshot
+STRATEGY_HARDLINK: Final[str] = "hardlink"
+
+# Copy strategy name reported for files updated block-by-block in place
+STRATEGY_DELTA: Final[str] = "delta"
+
+# Archives per incremental chain when max_archives is not applied
+DEFAULT_INCREMENTAL_CHAIN_LIMIT: Final[int] = 5
+
 
 # =============================================================================
 # Utility Functions for Backup Operations
@@ -226,34 +304,128 @@ class FileOperations:
 
     Attributes:
         hostname: System hostname for path assembly and restore operations
+        copy_workers: Number of worker threads used by copy_directory and
+            calculate_disk_usage
+        mirror_index: Mirror manifest consulted during a backup, or None
+        delta_threshold: Minimum file size in bytes for delta updates (0 disables)
+        exclusions: Compiled .dfbuignore patterns pruned from every walk
+        archive_format: Archive format option (tar.gz, tar.xz, tar.bz2, tar.zst, dedup)
+        compression_level: Archive compression level (0-9)
+        compression_workers: Threads used for block-parallel archive compression
+        incremental_archives: Whether archives hold only changes since the last one
+        incremental_chain_limit: Archives per chain before a new full archive
+        hash_while_copy: Whether copies record a digest of the copied bytes
+        copy_hash_algorithm: hashlib algorithm for hash-while-copy digests
+        strict_compare: Whether files_are_identical also compares contents
+        hash_cache: Persistent digest cache used by strict comparison, or None
+        scan_cache: Scan snapshot shared by the walks of one operation
+        size_cache: Persistent per-directory size cache, or None
 
     Public methods:
         expand_path: Expand user home directory in path string
         check_readable: Check if path has read permissions
         create_directory: Create directory with proper permissions
-        files_are_identical: Compare files using metadata (size + mtime)
+        files_are_identical: Compare files using metadata (size + mtime), and
+            contents in strict mode
+        stats_are_identical: Compare two stat results (size + mtime)
         copy_file: Copy single file with metadata preservation
         copy_directory: Copy directory recursively
         calculate_path_size: Calculate total size of file or directory
+        calculate_disk_usage: Calculate apparent and allocated size (du-style)
         assemble_dest_path: Build destination path from source and options
-        create_archive: Create compressed TAR.GZ archive
+        create_archive: Create compressed tar archive
         rotate_archives: Delete oldest archives exceeding limit
+        restore_archive_member: Restore one file from an archive via its index
         discover_restore_files: Find all files in restore source
         reconstruct_restore_paths: Build original paths from backup structure
         is_relative_to_home: Check if path is under home directory
+        is_excluded: Check a path against the exclusion patterns
+        scan_paths: Walk dotfile paths once into a shared scan snapshot
+        current_scan: Get the scan snapshot if it is still fresh
+        scanned: Get the fresh scan of a dotfile path
+        pop_copy_digest: Take the digest recorded when a file was copied
+        clear_copy_digests: Forget all recorded copy digests
+        open_mirror_index: Load the mirror index for a backup run
+        close_mirror_index: Save and detach the mirror index
+        rebuild_mirror_index: Rebuild the mirror index from mirror contents
+        load_merkle_tree: Load the Merkle tree stored with the mirror
+        update_merkle_tree: Record backed-up files in the mirror's Merkle tree
+        open_snapshot_link: Link unchanged files from the previous dated snapshot
+        close_snapshot_link: Stop linking from the previous snapshot
 
     Private methods:
-        None
+        _exclude_func: Walker predicate for an exclusion matcher
+        _exclude_member: tarfile filter dropping excluded archive members
+        _archive_signatures: Collect change signatures of files to archive
+        _can_extend_chain: Check whether the next archive can be incremental
+        _chain_parent: Find the archive an incremental defers a member to
+        _forget_signatures: Drop signatures of a path that failed to archive
+        _advance_snapshot: Record a new archive in the incremental snapshot
+        _create_dedup_archive: Store files in the chunk store and write a manifest
+        _latest_manifest: Load the newest dedup manifest in an archive directory
+        _collect_chunks: Delete chunks no remaining manifest references
+        _copy_tree_file: Copy one file found during a directory copy
+        _mirror_root: Host-level mirror directory (index and snapshot root)
+        _link_from_snapshot: Hard-link an unchanged file from the previous snapshot
+        _find_previous_snapshot: Locate the newest dated snapshot before today
+        _copy_with_metadata: Copy file data and metadata via KernelCopier
+        _try_delta_update: Update a large existing destination block-by-block
+        _contents_match: Compare file contents via the hash cache
     """
 
-    def __init__(self, hostname: str) -> None:
+    def __init__(
+        self,
+        hostname: str,
+        copy_workers: int = DEFAULT_COPY_WORKERS,
+        stats_tracker: StatisticsTracker | None = None,
+    ) -> None:
         """
         Initialize FileOperations.
 
         Args:
             hostname: System hostname for path operations
+            copy_workers: Number of worker threads for directory copies
+            stats_tracker: Optional StatisticsTracker receiving copy strategy counts
         """
         self.hostname: str = hostname
+        self._copy_engine: CopyEngine = CopyEngine(copy_workers)
+        self._copier: KernelCopier = KernelCopier()
+        self._stats_tracker: StatisticsTracker | None = stats_tracker
+        self._mirror_index: MirrorIndex | None = None
+        # (today's snapshot path prefix, previous snapshot dir) while linking
+        self._link_dest: tuple[str, Path] | None = None
+        # Merkle tree whose leaves give linked files their digest
+        self._link_tree: MerkleTree | None = None
+        self.delta_threshold: int = DEFAULT_DELTA_THRESHOLD_MB * 1024 * 1024
+        self.exclusions: ExclusionMatcher = ExclusionMatcher()
+        self.archive_format: str = DEFAULT_ARCHIVE_FORMAT
+        self.compression_level: int = DEFAULT_COMPRESSION_LEVEL
+        self.compression_workers: int = DEFAULT_COMPRESSION_WORKERS
+        self.incremental_archives: bool = False
+        self.incremental_chain_limit: int = DEFAULT_INCREMENTAL_CHAIN_LIMIT
+        self.hash_while_copy: bool = False
+        self.copy_hash_algorithm: str = DEFAULT_COPY_HASH_ALGORITHM
+        # Destination path -> "<algorithm>:<hex digest>" of the copied bytes
+        self._copy_digests: dict[str, str] = {}
+        self.strict_compare: bool = False
+        self.hash_cache: HashCache | None = None
+        self.scan_cache: ScanCache = ScanCache()
+        self.size_cache: DirSizeCache | None = None
+
+    @property
+    def copy_workers(self) -> int:
+        """Get number of worker threads used by copy_directory."""
+        return self._copy_engine.max_workers
+
+    @copy_workers.setter
+    def copy_workers(self, value: int) -> None:
+        """Set number of worker threads used by copy_directory."""
+        self._copy_engine.max_workers = value
+
+    @property
+    def mirror_index(self) -> MirrorIndex | None:
+        """Get the mirror index attached for the current backup run."""
+        return self._mirror_index
 
     def expand_path(self, path_str: str) -> Path:
         """
@@ -289,82 +461,133 @@ class FileOperations:
         """
         path.mkdir(mode=mode, parents=True, exist_ok=True)
 
-    def files_are_identical(self, src_path: Path, dest_path: Path) -> bool:
+    def files_are_identical(
+        self,
+        src_path: Path,
+        dest_path: Path,
+        src_stat: os.stat_result | None = None,
+    ) -> bool:
         """
         Compare two files to determine if they are identical.
 
         Uses efficient metadata comparison (size + mtime) instead of reading
         entire file contents. Includes tolerance for filesystem timestamp precision.
+        While a mirror index is open, indexed destinations are decided from the
+        index alone without touching the mirror. In strict mode, metadata
+        matches are confirmed by comparing contents; with a hash cache, an
+        unchanged pair costs only stat calls after its first comparison.
 
         Args:
             src_path: Source file path
             dest_path: Destination file path
+            src_stat: Cached source stat result (e.g., from a tree walk)
 
         Returns:
-            True if files are identical (same size and mtime), False otherwise
+            True if files are identical (same size and mtime, and same
+            contents in strict mode), False otherwise
         """
-        # Quick check: destination doesn't exist
-        if not dest_path.exists():
-            return False
-
+        index = self._mirror_index
         try:
-            src_stat = src_path.stat()
+            if src_stat is None:
+                src_stat = src_path.stat()
+
+            # Indexed destinations never need a stat on the (slow) mirror
+            if index is not None and index.covers(dest_path):
+                known = index.matches(dest_path, src_stat)
+                if known is not None and not (known and self.strict_compare):
+                    return known
+
+            # A missing destination raises FileNotFoundError (no exists() call)
             dest_stat = dest_path.stat()
+        except OSError, PermissionError:
+            return False
 
-            # Fast check: compare file sizes first (cheap operation)
-            if src_stat.st_size != dest_stat.st_size:
-                return False
+        identical = self.stats_are_identical(src_stat, dest_stat)
+        if identical and self.strict_compare:
+            identical = self._contents_match(src_path, dest_path)
+        # Adopt unindexed mirror files so the next run can skip the stat
+        if identical and index is not None and index.covers(dest_path):
+            index.record(dest_path, src_stat)
+        return identical
+
+    def stats_are_identical(
+        self, src_stat: os.stat_result, dest_stat: os.stat_result
+    ) -> bool:
+        """
+        Compare two stat results using size and mtime with tolerance.
 
-            # Precise check: compare modification times with filesystem tolerance
-            # Tolerance accounts for different filesystem timestamp precision (ext4, NTFS, etc.)
-            time_diff = abs(src_stat.st_mtime - dest_stat.st_mtime)
-            return time_diff <= FILE_MTIME_TOLERANCE_SECONDS
+        Args:
+            src_stat: Source file stat result
+            dest_stat: Destination file stat result
 
-        except OSError, PermissionError:
+        Returns:
+            True if size matches and mtimes are within tolerance, False otherwise
+        """
+        # Fast check: compare file sizes first (cheap operation)
+        if src_stat.st_size != dest_stat.st_size:
             return False
 
+        # Precise check: compare modification times with filesystem tolerance
+        # Tolerance accounts for different filesystem timestamp precision (ext4, NTFS, etc.)
+        time_diff = abs(src_stat.st_mtime - dest_stat.st_mtime)
+        return time_diff <= FILE_MTIME_TOLERANCE_SECONDS
+
     def copy_file(
         self,
         src_path: Path,
         dest_path: Path,
         create_parent: bool = True,
         skip_identical: bool = False,
+        src_stat: os.stat_result | None = None,
     ) -> bool:
         """
-        Copy file with metadata preservation using Python 3.14 Path.copy().
+        Copy file with metadata preservation using the fastest kernel copy path.
 
         Args:
             src_path: Source file path (validated by caller)
             dest_path: Destination file path
             create_parent: Whether to create parent directories
             skip_identical: Whether to skip copying if files are identical (mirror optimization)
+            src_stat: Cached source stat result, recorded in the mirror index
 
         Returns:
             True if copied successfully or skipped due to identical files, False otherwise
         """
         # Check if files are identical when optimization enabled
-        if skip_identical and self.files_are_identical(src_path, dest_path):
+        if skip_identical and self.files_are_identical(src_path, dest_path, src_stat):
+            return True
+
+        # Capture the pre-copy source stat for the mirror index / snapshot link
+        index = self._mirror_index
+        if index is not None and not index.covers(dest_path):
+            index = None
+        if src_stat is None and (index is not None or self._link_dest is not None):
+            try:
+                src_stat = src_path.stat()
+            except OSError:
+                index = None
+
+        # Unchanged since the previous dated snapshot: hard-link instead of copying
+        if (
+            skip_identical
+            and src_stat is not None
+            and self._link_from_snapshot(dest_path, src_stat)
+        ):
             return True
 
         # Create parent directory if needed
         if create_parent and not dest_path.parent.exists():
             self.create_directory(dest_path.parent)
 
-        # Use Path.copy() with metadata preservation (Python 3.14+ required)
-        # Fall back to shutil.copy2 for older Python versions
-        try:
-            src_path.copy(dest_path, follow_symlinks=True, preserve_metadata=True)
-            return True
-        except AttributeError:
-            # Fallback for Python < 3.14
-            try:
-                shutil.copy2(src_path, dest_path)
-                return True
-            except OSError, shutil.Error:
-                return False
-        except OSError:
-            # Copy operation failed
-            return False
+        success = self._copy_with_metadata(src_path, dest_path)
+
+        if index is not None:
+            if success and src_stat is not None:
+                index.record(dest_path, src_stat)
+            else:
+                index.discard(dest_path)
+
+        return success
 
     def copy_directory(
         self, src_path: Path, dest_base: Path, skip_identical: bool = False
@@ -372,6 +595,10 @@ class FileOperations:
         """
         Copy directory recursively with all files.
 
+        Files are copied on the bounded worker pool configured by
+        copy_workers. Results keep the order of the directory walk. A fresh
+        scan snapshot of src_path replaces the walk.
+
         Args:
             src_path: Source directory path
             dest_base: Destination base path
@@ -382,89 +609,92 @@ class FileOperations:
             dest_file is None if destination path is not applicable
         """
         results: list[tuple[Path, Path | None, bool, bool]] = []
+        root = self.scanned(src_path)
 
         # Check directory readability
-        if not self.check_readable(src_path):
+        if not (root.readable if root is not None else self.check_readable(src_path)):
             return results
 
         # Process files iteratively to avoid loading all into memory
         try:
-            # Use iterator for memory efficiency with large directories
-            for file_path in src_path.rglob("*"):
-                if not file_path.is_file():
-                    continue
-
-                # Skip files without read permissions
-                if not self.check_readable(file_path):
-                    results.append((file_path, None, False, False))
-                    continue
-
-                # Calculate destination path maintaining structure
-                try:
-                    file_relative = file_path.relative_to(src_path)
-                    file_dest = dest_base / file_relative
-
-                    # Check if file is identical and can be skipped
-                    if skip_identical and self.files_are_identical(
-                        file_path, file_dest
-                    ):
-                        results.append((file_path, file_dest, True, True))
-                    else:
-                        # Copy file
-                        success = self.copy_file(
-                            file_path,
-                            file_dest,
-                            create_parent=True,
-                            skip_identical=False,
-                        )
-                        results.append((file_path, file_dest, success, False))
-
-                except ValueError, OSError:
-                    results.append((file_path, None, False, False))
+            # Single-pass scandir walk yields entries with cached stat results
+            entries = (
+                root.entries
+                if root is not None and root.is_dir
+                else walk_files(src_path, self._exclude_func(self.exclusions))
+            )
+            results.extend(
+                self._copy_engine.run(
+                    entries,
+                    lambda entry: self._copy_tree_file(
+                        entry, dest_base, skip_identical
+                    ),
+                )
+            )
 
         except OSError, PermissionError:
             return results
 
         return results
 
-    def calculate_path_size(self, path: Path) -> int:
+    def calculate_path_size(
+        self, path: Path, exclusions: ExclusionMatcher | None = None
+    ) -> int:
         """
         Calculate total size of a file or directory in bytes.
 
+        Excluded files and directories are not counted, and hardlinked
+        files are counted once (see calculate_disk_usage).
+
         Args:
             path: Path to file or directory
+            exclusions: Matcher to apply instead of the exclusions attribute
 
         Returns:
-            Total size in bytes, 0 if path doesn't exist or permission denied
+            Apparent size in bytes, 0 if path doesn't exist or permission denied
         """
-        # Validate path exists and is readable
-        if not path.exists() or not self.check_readable(path):
-            return 0
+        return self.calculate_disk_usage(path, exclusions).apparent
 
-        try:
-            # Simple case: single file
-            if path.is_file():
-                return path.stat().st_size
-
-            # Complex case: directory with recursive traversal
-            if path.is_dir():
-                total_size = 0
-                # Sum all accessible file sizes in directory tree
-                for item in path.rglob("*"):
-                    if item.is_file():
-                        try:
-                            total_size += item.stat().st_size
-                        except OSError, PermissionError:
-                            # Skip inaccessible files (e.g., permission denied)
-                            continue
-                return total_size
+    def calculate_disk_usage(
+        self,
+        path: Path,
+        exclusions: ExclusionMatcher | None = None,
+        limit: int | None = None,
+    ) -> DiskUsage:
+        """
+        Calculate du-style apparent and allocated size of a file or directory.
 
-        except OSError, PermissionError:
-            # Error during directory traversal or stat operation
-            pass
+        Top-level subdirectories are sized in parallel on copy_workers
+        threads. A fresh scan snapshot of path, walked with the same
+        exclusions, is used as is; otherwise the size cache (if set) only
+        lists directories that changed since the last calculation. With a
+        limit the walk stops once the billable size is proven to reach it;
+        such a probe always stats every file, since the size cache misses
+        files that grew in place and would hide a crossed threshold.
 
-        # Default: not a file/directory or error occurred
-        return 0
+        Args:
+            path: Path to file or directory
+            exclusions: Matcher to apply instead of the exclusions attribute
+            limit: Probe limit in bytes, None to size the whole tree
+
+        Returns:
+            DiskUsage of path, empty if it doesn't exist or permission denied;
+            truncated if a probe stopped at the limit
+        """
+        if exclusions is None or exclusions is self.exclusions:
+            root = self.scanned(path)
+            if root is not None:
+                return root.usage
+
+        # Validate path exists and is readable
+        if not path.exists() or not self.check_readable(path):
+            return DiskUsage()
+
+        matcher = exclusions or self.exclusions
+        if self.size_cache is not None and limit is None:
+            return self.size_cache.disk_usage(path, matcher, self.copy_workers)
+        # Inaccessible entries are skipped by the calculator
+        return disk_usage(path, self._exclude_func(matcher), self.copy_workers, limit)
 
     def assemble_dest_path(
         self,
@@ -519,7 +749,26 @@ class FileOperations:
         hostname_subdir: bool,
     ) -> Path | None:
         """
-        Create compressed TAR.GZ archive of existing dotfiles.
+        Create compressed tar archive of existing dotfiles.
+
+        The archive uses the archive_format and compression_level
+        attributes; gzip and zstd are compressed on compression_workers
+        threads. Paths matching the exclusion patterns are left out, and
+        excluded directories are pruned without being traversed.
+
+        With incremental_archives set, the archive extends the current chain
+        when possible: it holds only files whose (size, mtime_ns, inode)
+        changed since the previous archive, plus tombstones for deleted
+        files. A new full archive starts the chain when there is no usable
+        snapshot or the chain has reached incremental_chain_limit archives.
+
+        A sidecar index (<archive>.idx) recording every member's offset,
+        size, mtime, and SHA-256 is written next to the archive so single
+        files can be restored without decompressing everything before them.
+
+        The dedup format writes a manifest instead of a tar file, storing
+        file contents as shared content-defined chunks; incremental_archives
+        does not apply since every manifest is complete.
 
         Args:
             dotfiles_to_archive: List of (path, exists, is_dir) tuples
@@ -537,34 +786,103 @@ class FileOperations:
         # Create archive directory
         self.create_directory(archive_base)
 
+        archive_format = resolve_archive_format(self.archive_format)
+        if archive_format == DEDUP_ARCHIVE_FORMAT:
+            return self._create_dedup_archive(dotfiles_to_archive, archive_base)
+
+        # Incremental mode: compare current signatures with the last snapshot
+        snapshot: ArchiveSnapshot | None = None
+        signatures: dict[str, FileSignature] = {}
+        delta: SnapshotDelta | None = None
+        if self.incremental_archives:
+            snapshot = ArchiveSnapshot.load(archive_base)
+            signatures = self._archive_signatures(dotfiles_to_archive)
+            if self._can_extend_chain(snapshot, archive_base, archive_format):
+                delta = snapshot.diff(signatures)
+
         # Generate timestamped archive filename
-        archive_name = (
-            f"dotfiles-{datetime.now(UTC).strftime(ARCHIVE_TIMESTAMP_FORMAT)}.tar.gz"
-        )
+        timestamp = datetime.now(UTC).strftime(ARCHIVE_TIMESTAMP_FORMAT)
+        marker = INCREMENTAL_MARKER if delta is not None else ""
+        archive_name = f"dotfiles-{timestamp}{marker}{archive_suffix(archive_format)}"
         archive_path = archive_base / archive_name
+        index = ArchiveIndex(archive_format)
 
         try:
-            # Create compressed TAR.GZ archive
-            with tarfile.open(archive_path, "w:gz") as tar:
-                for path, exists, _is_dir in dotfiles_to_archive:
-                    if exists:
+            # Members are named like the path without its leading slash,
+            # which is exactly the form the exclusion matcher expects
+            member_filter = None
+            if self.exclusions:
+                member_filter = self._exclude_member
+
+            # Create compressed archive with the configured codec and level
+            with open_archive_writer(
+                archive_path,
+                archive_format,
+                self.compression_level,
+                self.compression_workers,
+                index,
+            ) as tar:
+                if delta is None:
+                    for path, exists, is_dir in dotfiles_to_archive:
+                        if exists and not self.is_excluded(path, is_dir):
+                            try:
+                                tar.add(path, filter=member_filter)
+                            except OSError, ValueError, tarfile.TarError:
+                                # Skip files that can't be added (symlink loops, permission issues, invalid paths)
+                                self._forget_signatures(signatures, path)
+                                continue
+                else:
+                    for changed in delta.changed:
                         try:
-                            tar.add(path)
+                            tar.add(changed, recursive=False)
                         except OSError, ValueError, tarfile.TarError:
-                            # Skip files that can't be added (symlink loops, permission issues, invalid paths)
-                            continue
-
-            return archive_path
+                            # Not recorded, so the next archive retries the file
+                            signatures.pop(changed, None)
+
+                if snapshot is not None:
+                    self._advance_snapshot(
+                        snapshot,
+                        tar,
+                        archive_name=archive_name,
+                        archive_format=archive_format,
+                        delta=delta,
+                        signatures=signatures,
+                    )
 
         except OSError, tarfile.TarError:
             return None
 
+        try:
+            index.save(archive_path)
+        except OSError as e:
+            # The archive is complete; restores fall back to a full scan
+            logger.warning("Cannot write archive index for %s: %s", archive_path, e)
+
+        if snapshot is not None:
+            try:
+                snapshot.save(archive_base)
+            except OSError as e:
+                # A stale snapshot would chain onto the wrong parent: start over
+                logger.warning(
+                    "Cannot save archive snapshot in %s: %s", archive_base, e
+                )
+                (archive_base / SNAPSHOT_STATE_NAME).unlink(missing_ok=True)
+
+        return archive_path
+
     def rotate_archives(
         self, archive_base_dir: Path, hostname_subdir: bool, max_archives: int
     ) -> list[Path]:
         """
         Delete oldest archives exceeding maximum retention limit.
 
+        Archives are removed a whole chain at a time (a full archive and the
+        incrementals built on it), so a base is never deleted while a
+        retained incremental depends on it. The newest chain is always kept,
+        so more than max_archives may remain until a new chain starts.
+        When dedup manifests are deleted, chunks no remaining manifest
+        references are removed from the chunk store.
+
         Args:
             archive_base_dir: Base directory for archives
             hostname_subdir: Whether archives are in hostname subdirectory
@@ -579,12 +897,17 @@ class FileOperations:
             archive_base = archive_base / self.hostname
 
         deleted_archives: list[Path] = []
+        archive_suffixes = tuple(ARCHIVE_SUFFIXES.values())
+        dedup_suffix = archive_suffix(DEDUP_ARCHIVE_FORMAT)
 
         # Find all existing archives sorted by modification time with error handling
         try:
             # Build list of (path, mtime) tuples, skipping files that fail stat()
             archive_list: list[tuple[Path, float]] = []
-            for archive_path in archive_base.glob("dotfiles-*.tar.gz"):
+            for archive_path in archive_base.glob("dotfiles-*"):
+                # Sidecar files share the prefix but are not archives
+                if not archive_path.name.endswith(archive_suffixes):
+                    continue
                 try:
                     mtime = archive_path.stat().st_mtime
                     archive_list.append((archive_path, mtime))
@@ -593,29 +916,91 @@ class FileOperations:
                     logger.warning("Cannot access archive file %s: %s", archive_path, e)
                     continue
 
-            # Sort by modification time
+            # Sort by modification time (name breaks ties within one second)
             archives = [
-                path for path, _mtime in sorted(archive_list, key=lambda x: x[1])
+                path
+                for path, _mtime in sorted(
+                    archive_list, key=lambda x: (x[1], x[0].name)
+                )
             ]
         except OSError as e:
             logger.error("Error accessing archive directory %s: %s", archive_base, e)
             return deleted_archives
 
-        # Calculate number to delete
-        num_to_delete = len(archives) - max_archives
-
-        # Delete oldest archives
-        if num_to_delete > 0:
-            for i in range(num_to_delete):
+        # Delete oldest chains while enough archives remain afterwards
+        remaining = len(archives)
+        for chain in group_archive_chains(archives):
+            if remaining - len(chain) < max_archives:
+                break
+            remaining -= len(chain)
+            for archive in chain:
                 try:
-                    archives[i].unlink()
-                    deleted_archives.append(archives[i])
+                    archive.unlink()
+                    deleted_archives.append(archive)
+                    index_path(archive).unlink(missing_ok=True)
                 except OSError as e:
-                    logger.warning("Cannot delete archive %s: %s", archives[i], e)
+                    logger.warning("Cannot delete archive %s: %s", archive, e)
                     continue
 
+        if any(path.name.endswith(dedup_suffix) for path in deleted_archives):
+            deleted = set(deleted_archives)
+            self._collect_chunks(
+                archive_base,
+                [
+                    path
+                    for path in archives
+                    if path not in deleted and path.name.endswith(dedup_suffix)
+                ],
+            )
+
         return deleted_archives
 
+    def restore_archive_member(
+        self, archive_path: Path, member_path: Path, dest_root: Path
+    ) -> Path | None:
+        """
+        Restore one file from an archive via its index.
+
+        With the archive's sidecar index, decompression starts at the restart
+        point nearest the member instead of the start of the archive, and
+        the restored file is checked against the recorded SHA-256. Dedup
+        manifests are restored from their hash-verified chunks. The file is
+        written beside its destination and renamed into place only once it
+        verified, so a failed restore leaves an existing file untouched.
+
+        An incremental archive holds only files changed since its parent, so
+        a file missing from it is restored from the nearest older archive of
+        its chain that has it, unless a tombstone on the way records that
+        the file was deleted.
+
+        Args:
+            archive_path: Archive file to restore from
+            member_path: Original absolute path of the file
+            dest_root: Directory the original path is recreated under
+
+        Returns:
+            Path of the restored file, or None if restore failed
+        """
+        archive = archive_path
+        visited: set[Path] = set()
+        try:
+            if archive.name.endswith(archive_suffix(DEDUP_ARCHIVE_FORMAT)):
+                return extract_manifest_member(archive, member_path, dest_root)
+            while True:
+                visited.add(archive)
+                try:
+                    return extract_member(archive, member_path, dest_root)
+                except KeyError:
+                    parent = self._chain_parent(archive, member_path)
+                    if parent is None or parent in visited:
+                        raise
+                    archive = parent
+        except KeyError:
+            logger.error("%s is not in archive %s", member_path, archive_path)
+        except (OSError, ValueError, tarfile.TarError) as e:
+            logger.error("Cannot restore %s from %s: %s", member_path, archive, e)
+        return None
+
     def discover_restore_files(self, src_dir: Path) -> list[Path]:
         """
         Find all files in restore source directory recursively.
@@ -626,7 +1011,11 @@ class FileOperations:
         Returns:
             List of all file paths found
         """
-        return [f for f in src_dir.rglob("*") if f.is_file()]
+        return [
+            entry.path
+            for entry in walk_files(src_dir)
+            if not entry.path.name.startswith((INDEX_FILENAME, MERKLE_FILENAME))
+        ]
 
     def reconstruct_restore_paths(
         self, src_files: list[Path]
@@ -684,3 +1073,728 @@ class FileOperations:
             return True
         except ValueError:
             return False
+
+    def is_excluded(self, path: Path, is_dir: bool = False) -> bool:
+        """
+        Check a path against the exclusion patterns.
+
+        Args:
+            path: Absolute path to check
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path or one of its parent directories is excluded
+        """
+        return self.exclusions.is_excluded(path, is_dir)
+
+    def scan_paths(self, paths: list[Path]) -> ScanSnapshot | None:
+        """
+        Walk dotfile paths once into a shared scan snapshot.
+
+        A fresh snapshot that already covers every path is returned without
+        walking. Later size calculations, previews, validation, and
+        directory copies of these paths read from the snapshot until it
+        expires or scan_cache is invalidated.
+
+        Args:
+            paths: Expanded dotfile paths
+
+        Returns:
+            Fresh snapshot, or None if the scan cache is disabled
+        """
+        return self.scan_cache.scan(paths, self.exclusions)
+
+    def current_scan(self) -> ScanSnapshot | None:
+        """
+        Get the scan snapshot if it is fresh for the current exclusions.
+
+        Returns:
+            Fresh snapshot, or None
+        """
+        return self.scan_cache.current(self.exclusions)
+
+    def scanned(self, path: Path) -> ScanRoot | None:
+        """
+        Get the fresh scan of a dotfile path.
+
+        Args:
+            path: Expanded dotfile path
+
+        Returns:
+            ScanRoot walked with the current exclusions, or None if there
+            is no fresh snapshot of path
+        """
+        return self.scan_cache.lookup(path, self.exclusions)
+
+    @staticmethod
+    def _exclude_func(exclusions: ExclusionMatcher) -> ExcludeFunc | None:
+        """
+        Walker predicate for an exclusion matcher.
+
+        Args:
+            exclusions: Compiled exclusion patterns
+
+        Returns:
+            The matcher's matches method, or None when nothing is excluded
+        """
+        return exclusions.matches if exclusions else None
+
+    def _exclude_member(self, tarinfo: tarfile.TarInfo) -> tarfile.TarInfo | None:
+        """
+        Drop excluded members while building an archive.
+
+        Args:
+            tarinfo: Member about to be added by tarfile
+
+        Returns:
+            The member unchanged, or None to skip it (and its contents)
+        """
+        if self.exclusions.matches(tarinfo.name, tarinfo.isdir()):
+            return None
+        return tarinfo
+
+    def _archive_signatures(
+        self, dotfiles_to_archive: list[tuple[Path, bool, bool]]
+    ) -> dict[str, FileSignature]:
+        """
+        Collect the change signature of every file that would be archived.
+
+        Args:
+            dotfiles_to_archive: List of (path, exists, is_dir) tuples
+
+        Returns:
+            Signature by absolute path for every non-excluded file
+        """
+        signatures: dict[str, FileSignature] = {}
+        exclude = self._exclude_func(self.exclusions)
+        for path, exists, is_dir in dotfiles_to_archive:
+            if not exists or self.is_excluded(path, is_dir):
+                continue
+            if path.is_symlink():
+                # tar.add stores the link itself, never what it points to
+                with suppress(OSError):
+                    signatures[os.fspath(path)] = file_signature(path.lstat())
+                continue
+            if is_dir:
+                # Links inside the tree are signed by lstat, as tar stores them
+                for entry in walk_tree(path, exclude=exclude, include_symlinks=True):
+                    signatures[os.fspath(entry.path)] = file_signature(entry.stat)
+                continue
+            try:
+                signatures[os.fspath(path)] = file_signature(path.stat())
+            except OSError:
+                continue
+        return signatures
+
+    def _can_extend_chain(
+        self, snapshot: ArchiveSnapshot, archive_base: Path, archive_format: str
+    ) -> bool:
+        """
+        Check whether the next archive can be an incremental one.
+
+        Args:
+            snapshot: Snapshot state of the archive directory
+            archive_base: Directory holding the archives
+            archive_format: Format of the archive about to be written
+
+        Returns:
+            True if the chain's base and latest archive still exist, the
+            format is unchanged, and the chain is below its length limit
+        """
+        if snapshot.archive is None or snapshot.base is None:
+            return False
+        if snapshot.archive_format != archive_format:
+            return False
+        if snapshot.chain_length >= self.incremental_chain_limit:
+            return False
+        return (archive_base / snapshot.base).exists() and (
+            archive_base / snapshot.archive
+        ).exists()
+
+    @staticmethod
+    def _chain_parent(archive: Path, member_path: Path) -> Path | None:
+        """
+        Find the archive an incremental defers a missing member to.
+
+        Args:
+            archive: Archive the member is not in
+            member_path: Original absolute path of the member
+
+        Returns:
+            Parent archive path, or None if the archive is not incremental,
+            its tombstones list the member, or its parent no longer exists
+        """
+        if not is_incremental_archive(archive):
+            return None
+        metadata = read_archive_metadata(archive)
+        if metadata is None:
+            return None
+        parent = metadata.get("parent")
+        if not isinstance(parent, str) or not parent:
+            return None
+        if f"/{str(member_path).lstrip('/')}" in metadata.get("deleted", []):
+            return None
+        parent_path = archive.with_name(Path(parent).name)
+        return parent_path if parent_path.exists() else None
+
+    @staticmethod
+    def _forget_signatures(signatures: dict[str, FileSignature], root: Path) -> None:
+        """
+        Drop signatures of a path that failed to archive, and of its contents.
+
+        Args:
+            signatures: Signatures being recorded for the new snapshot
+            root: Path that could not be added to the archive
+        """
+        root_str = os.fspath(root)
+        prefix = f"{root_str}{os.sep}"
+        for path in [p for p in signatures if p == root_str or p.startswith(prefix)]:
+            del signatures[path]
+
+    @staticmethod
+    def _advance_snapshot(
+        snapshot: ArchiveSnapshot,
+        tar: tarfile.TarFile,
+        *,
+        archive_name: str,
+        archive_format: str,
+        delta: SnapshotDelta | None,
+        signatures: dict[str, FileSignature],
+    ) -> None:
+        """
+        Record a new archive in the snapshot and append its metadata member.
+
+        Args:
+            snapshot: Snapshot state to update in place
+            tar: Archive being written
+            archive_name: File name of the new archive
+            archive_format: Format of the new archive
+            delta: Changes stored in an incremental archive, None for full
+            signatures: Signatures of all files covered after this archive
+        """
+        parent = snapshot.archive if delta is not None else None
+        if delta is None:
+            archive_type, deleted = ARCHIVE_TYPE_FULL, []
+            snapshot.base = archive_name
+            snapshot.chain_length = 1
+        else:
+            archive_type, deleted = ARCHIVE_TYPE_INCREMENTAL, delta.deleted
+            snapshot.chain_length += 1
+        snapshot.archive = archive_name
+        snapshot.archive_format = archive_format
+        snapshot.files = signatures
+        tar.addfile(*snapshot.metadata_member(archive_type, parent, deleted))
+
+    def _create_dedup_archive(
+        self, dotfiles_to_archive: list[tuple[Path, bool, bool]], archive_base: Path
+    ) -> Path | None:
+        """
+        Store files in the chunk store and write a manifest.
+
+        Files whose size and mtime match the newest existing manifest reuse
+        its chunk list instead of being read and chunked again. Changed
+        files are chunked on the copy worker pool; the manifest keeps the
+        walk order.
+
+        Args:
+            dotfiles_to_archive: List of (path, exists, is_dir) tuples
+            archive_base: Archive directory (holds manifests and chunk store)
+
+        Returns:
+            Path to the manifest, or None if it could not be written
+        """
+        timestamp = datetime.now(UTC).strftime(ARCHIVE_TIMESTAMP_FORMAT)
+        suffix = archive_suffix(DEDUP_ARCHIVE_FORMAT)
+        manifest_path = archive_base / f"dotfiles-{timestamp}{suffix}"
+        store = ChunkStore(archive_base / CHUNK_STORE_DIR, self.compression_level)
+        manifest = DedupManifest()
+        previous = self._latest_manifest(archive_base)
+        exclude = self._exclude_func(self.exclusions)
+        written = 0
+        reused = 0
+
+        def files() -> Iterator[tuple[Path, os.stat_result, list[str] | None]]:
+            """Yield (path, stat, reusable chunk ids or None) for each file."""
+            for path, exists, is_dir in dotfiles_to_archive:
+                if not exists or self.is_excluded(path, is_dir):
+                    continue
+                try:
+                    found = (
+                        [
+                            (entry.path, entry.stat)
+                            for entry in walk_files(path, exclude)
+                        ]
+                        if is_dir
+                        else [(path, path.stat())]
+                    )
+                except OSError:
+                    continue
+                for file_path, st in found:
+                    chunks = (
+                        previous.unchanged_chunks(str(file_path.absolute()), st)
+                        if previous is not None
+                        else None
+                    )
+                    if chunks is not None and not store.has_chunks(chunks):
+                        chunks = None
+                    yield file_path, st, chunks
+
+        def store_file(
+            job: tuple[Path, os.stat_result, list[str] | None],
+        ) -> tuple[Path, os.stat_result, list[str], int, bool] | None:
+            """Chunk one changed file on a worker thread."""
+            file_path, st, chunks = job
+            if chunks is not None:
+                return file_path, st, chunks, 0, True
+            try:
+                chunks, stored = store.store_file(file_path)
+            except OSError:
+                # Skip unreadable files, as tar archives do
+                return None
+            return file_path, st, chunks, stored, False
+
+        for result in self._copy_engine.run(files(), store_file):
+            if result is None:
+                continue
+            file_path, st, chunks, stored, unchanged = result
+            written += stored
+            reused += unchanged
+            manifest.add(
+                ManifestEntry(
+                    path=str(file_path.absolute()),
+                    size=st.st_size,
+                    mode=stat.S_IMODE(st.st_mode),
+                    mtime_ns=st.st_mtime_ns,
+                    chunks=chunks,
+                )
+            )
+
+        try:
+            manifest.save(manifest_path)
+        except OSError as e:
+            logger.error("Cannot write archive manifest %s: %s", manifest_path, e)
+            return None
+
+        logger.info(
+            "Dedup archive %s: %d files (%d unchanged), %d new bytes stored",
+            manifest_path.name,
+            len(manifest.entries),
+            reused,
+            written,
+        )
+        return manifest_path
+
+    def _latest_manifest(self, archive_base: Path) -> DedupManifest | None:
+        """
+        Load the newest dedup manifest in an archive directory.
+
+        Args:
+            archive_base: Archive directory holding the manifests
+
+        Returns:
+            Newest readable manifest, or None if there is none
+        """
+        suffix = archive_suffix(DEDUP_ARCHIVE_FORMAT)
+        try:
+            # Timestamped names sort chronologically
+            manifests = sorted(archive_base.glob(f"dotfiles-*{suffix}"), reverse=True)
+        except OSError:
+            return None
+        for path in manifests:
+            try:
+                return DedupManifest.load(path)
+            except (OSError, ValueError) as e:
+                logger.warning("Cannot read archive manifest %s: %s", path, e)
+        return None
+
+    def _collect_chunks(self, archive_base: Path, manifests: list[Path]) -> None:
+        """
+        Delete chunks no remaining manifest references.
+
+        Args:
+            archive_base: Archive directory holding the chunk store
+            manifests: Manifests kept after rotation
+        """
+        store_root = archive_base / CHUNK_STORE_DIR
+        if not store_root.is_dir():
+            return
+        deleted, freed = ChunkStore(store_root).collect_garbage(manifests)
+        if deleted:
+            logger.info("Removed %d unreferenced chunks (%d bytes)", deleted, freed)
+
+    def _copy_tree_file(
+        self,
+        entry: WalkEntry,
+        dest_base: Path,
+        skip_identical: bool,
+    ) -> tuple[Path, Path | None, bool, bool]:
+        """
+        Copy one file found during a directory copy.
+
+        Runs on a copy worker thread, so it only touches per-file state.
+        Uses the stat cached by the tree walk, so an unchanged file costs a
+        single stat of the destination.
+
+        Args:
+            entry: Walk entry for the source file
+            dest_base: Destination directory matching the walk root
+            skip_identical: Whether to skip copying if files are identical
+
+        Returns:
+            (src_file, dest_file, success, skipped) tuple for the file
+        """
+        file_path = entry.path
+
+        # Skip files without read permissions (checked from cached mode bits)
+        if not stat_is_readable(entry.stat):
+            return (file_path, None, False, False)
+
+        # Calculate destination path maintaining structure
+        try:
+            file_dest = dest_base / entry.relative
+
+            # Check if file is identical and can be skipped
+            if skip_identical and self.files_are_identical(
+                file_path, file_dest, src_stat=entry.stat
+            ):
+                return (file_path, file_dest, True, True)
+
+            # Unchanged since the previous dated snapshot: link, report as unchanged
+            if skip_identical and self._link_from_snapshot(file_dest, entry.stat):
+                return (file_path, file_dest, True, True)
+
+            # Copy file
+            success = self.copy_file(
+                file_path,
+                file_dest,
+                create_parent=True,
+                skip_identical=False,
+                src_stat=entry.stat,
+            )
+            return (file_path, file_dest, success, False)
+
+        except ValueError, OSError:
+            return (file_path, None, False, False)
+
+    def open_mirror_index(self, base_path: Path, hostname_subdir: bool) -> None:
+        """
+        Load the mirror index for a backup run.
+
+        While open, files_are_identical consults the index and copy_file
+        records every file copied into the mirror.
+
+        Args:
+            base_path: Mirror base directory
+            hostname_subdir: Whether mirror paths include the hostname
+        """
+        index = MirrorIndex(self._mirror_root(base_path, hostname_subdir))
+        index.load()
+        self._mirror_index = index
+
+    def close_mirror_index(self) -> None:
+        """Save and detach the mirror index opened by open_mirror_index."""
+        index = self._mirror_index
+        self._mirror_index = None
+        if index is not None:
+            index.save()
+
+    def rebuild_mirror_index(self, base_path: Path, hostname_subdir: bool) -> int:
+        """
+        Rebuild the mirror index from the current mirror contents.
+
+        Use after the mirror was edited outside DFBU so skip decisions match
+        the files actually present.
+
+        Args:
+            base_path: Mirror base directory
+            hostname_subdir: Whether mirror paths include the hostname
+
+        Returns:
+            Number of files indexed, or -1 if the index could not be written
+        """
+        index = MirrorIndex(self._mirror_root(base_path, hostname_subdir))
+        count = index.rebuild()
+        return count if index.save() else -1
+
+    def load_merkle_tree(self, base_path: Path, hostname_subdir: bool) -> MerkleTree:
+        """
+        Load the Merkle tree stored with the mirror.
+
+        Args:
+            base_path: Mirror base directory
+            hostname_subdir: Whether mirror paths include the hostname
+
+        Returns:
+            Stored tree, empty if the mirror has none yet
+        """
+        return MerkleTree.load(self._mirror_root(base_path, hostname_subdir))
+
+    def update_merkle_tree(
+        self,
+        base_path: Path,
+        hostname_subdir: bool,
+        backed_up: dict[Path, str | None],
+        *,
+        hash_missing: bool = True,
+    ) -> bool:
+        """
+        Record backed-up files in the Merkle tree stored with the mirror.
+
+        Files copied with hash_while_copy (or linked from a snapshot) reuse
+        their copy digest; others are hashed only if changed since their
+        leaf was recorded, or dropped from the tree without hash_missing.
+
+        Args:
+            base_path: Mirror base directory
+            hostname_subdir: Whether mirror paths include the hostname
+            backed_up: Copy digest (or None) by backup file path
+            hash_missing: Hash files without a copy digest or current leaf
+
+        Returns:
+            True if the tree was saved, False if writing failed
+        """
+        tree = self.load_merkle_tree(base_path, hostname_subdir)
+        for backup_path, digest in backed_up.items():
+            tree.update(backup_path, digest, self.hash_cache, hash_missing=hash_missing)
+        return tree.save()
+
+    def open_snapshot_link(
+        self, base_path: Path, hostname_subdir: bool, tree: MerkleTree | None = None
+    ) -> Path | None:
+        """
+        Link unchanged files from the previous dated snapshot.
+
+        For date_subdir mirrors, files whose source is unchanged since the
+        newest earlier YYYY-MM-DD snapshot are hard-linked into today's
+        snapshot instead of copied (like rsync --link-dest). A linked file
+        whose previous copy has a current leaf in tree gets that digest as
+        its copy digest, so it is never hashed again.
+
+        Args:
+            base_path: Mirror base directory
+            hostname_subdir: Whether mirror paths include the hostname
+            tree: Merkle tree stored with the mirror, or None
+
+        Returns:
+            Previous snapshot directory used for linking, or None if there is none
+        """
+        root = self._mirror_root(base_path, hostname_subdir)
+        today = time.strftime(DATE_FORMAT)
+        previous = self._find_previous_snapshot(root, today)
+        self._link_dest = (
+            (f"{root / today}{os.sep}", previous) if previous is not None else None
+        )
+        self._link_tree = tree
+        if previous is not None:
+            logger.info("Linking unchanged files from snapshot %s", previous)
+        return previous
+
+    def pop_copy_digest(self, dest_path: Path) -> str | None:
+        """
+        Take the digest recorded when a file was copied.
+
+        Only files copied in full with hash_while_copy enabled, and files
+        hard-linked from a snapshot with a current Merkle leaf, have one;
+        skipped and delta-updated files do not.
+
+        Args:
+            dest_path: Destination path passed to the copy
+
+        Returns:
+            "<algorithm>:<hex digest>" of the copied bytes, or None
+        """
+        return self._copy_digests.pop(os.fspath(dest_path), None)
+
+    def clear_copy_digests(self) -> None:
+        """Forget all recorded copy digests."""
+        self._copy_digests.clear()
+
+    def close_snapshot_link(self) -> None:
+        """Stop linking from the previous snapshot."""
+        self._link_dest = None
+        self._link_tree = None
+
+    def _link_from_snapshot(self, dest_path: Path, src_stat: os.stat_result) -> bool:
+        """
+        Hard-link an unchanged file from the previous snapshot.
+
+        Args:
+            dest_path: Destination path inside today's snapshot
+            src_stat: Current stat result of the source file
+
+        Returns:
+            True if dest_path was linked, False if the file must be copied
+        """
+        link_dest = self._link_dest
+        if link_dest is None:
+            return False
+        prefix, previous = link_dest
+        dest_str = os.fspath(dest_path)
+        if not dest_str.startswith(prefix):
+            return False
+
+        previous_file = previous / dest_str[len(prefix) :]
+        try:
+            previous_stat = previous_file.stat()
+            if not self.stats_are_identical(src_stat, previous_stat):
+                return False
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            os.link(previous_file, dest_path)
+        except OSError:
+            # Missing in the previous snapshot, cross-device, or dest exists
+            return False
+
+        # Same inode: reuse its digest (os.link changes ctime, so check first)
+        tree = self._link_tree
+        if tree is not None:
+            key = tree.key(previous_file)
+            leaf = tree.leaf(key) if key is not None else None
+            if leaf is not None and leaf.matches(previous_stat):
+                self._copy_digests[dest_str] = f"{MERKLE_HASH_ALGORITHM}:{leaf.digest}"
+
+        if self._mirror_index is not None and self._mirror_index.covers(dest_path):
+            self._mirror_index.record(dest_path, src_stat)
+        if self._stats_tracker is not None:
+            self._stats_tracker.record_copy_strategy(STRATEGY_HARDLINK)
+        return True
+
+    def _find_previous_snapshot(self, root: Path, today: str) -> Path | None:
+        """
+        Locate the newest dated snapshot before today.
+
+        Args:
+            root: Host-level mirror directory containing dated snapshots
+            today: Today's snapshot directory name
+
+        Returns:
+            Path of the newest earlier snapshot, or None if there is none
+        """
+        try:
+            with os.scandir(root) as entries:
+                names = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                    and SNAPSHOT_DIR_PATTERN.fullmatch(entry.name)
+                    and entry.name < today
+                ]
+        except OSError:
+            return None
+        return root / max(names) if names else None
+
+    def _mirror_root(self, base_path: Path, hostname_subdir: bool) -> Path:
+        """
+        Host-level mirror directory holding the index and dated snapshots.
+
+        Args:
+            base_path: Mirror base directory
+            hostname_subdir: Whether mirror paths include the hostname
+
+        Returns:
+            <base_path>/<hostname> or <base_path>
+        """
+        return base_path / self.hostname if hostname_subdir else base_path
+
+    def _copy_with_metadata(self, src_path: Path, dest_path: Path) -> bool:
+        """
+        Copy file data and metadata with the cached kernel copy strategy.
+
+        Large existing destinations are delta-updated in place instead.
+        With hash_while_copy, the data is hashed as it is copied and the
+        digest is kept for pop_copy_digest.
+
+        Args:
+            src_path: Source file path
+            dest_path: Destination file path
+
+        Returns:
+            True if copied successfully, False otherwise
+        """
+        dest_key = os.fspath(dest_path)
+        self._copy_digests.pop(dest_key, None)
+
+        try:
+            dest_stat = dest_path.lstat()
+        except OSError:
+            dest_stat = None
+
+        if dest_stat is not None:
+            if dest_stat.st_nlink > 1:
+                # Never write through a hard link shared with an older snapshot
+                try:
+                    dest_path.unlink()
+                except OSError:
+                    return False
+            elif self._try_delta_update(src_path, dest_path, dest_stat):
+                return True
+
+        try:
+            if self.hash_while_copy:
+                strategy, digest = self._copier.copy_hashed(
+                    src_path, dest_path, self.copy_hash_algorithm
+                )
+                self._copy_digests[dest_key] = f"{self.copy_hash_algorithm}:{digest}"
+            else:
+                strategy = self._copier.copy(src_path, dest_path)
+        except OSError, ValueError:
+            # Copy operation failed
+            return False
+
+        if self._stats_tracker is not None:
+            self._stats_tracker.record_copy_strategy(strategy)
+        return True
+
+    def _try_delta_update(
+        self, src_path: Path, dest_path: Path, dest_stat: os.stat_result
+    ) -> bool:
+        """
+        Update a large existing destination block-by-block.
+
+        Only regular destination files whose source is at least
+        delta_threshold bytes qualify. Any failure leaves the full copy to
+        the caller, which rewrites the destination from scratch.
+
+        Args:
+            src_path: Source file path
+            dest_path: Destination file path
+            dest_stat: lstat result of the existing destination
+
+        Returns:
+            True if the destination was delta-updated, False to do a full copy
+        """
+        if self.delta_threshold <= 0 or not stat.S_ISREG(dest_stat.st_mode):
+            return False
+        try:
+            if src_path.stat().st_size < self.delta_threshold:
+                return False
+            result = delta_update(src_path, dest_path)
+        except OSError as e:
+            logger.debug("Delta update of %s failed, copying: %s", dest_path, e)
+            return False
+
+        if self._stats_tracker is not None:
+            self._stats_tracker.record_copy_strategy(STRATEGY_DELTA)
+            self._stats_tracker.record_delta_bytes_saved(result.bytes_saved)
+        return True
+
+    def _contents_match(self, src_path: Path, dest_path: Path) -> bool:
+        """
+        Compare file contents via the hash cache.
+
+        Without a hash cache the files are compared byte by byte.
+
+        Args:
+            src_path: Source file path
+            dest_path: Destination file path
+
+        Returns:
+            True if both files have the same contents, False otherwise
+        """
+        cache = self.hash_cache
+        try:
+            if cache is None:
+                return filecmp.cmp(src_path, dest_path, shallow=False)
+            return cache.file_digest(src_path) == cache.file_digest(dest_path)
+        except OSError as e:
+            logger.debug("Content comparison of %s failed: %s", src_path, e)
+            return False
@@ -0,0 +1,221 @@
+"""
+DFBU FsWalker - Single-Pass Directory Tree Walker
+
+Description:
+    Walks directory trees with os.scandir and yields entries that carry the
+    file type and a cached stat result. Replaces the rglob + is_file() +
+    stat() pattern used by copy, size, restore, and preview traversals so an
+    unchanged file costs roughly one stat syscall instead of five or six.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - One scandir call per directory, file type from d_type (no extra syscall)
+    - Exactly one stat per yielded entry, cached on the entry
+    - Relative POSIX path precomputed during the walk
+    - Symlinked directories are not followed (matches Path.rglob default)
+    - Unreadable subdirectories are skipped silently, like Path.rglob
+    - Optional exclusion predicate that prunes whole directories
+    - Stat-based readability check replacing per-file os.access calls
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: os, stat, dataclasses, pathlib
+
+Classes:
+    - WalkEntry: Immutable directory entry with cached stat result
+
+Functions:
+    - walk_tree: Yield entries for every file (and optionally directory) under a root
+    - walk_files: Yield file entries under a root
+    - stat_is_readable: Check read permission from a stat result
+"""
+
+import os
+import stat
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+
+# =============================================================================
+# WalkEntry Class
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class WalkEntry:
+    """
+    Immutable directory entry produced by walk_tree.
+
+    Attributes:
+        path: Absolute (or root-relative, matching the root given) path
+        relative: POSIX path relative to the walk root
+        stat: Cached stat result (follows symlinks for files)
+        is_dir: True if the entry is a directory
+        is_symlink: True if the entry itself is a symbolic link
+    """
+
+    path: Path
+    relative: str
+    stat: os.stat_result
+    is_dir: bool = False
+    is_symlink: bool = False
+
+    @property
+    def is_file(self) -> bool:
+        """Return True if the entry is a regular file (or symlink to one)."""
+        return not self.is_dir
+
+    @property
+    def size(self) -> int:
+        """Return the apparent size in bytes from the cached stat."""
+        return self.stat.st_size
+
+
+# =============================================================================
+# Walk Functions
+# =============================================================================
+
+
+# Exclusion predicate: (absolute path, is_dir) -> True to skip the entry
+type ExcludeFunc = Callable[[str, bool], bool]
+
+
+def walk_tree(
+    root: Path,
+    include_dirs: bool = False,
+    exclude: ExcludeFunc | None = None,
+    *,
+    include_symlinks: bool = False,
+) -> Iterator[WalkEntry]:
+    """
+    Walk a directory tree with os.scandir, yielding entries with cached stat.
+
+    Files (including symlinks to files) are always yielded. Directories are
+    descended into but only yielded when include_dirs is True. Symlinks to
+    directories are neither followed nor yielded. Entries whose stat fails
+    (e.g., dangling symlinks, races with deletion) are skipped. Entries the
+    exclude predicate rejects are skipped, and excluded directories are not
+    descended into at all.
+
+    With include_symlinks, every symlink (to a file, to a directory, or
+    dangling) is yielded as a file entry with its own lstat result, the
+    way tar stores links, and never followed.
+
+    Args:
+        root: Directory to walk
+        include_dirs: Whether to yield directory entries as well as files
+        exclude: Optional predicate called with (path, is_dir) for each entry
+        include_symlinks: Whether to yield all symlinks as links
+
+    Yields:
+        WalkEntry for every file (and directory if requested) under root
+    """
+    # Explicit stack keeps deep trees from hitting the recursion limit
+    stack: list[tuple[str, str]] = [(os.fspath(root), "")]
+
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            with os.scandir(dir_path) as iterator:
+                entries = list(iterator)
+        except OSError:
+            # Unreadable or vanished directory: skip like Path.rglob does
+            continue
+
+        subdirs: list[tuple[str, str]] = []
+        for entry in entries:
+            relative = f"{rel_prefix}{entry.name}"
+            try:
+                is_symlink = entry.is_symlink()
+                if is_symlink and include_symlinks:
+                    if exclude is not None and exclude(entry.path, False):
+                        continue
+                    yield WalkEntry(
+                        path=Path(entry.path),
+                        relative=relative,
+                        stat=entry.stat(follow_symlinks=False),
+                        is_symlink=True,
+                    )
+                elif entry.is_dir(follow_symlinks=False):
+                    if exclude is not None and exclude(entry.path, True):
+                        continue
+                    subdirs.append((entry.path, f"{relative}/"))
+                    if include_dirs:
+                        yield WalkEntry(
+                            path=Path(entry.path),
+                            relative=relative,
+                            stat=entry.stat(follow_symlinks=False),
+                            is_dir=True,
+                        )
+                elif entry.is_file():
+                    if exclude is not None and exclude(entry.path, False):
+                        continue
+                    yield WalkEntry(
+                        path=Path(entry.path),
+                        relative=relative,
+                        stat=entry.stat(),
+                        is_symlink=is_symlink,
+                    )
+            except OSError:
+                continue
+
+        # Reverse so subdirectories are visited in scandir order
+        stack.extend(reversed(subdirs))
+
+
+def walk_files(root: Path, exclude: ExcludeFunc | None = None) -> Iterator[WalkEntry]:
+    """
+    Yield file entries under a directory tree.
+
+    Args:
+        root: Directory to walk
+        exclude: Optional predicate called with (path, is_dir) for each entry
+
+    Yields:
+        WalkEntry for every file under root that is not excluded
+    """
+    return walk_tree(root, include_dirs=False, exclude=exclude)
+
+
+# =============================================================================
+# Permission Helpers
+# =============================================================================
+
+
+@cache
+def _process_groups() -> frozenset[int]:
+    """Return the effective group IDs of this process (cached)."""
+    return frozenset((os.getegid(), *os.getgroups()))
+
+
+def stat_is_readable(st: os.stat_result) -> bool:
+    """
+    Check read permission from a stat result without a syscall.
+
+    Evaluates the owner/group/other mode bits against the process identity.
+    POSIX ACLs are not considered; a file denied by an ACL still fails at
+    open time and is reported as a copy failure.
+
+    Args:
+        st: Stat result of the file
+
+    Returns:
+        True if the process may read the file, False otherwise
+    """
+    euid = os.geteuid()
+    if euid == 0:
+        return True
+    if st.st_uid == euid:
+        return bool(st.st_mode & stat.S_IRUSR)
+    if st.st_gid in _process_groups():
+        return bool(st.st_mode & stat.S_IRGRP)
+    return bool(st.st_mode & stat.S_IROTH)
@@ -0,0 +1,367 @@
+"""
+DFBU HashCache - Persistent Content-Hash Cache
+
+Description:
+    Remembers file content digests on disk, keyed by the file's device,
+    inode, size, mtime_ns, and ctime_ns. Hash verification and strict
+    comparison look a file up by a single fstat and only read it when the
+    key changed, so re-verifying an unchanged backup costs stat calls
+    instead of full hash passes. Least recently used entries are evicted
+    once the cache exceeds its entry limit.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - SQLite cache stored at ~/.local/share/dfbu/hash-cache
+    - Loaded lazily on first use, written back in one transaction
+    - LRU eviction bounded by a maximum number of entries
+    - Thread-safe lookups for parallel verification and copy workers
+    - Digests of files modified while hashing are never stored
+    - Files changed within the last timestamp tick are not cached (racy files)
+    - Corrupt or outdated cache files are discarded and recreated
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: sqlite3, threading, collections
+    - file_hasher module for pooled and memory-mapped hashing
+
+Classes:
+    - HashCache: In-memory LRU view of the persistent digest cache
+
+Functions:
+    None
+"""
+
+import logging
+import os
+import sqlite3
+import stat
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Final
+
+from gui.file_hasher import digest_open_file
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_HASH_CACHE_PATH: Final[Path] = (
+    Path.home() / ".local" / "share" / "dfbu" / "hash-cache"
+)
+
+# Entries kept before the least recently used ones are evicted (~100 bytes each)
+DEFAULT_HASH_CACHE_ENTRIES: Final[int] = 200_000
+
+# Files whose ctime is this recent are not cached: a second write within the
+# filesystem's timestamp granularity would leave the key unchanged (as in git)
+RACY_WINDOW_NS: Final[int] = 2_000_000_000
+
+# Bumped whenever the table layout changes; older files are rebuilt empty
+HASH_CACHE_SCHEMA_VERSION: Final[int] = 1
+
+# (st_dev, st_ino, st_size, st_mtime_ns, st_ctime_ns, algorithm)
+type CacheKey = tuple[int, int, int, int, int, str]
+
+
+# =============================================================================
+# HashCache Class
+# =============================================================================
+
+
+class HashCache:
+    """
+    In-memory LRU view of the persistent digest cache.
+
+    ctime_ns is part of the key in addition to device, inode, size, and
+    mtime_ns: rewriting a file in place and restoring its mtime (as copy2
+    does) still changes ctime, so such a file is hashed again.
+
+    Attributes:
+        path: Location of the SQLite cache file
+        max_entries: Number of entries kept before LRU eviction
+
+    Public methods:
+        load: Read the cache file into memory
+        save: Write pending changes back to the cache file
+        lookup: Get the cached digest for a stat result
+        store: Cache the digest for a stat result
+        file_digest: Digest of a file, read only on a cache miss
+
+    Private methods:
+        _key: Build the cache key for a stat result
+        _ensure_loaded: Load the cache file on first use
+        _connect: Open the cache database and ensure the schema
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_HASH_CACHE_PATH,
+        max_entries: int = DEFAULT_HASH_CACHE_ENTRIES,
+    ) -> None:
+        """
+        Initialize HashCache.
+
+        Args:
+            path: Location of the SQLite cache file
+            max_entries: Number of entries kept before LRU eviction
+        """
+        self.path: Path = path
+        self.max_entries: int = max(1, max_entries)
+        # Key -> (digest, last use); ordered from least to most recently used
+        self._entries: OrderedDict[CacheKey, tuple[str, int]] = OrderedDict()
+        self._touched: set[CacheKey] = set()
+        self._evicted: set[CacheKey] = set()
+        self._clock: int = 0
+        self._loaded: bool = False
+        self._replace_all: bool = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of cached digests."""
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    def load(self) -> None:
+        """
+        Read the cache file into memory.
+
+        A missing cache yields an empty cache. An unreadable or outdated
+        cache is logged and replaced on the next save.
+        """
+        with self._lock:
+            self._loaded = False
+            self._ensure_loaded()
+
+    def save(self) -> bool:
+        """
+        Write pending changes back to the cache file in one transaction.
+
+        Returns:
+            True if the cache file is up to date, False if writing failed
+        """
+        with self._lock:
+            if not (self._touched or self._evicted or self._replace_all):
+                return True
+            replace_all = self._replace_all
+            keys = self._entries.keys() if replace_all else self._touched
+            touched = [
+                (*key, *self._entries[key]) for key in keys if key in self._entries
+            ]
+            evicted = list(self._evicted)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if replace_all:
+                # Recreate from scratch (also recovers from a corrupt file)
+                self.path.unlink(missing_ok=True)
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "DELETE FROM digests WHERE dev = ? AND ino = ? AND size = ? "
+                    "AND mtime_ns = ? AND ctime_ns = ? AND algorithm = ?",
+                    evicted,
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO digests (dev, ino, size, mtime_ns, "
+                    "ctime_ns, algorithm, digest, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    touched,
+                )
+            conn.close()
+        except sqlite3.Error, OSError:
+            logger.exception("Failed to write hash cache %s", self.path)
+            return False
+
+        with self._lock:
+            self._touched.clear()
+            self._evicted.clear()
+            self._replace_all = False
+        return True
+
+    def lookup(self, st: os.stat_result, algorithm: str = "sha256") -> str | None:
+        """
+        Get the cached digest for a stat result.
+
+        Args:
+            st: Current stat result of the file
+            algorithm: hashlib algorithm name of the digest
+
+        Returns:
+            Hex digest if cached, None otherwise
+        """
+        key = self._key(st, algorithm)
+        with self._lock:
+            self._ensure_loaded()
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            self._clock += 1
+            self._entries[key] = (cached[0], self._clock)
+            self._entries.move_to_end(key)
+            self._touched.add(key)
+            return cached[0]
+
+    def store(self, st: os.stat_result, digest: str, algorithm: str = "sha256") -> None:
+        """
+        Cache the digest for a stat result, evicting the least recently used.
+
+        Args:
+            st: Stat result of the file the digest was computed from
+            digest: Hex digest of the file contents
+            algorithm: hashlib algorithm name of the digest
+        """
+        key = self._key(st, algorithm)
+        with self._lock:
+            self._ensure_loaded()
+            self._clock += 1
+            self._entries[key] = (digest, self._clock)
+            self._entries.move_to_end(key)
+            self._touched.add(key)
+            self._evicted.discard(key)
+            while len(self._entries) > self.max_entries:
+                oldest, _ = self._entries.popitem(last=False)
+                self._touched.discard(oldest)
+                self._evicted.add(oldest)
+
+    def file_digest(
+        self, file_path: Path, algorithm: str = "sha256", *, allow_mmap: bool = False
+    ) -> str:
+        """
+        Digest of a file, read only on a cache miss.
+
+        The file is stat'ed through its open descriptor before and after
+        hashing; a digest is only cached if the file did not change while
+        it was read. Non-regular files and files changed within
+        RACY_WINDOW_NS are hashed but never cached.
+
+        Args:
+            file_path: File to hash
+            algorithm: hashlib algorithm name (default: SHA-256)
+            allow_mmap: Map large files (see file_hasher.digest_open_file)
+
+        Returns:
+            Hex digest of the file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the algorithm is unknown
+        """
+        with Path(file_path).open("rb", buffering=0) as f:
+            before = os.fstat(f.fileno())
+            cacheable = (
+                stat.S_ISREG(before.st_mode)
+                and time.time_ns() - before.st_ctime_ns >= RACY_WINDOW_NS
+            )
+            if cacheable:
+                cached = self.lookup(before, algorithm)
+                if cached is not None:
+                    return cached
+            digest = digest_open_file(
+                f, algorithm, before.st_size, allow_mmap=allow_mmap
+            )
+            if cacheable and self._key(os.fstat(f.fileno()), algorithm) == self._key(
+                before, algorithm
+            ):
+                self.store(before, digest, algorithm)
+        return digest
+
+    @staticmethod
+    def _key(st: os.stat_result, algorithm: str) -> CacheKey:
+        """
+        Build the cache key for a stat result.
+
+        Args:
+            st: Stat result of the file
+            algorithm: hashlib algorithm name of the digest
+
+        Returns:
+            Cache key tuple
+        """
+        return (
+            st.st_dev,
+            st.st_ino,
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_ctime_ns,
+            algorithm,
+        )
+
+    def _ensure_loaded(self) -> None:
+        """Load the cache file on first use (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._entries.clear()
+        self._touched.clear()
+        self._evicted.clear()
+        self._clock = 0
+        self._replace_all = False
+
+        if not self.path.exists():
+            return
+
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT dev, ino, size, mtime_ns, ctime_ns, algorithm, digest, "
+                    "last_used FROM digests ORDER BY last_used"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Discarding unreadable hash cache %s: %s", self.path, e)
+            self._replace_all = True
+            return
+
+        for *key, digest, last_used in rows:
+            self._entries[tuple(key)] = (digest, last_used)
+        self._clock = rows[-1][-1] if rows else 0
+        # A lowered limit takes effect on the next save
+        while len(self._entries) > self.max_entries:
+            oldest, _ = self._entries.popitem(last=False)
+            self._evicted.add(oldest)
+        logger.debug("Loaded %d entries from %s", len(self._entries), self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the cache database and ensure the schema.
+
+        Returns:
+            Open SQLite connection
+
+        Raises:
+            sqlite3.DatabaseError: If the file is not a usable cache
+        """
+        conn = sqlite3.connect(self.path)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, HASH_CACHE_SCHEMA_VERSION):
+            conn.close()
+            # Unknown layout from another release: start over
+            self.path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS digests ("
+            "dev INTEGER NOT NULL, ino INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, ctime_ns INTEGER NOT NULL, "
+            "algorithm TEXT NOT NULL, digest TEXT NOT NULL, "
+            "last_used INTEGER NOT NULL, "
+            "PRIMARY KEY (dev, ino, size, mtime_ns, ctime_ns, algorithm))"
+        )
+        conn.execute(f"PRAGMA user_version = {HASH_CACHE_SCHEMA_VERSION}")
+        return conn
@@ -0,0 +1,535 @@
+"""
+DFBU MerkleTree - Directory Digest Tree of a Mirror
+
+Description:
+    Keeps a Merkle tree of the mirror next to the mirror index: every file
+    leaf holds the SHA-256 of the backed-up file, and every directory holds
+    a digest of its children's names and digests. Two trees are compared
+    top-down and only subtrees whose digests differ are descended into, so
+    finding what changed since the last verification, or between the
+    mirrors of two hosts, costs time proportional to the differences rather
+    than the size of the mirror.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - JSON tree stored at <mirror_dir>/<hostname>/.dfbu-merkle
+    - Leaves reuse hash-while-copy digests; other files are hashed only when
+      their size, mtime_ns, or ctime_ns changed since the leaf was recorded
+      (or left out of the tree when the caller does not want them hashed)
+    - Directory digests are stored and recomputed only along changed paths
+    - diff descends only into subtrees whose digests differ
+    - Snapshot of the last successfully verified tree for O(changed) checks
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: hashlib, json, os
+
+Classes:
+    - MerkleLeaf: Digest and stat signature of one mirrored file
+    - MerkleTree: Directory digest tree of one mirror root
+
+Functions:
+    - diff_mirrors: Paths that differ between two mirror roots
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from gui.file_hasher import file_digest
+
+
+if TYPE_CHECKING:
+    from gui.hash_cache import HashCache
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Tree file inside the mirror root, next to the mirror index
+MERKLE_FILENAME: Final[str] = ".dfbu-merkle"
+
+# Tree as of the last verification in which every checked file passed
+VERIFIED_MERKLE_FILENAME: Final[str] = ".dfbu-merkle-verified"
+
+MERKLE_VERSION: Final[int] = 1
+
+MERKLE_HASH_ALGORITHM: Final[str] = "sha256"
+
+# Relative path of the mirror root itself
+ROOT_KEY: Final[str] = ""
+
+
+# =============================================================================
+# MerkleLeaf Class
+# =============================================================================
+
+
+class MerkleLeaf(NamedTuple):
+    """
+    Digest and stat signature of one mirrored file.
+
+    Attributes:
+        digest: SHA-256 hex digest of the backed-up file
+        size: Backup file size in bytes when the digest was taken
+        mtime_ns: Backup file modification time when the digest was taken
+        ctime_ns: Backup file change time when the digest was taken
+    """
+
+    digest: str
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+
+    def matches(self, st: os.stat_result) -> bool:
+        """
+        Check whether a stat result still describes the hashed file.
+
+        Args:
+            st: Current stat result of the backup file
+
+        Returns:
+            True if size, mtime_ns, and ctime_ns are unchanged
+        """
+        return (self.size, self.mtime_ns, self.ctime_ns) == (
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_ctime_ns,
+        )
+
+
+# =============================================================================
+# MerkleTree Class
+# =============================================================================
+
+
+class MerkleTree:
+    """
+    Directory digest tree of one mirror root.
+
+    Keys are POSIX paths relative to the root. A directory's digest is the
+    SHA-256 of one "<kind> <name> <digest>" line per child, sorted by name,
+    so equal digests mean equal subtrees. Changing a leaf only marks its
+    ancestors for recomputation.
+
+    Attributes:
+        root: Mirror directory the tree describes
+        tree_path: Location of the tree file
+
+    Public methods:
+        load: Read a stored tree of a mirror root
+        save: Write the tree atomically
+        key: Convert a path inside the root to its tree key
+        leaf: Get the leaf of a file
+        update: Record the digest of a backed-up file
+        discard: Remove a file from the tree
+        set_leaf: Set the leaf of a file by key
+        remove: Remove a file from the tree by key
+        digest: Digest of a file or directory
+        diff: Files whose digests differ from another tree
+        leaves: Keys of all files in the tree
+
+    Private methods:
+        _node: Kind and digest of a tree node
+        _files_under: Keys of all files under a node
+        _compute_digest: Recompute a directory digest from its children
+        _link: Add a file key and its ancestor directories
+        _invalidate: Mark the ancestors of a changed node for recomputation
+    """
+
+    def __init__(self, root: Path, filename: str = MERKLE_FILENAME) -> None:
+        """
+        Initialize an empty MerkleTree.
+
+        Args:
+            root: Mirror directory the tree describes
+            filename: Name of the tree file inside root
+        """
+        self.root: Path = root
+        self.tree_path: Path = root / filename
+        self._prefix: str = f"{os.fspath(root).rstrip(os.sep)}{os.sep}"
+        self._leaves: dict[str, MerkleLeaf] = {}
+        self._dirs: dict[str, str] = {}
+        # Directory key -> names of its children (files and directories)
+        self._children: dict[str, set[str]] = {ROOT_KEY: set()}
+        self._stale: set[str] = set()
+
+    def __len__(self) -> int:
+        """Return number of files in the tree."""
+        return len(self._leaves)
+
+    @classmethod
+    def load(cls, root: Path, filename: str = MERKLE_FILENAME) -> MerkleTree:
+        """
+        Read a stored tree of a mirror root.
+
+        A missing, unreadable, or outdated tree file yields an empty tree,
+        which is rebuilt leaf by leaf as files are backed up.
+
+        Args:
+            root: Mirror directory the tree describes
+            filename: Name of the tree file inside root
+
+        Returns:
+            Loaded tree, empty if none could be read
+        """
+        tree = cls(root, filename)
+        try:
+            data = json.loads(tree.tree_path.read_text(encoding="utf-8"))
+            if data.get("version") != MERKLE_VERSION:
+                return tree
+            leaves = {key: MerkleLeaf(*leaf) for key, leaf in data["files"].items()}
+            dirs = {key: str(digest) for key, digest in data["dirs"].items()}
+        except FileNotFoundError:
+            return tree
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("Ignoring unreadable Merkle tree %s: %s", tree.tree_path, e)
+            return tree
+
+        for key in leaves:
+            tree._link(key)
+        tree._leaves = leaves
+        tree._dirs = dirs
+        # Directories missing from the stored digests are recomputed on demand
+        tree._stale = {key for key in tree._children if key not in dirs}
+        return tree
+
+    def save(self) -> bool:
+        """
+        Write the tree atomically, with all directory digests up to date.
+
+        Returns:
+            True if the tree was written, False if writing failed
+        """
+        target = self.tree_path
+        self.digest(ROOT_KEY)
+        data = {
+            "version": MERKLE_VERSION,
+            "algorithm": MERKLE_HASH_ALGORITHM,
+            "files": self._leaves,
+            "dirs": self._dirs,
+        }
+        tmp_file = target.with_name(f"{target.name}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(
+                json.dumps(data, separators=(",", ":")), encoding="utf-8"
+            )
+            tmp_file.replace(target)
+        except OSError:
+            logger.exception("Failed to write Merkle tree %s", target)
+            return False
+        return True
+
+    def key(self, path: Path) -> str | None:
+        """
+        Convert a path inside the root to its tree key.
+
+        Args:
+            path: File path inside the mirror root
+
+        Returns:
+            POSIX path relative to the root, or None if path is outside it
+        """
+        path_str = os.fspath(path)
+        if not path_str.startswith(self._prefix):
+            return None
+        return path_str[len(self._prefix) :]
+
+    def leaf(self, key: str) -> MerkleLeaf | None:
+        """
+        Get the leaf of a file.
+
+        Args:
+            key: Tree key of the file
+
+        Returns:
+            MerkleLeaf if the file is in the tree, None otherwise
+        """
+        return self._leaves.get(key)
+
+    def update(
+        self,
+        backup_path: Path,
+        digest: str | None = None,
+        hash_cache: HashCache | None = None,
+        *,
+        hash_missing: bool = True,
+    ) -> bool:
+        """
+        Record the digest of a backed-up file.
+
+        A "<algorithm>:<hex digest>" recorded while copying is used as is
+        when it is a SHA-256. Otherwise the existing leaf is kept if the
+        backup's stat signature is unchanged, and the file is hashed if not
+        (or, without hash_missing, removed from the tree).
+
+        Args:
+            backup_path: Backup file inside the mirror root
+            digest: Digest of the copied bytes, if recorded while copying
+            hash_cache: Digest cache used when the file must be hashed
+            hash_missing: Hash the file when no digest or current leaf exists
+
+        Returns:
+            True if the file is in the tree afterwards, False if it is outside
+            the root, could not be read, or was not hashed (it is removed
+            from the tree)
+        """
+        key = self.key(backup_path)
+        if key is None:
+            return False
+        try:
+            st = backup_path.stat()
+            algorithm, _, hex_digest = (digest or "").partition(":")
+            if algorithm != MERKLE_HASH_ALGORITHM or not hex_digest:
+                current = self._leaves.get(key)
+                if current is not None and current.matches(st):
+                    return True
+                if not hash_missing:
+                    # Verification hashes files missing from the tree itself
+                    self.remove(key)
+                    return False
+                # Backup files are only written by DFBU, so mapping is safe
+                if hash_cache is not None:
+                    hex_digest = hash_cache.file_digest(
+                        backup_path, MERKLE_HASH_ALGORITHM, allow_mmap=True
+                    )
+                else:
+                    hex_digest = file_digest(
+                        backup_path, MERKLE_HASH_ALGORITHM, allow_mmap=True
+                    )
+        except OSError as e:
+            logger.warning("Cannot add %s to Merkle tree: %s", backup_path, e)
+            self.discard(backup_path)
+            return False
+
+        self.set_leaf(
+            key, MerkleLeaf(hex_digest, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+        )
+        return True
+
+    def discard(self, backup_path: Path) -> None:
+        """
+        Remove a file from the tree.
+
+        Args:
+            backup_path: Backup file inside the mirror root
+        """
+        key = self.key(backup_path)
+        if key is not None:
+            self.remove(key)
+
+    def set_leaf(self, key: str, leaf: MerkleLeaf) -> None:
+        """
+        Set the leaf of a file, adding the file if needed.
+
+        Args:
+            key: Tree key of the file
+            leaf: Digest and stat signature of the file
+        """
+        if self._leaves.get(key) == leaf:
+            return
+        if key not in self._leaves:
+            self._link(key)
+        self._leaves[key] = leaf
+        self._invalidate(key)
+
+    def remove(self, key: str) -> None:
+        """
+        Remove a file from the tree by key.
+
+        Args:
+            key: Tree key of the file
+        """
+        if self._leaves.pop(key, None) is None:
+            return
+        self._invalidate(key)
+        # Unlink the file and any directories it leaves empty
+        while key:
+            parent, _, name = key.rpartition("/")
+            siblings = self._children[parent]
+            siblings.discard(name)
+            self._children.pop(key, None)
+            self._dirs.pop(key, None)
+            self._stale.discard(key)
+            if siblings or not parent:
+                break
+            key = parent
+
+    def digest(self, key: str = ROOT_KEY) -> str | None:
+        """
+        Digest of a file or directory.
+
+        Args:
+            key: Tree key of the node (ROOT_KEY for the whole mirror)
+
+        Returns:
+            Hex digest, or None if the node is not in the tree
+        """
+        node = self._node(key)
+        return node[1] if node is not None else None
+
+    def diff(self, other: MerkleTree, key: str = ROOT_KEY) -> list[str]:
+        """
+        Files whose digests differ from another tree.
+
+        Starting at key, subtrees with equal digests are skipped with one
+        comparison; only differing directories are descended into.
+
+        Args:
+            other: Tree to compare with (e.g., another host's mirror)
+            key: Tree key of the subtree to compare
+
+        Returns:
+            Sorted keys of files that differ, or exist in only one tree
+        """
+        changed: list[str] = []
+        pending = [key]
+        while pending:
+            current = pending.pop()
+            mine, theirs = self._node(current), other._node(current)
+            if mine == theirs:
+                continue
+            if mine is not None and theirs is not None and mine[0] == theirs[0] == "D":
+                names = self._children.get(current, set()) | other._children.get(
+                    current, set()
+                )
+                pending.extend(
+                    f"{current}/{name}" if current else name for name in names
+                )
+                continue
+            # Changed file, or a node present or typed differently on one side
+            changed.extend(self._files_under(current))
+            changed.extend(other._files_under(current))
+        return sorted(set(changed))
+
+    def leaves(self) -> Iterator[str]:
+        """Yield keys of all files in the tree."""
+        yield from self._leaves
+
+    def _node(self, key: str) -> tuple[str, str] | None:
+        """
+        Kind and digest of a tree node.
+
+        Args:
+            key: Tree key of the node
+
+        Returns:
+            ("F", digest) for files, ("D", digest) for directories, or None
+        """
+        leaf = self._leaves.get(key)
+        if leaf is not None:
+            return ("F", leaf.digest)
+        if key not in self._children:
+            return None
+        if key in self._stale or key not in self._dirs:
+            self._compute_digest(key)
+        return ("D", self._dirs[key])
+
+    def _files_under(self, key: str) -> list[str]:
+        """
+        Keys of all files under a node.
+
+        Args:
+            key: Tree key of a file or directory
+
+        Returns:
+            [key] for a file, all descendant files for a directory
+        """
+        if key in self._leaves:
+            return [key]
+        files: list[str] = []
+        pending = [key]
+        while pending:
+            current = pending.pop()
+            for name in self._children.get(current, ()):
+                child = f"{current}/{name}" if current else name
+                if child in self._leaves:
+                    files.append(child)
+                else:
+                    pending.append(child)
+        return files
+
+    def _compute_digest(self, key: str) -> None:
+        """
+        Recompute a directory digest from its children.
+
+        Args:
+            key: Tree key of the directory
+        """
+        lines: list[str] = []
+        for name in sorted(self._children.get(key, ())):
+            child = f"{key}/{name}" if key else name
+            node = self._node(child)
+            if node is not None:
+                lines.append(f"{node[0]} {name} {node[1]}\n")
+        self._dirs[key] = hashlib.sha256(
+            "".join(lines).encode("utf-8", "surrogateescape")
+        ).hexdigest()
+        self._stale.discard(key)
+
+    def _link(self, key: str) -> None:
+        """
+        Add a file key and its missing ancestor directories to the tree.
+
+        Args:
+            key: Tree key of the file
+        """
+        while key:
+            parent, _, name = key.rpartition("/")
+            siblings = self._children.setdefault(parent, set())
+            if name in siblings:
+                break
+            siblings.add(name)
+            key = parent
+
+    def _invalidate(self, key: str) -> None:
+        """
+        Mark every ancestor directory of a node for recomputation.
+
+        Args:
+            key: Tree key of the changed node
+        """
+        while key:
+            key = key.rpartition("/")[0]
+            self._stale.add(key)
+
+
+# =============================================================================
+# Module Functions
+# =============================================================================
+
+
+def diff_mirrors(first: Path, second: Path) -> list[str]:
+    """
+    Paths that differ between two mirror roots.
+
+    Compares the stored trees of, e.g., two hosts under one mirror base
+    directory with hostname_subdir enabled.
+
+    Args:
+        first: Mirror root of the first host
+        second: Mirror root of the second host
+
+    Returns:
+        Sorted relative paths of files that differ or exist on one side only
+    """
+    return MerkleTree.load(first).diff(MerkleTree.load(second))
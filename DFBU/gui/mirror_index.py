@@ -0,0 +1,369 @@
+"""
+DFBU MirrorIndex - Persistent Mirror Manifest
+
+Description:
+    Keeps a SQLite manifest next to the mirror recording the size, mtime_ns,
+    source inode, and optional content digest of every backed-up file. The
+    skip-unchanged decision compares the source stat against this index
+    instead of stat-ing the destination, which dominates no-change runs on
+    slow disks and FUSE mounts.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - SQLite manifest stored at <mirror_dir>/<hostname>/.dfbu-index
+    - Loaded into memory once per backup, written back in one transaction
+    - Thread-safe record/discard for the parallel copy engine
+    - Rebuild from the mirror contents after external edits
+    - Corrupt or outdated index files are discarded and recreated
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: sqlite3, threading, dataclasses
+
+Classes:
+    - IndexRecord: Immutable manifest entry for one mirrored file
+    - MirrorIndex: In-memory view of the persistent mirror manifest
+
+Functions:
+    None
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from gui.fs_walker import walk_files
+from gui.merkle_tree import MERKLE_FILENAME
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Manifest filename inside the mirror root (SQLite journal files share the prefix)
+INDEX_FILENAME: Final[str] = ".dfbu-index"
+
+# Bumped whenever the table layout changes; older files are rebuilt empty
+INDEX_SCHEMA_VERSION: Final[int] = 1
+
+
+# =============================================================================
+# IndexRecord Class
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class IndexRecord:
+    """
+    Manifest entry for one mirrored file.
+
+    Attributes:
+        size: Source size in bytes at the time of backup
+        mtime_ns: Source modification time in nanoseconds
+        inode: Source inode number, None if unknown (rebuilt entries)
+        digest: Optional hex content digest of the backed-up file
+    """
+
+    size: int
+    mtime_ns: int
+    inode: int | None = None
+    digest: str | None = None
+
+
+# =============================================================================
+# MirrorIndex Class
+# =============================================================================
+
+
+class MirrorIndex:
+    """
+    In-memory view of the persistent mirror manifest.
+
+    Entries are keyed by the destination path relative to the index root.
+    The manifest is read once by load() and written back by save(), so copy
+    workers only touch an in-memory dict guarded by a lock.
+
+    Attributes:
+        root: Mirror directory the index describes
+        index_path: Location of the SQLite manifest file
+
+    Public methods:
+        load: Read the manifest into memory
+        save: Write pending changes back to the manifest
+        covers: Check whether a destination path belongs to this index
+        lookup: Get the record for a destination path
+        matches: Compare a source stat against the recorded entry
+        record: Store the source stat for a backed-up file
+        discard: Remove the entry for a destination path
+        rebuild: Replace all entries with the current mirror contents
+
+    Private methods:
+        _key: Convert a destination path to its manifest key
+        _connect: Open the manifest database and ensure the schema
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Initialize MirrorIndex.
+
+        Args:
+            root: Mirror directory the index describes
+        """
+        self.root: Path = root
+        self.index_path: Path = root / INDEX_FILENAME
+        self._prefix: str = f"{os.fspath(root).rstrip(os.sep)}{os.sep}"
+        self._records: dict[str, IndexRecord] = {}
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        self._replace_all: bool = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of indexed files."""
+        return len(self._records)
+
+    def load(self) -> None:
+        """
+        Read the manifest into memory.
+
+        A missing manifest yields an empty index. An unreadable or outdated
+        manifest is logged and replaced on the next save.
+        """
+        self._records.clear()
+        self._dirty.clear()
+        self._removed.clear()
+        self._replace_all = False
+
+        if not self.index_path.exists():
+            return
+
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT path, size, mtime_ns, inode, digest FROM files"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(
+                "Discarding unreadable mirror index %s: %s", self.index_path, e
+            )
+            self._replace_all = True
+            return
+
+        self._records = {
+            path: IndexRecord(size, mtime_ns, inode, digest)
+            for path, size, mtime_ns, inode, digest in rows
+        }
+        logger.debug("Loaded %d entries from %s", len(self._records), self.index_path)
+
+    def save(self) -> bool:
+        """
+        Write pending changes back to the manifest in one transaction.
+
+        Returns:
+            True if the manifest is up to date, False if writing failed
+        """
+        with self._lock:
+            if not (self._dirty or self._removed or self._replace_all):
+                return True
+            replace_all = self._replace_all
+            keys = self._records.keys() if replace_all else self._dirty
+            dirty = {key: self._records[key] for key in keys if key in self._records}
+            removed = list(self._removed)
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if replace_all:
+                # Recreate from scratch (also recovers from a corrupt file)
+                self.index_path.unlink(missing_ok=True)
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "DELETE FROM files WHERE path = ?", ((key,) for key in removed)
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, inode, digest) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (key, rec.size, rec.mtime_ns, rec.inode, rec.digest)
+                        for key, rec in dirty.items()
+                    ),
+                )
+            conn.close()
+        except sqlite3.Error, OSError:
+            logger.exception("Failed to write mirror index %s", self.index_path)
+            return False
+
+        with self._lock:
+            self._dirty.clear()
+            self._removed.clear()
+            self._replace_all = False
+        return True
+
+    def covers(self, dest_path: Path) -> bool:
+        """
+        Check whether a destination path belongs to this index.
+
+        Args:
+            dest_path: Destination file path
+
+        Returns:
+            True if dest_path is inside the index root
+        """
+        return os.fspath(dest_path).startswith(self._prefix)
+
+    def lookup(self, dest_path: Path) -> IndexRecord | None:
+        """
+        Get the record for a destination path.
+
+        Args:
+            dest_path: Destination file path inside the index root
+
+        Returns:
+            IndexRecord if the file is indexed, None otherwise
+        """
+        return self._records.get(self._key(dest_path))
+
+    def matches(self, dest_path: Path, src_stat: os.stat_result) -> bool | None:
+        """
+        Compare a source stat against the recorded entry.
+
+        Size and mtime_ns must match exactly. The inode must also match when
+        it was recorded, which catches files replaced by rename.
+
+        Args:
+            dest_path: Destination file path inside the index root
+            src_stat: Current stat result of the source file
+
+        Returns:
+            True if unchanged, False if changed, None if the file is not indexed
+        """
+        key = self._key(dest_path)
+        rec = self._records.get(key)
+        if rec is None:
+            return None
+        if rec.size != src_stat.st_size or rec.mtime_ns != src_stat.st_mtime_ns:
+            return False
+        if rec.inode is None:
+            # Entry came from a rebuild: adopt the source inode from now on
+            self.record(dest_path, src_stat, rec.digest)
+            return True
+        return rec.inode == src_stat.st_ino
+
+    def record(
+        self, dest_path: Path, src_stat: os.stat_result, digest: str | None = None
+    ) -> None:
+        """
+        Store the source stat for a backed-up file.
+
+        Args:
+            dest_path: Destination file path inside the index root
+            src_stat: Stat result of the source file that was copied
+            digest: Optional hex content digest of the copied data
+        """
+        key = self._key(dest_path)
+        rec = IndexRecord(
+            src_stat.st_size, src_stat.st_mtime_ns, src_stat.st_ino, digest
+        )
+        with self._lock:
+            self._records[key] = rec
+            self._dirty.add(key)
+            self._removed.discard(key)
+
+    def discard(self, dest_path: Path) -> None:
+        """
+        Remove the entry for a destination path.
+
+        Args:
+            dest_path: Destination file path inside the index root
+        """
+        key = self._key(dest_path)
+        with self._lock:
+            if self._records.pop(key, None) is not None:
+                self._removed.add(key)
+            self._dirty.discard(key)
+
+    def rebuild(self) -> int:
+        """
+        Replace all entries with the current mirror contents.
+
+        Entries are built from the mirrored files' own stat results, which
+        match the source because copies preserve mtime. Source inodes are
+        unknown until the next backup adopts them.
+
+        Returns:
+            Number of files indexed
+        """
+        records: dict[str, IndexRecord] = {}
+        if self.root.is_dir():
+            for entry in walk_files(self.root):
+                if entry.relative.startswith((INDEX_FILENAME, MERKLE_FILENAME)):
+                    continue
+                records[entry.relative] = IndexRecord(
+                    entry.stat.st_size, entry.stat.st_mtime_ns
+                )
+
+        with self._lock:
+            self._records = records
+            self._dirty.clear()
+            self._removed.clear()
+            self._replace_all = True
+
+        logger.info(
+            "Rebuilt mirror index %s with %d entries", self.index_path, len(records)
+        )
+        return len(records)
+
+    def _key(self, dest_path: Path) -> str:
+        """
+        Convert a destination path to its manifest key.
+
+        Args:
+            dest_path: Destination file path inside the index root
+
+        Returns:
+            POSIX path relative to the index root
+        """
+        return os.fspath(dest_path)[len(self._prefix) :]
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the manifest database and ensure the schema.
+
+        Returns:
+            Open SQLite connection
+
+        Raises:
+            sqlite3.DatabaseError: If the file is not a usable manifest
+        """
+        conn = sqlite3.connect(self.index_path)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, INDEX_SCHEMA_VERSION):
+            conn.close()
+            # Unknown layout from another release: start over
+            self.index_path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.index_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, inode INTEGER, digest TEXT)"
+        )
+        conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+        return conn
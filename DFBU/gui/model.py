@@ -10,7 +10,7 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 10-30-2025
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
@@ -32,6 +32,7 @@ Functions:
     None
 """
 
+import os
 import sys
 from collections.abc import Callable
 from pathlib import Path
@@ -49,19 +50,43 @@ from core.common_types import (
     LegacyDotFileDict,
     OptionsDict,
     SizeReportDict,
+    VerificationReportDict,
 )
 
+from gui.archive_compression import (
+    DEFAULT_ARCHIVE_FORMAT,
+    DEFAULT_COMPRESSION_LEVEL,
+)
 from gui.backup_history import BackupHistoryManager
 from gui.backup_orchestrator import BackupOrchestrator
+from gui.change_journal import (
+    ChangeJournal,
+    InotifyWatcher,
+    QtChangeWatcher,
+    create_change_watcher,
+)
 from gui.config_manager import ConfigManager
+from gui.copy_engine import DEFAULT_COPY_WORKERS
+from gui.delta_sync import DEFAULT_DELTA_THRESHOLD_MB
 from gui.error_handler import ErrorHandler
+from gui.exclusion import IGNORE_FILE_NAME, compile_exclusions
 from gui.file_operations import FileOperations
+from gui.hash_cache import DEFAULT_HASH_CACHE_PATH, HashCache
+from gui.merkle_tree import diff_mirrors
 from gui.preview_generator import PreviewGenerator
 from gui.profile_manager import ProfileManager
 from gui.restore_backup_manager import RestoreBackupManager
+from gui.scan_snapshot import DEFAULT_SCAN_TTL_SECONDS, ScanSnapshot
 from gui.size_analyzer import SizeAnalyzer
+from gui.size_cache import DEFAULT_SIZE_CACHE_PATH, DirSizeCache
 from gui.statistics_tracker import BackupStatistics, StatisticsTracker
-from gui.verification_manager import VerificationManager
+from gui.verification_coverage import DEFAULT_COVERAGE_PATH, VerificationCoverage
+from gui.verification_manager import (
+    DEFAULT_SAMPLE_PERCENT,
+    DEFAULT_VERIFY_WORKERS,
+    VerificationManager,
+)
+from gui.verification_results import DEFAULT_RESULTS_DIR, FailureCallback
 
 
 # =============================================================================
@@ -97,7 +122,11 @@ class DFBUModel:
         get_dotfile_count: Get number of configured dotfiles
         get_dotfile_sizes: Calculate sizes for all dotfiles
         validate_dotfile_paths: Check which dotfiles exist on system
+        scan_dotfiles: Walk enabled dotfile paths once for the current operation
+        invalidate_scan: Discard the scan snapshot so the next walk is fresh
         expand_path: Expand user home directory in path
+        load_exclusions: Compile .dfbuignore patterns for all backup walks
+        is_path_excluded: Check a path against the exclusion patterns
         check_readable: Check if path has read permissions
         create_directory: Create directory with permissions
         files_are_identical: Compare files using metadata
@@ -105,8 +134,17 @@ class DFBUModel:
         copy_directory: Copy directory recursively
         calculate_path_size: Calculate total size of file or directory
         assemble_dest_path: Build destination path for backup
-        create_archive: Create compressed TAR.GZ archive
+        create_archive: Create compressed tar archive
         rotate_archives: Delete oldest archives exceeding limit
+        restore_archive_member: Restore one file from an archive via its index
+        begin_mirror_backup: Load the mirror index and snapshot link for a backup
+        end_mirror_backup: Save the mirror index, Merkle tree, and hash cache
+        diff_host_mirror: Files that differ from another host's mirror
+        rebuild_mirror_index: Rebuild the mirror index from mirror contents
+        refresh_change_watcher: Start, restart, or stop the change watcher
+        stop_change_watcher: Stop watching dotfile paths for changes
+        begin_journaled_backup: Take the journaled changes for a mirror backup
+        end_journaled_backup: Return unfinished paths to the change journal
         discover_restore_files: Find all files in restore source
         reconstruct_restore_paths: Build original paths from backup structure
         record_item_processed: Record successful item processing
@@ -121,7 +159,10 @@ class DFBUModel:
         format_size_report: Format a size report for display
 
     Private methods:
-        None (delegation only)
+        _apply_performance_options: Push performance options to components
+        _watch_roots: Expanded paths of all enabled dotfile entries
+        _journal_scope: Mirror root the change journal is synced against
+        _save_size_cache: Persist directory sizes learned by a size calculation
     """
 
     def __init__(self, config_path: Path) -> None:
@@ -133,17 +174,19 @@ class DFBUModel:
         """
         self.hostname: str = gethostname()
 
+        # Initialize StatisticsTracker (receives copy strategy counts from FileOperations)
+        self._stats_tracker: StatisticsTracker = StatisticsTracker()
+
         # Initialize FileOperations (needed by ConfigManager)
-        self._file_ops: FileOperations = FileOperations(self.hostname)
+        self._file_ops: FileOperations = FileOperations(
+            self.hostname, stats_tracker=self._stats_tracker
+        )
 
         # Initialize ConfigManager
         self._config_manager: ConfigManager = ConfigManager(
             config_path, expand_path_callback=self._file_ops.expand_path
         )
 
-        # Initialize StatisticsTracker
-        self._stats_tracker: StatisticsTracker = StatisticsTracker()
-
         # Initialize pre-restore backup manager with config-based directory
         self._restore_backup_manager: RestoreBackupManager = RestoreBackupManager(
             backup_base_dir=self._config_manager.restore_backup_dir,
@@ -169,6 +212,10 @@ class DFBUModel:
 
         # Track backed up files for verification (used by BackupWorker)
         self._last_backup_files: list[tuple[Path, Path]] = []
+        # Digests of copied bytes by backup path (hash-while-copy)
+        self._last_backup_digests: dict[Path, str] = {}
+        # Archive written by the last backup, verified by streaming through it
+        self._last_archive: Path | None = None
 
         # Initialize ErrorHandler for structured error handling (v0.9.0)
         self._error_handler: ErrorHandler = ErrorHandler()
@@ -199,6 +246,24 @@ class DFBUModel:
         # Lazy-initialized PreviewGenerator (v1.1.0)
         self._preview_generator: PreviewGenerator | None = None
 
+        # Change journal fed by a background watcher when enabled (v1.3.0)
+        self._change_journal: ChangeJournal = ChangeJournal()
+        self._change_watcher: InotifyWatcher | QtChangeWatcher | None = None
+
+        # Persistent digest cache shared by verification and strict comparison
+        self._hash_cache: HashCache = HashCache(DEFAULT_HASH_CACHE_PATH)
+
+        # Per-directory sizes so refreshes only list directories that changed
+        self._size_cache: DirSizeCache = DirSizeCache(DEFAULT_SIZE_CACHE_PATH)
+
+        # Last hash verification of each backup file, for sampled verification
+        self._verification_manager.coverage = VerificationCoverage(
+            DEFAULT_COVERAGE_PATH
+        )
+
+        # Apply default performance options until config is loaded (v1.3.0)
+        self._apply_performance_options()
+
     # =========================================================================
     # Property Accessors for Backward Compatibility
     # =========================================================================
@@ -295,6 +360,7 @@ class DFBUModel:
             Tuple of (success, error_message). error_message is empty on success.
         """
         success, error = self._config_manager.load_config()
+        self.invalidate_scan()
 
         # Update BackupOrchestrator with new base directories
         if success:
@@ -328,6 +394,12 @@ class DFBUModel:
             # Load profiles (v1.1.0)
             self._profile_manager.load_profiles()
 
+            # Exclusions apply to mirror, archive, preview, and size walks
+            self.load_exclusions()
+
+            # Apply performance options (v1.3.0)
+            self._apply_performance_options()
+
         return success, error
 
     def save_config(self) -> tuple[bool, str]:
@@ -360,9 +432,11 @@ class DFBUModel:
         Returns:
             True if dotfile was added successfully
         """
-        return self._config_manager.add_dotfile(
+        result = self._config_manager.add_dotfile(
             category, application, description, paths, enabled
         )
+        self.invalidate_scan()
+        return result
 
     def update_dotfile(
         self,
@@ -387,9 +461,11 @@ class DFBUModel:
         Returns:
             True if dotfile was updated successfully
         """
-        return self._config_manager.update_dotfile(
+        result = self._config_manager.update_dotfile(
             index, category, application, description, paths, enabled
         )
+        self.invalidate_scan()
+        return result
 
     def remove_dotfile(self, index: int) -> bool:
         """
@@ -401,7 +477,9 @@ class DFBUModel:
         Returns:
             True if dotfile was removed successfully
         """
-        return self._config_manager.remove_dotfile(index)
+        result = self._config_manager.remove_dotfile(index)
+        self.invalidate_scan()
+        return result
 
     def toggle_dotfile_enabled(self, index: int) -> bool:
         """
@@ -413,7 +491,9 @@ class DFBUModel:
         Returns:
             New enabled status if successful, current status otherwise
         """
-        return self._config_manager.toggle_dotfile_enabled(index)
+        result = self._config_manager.toggle_dotfile_enabled(index)
+        self.invalidate_scan()
+        return result
 
     def update_option(self, key: str, value: bool | int | str) -> bool:
         """
@@ -426,7 +506,84 @@ class DFBUModel:
         Returns:
             True if option was updated successfully
         """
-        return self._config_manager.update_option(key, value)
+        success = self._config_manager.update_option(key, value)
+        if success:
+            self._apply_performance_options()
+        return success
+
+    def _apply_performance_options(self) -> None:
+        """Push performance-related options to the components that use them."""
+        options = self._config_manager.options
+        self._file_ops.copy_workers = options.get("copy_workers", DEFAULT_COPY_WORKERS)
+        threshold_mb = options.get(
+            "delta_sync_threshold_mb", DEFAULT_DELTA_THRESHOLD_MB
+        )
+        self._file_ops.delta_threshold = threshold_mb * 1024 * 1024
+        self._file_ops.archive_format = options.get(
+            "archive_format", DEFAULT_ARCHIVE_FORMAT
+        )
+        self._file_ops.compression_level = options.get(
+            "archive_compression_level", DEFAULT_COMPRESSION_LEVEL
+        )
+        # Chains hold at most max_archives archives so rotation can drop old ones
+        self._file_ops.incremental_archives = options.get("incremental_archives", False)
+        self._file_ops.incremental_chain_limit = max(1, options["max_archives"])
+        # Digests taken while copying spare hash verification a source re-read
+        self._file_ops.hash_while_copy = options.get("hash_verification", False)
+        self._verification_manager.workers = options.get(
+            "verify_workers", DEFAULT_VERIFY_WORKERS
+        )
+        hash_cache = self._hash_cache if options.get("hash_cache", True) else None
+        self._verification_manager.hash_cache = hash_cache
+        self._file_ops.hash_cache = hash_cache
+        self._file_ops.strict_compare = options.get("strict_compare", False)
+        self._verification_manager.sample_percent = max(
+            1, min(100, options.get("verify_sample_percent", DEFAULT_SAMPLE_PERCENT))
+        )
+        budget_mb = options.get("verify_sample_budget_mb", 0)
+        self._verification_manager.sample_budget_bytes = max(0, budget_mb) * 1024 * 1024
+        # Large backups: count passed files instead of keeping a dict for each
+        self._verification_manager.failures_only = options.get(
+            "verify_failures_only", False
+        )
+        self._verification_manager.results_dir = (
+            DEFAULT_RESULTS_DIR if options.get("verify_results_file", False) else None
+        )
+        self._file_ops.scan_cache.ttl = options.get(
+            "scan_snapshot_ttl", DEFAULT_SCAN_TTL_SECONDS
+        )
+        self._file_ops.size_cache = (
+            self._size_cache if options.get("size_cache", True) else None
+        )
+        # Huge caches: stop sizing an entry once it is proven critical
+        self._size_analyzer.size_probe_enabled = options.get("size_probe", False)
+
+    def _watch_roots(self) -> tuple[Path, ...]:
+        """
+        Expanded paths of all enabled dotfile entries.
+
+        Returns:
+            Sorted, de-duplicated tuple of paths to watch
+        """
+        roots = {
+            self.expand_path(path_str)
+            for dotfile in self.dotfiles
+            if dotfile.get("enabled", True)
+            for path_str in dotfile["paths"]
+            if path_str
+        }
+        return tuple(sorted(roots))
+
+    def _journal_scope(self) -> str:
+        """
+        Mirror root the change journal is synced against.
+
+        Returns:
+            Host-level mirror directory as a string
+        """
+        if self.options["hostname_subdir"]:
+            return os.fspath(self.mirror_base_dir / self.hostname)
+        return os.fspath(self.mirror_base_dir)
 
     def update_path(self, path_type: str, value: str) -> bool:
         """
@@ -493,6 +650,35 @@ class DFBUModel:
         """
         return self._file_ops.expand_path(path_str)
 
+    def load_exclusions(self) -> list[str]:
+        """
+        Compile .dfbuignore patterns for all backup walks.
+
+        Reads the ignore file from the configuration directory and installs
+        the compiled matcher on FileOperations, so copy_directory,
+        create_archive, previews, and size calculations prune the same paths.
+
+        Returns:
+            Pattern lines loaded from the ignore file
+        """
+        ignore_file = self._config_manager.config_path / IGNORE_FILE_NAME
+        patterns = self._size_analyzer.load_ignore_patterns(ignore_file)
+        self._file_ops.exclusions = compile_exclusions(tuple(patterns))
+        return patterns
+
+    def is_path_excluded(self, path: Path, is_dir: bool = False) -> bool:
+        """
+        Check a path against the exclusion patterns.
+
+        Args:
+            path: Absolute path to check
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path or one of its parent directories is excluded
+        """
+        return self._file_ops.is_excluded(path, is_dir)
+
     def check_readable(self, path: Path) -> bool:
         """
         Check if path has read permissions.
@@ -596,6 +782,7 @@ class DFBUModel:
                     total_size += self.calculate_path_size(path)
             size_results[i] = total_size
 
+        self._save_size_cache()
         return size_results
 
     def assemble_dest_path(
@@ -625,7 +812,7 @@ class DFBUModel:
         self, dotfiles_to_archive: list[tuple[Path, bool, bool]]
     ) -> Path | None:
         """
-        Create compressed TAR.GZ archive of existing dotfiles.
+        Create compressed tar archive of existing dotfiles.
 
         Args:
             dotfiles_to_archive: List of (path, exists, is_dir) tuples
@@ -633,11 +820,14 @@ class DFBUModel:
         Returns:
             Path to created archive file, or None if operation failed
         """
-        return self._file_ops.create_archive(
+        archive_path = self._file_ops.create_archive(
             dotfiles_to_archive,
             self.archive_base_dir,
             self.options["hostname_subdir"],
         )
+        if archive_path is not None:
+            self._last_archive = archive_path
+        return archive_path
 
     def rotate_archives(self) -> list[Path]:
         """
@@ -652,6 +842,178 @@ class DFBUModel:
             self.options["max_archives"],
         )
 
+    def restore_archive_member(
+        self, archive_path: Path, member_path: Path, dest_root: Path
+    ) -> Path | None:
+        """
+        Restore one file from an archive via its index.
+
+        Like a full restore, an existing file at the destination is saved by
+        the pre-restore backup first when that option is enabled.
+
+        Args:
+            archive_path: Archive file to restore from
+            member_path: Original absolute path of the file
+            dest_root: Directory the original path is recreated under
+                (Path("/") restores over the original file)
+
+        Returns:
+            Path of the restored file, or None if restore failed
+        """
+        pre_restore_enabled: bool = self._config_manager.options.get(
+            "pre_restore_backup", True
+        )
+        return self._backup_orchestrator.restore_archive_member(
+            archive_path,
+            member_path,
+            dest_root,
+            pre_restore_enabled=pre_restore_enabled,
+        )
+
+    def begin_mirror_backup(self) -> None:
+        """Load the mirror index and snapshot link before a mirror backup."""
+        hostname_subdir = self.options["hostname_subdir"]
+        if self.options.get("mirror_index", True):
+            self._file_ops.open_mirror_index(self.mirror_base_dir, hostname_subdir)
+        # Hardlink snapshots only apply to dated mirrors (v1.3.0)
+        if self.options["date_subdir"] and self.options.get("hardlink_snapshots", True):
+            # Linked files take their digest from the previous snapshot's leaf
+            tree = (
+                self._file_ops.load_merkle_tree(self.mirror_base_dir, hostname_subdir)
+                if self.options.get("merkle_tree", True)
+                else None
+            )
+            self._file_ops.open_snapshot_link(
+                self.mirror_base_dir, hostname_subdir, tree
+            )
+
+    def end_mirror_backup(self) -> None:
+        """
+        Save the mirror index, Merkle tree, and hash cache.
+
+        Also stops snapshot linking and discards the scan snapshot. Files
+        registered during the backup are recorded in the Merkle tree stored
+        with the mirror. Files without a copy digest or current leaf are
+        only hashed for the tree when hash verification is enabled; the
+        tree only serves hash verification, which hashes them otherwise.
+        """
+        self._file_ops.close_snapshot_link()
+        self._file_ops.close_mirror_index()
+        # The snapshot belongs to this backup; the next operation walks again
+        self.invalidate_scan()
+        if self.options.get("merkle_tree", True) and self._last_backup_files:
+            self._file_ops.update_merkle_tree(
+                self.mirror_base_dir,
+                self.options["hostname_subdir"],
+                {
+                    backup: self._last_backup_digests.get(backup)
+                    for _, backup in self._last_backup_files
+                },
+                hash_missing=self.options.get("hash_verification", False),
+            )
+        # Keep digests from strict comparisons for the next run
+        if self._file_ops.strict_compare and self._file_ops.hash_cache is not None:
+            self._file_ops.hash_cache.save()
+
+    def diff_host_mirror(self, hostname: str) -> list[str] | None:
+        """
+        Files that differ between this host's mirror and another host's.
+
+        Compares the Merkle trees stored with both mirrors, descending only
+        into subtrees whose digests differ.
+
+        Args:
+            hostname: Other host whose mirror shares the mirror base directory
+
+        Returns:
+            Sorted paths relative to the host mirror roots, or None if mirrors
+            are not separated by hostname
+        """
+        if not self.options["hostname_subdir"]:
+            return None
+        return diff_mirrors(
+            self.mirror_base_dir / self._file_ops.hostname,
+            self.mirror_base_dir / hostname,
+        )
+
+    def rebuild_mirror_index(self) -> int:
+        """
+        Rebuild the mirror index from the current mirror contents.
+
+        Returns:
+            Number of files indexed, or -1 if the index could not be written
+        """
+        return self._file_ops.rebuild_mirror_index(
+            self.mirror_base_dir, self.options["hostname_subdir"]
+        )
+
+    def refresh_change_watcher(self) -> bool:
+        """
+        Start, restart, or stop the change watcher to match the configuration.
+
+        The watcher runs when the change_journal option is on and the mirror
+        is not dated (dated snapshots always need a full walk). It restarts
+        when the set of enabled dotfile paths changes. Must be called from
+        the GUI thread; the watcher walks its trees in the background and
+        is not used for backups until that initial pass completes.
+
+        Returns:
+            True if a watcher is running after the call
+        """
+        enabled = self.options.get("change_journal", False) and not self.options.get(
+            "date_subdir", False
+        )
+        roots = self._watch_roots() if enabled else ()
+        watcher = self._change_watcher
+        if watcher is not None and watcher.is_running and watcher.roots == roots:
+            return True
+
+        self.stop_change_watcher()
+        if not roots:
+            return False
+        self._change_watcher = create_change_watcher(self._change_journal, roots)
+        if not self._change_watcher.start():
+            self._change_watcher = None
+            return False
+        return True
+
+    def stop_change_watcher(self) -> None:
+        """Stop watching dotfile paths for changes."""
+        if self._change_watcher is not None:
+            self._change_watcher.stop()
+            self._change_watcher = None
+
+    def begin_journaled_backup(self, force_full: bool = False) -> set[str] | None:
+        """
+        Take the journaled changes for a mirror backup.
+
+        Once a watcher has finished its initial watch pass, the journal is
+        checkpointed so changes made during this backup are kept for the
+        next one. Before that the journal is left unsynced.
+
+        Args:
+            force_full: Whether the caller walks everything regardless
+
+        Returns:
+            Changed paths to back up, or None if every path must be walked
+        """
+        watcher = self._change_watcher
+        if watcher is None or not watcher.is_ready:
+            return None
+        changes = self._change_journal.checkpoint(self._journal_scope())
+        return None if force_full else changes
+
+    def end_journaled_backup(self, retry_paths: list[str] | None) -> None:
+        """
+        Return unfinished paths to the change journal.
+
+        Args:
+            retry_paths: Paths that failed and must be retried next time,
+                or None if the backup was interrupted before a full walk
+        """
+        if self._change_watcher is not None:
+            self._change_journal.restore(retry_paths)
+
     def discover_restore_files(self, src_dir: Path) -> list[Path]:
         """
         Find all files in restore source directory recursively.
@@ -691,7 +1053,32 @@ class DFBUModel:
         """
         # Cast to list[DotFileDict] as LegacyDotFileDict is compatible for validation
         dotfiles_for_validation: list[DotFileDict] = self.dotfiles  # type: ignore[assignment]  # Compatible structure
-        return self._backup_orchestrator.validate_dotfile_paths(dotfiles_for_validation)
+        return self._backup_orchestrator.validate_dotfile_paths(
+            dotfiles_for_validation, self._file_ops.current_scan()
+        )
+
+    def scan_dotfiles(self) -> ScanSnapshot | None:
+        """
+        Walk all enabled dotfile paths once for the current operation.
+
+        Size analysis, previews, path validation, and the mirror copy read
+        from the resulting snapshot instead of walking the trees again,
+        until it expires (scan_snapshot_ttl) or invalidate_scan is called.
+        A fresh snapshot covering every path is reused without walking.
+
+        Returns:
+            Fresh snapshot, or None if scan_snapshot_ttl is 0
+        """
+        return self._file_ops.scan_paths(list(self._watch_roots()))
+
+    def invalidate_scan(self) -> None:
+        """Discard the scan snapshot so the next walk sees current files."""
+        self._file_ops.scan_cache.invalidate()
+
+    def _save_size_cache(self) -> None:
+        """Persist directory sizes learned by the last size calculation."""
+        if self._file_ops.size_cache is not None:
+            self._file_ops.size_cache.save()
 
     def execute_restore(
         self,
@@ -752,25 +1139,83 @@ class DFBUModel:
     # Backup Verification (Delegate to VerificationManager)
     # =========================================================================
 
-    def verify_last_backup(self) -> str | None:
+    def verify_last_backup(
+        self,
+        progress_callback: Callable[[int], None] | None = None,
+        failure_callback: FailureCallback | None = None,
+    ) -> str | None:
         """
         Verify integrity of the last backup operation.
 
         Uses the Model's tracked file pairs (populated by BackupWorker)
         rather than BackupOrchestrator's tracking (which BackupWorker bypasses).
+        An archive written by the same backup is verified after the mirror by
+        streaming through it once.
+
+        Args:
+            progress_callback: Optional callback for progress updates (0-100)
+            failure_callback: Optional callback receiving each failed file's
+                result as soon as it is found
 
         Returns:
-            Formatted verification report for log display, or None if no backup to verify
-        """
-        if not self._last_backup_files:
+            Formatted verification report(s) for log display, or None if no
+            backup to verify
+        """
+        # Copies: a backup started meanwhile clears and refills the originals
+        files = list(self._last_backup_files)
+        digests = dict(self._last_backup_digests)
+        archive = self._last_archive
+        steps = int(bool(files)) + int(archive is not None)
+        if steps == 0:
             return None
 
-        report = self._verification_manager.verify_backup(
-            backup_path=self.mirror_base_dir,
-            source_paths=self._last_backup_files,
-            backup_type="mirror",
+        def step_progress(step: int) -> Callable[[int], None] | None:
+            # Mirror and archive each cover an equal share of the progress bar
+            if progress_callback is None:
+                return None
+            return lambda pct: progress_callback((step * 100 + pct) // steps)
+
+        reports: list[VerificationReportDict] = []
+        if files:
+            tree = (
+                self._file_ops.load_merkle_tree(
+                    self.mirror_base_dir, self.options["hostname_subdir"]
+                )
+                if self.options.get("merkle_tree", True)
+                else None
+            )
+            reports.append(
+                self._verification_manager.verify_backup(
+                    backup_path=self.mirror_base_dir,
+                    source_paths=files,
+                    backup_type="mirror",
+                    digests=digests,
+                    progress_callback=step_progress(0),
+                    tree=tree,
+                    failure_callback=failure_callback,
+                )
+            )
+        if archive is not None:
+            reports.append(
+                self._verification_manager.verify_archive(
+                    archive,
+                    progress_callback=step_progress(len(reports)),
+                    failure_callback=failure_callback,
+                )
+            )
+        return "\n".join(
+            self._verification_manager.format_report_for_log(report)
+            for report in reports
         )
-        return self._verification_manager.format_report_for_log(report)
+
+    def has_backup_to_verify(self) -> bool:
+        """
+        Check whether the last backup left files or an archive to verify.
+
+        Returns:
+            True if verify_last_backup has something to verify
+        """
+        return bool(self._last_backup_files) or self._last_archive is not None
 
     def get_last_backup_file_count(self) -> int:
         """
@@ -785,13 +1230,19 @@ class DFBUModel:
         """
         Register a successfully backed up file for verification tracking.
 
-        Called by BackupWorker after each successful file copy.
+        Called by BackupWorker after each successful file copy. A digest
+        recorded while the file was copied is kept for verification.
 
         Args:
             source: Original source file path
             backup: Backup destination file path
         """
         self._last_backup_files.append((source, backup))
+        digest = self._file_ops.pop_copy_digest(backup)
+        if digest is not None:
+            self._last_backup_digests[backup] = digest
+        else:
+            self._last_backup_digests.pop(backup, None)
 
     def clear_backup_tracking(self) -> None:
         """
@@ -800,6 +1251,9 @@ class DFBUModel:
         Should be called at the start of a new backup operation.
         """
         self._last_backup_files.clear()
+        self._last_backup_digests.clear()
+        self._last_archive = None
+        self._file_ops.clear_copy_digests()
 
     def set_hash_verification_enabled(self, enabled: bool) -> None:
         """
@@ -809,6 +1263,7 @@ class DFBUModel:
             enabled: Whether to enable hash verification
         """
         self._verification_manager.hash_verification_enabled = enabled
+        self._file_ops.hash_while_copy = enabled
 
     # =========================================================================
     # Size Analysis (Delegate to SizeAnalyzer)
@@ -821,7 +1276,10 @@ class DFBUModel:
         """
         Analyze sizes of all configured dotfiles before backup.
 
-        Loads .dfbuignore patterns and analyzes enabled dotfiles.
+        Reloads .dfbuignore patterns and analyzes enabled dotfiles from a
+        scan snapshot that the backup started next reuses. In probe mode
+        (size_probe) no full snapshot is walked up front; each entry is
+        sized only until it proves critical, and the backup walks itself.
 
         Args:
             progress_callback: Optional callback for progress updates (0-100)
@@ -829,20 +1287,24 @@ class DFBUModel:
         Returns:
             SizeReportDict with analysis results
         """
-        # Load ignore patterns from data directory
-        ignore_file = self._config_manager.config_path / ".dfbuignore"
-        patterns = self._size_analyzer.load_ignore_patterns(ignore_file)
+        # Reload ignore patterns so edits apply to the next backup as well
+        patterns = self.load_exclusions()
+        # One walk shared with the backup that normally follows the scan
+        if not self._size_analyzer.size_probe_enabled:
+            self.scan_dotfiles()
 
         # Filter to enabled dotfiles only
         enabled_dotfiles = [df for df in self.dotfiles if df.get("enabled", True)]
         # Cast to list[DotFileDict] as LegacyDotFileDict is compatible for size analysis
         dotfiles_for_analysis: list[DotFileDict] = enabled_dotfiles  # type: ignore[assignment]  # Compatible structure
 
-        return self._size_analyzer.analyze_dotfiles(
+        report = self._size_analyzer.analyze_dotfiles(
             dotfiles=dotfiles_for_analysis,
             progress_callback=progress_callback,
             ignore_patterns=patterns,
         )
+        self._save_size_cache()
+        return report
 
     def is_size_check_enabled(self) -> bool:
         """
@@ -1016,6 +1478,8 @@ class DFBUModel:
         """
         # Initialize preview generator if needed
         self._init_preview_generator()
+        # One walk shared with a backup started right after the preview
+        self.scan_dotfiles()
 
         # Get enabled dotfiles from ConfigManager
         enabled_dotfiles = [df for df in self.dotfiles if df.get("enabled", True)]
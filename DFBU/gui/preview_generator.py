@@ -10,6 +10,7 @@ Date Created: 2026-02-05
 License: MIT
 """
 
+import os
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -17,6 +18,7 @@ from typing import Any
 from core.common_types import BackupPreviewDict, PreviewItemDict
 
 from gui.file_operations import FileOperations
+from gui.fs_walker import walk_files
 
 
 class PreviewGenerator:
@@ -86,9 +88,19 @@ class PreviewGenerator:
                     continue
 
                 src_path = self._file_ops.expand_path(path_str)
+                # Fresh scan snapshot of this path, shared with size scan and backup
+                root = self._file_ops.scanned(src_path)
 
                 # Check if source exists
-                if not src_path.exists():
+                if not (root.exists if root is not None else src_path.exists()):
+                    processed += 1
+                    if progress_callback and total_paths > 0:
+                        progress_callback(int((processed / total_paths) * 100))
+                    continue
+
+                # Excluded paths are left out of the preview like the backup
+                is_dir = root.is_dir if root is not None else src_path.is_dir()
+                if self._file_ops.is_excluded(src_path, is_dir):
                     processed += 1
                     if progress_callback and total_paths > 0:
                         progress_callback(int((processed / total_paths) * 100))
@@ -103,8 +115,13 @@ class PreviewGenerator:
                 )
 
                 # Process single file
-                if src_path.is_file():
-                    item = self._preview_file(src_path, dest_path, app_name)
+                if root.is_file if root is not None else src_path.is_file():
+                    item = self._preview_file(
+                        src_path,
+                        dest_path,
+                        app_name,
+                        src_stat=root.stat if root is not None else None,
+                    )
                     items.append(item)
                     total_size += item["size_bytes"]
                     new_count, changed_count, unchanged_count, error_count = (
@@ -114,24 +131,33 @@ class PreviewGenerator:
                     )
 
                 # Process directory recursively
-                elif src_path.is_dir():
-                    for file_path in src_path.rglob("*"):
-                        if file_path.is_file():
-                            rel_path = file_path.relative_to(src_path)
-                            file_dest = dest_path / rel_path
-
-                            item = self._preview_file(file_path, file_dest, app_name)
-                            items.append(item)
-                            total_size += item["size_bytes"]
-                            new_count, changed_count, unchanged_count, error_count = (
-                                self._update_status_counts(
-                                    item,
-                                    new_count,
-                                    changed_count,
-                                    unchanged_count,
-                                    error_count,
-                                )
+                elif is_dir:
+                    # Single-pass walk reuses the cached source stat per file
+                    exclusions = self._file_ops.exclusions
+                    exclude = exclusions.matches if exclusions else None
+                    entries = (
+                        root.entries
+                        if root is not None
+                        else walk_files(src_path, exclude)
+                    )
+                    for entry in entries:
+                        item = self._preview_file(
+                            entry.path,
+                            dest_path / entry.relative,
+                            app_name,
+                            src_stat=entry.stat,
+                        )
+                        items.append(item)
+                        total_size += item["size_bytes"]
+                        new_count, changed_count, unchanged_count, error_count = (
+                            self._update_status_counts(
+                                item,
+                                new_count,
+                                changed_count,
+                                unchanged_count,
+                                error_count,
                             )
+                        )
 
                 processed += 1
                 if progress_callback and total_paths > 0:
@@ -176,7 +202,11 @@ class PreviewGenerator:
         return new_count, changed_count, unchanged_count, error_count + 1
 
     def _preview_file(
-        self, src_path: Path, dest_path: Path, app_name: str
+        self,
+        src_path: Path,
+        dest_path: Path,
+        app_name: str,
+        src_stat: os.stat_result | None = None,
     ) -> PreviewItemDict:
         """
         Preview a single file.
@@ -185,16 +215,25 @@ class PreviewGenerator:
             src_path: Source file path
             dest_path: Destination file path
             app_name: Application name for the dotfile
+            src_stat: Cached source stat result from a tree walk
 
         Returns:
             PreviewItemDict with file preview info
         """
         try:
-            size = src_path.stat().st_size
+            if src_stat is None:
+                src_stat = src_path.stat()
+            size = src_stat.st_size
+
+            # One destination stat decides new / unchanged / changed
+            try:
+                dest_stat = dest_path.stat()
+            except FileNotFoundError:
+                dest_stat = None
 
-            if not dest_path.exists():
+            if dest_stat is None:
                 status = "new"
-            elif self._file_ops.files_are_identical(src_path, dest_path):
+            elif self._file_ops.stats_are_identical(src_stat, dest_stat):
                 status = "unchanged"
             else:
                 status = "changed"
@@ -11,7 +11,7 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 11-05-2025
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
@@ -56,7 +56,12 @@ from core.common_types import (
     VerificationReportDict,
 )
 
+from gui.exclusion import ExclusionMatcher
+from gui.merkle_tree import MerkleTree
+from gui.scan_snapshot import ScanRoot, ScanSnapshot
+from gui.size_calculator import DiskUsage
 from gui.statistics_tracker import BackupStatistics
+from gui.verification_results import FailureCallback
 
 
 # =============================================================================
@@ -156,18 +161,65 @@ class FileOperationsProtocol(Protocol):
         """
         ...
 
-    def calculate_path_size(self, path: Path) -> int:
+    def calculate_path_size(
+        self, path: Path, exclusions: ExclusionMatcher | None = None
+    ) -> int:
         """
         Calculate total size of a file or directory in bytes.
 
         Args:
             path: Path to file or directory
+            exclusions: Matcher to apply instead of the configured exclusions
 
         Returns:
             Total size in bytes, 0 if path doesn't exist or permission denied
         """
         ...
 
+    def calculate_disk_usage(
+        self,
+        path: Path,
+        exclusions: ExclusionMatcher | None = None,
+        limit: int | None = None,
+    ) -> DiskUsage:
+        """
+        Calculate du-style apparent and allocated size of a file or directory.
+
+        Args:
+            path: Path to file or directory
+            exclusions: Matcher to apply instead of the configured exclusions
+            limit: Probe limit in bytes, None to size the whole tree
+
+        Returns:
+            DiskUsage of path, empty if it doesn't exist or permission denied;
+            truncated if a probe stopped at the limit
+        """
+        ...
+
+    def scan_paths(self, paths: list[Path]) -> ScanSnapshot | None:
+        """
+        Walk dotfile paths once into a shared scan snapshot.
+
+        Args:
+            paths: Expanded dotfile paths
+
+        Returns:
+            Fresh snapshot, or None if the scan cache is disabled
+        """
+        ...
+
+    def scanned(self, path: Path) -> ScanRoot | None:
+        """
+        Get the fresh scan of a dotfile path.
+
+        Args:
+            path: Expanded dotfile path
+
+        Returns:
+            ScanRoot walked with the current exclusions, or None
+        """
+        ...
+
     def assemble_dest_path(
         self,
         base_path: Path,
@@ -196,7 +248,7 @@ class FileOperationsProtocol(Protocol):
         hostname_subdir: bool,
     ) -> Path | None:
         """
-        Create compressed TAR.GZ archive of existing dotfiles.
+        Create compressed tar archive of existing dotfiles.
 
         Args:
             dotfiles_to_archive: List of (path, exists, is_dir) tuples
@@ -624,6 +676,11 @@ class VerificationManagerProtocol(Protocol):
         backup_path: Path,
         source_paths: list[tuple[Path, Path]],
         backup_type: str = "mirror",
+        digests: dict[Path, str] | None = None,
+        progress_callback: Callable[[int], None] | None = None,
+        *,
+        tree: MerkleTree | None = None,
+        failure_callback: FailureCallback | None = None,
     ) -> VerificationReportDict:
         """
         Verify integrity of a backup by comparing files against sources.
@@ -632,12 +689,36 @@ class VerificationManagerProtocol(Protocol):
             backup_path: Base path of the backup to verify
             source_paths: List of (source_path, backup_path) tuples to verify
             backup_type: Type of backup ("mirror" or "archive")
+            digests: "<algorithm>:<hex digest>" recorded at copy time, by backup path
+            progress_callback: Optional callback for progress updates (0-100)
+            tree: Merkle tree stored with the mirror, to skip unchanged subtrees
+            failure_callback: Called with each failed result as it arrives
 
         Returns:
             VerificationReportDict with verification results
         """
         ...
 
+    def verify_archive(
+        self,
+        archive_path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+        *,
+        failure_callback: FailureCallback | None = None,
+    ) -> VerificationReportDict:
+        """
+        Verify all files in an archive in one streaming pass.
+
+        Args:
+            archive_path: Archive file or dedup manifest to verify
+            progress_callback: Optional callback for progress updates (0-100)
+            failure_callback: Called with each failed result as it arrives
+
+        Returns:
+            VerificationReportDict with one result per archived file
+        """
+        ...
+
     def verify_file(
         self,
         source_path: Path,
@@ -865,6 +946,16 @@ class SizeAnalyzerProtocol(Protocol):
         """Set whether size checking is enabled."""
         ...
 
+    @property
+    def size_probe_enabled(self) -> bool:
+        """Get whether entries are only sized until they exceed critical."""
+        ...
+
+    @size_probe_enabled.setter
+    def size_probe_enabled(self, value: bool) -> None:
+        """Set whether entries are only sized until they exceed critical."""
+        ...
+
     def analyze_dotfiles(
         self,
         dotfiles: list[DotFileDict],
@@ -0,0 +1,331 @@
+"""
+DFBU ScanSnapshot - Shared Source Tree Snapshot for One Operation
+
+Description:
+    One "Start Backup" used to walk the same dotfile trees up to four times:
+    the size scan, path validation (in the ViewModel and again in the
+    backup worker), an optional preview, and the mirror copy. A scan
+    snapshot walks every enabled dotfile path once and keeps the result as
+    an immutable in-memory tree of entries with their stat data. Size
+    analysis, previews, validation, and the mirror copy read from the
+    snapshot while it is fresh and fall back to their own walks otherwise.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - One scandir walk per dotfile root, reusing fs_walker entries
+    - Frozen roots and entry tuples, safe to share between worker threads
+    - Short TTL so a backup started long after the scan walks again
+    - Generation counter bumped when the configuration or a backup changes
+      what a fresh walk would return
+    - Tied to the exclusion matcher it was walked with
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: os, stat, threading, time, dataclasses
+
+Classes:
+    - ScanRoot: Stat data and file entries of one dotfile path
+    - ScanSnapshot: Immutable scan of a set of dotfile paths
+    - ScanCache: Holds the current snapshot until it expires or is invalidated
+
+Functions:
+    - scan_root: Walk one dotfile path into a ScanRoot
+"""
+
+import logging
+import os
+import stat
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+from gui.exclusion import ExclusionMatcher
+from gui.fs_walker import WalkEntry, walk_files
+from gui.size_calculator import DiskUsage, SizeTally, usage_from_entries
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Seconds a snapshot is reused; files changed later are missed until then
+DEFAULT_SCAN_TTL_SECONDS: Final[int] = 30
+
+
+# =============================================================================
+# ScanRoot Class
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class ScanRoot:
+    """
+    Stat data and file entries of one dotfile path.
+
+    Attributes:
+        path: Expanded dotfile path
+        stat: Stat result following symlinks, None if the path does not exist
+        is_dir: True if the path is a directory
+        readable: Whether the process may read the path
+        entries: Files under a directory, in walk order, exclusions pruned
+        usage: du-style usage as calculate_disk_usage reports it
+    """
+
+    path: Path
+    stat: os.stat_result | None = None
+    is_dir: bool = False
+    readable: bool = False
+    entries: tuple[WalkEntry, ...] = ()
+    usage: DiskUsage = field(default_factory=DiskUsage)
+
+    @property
+    def exists(self) -> bool:
+        """Return True if the path existed when it was scanned."""
+        return self.stat is not None
+
+    @property
+    def is_file(self) -> bool:
+        """Return True if the path is a regular file (or symlink to one)."""
+        return self.stat is not None and stat.S_ISREG(self.stat.st_mode)
+
+    @property
+    def size(self) -> int:
+        """Return the apparent size in bytes as calculate_path_size reports it."""
+        return self.usage.apparent
+
+
+def scan_root(path: Path, exclusions: ExclusionMatcher) -> ScanRoot | None:
+    """
+    Walk one dotfile path into a ScanRoot.
+
+    Args:
+        path: Expanded dotfile path
+        exclusions: Exclusion matcher in effect for the walk
+
+    Returns:
+        ScanRoot with the path's stat and, for directories, all file entries;
+        None if the path itself is excluded (it is not walked)
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return ScanRoot(path)
+
+    is_dir = stat.S_ISDIR(st.st_mode)
+    if exclusions and exclusions.is_excluded(path, is_dir):
+        return None
+    readable = os.access(path, os.R_OK)
+    if is_dir:
+        exclude = exclusions.matches if exclusions else None
+        entries = tuple(walk_files(path, exclude)) if readable else ()
+        return ScanRoot(
+            path,
+            st,
+            is_dir=True,
+            readable=readable,
+            entries=entries,
+            usage=usage_from_entries(path, entries),
+        )
+    tally = SizeTally()
+    if readable and stat.S_ISREG(st.st_mode):
+        tally.add(st, os.fspath(path))
+    return ScanRoot(path, st, readable=readable, usage=tally.usage())
+
+
+# =============================================================================
+# ScanSnapshot Class
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class ScanSnapshot:
+    """
+    Immutable scan of a set of dotfile paths.
+
+    Attributes:
+        roots: ScanRoot of every scanned path, keyed by expanded path
+        excluded: Requested paths left unscanned because they are excluded
+        exclusions: Exclusion matcher the directories were walked with
+        generation: ScanCache generation the snapshot belongs to
+        created: time.monotonic() when the walk started
+    """
+
+    roots: Mapping[Path, ScanRoot]
+    excluded: frozenset[Path]
+    exclusions: ExclusionMatcher
+    generation: int
+    created: float
+
+    def get(self, path: Path) -> ScanRoot | None:
+        """
+        Get the scan of one dotfile path.
+
+        Args:
+            path: Expanded dotfile path
+
+        Returns:
+            ScanRoot if the path was scanned, None otherwise
+        """
+        return self.roots.get(path)
+
+    @property
+    def file_count(self) -> int:
+        """Return number of files across all scanned paths."""
+        return sum(
+            len(root.entries) if root.is_dir else int(root.is_file)
+            for root in self.roots.values()
+        )
+
+
+# =============================================================================
+# ScanCache Class
+# =============================================================================
+
+
+class ScanCache:
+    """
+    Holds the current scan snapshot until it expires or is invalidated.
+
+    A snapshot is only handed out for the exclusion matcher it was walked
+    with (compile_exclusions returns one matcher per pattern list), within
+    ttl seconds of its walk, and while its generation is current.
+
+    Attributes:
+        ttl: Seconds a snapshot is reused (0 disables the cache)
+        generation: Incremented by every invalidate() call
+
+    Public methods:
+        scan: Return a fresh snapshot covering paths, walking if needed
+        current: Return the snapshot if it is still fresh
+        lookup: Get the fresh scan of one dotfile path
+        invalidate: Drop the snapshot and start a new generation
+    """
+
+    def __init__(self, ttl: float = DEFAULT_SCAN_TTL_SECONDS) -> None:
+        """
+        Initialize ScanCache.
+
+        Args:
+            ttl: Seconds a snapshot is reused (0 disables the cache)
+        """
+        self.ttl: float = ttl
+        self._generation: int = 0
+        self._snapshot: ScanSnapshot | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Get the current snapshot generation."""
+        return self._generation
+
+    def scan(
+        self, paths: Iterable[Path], exclusions: ExclusionMatcher
+    ) -> ScanSnapshot | None:
+        """
+        Return a fresh snapshot covering paths, walking them if needed.
+
+        The current snapshot is reused when it covers every path; otherwise
+        all paths are walked again so the snapshot has a single age.
+
+        Args:
+            paths: Expanded dotfile paths to scan
+            exclusions: Exclusion matcher in effect for the walks
+
+        Returns:
+            Fresh snapshot, or None if the cache is disabled
+        """
+        if self.ttl <= 0:
+            return None
+        wanted = list(dict.fromkeys(paths))
+        snapshot = self.current(exclusions)
+        if snapshot is not None and all(
+            path in snapshot.roots or path in snapshot.excluded for path in wanted
+        ):
+            return snapshot
+
+        generation = self._generation
+        created = time.monotonic()
+        roots: dict[Path, ScanRoot] = {}
+        excluded: set[Path] = set()
+        for path in wanted:
+            root = scan_root(path, exclusions)
+            if root is None:
+                excluded.add(path)
+            else:
+                roots[path] = root
+        snapshot = ScanSnapshot(
+            roots=MappingProxyType(roots),
+            excluded=frozenset(excluded),
+            exclusions=exclusions,
+            generation=generation,
+            created=created,
+        )
+        with self._lock:
+            # An invalidate() during the walk makes the result stale at once
+            if generation == self._generation:
+                self._snapshot = snapshot
+        logger.debug(
+            f"Scanned {len(roots)} paths ({snapshot.file_count} files) "
+            f"in {time.monotonic() - created:.2f}s"
+        )
+        return snapshot
+
+    def current(self, exclusions: ExclusionMatcher) -> ScanSnapshot | None:
+        """
+        Return the snapshot if it is still fresh.
+
+        Args:
+            exclusions: Exclusion matcher the caller walks with
+
+        Returns:
+            Snapshot walked with exclusions, within ttl, of the current
+            generation; None otherwise
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                return None
+            if (
+                snapshot.generation != self._generation
+                or time.monotonic() - snapshot.created > self.ttl
+            ):
+                # Release the entries as soon as they can no longer be used
+                self._snapshot = None
+                return None
+        return snapshot if snapshot.exclusions is exclusions else None
+
+    def lookup(self, path: Path, exclusions: ExclusionMatcher) -> ScanRoot | None:
+        """
+        Get the fresh scan of one dotfile path.
+
+        Args:
+            path: Expanded dotfile path
+            exclusions: Exclusion matcher the caller walks with
+
+        Returns:
+            ScanRoot from a fresh snapshot, None if there is none or the
+            path was not scanned
+        """
+        snapshot = self.current(exclusions)
+        return snapshot.get(path) if snapshot is not None else None
+
+    def invalidate(self) -> None:
+        """Drop the snapshot and start a new generation."""
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
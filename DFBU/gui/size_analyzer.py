@@ -11,13 +11,16 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 2026-02-01
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
     - Pre-backup size analysis for all configured dotfiles
     - Configurable size thresholds (warning, alert, critical)
-    - .dfbuignore pattern support (gitignore-style exclusions)
+    - Parallel du-style sizes; sparse files judged by allocated blocks
+    - Largest files and subdirectories listed under each large directory
+    - Bounded probe mode that stops sizing an entry once it is critical
+    - .dfbuignore pattern support (compiled gitignore-style exclusions)
     - Progress callbacks for non-blocking UI updates
     - Human-readable log output formatting
 
@@ -32,7 +35,6 @@ Classes:
 
 from __future__ import annotations
 
-import fnmatch
 import logging
 import sys
 from collections.abc import Callable
@@ -42,11 +44,19 @@ from typing import TYPE_CHECKING, Final
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from core.common_types import DotFileDict, SizeItemDict, SizeReportDict
+from core.common_types import (
+    DotFileDict,
+    SizeEntryDict,
+    SizeItemDict,
+    SizeReportDict,
+)
+
+from gui.exclusion import compile_exclusions
 
 
 if TYPE_CHECKING:
     from gui.protocols import FileOperationsProtocol
+    from gui.size_calculator import SizedPath
 
 
 # Setup logger for this module
@@ -65,6 +75,9 @@ DEFAULT_WARNING_THRESHOLD_MB: Final[int] = 10
 DEFAULT_ALERT_THRESHOLD_MB: Final[int] = 100
 DEFAULT_CRITICAL_THRESHOLD_MB: Final[int] = 1024
 
+# Largest files/subdirectories printed per large item in the log report
+LOG_TOP_ENTRIES: Final[int] = 5
+
 
 # =============================================================================
 # SizeAnalyzer Class
@@ -84,6 +97,7 @@ class SizeAnalyzer:
         alert_threshold_mb: Size threshold for alert level (default: 100 MB)
         critical_threshold_mb: Size threshold for critical level (default: 1024 MB)
         size_check_enabled: Whether size checking is enabled
+        size_probe_enabled: Stop sizing an entry once it exceeds critical
 
     Public methods:
         analyze_dotfiles: Analyze sizes of all configured dotfiles
@@ -100,6 +114,8 @@ class SizeAnalyzer:
         alert_threshold_mb: int = DEFAULT_ALERT_THRESHOLD_MB,
         critical_threshold_mb: int = DEFAULT_CRITICAL_THRESHOLD_MB,
         size_check_enabled: bool = True,
+        *,
+        size_probe_enabled: bool = False,
     ) -> None:
         """
         Initialize SizeAnalyzer.
@@ -110,12 +126,15 @@ class SizeAnalyzer:
             alert_threshold_mb: Size threshold for alert level (default: 100 MB)
             critical_threshold_mb: Size threshold for critical level (default: 1024 MB)
             size_check_enabled: Whether size checking is enabled (default: True)
+            size_probe_enabled: Stop sizing an entry once it exceeds the
+                critical threshold (default: False)
         """
         self._file_operations = file_operations
         self._warning_threshold_mb = warning_threshold_mb
         self._alert_threshold_mb = alert_threshold_mb
         self._critical_threshold_mb = critical_threshold_mb
         self._size_check_enabled = size_check_enabled
+        self._size_probe_enabled = size_probe_enabled
 
     # -------------------------------------------------------------------------
     # Properties
@@ -161,6 +180,16 @@ class SizeAnalyzer:
         """Set whether size checking is enabled."""
         self._size_check_enabled = value
 
+    @property
+    def size_probe_enabled(self) -> bool:
+        """Get whether entries are only sized until they exceed critical."""
+        return self._size_probe_enabled
+
+    @size_probe_enabled.setter
+    def size_probe_enabled(self, value: bool) -> None:
+        """Set whether entries are only sized until they exceed critical."""
+        self._size_probe_enabled = value
+
     # -------------------------------------------------------------------------
     # Public Methods
     # -------------------------------------------------------------------------
@@ -174,6 +203,10 @@ class SizeAnalyzer:
         """
         Analyze sizes of all configured dotfiles.
 
+        In probe mode each entry is walked only until its billable size
+        reaches the critical threshold. Such an entry is reported critical
+        with the size and largest files found so far, marked truncated.
+
         Args:
             dotfiles: List of dotfile dictionaries to analyze
             progress_callback: Optional callback for progress updates (0-100)
@@ -183,9 +216,17 @@ class SizeAnalyzer:
             SizeReportDict with analysis results
         """
         patterns = ignore_patterns or []
+        exclusions = compile_exclusions(tuple(patterns))
         large_items: list[SizeItemDict] = []
         total_size_bytes = 0
+        total_allocated_bytes = 0
         total_files = 0
+        truncated = False
+        limit = (
+            self._critical_threshold_mb * BYTES_PER_MB
+            if self._size_probe_enabled
+            else None
+        )
         items_by_level: dict[str, int] = {
             "info": 0,
             "warning": 0,
@@ -220,12 +261,23 @@ class SizeAnalyzer:
                 if not path.exists():
                     continue
 
-                size_bytes = self._file_operations.calculate_path_size(path)
+                # Excluded subtrees are pruned from the size walk as well
+                if limit is not None:
+                    usage = self._file_operations.calculate_disk_usage(
+                        path, exclusions or None, limit
+                    )
+                elif exclusions:
+                    usage = self._file_operations.calculate_disk_usage(path, exclusions)
+                else:
+                    usage = self._file_operations.calculate_disk_usage(path)
+                truncated |= usage.truncated
+                size_bytes = usage.apparent
                 total_size_bytes += size_bytes
+                total_allocated_bytes += usage.allocated
                 total_files += 1
 
-                # Categorize by threshold
-                level = self.categorize_size(size_bytes)
+                # Sparse files are judged by the blocks they actually occupy
+                level = self.categorize_size(usage.billable)
                 items_by_level[level] += 1
 
                 # Track items above warning threshold
@@ -237,7 +289,19 @@ class SizeAnalyzer:
                         "level": level,
                         "is_dir": path.is_dir(),
                         "application": app_name,
+                        "allocated_bytes": usage.allocated,
                     }
+                    # Name what to exclude inside a large directory
+                    if size_item["is_dir"]:
+                        size_item["largest_files"] = self._sized_entries(
+                            usage.largest_files
+                        )
+                        size_item["largest_dirs"] = self._sized_entries(
+                            usage.largest_dirs
+                        )
+                    # Sizes of a probe stopped at the limit are lower bounds
+                    if usage.truncated:
+                        size_item["truncated"] = True
                     large_items.append(size_item)
 
         # Sort large items by size (largest first)
@@ -255,6 +319,8 @@ class SizeAnalyzer:
             "has_alert": items_by_level["alert"] > 0,
             "has_warning": items_by_level["warning"] > 0,
             "excluded_patterns": patterns,
+            "total_allocated_bytes": total_allocated_bytes,
+            "truncated": truncated,
         }
 
         logger.info(
@@ -307,14 +373,10 @@ class SizeAnalyzer:
         - **/cache/ matches any cache directory
         - *.log matches any .log file
         - /specific/path matches exact path
+        - !pattern re-includes a path excluded by an earlier pattern
 
-        Limitations:
-            This is a simplified implementation using fnmatch. It handles
-            common patterns from .dfbuignore but has limitations:
-            - Negation patterns (starting with !) are not supported
-            - Complex patterns like **/cache/**/*.log may not match exactly
-              as gitignore would (** is converted to single *)
-            - For full gitignore compatibility, consider the 'pathspec' library
+        Patterns are compiled once per pattern list (see gui.exclusion), and
+        a path inside an excluded directory is excluded as well.
 
         Args:
             path: Path to check
@@ -326,28 +388,7 @@ class SizeAnalyzer:
         if not patterns:
             return False
 
-        path_str = str(path)
-
-        for pattern in patterns:
-            # Handle ** patterns (match any directory depth)
-            if "**" in pattern:
-                # Convert ** to fnmatch-compatible pattern
-                fnmatch_pattern = pattern.replace("**", "*")
-                if fnmatch.fnmatch(path_str, fnmatch_pattern):
-                    return True
-                # Also check path parts for directory patterns like **/cache/
-                if pattern.endswith("/"):
-                    dir_name = pattern.rstrip("/").split("/")[-1]
-                    if any(part == dir_name for part in path.parts):
-                        return True
-            else:
-                # Simple pattern matching
-                if fnmatch.fnmatch(path_str, pattern):
-                    return True
-                if fnmatch.fnmatch(path.name, pattern):
-                    return True
-
-        return False
+        return compile_exclusions(tuple(patterns)).is_excluded(path, path.is_dir())
 
     def categorize_size(self, size_bytes: int) -> str:
         """
@@ -390,7 +431,11 @@ class SizeAnalyzer:
         # Summary
         lines.append(f"Timestamp:    {report['timestamp']}")
         lines.append(f"Total Files:  {report['total_files']}")
-        lines.append(f"Total Size:   {report['total_size_mb']:.1f} MB")
+        total_prefix = "> " if report.get("truncated") else ""
+        lines.append(f"Total Size:   {total_prefix}{report['total_size_mb']:.1f} MB")
+        if "total_allocated_bytes" in report:
+            on_disk_mb = report["total_allocated_bytes"] / BYTES_PER_MB
+            lines.append(f"On Disk:      {on_disk_mb:.1f} MB")
         lines.append("")
 
         # Threshold summary
@@ -424,11 +469,23 @@ class SizeAnalyzer:
                 }.get(item["level"], "")
 
                 item_type = "DIR" if item["is_dir"] else "FILE"
+                size_prefix = "> " if item.get("truncated") else ""
                 lines.append(
-                    f"  {level_icon} [{item['level'].upper()}] {item['size_mb']:.1f} MB - "
+                    f"  {level_icon} [{item['level'].upper()}] "
+                    f"{size_prefix}{item['size_mb']:.1f} MB - "
                     f"{item['path']} ({item_type})"
                 )
                 lines.append(f"      Application: {item['application']}")
+                for label, entries in (
+                    ("Largest folders", item.get("largest_dirs")),
+                    ("Largest files", item.get("largest_files")),
+                ):
+                    if not entries:
+                        continue
+                    lines.append(f"      {label}:")
+                    for entry in entries[:LOG_TOP_ENTRIES]:
+                        entry_mb = entry["size_bytes"] / BYTES_PER_MB
+                        lines.append(f"        {entry_mb:8.1f} MB  {entry['path']}")
 
             lines.append("")
 
@@ -449,6 +506,19 @@ class SizeAnalyzer:
     # Private Methods
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _sized_entries(entries: tuple[SizedPath, ...]) -> list[SizeEntryDict]:
+        """
+        Convert (size, path) pairs from a size calculation to report entries.
+
+        Args:
+            entries: (apparent size in bytes, path) pairs, largest first
+
+        Returns:
+            List of SizeEntryDict in the same order
+        """
+        return [{"path": path, "size_bytes": size} for size, path in entries]
+
     def _get_dotfile_paths(self, dotfile: DotFileDict) -> list[str]:
         """
         Extract path list from dotfile dictionary.
@@ -0,0 +1,489 @@
+"""
+DFBU SizeCache - Persistent Per-Directory Size Cache
+
+Description:
+    Remembers, for every directory under the configured dotfile paths, the
+    du-style size of its direct files and the names of its subdirectories,
+    keyed by the directory's inode, mtime_ns, and ctime_ns. A size refresh
+    stats each directory once and only lists the directories whose key
+    changed, so refreshing the Size column of an unchanged ~/.config costs
+    a few hundred stat calls instead of a full recursive walk.
+
+    A directory's timestamps change when entries are added, removed, or
+    renamed, which covers editors and tools that save by rename. A file
+    rewritten in place (e.g. an appended log) leaves its directory
+    unchanged, so its old size is reported until the directory changes.
+    Pre-backup size checks read the exact scan snapshot instead.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - SQLite cache stored at ~/.local/share/dfbu/size-cache
+    - One stat per unchanged directory, scandir only for changed ones
+    - Top-level subdirectories refreshed in parallel like disk_usage
+    - Hardlinked inodes still counted once across cached directories
+    - Largest direct files kept per directory, so top offenders need no listing
+    - Directories changed within the last timestamp tick are not cached
+    - Cleared when the exclusion patterns change
+    - LRU eviction bounded by a maximum number of directories
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: sqlite3, json, threading, concurrent.futures
+
+Classes:
+    - DirRecord: Cached direct-children size of one directory
+    - DirSizeCache: Size calculation backed by the persistent directory cache
+
+Functions:
+    None
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import stat
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+from gui.copy_engine import DEFAULT_COPY_WORKERS
+from gui.exclusion import ExclusionMatcher
+from gui.fs_walker import ExcludeFunc
+from gui.hash_cache import RACY_WINDOW_NS
+from gui.size_calculator import (
+    DiskUsage,
+    SizeTally,
+    disk_usage,
+    tally_dir,
+    tally_subtrees,
+)
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_SIZE_CACHE_PATH: Final[Path] = (
+    Path.home() / ".local" / "share" / "dfbu" / "size-cache"
+)
+
+# Directories kept before the least recently used ones are evicted
+DEFAULT_SIZE_CACHE_DIRS: Final[int] = 100_000
+
+# Bumped whenever the table layout changes; older files are rebuilt empty
+SIZE_CACHE_SCHEMA_VERSION: Final[int] = 2
+
+
+# =============================================================================
+# DirRecord Class
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class DirRecord:
+    """
+    Cached direct-children size of one directory.
+
+    Attributes:
+        ino: Inode of the directory (a replaced directory is a miss)
+        mtime_ns: Directory mtime when it was listed
+        ctime_ns: Directory ctime when it was listed (catches chmod)
+        apparent: st_size total of direct files with a single link
+        allocated: Allocated bytes of direct files with a single link
+        files: Number of direct files with a single link
+        subdirs: Names of the subdirectories that are not excluded
+        linked: (st_dev, st_ino, st_size, st_blocks) of hardlinked files
+        largest: (st_size, name) of the largest direct files (TOP_ENTRIES)
+    """
+
+    ino: int
+    mtime_ns: int
+    ctime_ns: int
+    apparent: int
+    allocated: int
+    files: int
+    subdirs: tuple[str, ...]
+    linked: tuple[tuple[int, int, int, int], ...]
+    largest: tuple[tuple[int, str], ...]
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Return True if the directory is unchanged since it was listed."""
+        return (
+            self.ino == st.st_ino
+            and self.mtime_ns == st.st_mtime_ns
+            and self.ctime_ns == st.st_ctime_ns
+        )
+
+
+# =============================================================================
+# DirSizeCache Class
+# =============================================================================
+
+
+class DirSizeCache:
+    """
+    Size calculation backed by the persistent directory cache.
+
+    Attributes:
+        path: Location of the SQLite cache file
+        max_dirs: Number of directories kept before LRU eviction
+        hits: Directories answered from the cache since creation
+        misses: Directories listed since creation
+
+    Public methods:
+        load: Read the cache file into memory
+        save: Write the cache back to its file
+        disk_usage: du-style usage of a path, listing only changed directories
+
+    Private methods:
+        _refresh_tree: Tally a subtree, one directory at a time
+        _refresh_dir: Tally one directory from its record or a fresh listing
+        _use_patterns: Clear the cache if the exclusion patterns changed
+        _ensure_loaded: Load the cache file on first use
+        _connect: Open the cache database and ensure the schema
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_SIZE_CACHE_PATH,
+        max_dirs: int = DEFAULT_SIZE_CACHE_DIRS,
+    ) -> None:
+        """
+        Initialize DirSizeCache.
+
+        Args:
+            path: Location of the SQLite cache file
+            max_dirs: Number of directories kept before LRU eviction
+        """
+        self.path: Path = path
+        self.max_dirs: int = max(1, max_dirs)
+        self.hits: int = 0
+        self.misses: int = 0
+        # Directory path -> record; ordered from least to most recently used
+        self._records: OrderedDict[str, DirRecord] = OrderedDict()
+        self._patterns: tuple[str, ...] = ()
+        self._dirty: bool = False
+        self._loaded: bool = False
+        self._replace_all: bool = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of cached directories."""
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._records)
+
+    def load(self) -> None:
+        """
+        Read the cache file into memory.
+
+        A missing cache yields an empty cache. An unreadable or outdated
+        cache is logged and replaced on the next save.
+        """
+        with self._lock:
+            self._loaded = False
+            self._ensure_loaded()
+
+    def save(self) -> bool:
+        """
+        Write the cache back to its file in one transaction.
+
+        Returns:
+            True if the cache file is up to date, False if writing failed
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            rows = [
+                (
+                    os.fsencode(dir_path),
+                    record.ino,
+                    record.mtime_ns,
+                    record.ctime_ns,
+                    record.apparent,
+                    record.allocated,
+                    record.files,
+                    b"/".join(os.fsencode(name) for name in record.subdirs),
+                    json.dumps(record.linked),
+                    json.dumps(record.largest),
+                    last_used,
+                )
+                for last_used, (dir_path, record) in enumerate(self._records.items())
+            ]
+            patterns = "\n".join(self._patterns)
+            replace_all = self._replace_all
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if replace_all:
+                # Recreate from scratch (also recovers from a corrupt file)
+                self.path.unlink(missing_ok=True)
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM dirs")
+                conn.executemany(
+                    "INSERT INTO dirs (path, ino, mtime_ns, ctime_ns, apparent, "
+                    "allocated, files, subdirs, linked, largest, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('patterns', ?)",
+                    (patterns,),
+                )
+            conn.close()
+        except sqlite3.Error, OSError:
+            logger.exception("Failed to write size cache %s", self.path)
+            return False
+
+        with self._lock:
+            self._dirty = False
+            self._replace_all = False
+        return True
+
+    def disk_usage(
+        self,
+        path: Path,
+        exclusions: ExclusionMatcher,
+        workers: int = DEFAULT_COPY_WORKERS,
+    ) -> DiskUsage:
+        """
+        du-style usage of a path, listing only changed directories.
+
+        Args:
+            path: File or directory to size
+            exclusions: Exclusion matcher pruning files and subtrees
+            workers: Worker threads for top-level subdirectories
+
+        Returns:
+            DiskUsage of path, empty if it does not exist or cannot be read
+        """
+        exclude: ExcludeFunc | None = exclusions.matches if exclusions else None
+        try:
+            st = path.stat()
+        except OSError:
+            return DiskUsage()
+        if not stat.S_ISDIR(st.st_mode):
+            return disk_usage(path, exclude, workers)
+
+        self._use_patterns(exclusions.patterns)
+        tally = SizeTally()
+        subdirs = self._refresh_dir(os.fspath(path), st, exclude, tally)
+        return tally_subtrees(
+            tally, subdirs, lambda subdir: self._refresh_tree(subdir, exclude), workers
+        )
+
+    def _refresh_tree(self, root: str, exclude: ExcludeFunc | None) -> SizeTally:
+        """
+        Tally a subtree, one directory at a time.
+
+        Args:
+            root: Directory to tally
+            exclude: Optional predicate called with (path, is_dir) for each entry
+
+        Returns:
+            Tally of the files under root
+        """
+        tally = SizeTally()
+        stack = [root]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                st = Path(dir_path).stat(follow_symlinks=False)
+            except OSError:
+                # Vanished since its parent was listed
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                stack.extend(self._refresh_dir(dir_path, st, exclude, tally))
+        return tally
+
+    def _refresh_dir(
+        self,
+        dir_path: str,
+        st: os.stat_result,
+        exclude: ExcludeFunc | None,
+        tally: SizeTally,
+    ) -> list[str]:
+        """
+        Tally one directory from its record or a fresh listing.
+
+        Args:
+            dir_path: Directory to tally
+            st: Current stat result of the directory
+            exclude: Optional predicate called with (path, is_dir) for each entry
+            tally: Tally receiving the directory's direct files
+
+        Returns:
+            Subdirectories to descend into (excluded ones are pruned)
+        """
+        with self._lock:
+            record = self._records.get(dir_path)
+            if record is not None and record.matches(st):
+                self._records.move_to_end(dir_path)
+                self.hits += 1
+            else:
+                record = None
+                self.misses += 1
+
+        if record is not None:
+            tally.apparent += record.apparent
+            tally.allocated += record.allocated
+            tally.files += record.files
+            for dev, ino, size, blocks in record.linked:
+                tally.linked.setdefault((dev, ino), (size, blocks))
+            for size, name in record.largest:
+                tally.rank(size, f"{dir_path}/{name}")
+            return [f"{dir_path}/{name}" for name in record.subdirs]
+
+        direct = SizeTally()
+        subdirs = tally_dir(dir_path, direct, exclude)
+        tally.merge(direct)
+        # Entries added within the same timestamp tick would not change the key
+        if time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) < RACY_WINDOW_NS:
+            return subdirs
+
+        record = DirRecord(
+            ino=st.st_ino,
+            mtime_ns=st.st_mtime_ns,
+            ctime_ns=st.st_ctime_ns,
+            apparent=direct.apparent,
+            allocated=direct.allocated,
+            files=direct.files,
+            subdirs=tuple(subdir.rsplit("/", 1)[-1] for subdir in subdirs),
+            linked=tuple(
+                (dev, ino, size, blocks)
+                for (dev, ino), (size, blocks) in direct.linked.items()
+            ),
+            largest=tuple(
+                (size, path.rsplit("/", 1)[-1]) for size, path in direct.largest
+            ),
+        )
+        with self._lock:
+            self._records[dir_path] = record
+            self._records.move_to_end(dir_path)
+            while len(self._records) > self.max_dirs:
+                self._records.popitem(last=False)
+            self._dirty = True
+        return subdirs
+
+    def _use_patterns(self, patterns: tuple[str, ...]) -> None:
+        """
+        Clear the cache if the exclusion patterns changed.
+
+        Args:
+            patterns: Pattern lines of the matcher the caller walks with
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if patterns != self._patterns:
+                # Records list subdirectories and sizes with exclusions applied
+                self._records.clear()
+                self._patterns = patterns
+                self._dirty = True
+
+    def _ensure_loaded(self) -> None:
+        """Load the cache file on first use (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._records.clear()
+        self._patterns = ()
+        self._dirty = False
+        self._replace_all = False
+
+        if not self.path.exists():
+            return
+
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT path, ino, mtime_ns, ctime_ns, apparent, allocated, "
+                    "files, subdirs, linked, largest FROM dirs ORDER BY last_used"
+                ).fetchall()
+                meta = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'patterns'"
+                ).fetchone()
+            finally:
+                conn.close()
+            for (
+                raw_path,
+                ino,
+                mtime_ns,
+                ctime_ns,
+                apparent,
+                allocated,
+                files,
+                raw_subdirs,
+                linked,
+                largest,
+            ) in rows:
+                self._records[os.fsdecode(raw_path)] = DirRecord(
+                    ino=ino,
+                    mtime_ns=mtime_ns,
+                    ctime_ns=ctime_ns,
+                    apparent=apparent,
+                    allocated=allocated,
+                    files=files,
+                    subdirs=tuple(
+                        os.fsdecode(name) for name in raw_subdirs.split(b"/") if name
+                    ),
+                    linked=tuple(tuple(item) for item in json.loads(linked)),
+                    largest=tuple(tuple(item) for item in json.loads(largest)),
+                )
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            logger.warning("Discarding unreadable size cache %s: %s", self.path, e)
+            self._records.clear()
+            self._dirty = True
+            self._replace_all = True
+            return
+
+        self._patterns = tuple(meta[0].split("\n")) if meta and meta[0] else ()
+        logger.debug("Loaded %d directories from %s", len(self._records), self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the cache database and ensure the schema.
+
+        Returns:
+            Open SQLite connection
+
+        Raises:
+            sqlite3.DatabaseError: If the file is not a usable cache
+        """
+        conn = sqlite3.connect(self.path)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SIZE_CACHE_SCHEMA_VERSION):
+            conn.close()
+            # Unknown layout from another release: start over
+            self.path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS dirs ("
+            "path BLOB PRIMARY KEY, ino INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, ctime_ns INTEGER NOT NULL, "
+            "apparent INTEGER NOT NULL, allocated INTEGER NOT NULL, "
+            "files INTEGER NOT NULL, subdirs BLOB NOT NULL, linked TEXT NOT NULL, "
+            "largest TEXT NOT NULL, "
+            "last_used INTEGER NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        conn.execute(f"PRAGMA user_version = {SIZE_CACHE_SCHEMA_VERSION}")
+        return conn
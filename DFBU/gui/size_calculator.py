@@ -0,0 +1,454 @@
+"""
+DFBU SizeCalculator - Parallel du-Style Size Calculation
+
+Description:
+    Calculates the size of a dotfile path the way du does: apparent size
+    (st_size) and allocated size (st_blocks * 512), with every hardlinked
+    inode counted once. Directories are walked with os.scandir, and the
+    top-level subdirectories are fanned out across a thread pool so large
+    trees such as ~/.cache or ~/.mozilla are sized in parallel. The same
+    walk keeps the largest files and heaviest top-level subdirectories in
+    bounded heaps, so size warnings can name what to exclude. A byte limit
+    turns the walk into a bounded probe that stops as soon as the limit is
+    proven to be exceeded.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - Apparent and allocated sizes, so sparse files are not over-reported
+    - Hardlinked inodes counted once per calculation, across all threads
+    - One scandir walk per top-level subdirectory on a thread pool
+    - Same traversal rules as fs_walker (symlinked directories not followed,
+      unreadable directories skipped, exclusions prune whole subtrees)
+    - Top TOP_ENTRIES files and subdirectories by size, memory bounded per
+      thread rather than per file
+    - Usage of already-walked entries (scan snapshots) without new syscalls
+    - Bounded probes that stop walking once a size limit is exceeded
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: os, stat, heapq, threading, concurrent.futures,
+      dataclasses
+
+Classes:
+    - DiskUsage: Apparent size, allocated size, file count, and top entries
+    - SizeBudget: Byte limit shared by the threads of a bounded probe
+    - SizeTally: Mutable accumulator that counts hardlinked inodes once
+
+Functions:
+    - tally_dir: Tally the files directly inside one directory
+    - tally_subtrees: Tally top-level subdirectories on a thread pool
+    - disk_usage: Calculate the du-style usage of a file or directory
+    - usage_from_entries: Calculate usage from already walked entries
+"""
+
+import heapq
+import os
+import stat
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, Self
+
+from gui.copy_engine import DEFAULT_COPY_WORKERS
+from gui.fs_walker import ExcludeFunc, WalkEntry
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# st_blocks is always counted in 512-byte units on Linux
+STAT_BLOCK_SIZE: Final[int] = 512
+
+# Largest files and subdirectories kept per calculation
+TOP_ENTRIES: Final[int] = 10
+
+# (apparent size in bytes, path)
+type SizedPath = tuple[int, str]
+
+
+# =============================================================================
+# DiskUsage Class
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class DiskUsage:
+    """
+    Apparent size, allocated size, file count, and top entries of a path.
+
+    Attributes:
+        apparent: Sum of st_size in bytes (what a copy reads)
+        allocated: Sum of st_blocks * 512 in bytes (what the disk holds)
+        files: Number of files counted (hardlinks to one inode count once)
+        largest_files: Up to TOP_ENTRIES largest files, largest first
+        largest_dirs: Up to TOP_ENTRIES heaviest top-level subdirectories,
+            heaviest first
+        truncated: The walk stopped at a probe limit; sizes are lower bounds
+    """
+
+    apparent: int = 0
+    allocated: int = 0
+    files: int = 0
+    largest_files: tuple[SizedPath, ...] = ()
+    largest_dirs: tuple[SizedPath, ...] = ()
+    truncated: bool = False
+
+    @property
+    def billable(self) -> int:
+        """
+        Return the size used for threshold checks.
+
+        The smaller of the two sizes: sparse files are judged by the blocks
+        they occupy, while small files are not inflated to a whole block.
+        """
+        return min(self.apparent, self.allocated)
+
+
+# =============================================================================
+# SizeBudget Class
+# =============================================================================
+
+
+class SizeBudget:
+    """
+    Byte limit shared by the threads of a bounded size probe.
+
+    Files are charged the smaller of their apparent and allocated sizes,
+    and hardlinked files are not charged at all, so an exhausted budget
+    proves the billable size of the walked path reached the limit.
+
+    Attributes:
+        limit: Bytes after which the walk stops
+        spent: Bytes charged so far
+
+    Public methods:
+        spend: Charge bytes against the budget
+        exhausted: Return True once the limit is reached
+    """
+
+    __slots__ = ("_lock", "limit", "spent")
+
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize SizeBudget.
+
+        Args:
+            limit: Bytes after which the walk stops
+        """
+        self.limit: int = limit
+        self.spent: int = 0
+        self._lock = threading.Lock()
+
+    def spend(self, size: int) -> None:
+        """Charge bytes against the budget."""
+        with self._lock:
+            self.spent += size
+
+    def exhausted(self) -> bool:
+        """Return True once the limit is reached."""
+        return self.spent >= self.limit
+
+
+# =============================================================================
+# SizeTally Class
+# =============================================================================
+
+
+class SizeTally:
+    """
+    Mutable accumulator for one thread's share of a size calculation.
+
+    Files with more than one link are keyed by (st_dev, st_ino) and only
+    summed by usage(), so an inode reached through several names (in the
+    same or different threads) is counted once.
+
+    Attributes:
+        apparent: st_size total of files with a single link
+        allocated: Allocated bytes of files with a single link
+        files: Number of files with a single link
+        linked: (st_dev, st_ino) -> (st_size, st_blocks) of hardlinked files
+        largest: Min-heap of the TOP_ENTRIES largest files seen
+        budget: Probe budget charged for every file, None for a full walk
+        truncated: Set when the walk stopped with directories left
+
+    Public methods:
+        add: Count one file from its stat result
+        rank: Offer a file to the largest-files heap
+        merge: Fold another tally into this one
+        stop: Return True (and mark the tally truncated) once over budget
+        usage: Return the totals, counting each hardlinked inode once
+    """
+
+    __slots__ = (
+        "allocated",
+        "apparent",
+        "budget",
+        "files",
+        "largest",
+        "linked",
+        "truncated",
+    )
+
+    def __init__(self, budget: SizeBudget | None = None) -> None:
+        """
+        Initialize an empty tally.
+
+        Args:
+            budget: Probe budget charged for every file, None for a full walk
+        """
+        self.apparent: int = 0
+        self.allocated: int = 0
+        self.files: int = 0
+        self.linked: dict[tuple[int, int], tuple[int, int]] = {}
+        self.largest: list[SizedPath] = []
+        self.budget: SizeBudget | None = budget
+        self.truncated: bool = False
+
+    def add(self, st: os.stat_result, path: str) -> None:
+        """
+        Count one file from its stat result.
+
+        Every name is ranked, hardlinked or not: the backup copies each name.
+        """
+        self.rank(st.st_size, path)
+        if st.st_nlink > 1:
+            self.linked.setdefault((st.st_dev, st.st_ino), (st.st_size, st.st_blocks))
+        else:
+            allocated = st.st_blocks * STAT_BLOCK_SIZE
+            self.apparent += st.st_size
+            self.allocated += allocated
+            self.files += 1
+            if self.budget is not None:
+                self.budget.spend(min(st.st_size, allocated))
+
+    def rank(self, size: int, path: str) -> None:
+        """Offer a file to the largest-files heap."""
+        if len(self.largest) < TOP_ENTRIES:
+            heapq.heappush(self.largest, (size, path))
+        elif size > self.largest[0][0]:
+            heapq.heapreplace(self.largest, (size, path))
+
+    def merge(self, other: Self) -> None:
+        """Fold another tally into this one."""
+        self.apparent += other.apparent
+        self.allocated += other.allocated
+        self.files += other.files
+        for key, sizes in other.linked.items():
+            self.linked.setdefault(key, sizes)
+        for size, path in other.largest:
+            self.rank(size, path)
+        self.truncated |= other.truncated
+
+    def stop(self) -> bool:
+        """
+        Return True (and mark the tally truncated) once over budget.
+
+        Walks call this before listing each further directory.
+        """
+        if self.budget is None or not self.budget.exhausted():
+            return False
+        self.truncated = True
+        return True
+
+    def usage(self, dirs: Iterable[SizedPath] = ()) -> DiskUsage:
+        """
+        Return the totals, counting each hardlinked inode once.
+
+        Args:
+            dirs: (apparent size, path) of the top-level subdirectories
+
+        Returns:
+            DiskUsage with the largest files and heaviest subdirectories
+        """
+        linked = self.linked.values()
+        return DiskUsage(
+            apparent=self.apparent + sum(size for size, _ in linked),
+            allocated=self.allocated
+            + sum(blocks for _, blocks in linked) * STAT_BLOCK_SIZE,
+            files=self.files + len(self.linked),
+            largest_files=tuple(sorted(self.largest, reverse=True)),
+            largest_dirs=tuple(heapq.nlargest(TOP_ENTRIES, dirs)),
+            truncated=self.truncated,
+        )
+
+
+# =============================================================================
+# Walk Helpers
+# =============================================================================
+
+
+def _tally_tree(
+    root: str, exclude: ExcludeFunc | None, budget: SizeBudget | None
+) -> SizeTally:
+    """
+    Tally every file under a directory with an explicit scandir stack.
+
+    Args:
+        root: Directory to walk
+        exclude: Optional predicate called with (path, is_dir) for each entry
+        budget: Probe budget that stops the walk, None for a full walk
+
+    Returns:
+        Tally of the files under root
+    """
+    tally = SizeTally(budget)
+    stack = [root]
+    while stack and not tally.stop():
+        stack.extend(tally_dir(stack.pop(), tally, exclude))
+    return tally
+
+
+def tally_dir(
+    dir_path: str, tally: SizeTally, exclude: ExcludeFunc | None
+) -> list[str]:
+    """
+    Tally the files directly inside one directory.
+
+    Args:
+        dir_path: Directory to list
+        tally: Tally receiving the files
+        exclude: Optional predicate called with (path, is_dir) for each entry
+
+    Returns:
+        Subdirectories to descend into (excluded ones are pruned)
+    """
+    subdirs: list[str] = []
+    try:
+        with os.scandir(dir_path) as iterator:
+            entries = list(iterator)
+    except OSError:
+        # Unreadable or vanished directory: skip like fs_walker does
+        return subdirs
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if not is_dir and not entry.is_file():
+                continue
+            if exclude is not None and exclude(entry.path, is_dir):
+                continue
+            if is_dir:
+                subdirs.append(entry.path)
+            else:
+                tally.add(entry.stat(), entry.path)
+        except OSError:
+            continue
+    return subdirs
+
+
+def tally_subtrees(
+    tally: SizeTally,
+    subdirs: list[str],
+    tally_tree: Callable[[str], SizeTally],
+    workers: int,
+) -> DiskUsage:
+    """
+    Tally top-level subdirectories on a thread pool and fold them in.
+
+    Args:
+        tally: Tally of the root's direct files
+        subdirs: Top-level subdirectories of the root
+        tally_tree: Tallies one subdirectory and everything below it
+        workers: Worker threads (1 tallies serially)
+
+    Returns:
+        DiskUsage of the root with its heaviest subdirectories
+    """
+    dirs: list[SizedPath] = []
+    if workers <= 1 or len(subdirs) <= 1:
+        for subdir in subdirs:
+            subtree = tally_tree(subdir)
+            dirs.append((subtree.usage().apparent, subdir))
+            tally.merge(subtree)
+        return tally.usage(dirs)
+
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(subdirs)), thread_name_prefix="dfbu-size"
+    ) as executor:
+        subtrees = executor.map(tally_tree, subdirs)
+        for subdir, subtree in zip(subdirs, subtrees, strict=True):
+            dirs.append((subtree.usage().apparent, subdir))
+            tally.merge(subtree)
+    return tally.usage(dirs)
+
+
+# =============================================================================
+# Size Functions
+# =============================================================================
+
+
+def disk_usage(
+    path: Path,
+    exclude: ExcludeFunc | None = None,
+    workers: int = DEFAULT_COPY_WORKERS,
+    limit: int | None = None,
+) -> DiskUsage:
+    """
+    Calculate the du-style usage of a file or directory.
+
+    The files directly inside a directory are counted on the calling
+    thread; each top-level subdirectory is walked on the thread pool.
+    With a limit, every thread stops listing directories once the files
+    counted so far prove the billable size reached it.
+
+    Args:
+        path: File or directory to size
+        exclude: Optional predicate called with (path, is_dir) for each entry
+        workers: Worker threads for subdirectories (1 walks serially)
+        limit: Probe limit in bytes, None to walk the whole tree
+
+    Returns:
+        DiskUsage of path, empty if it does not exist or cannot be read;
+        truncated if the walk stopped at the limit
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return DiskUsage()
+
+    budget = SizeBudget(limit) if limit is not None else None
+    tally = SizeTally(budget)
+    if not stat.S_ISDIR(st.st_mode):
+        if stat.S_ISREG(st.st_mode):
+            tally.add(st, os.fspath(path))
+        return tally.usage()
+
+    subdirs = tally_dir(os.fspath(path), tally, exclude)
+    return tally_subtrees(
+        tally, subdirs, lambda subdir: _tally_tree(subdir, exclude, budget), workers
+    )
+
+
+def usage_from_entries(root: Path, entries: Iterable[WalkEntry]) -> DiskUsage:
+    """
+    Calculate usage from already walked entries.
+
+    Args:
+        root: Directory the entries were walked from
+        entries: fs_walker file entries under root
+
+    Returns:
+        DiskUsage of the files, each hardlinked inode counted once
+    """
+    tally = SizeTally()
+    subtrees: dict[str, SizeTally] = {}
+    for entry in entries:
+        top, sep, _ = entry.relative.partition("/")
+        target = subtrees.setdefault(top, SizeTally()) if sep else tally
+        target.add(entry.stat, os.fspath(entry.path))
+
+    dirs: list[SizedPath] = []
+    for name, subtree in subtrees.items():
+        dirs.append((subtree.usage().apparent, os.fspath(root / name)))
+        tally.merge(subtree)
+    return tally.usage(dirs)
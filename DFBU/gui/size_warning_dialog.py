@@ -1,13 +1,14 @@
 """Size warning dialog for pre-backup size analysis.
 
 Displays large files and directories with options to continue or cancel.
-Loaded from Qt Designer .ui file.
+Each large directory expands to its largest subfolders and files, so the
+user can see what to add to .dfbuignore. Loaded from Qt Designer .ui file.
 """
 
 from pathlib import Path
 from typing import Final
 
-from core.common_types import SizeReportDict
+from core.common_types import SizeEntryDict, SizeReportDict
 from PySide6.QtCore import QFile
 from PySide6.QtGui import QColor
 from PySide6.QtUiTools import QUiLoader
@@ -40,6 +41,15 @@ LEVEL_ICONS: Final[dict[str, str]] = {
     "critical": "\U0001f534",  # Red circle
 }
 
+BYTES_PER_MB: Final[int] = 1024 * 1024
+
+
+def _format_size_mb(size_mb: float) -> str:
+    """Format a size in megabytes as MB, or GB from 1024 MB up."""
+    if size_mb >= 1024:
+        return f"{size_mb / 1024:.2f} GB"
+    return f"{size_mb:.1f} MB"
+
 
 class SizeWarningDialog(QDialog):
     """Dialog for size warnings before backup operations.
@@ -145,12 +155,10 @@ class SizeWarningDialog(QDialog):
         """Populate dialog with size report data."""
         report = self.size_report
 
-        # Update summary labels
-        total_size_mb = report["total_size_mb"]
-        if total_size_mb >= 1024:
-            size_text = f"{total_size_mb / 1024:.2f} GB"
-        else:
-            size_text = f"{total_size_mb:.1f} MB"
+        # Update summary labels (a probed report only has a lower bound)
+        size_text = _format_size_mb(report["total_size_mb"])
+        if report.get("truncated"):
+            size_text = f"> {size_text}"
 
         self.total_size_label.setText(f"Total backup size: {size_text}")
         self.file_count_label.setText(f"{report['total_files']} files analyzed")
@@ -172,18 +180,13 @@ class SizeWarningDialog(QDialog):
             level = item["level"]
             icon = LEVEL_ICONS.get(level, "")
 
-            # Format size
-            size_mb = item["size_mb"]
-            if size_mb >= 1024:
-                size_text = f"{size_mb / 1024:.2f} GB"
-            else:
-                size_text = f"{size_mb:.1f} MB"
-
             # Create tree item
             tree_item = QTreeWidgetItem(
                 [
                     f"{icon} {level.upper()}",
-                    size_text,
+                    # A probe stopped at the critical threshold: at least this
+                    ("> " if item.get("truncated") else "")
+                    + _format_size_mb(item["size_mb"]),
                     item["path"],
                     item["application"],
                 ]
@@ -194,7 +197,12 @@ class SizeWarningDialog(QDialog):
                 tree_item.setBackground(0, LEVEL_COLORS[level])
                 tree_item.setForeground(0, QColor(DFBUColors.NEUTRAL_900))
 
+            # Largest subfolders and files under a large directory
+            self._add_entries(tree_item, "Folder", item.get("largest_dirs", []))
+            self._add_entries(tree_item, "File", item.get("largest_files", []))
+
             self.large_items_tree.addTopLevelItem(tree_item)
+            tree_item.setExpanded(level == "critical")
 
         # Resize columns to content
         for i in range(self.large_items_tree.columnCount()):
@@ -210,6 +218,22 @@ class SizeWarningDialog(QDialog):
         else:
             self.critical_warning_label.setText("")
 
+    def _add_entries(
+        self, parent: QTreeWidgetItem, kind: str, entries: list[SizeEntryDict]
+    ) -> None:
+        """Add the largest files or subfolders of an item as child rows."""
+        for entry in entries:
+            parent.addChild(
+                QTreeWidgetItem(
+                    [
+                        kind,
+                        _format_size_mb(entry["size_bytes"] / BYTES_PER_MB),
+                        entry["path"],
+                        "",
+                    ]
+                )
+            )
+
     def _connect_signals(self) -> None:
         """Connect button signals to handlers."""
         self.continue_btn.clicked.connect(self._on_continue)
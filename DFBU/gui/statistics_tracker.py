@@ -10,19 +10,21 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 11-01-2025
-Date Changed: 11-01-2025
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
     - Item processing statistics (processed, skipped, failed)
     - Processing time tracking (individual, average, min, max)
     - Statistics reset for new operations
+    - Thread-safe copy strategy counters for parallel copies
+    - Bytes saved by block-level delta updates
     - Clean separation from business logic
 
 Requirements:
     - Linux environment
     - Python 3.14+ for latest language features
-    - Standard library: dataclasses only
+    - Standard library: dataclasses, threading
 
 Classes:
     - BackupStatistics: Dataclass for operation statistics
@@ -32,6 +34,7 @@ Functions:
     None
 """
 
+import threading
 from dataclasses import dataclass, field
 
 
@@ -55,6 +58,8 @@ class BackupStatistics:
         average_time: Average processing time per item
         min_time: Minimum processing time
         max_time: Maximum processing time
+        copy_strategies: Number of files copied by each copy strategy
+        delta_bytes_saved: Bytes not rewritten thanks to delta updates
     """
 
     total_items: int = 0
@@ -63,6 +68,8 @@ class BackupStatistics:
     failed_items: int = 0
     total_time: float = 0.0
     processing_times: list[float] = field(default_factory=list)
+    copy_strategies: dict[str, int] = field(default_factory=dict)
+    delta_bytes_saved: int = 0
 
     @property
     def average_time(self) -> float:
@@ -89,6 +96,8 @@ class BackupStatistics:
         self.failed_items = 0
         self.total_time = 0.0
         self.processing_times = []
+        self.copy_strategies = {}
+        self.delta_bytes_saved = 0
 
 
 # =============================================================================
@@ -110,6 +119,8 @@ class StatisticsTracker:
         record_item_processed: Record successfully processed item
         record_item_skipped: Record skipped item
         record_item_failed: Record failed item
+        record_copy_strategy: Record which copy strategy copied a file
+        record_delta_bytes_saved: Record bytes saved by a delta update
         reset_statistics: Reset statistics for new operation
         get_statistics: Get current statistics
 
@@ -120,6 +131,7 @@ class StatisticsTracker:
     def __init__(self) -> None:
         """Initialize StatisticsTracker with empty statistics."""
         self.statistics = BackupStatistics()
+        self._lock = threading.Lock()
 
     def record_item_processed(self, processing_time: float) -> None:
         """
@@ -139,6 +151,31 @@ class StatisticsTracker:
         """Record failed item."""
         self.statistics.failed_items += 1
 
+    def record_copy_strategy(self, strategy: str) -> None:
+        """
+        Record which copy strategy copied a file.
+
+        Safe to call from copy worker threads.
+
+        Args:
+            strategy: Strategy name (e.g., reflink, copy_file_range)
+        """
+        with self._lock:
+            counts = self.statistics.copy_strategies
+            counts[strategy] = counts.get(strategy, 0) + 1
+
+    def record_delta_bytes_saved(self, bytes_saved: int) -> None:
+        """
+        Record bytes saved by a delta update.
+
+        Safe to call from copy worker threads.
+
+        Args:
+            bytes_saved: Bytes a full copy would have written but delta skipped
+        """
+        with self._lock:
+            self.statistics.delta_bytes_saved += bytes_saved
+
     def reset_statistics(self) -> None:
         """Reset operation statistics for new run."""
         self.statistics.reset()
@@ -0,0 +1,300 @@
+"""
+DFBU VerificationCoverage - Hash Verification Coverage for Sampled Runs
+
+Description:
+    Records when each backup file was last hash-verified, together with
+    the backup file's size, mtime_ns, and ctime_ns at that time. Sampled
+    verification uses it to always hash files that are new or changed
+    since their last verification, and to pick the least recently verified
+    unchanged files for the rotating slice, so repeated cheap runs
+    eventually cover every file.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - SQLite store at ~/.local/share/dfbu/verify-coverage
+    - Change detection by backup stat signature (copies always change ctime)
+    - Rotation order by last verification time, never-verified files first
+    - Records older than COVERAGE_MAX_AGE_DAYS are pruned on save
+    - Corrupt or outdated files are discarded and recreated
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: sqlite3, threading, time
+
+Classes:
+    - CoverageRecord: Stat signature and time of one file's last verification
+    - VerificationCoverage: Persistent last-verified table for backup files
+
+Functions:
+    None
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Final, NamedTuple
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_COVERAGE_PATH: Final[Path] = (
+    Path.home() / ".local" / "share" / "dfbu" / "verify-coverage"
+)
+
+# Files not verified for this long are forgotten (removed or renamed backups)
+COVERAGE_MAX_AGE_DAYS: Final[int] = 90
+
+# Bumped whenever the table layout changes; older files are rebuilt empty
+COVERAGE_SCHEMA_VERSION: Final[int] = 1
+
+
+# =============================================================================
+# CoverageRecord Class
+# =============================================================================
+
+
+class CoverageRecord(NamedTuple):
+    """
+    Stat signature and time of one file's last successful hash verification.
+
+    Attributes:
+        size: Backup file size in bytes when verified
+        mtime_ns: Backup file modification time when verified
+        ctime_ns: Backup file change time when verified
+        verified_at: Wall-clock time of the verification in nanoseconds
+    """
+
+    size: int
+    mtime_ns: int
+    ctime_ns: int
+    verified_at: int
+
+
+# =============================================================================
+# VerificationCoverage Class
+# =============================================================================
+
+
+class VerificationCoverage:
+    """
+    Persistent last-verified table for backup files.
+
+    Loaded into memory on first use and written back in one transaction,
+    like the mirror index.
+
+    Attributes:
+        path: Location of the SQLite coverage file
+
+    Public methods:
+        load: Read the coverage table into memory
+        save: Write pending changes back and prune old records
+        lookup: Get the coverage record of a backup file
+        is_current: Check whether a file is unchanged since its last verification
+        record: Record a successful hash verification
+
+    Private methods:
+        _ensure_loaded: Load the coverage file on first use
+        _connect: Open the coverage database and ensure the schema
+    """
+
+    def __init__(self, path: Path = DEFAULT_COVERAGE_PATH) -> None:
+        """
+        Initialize VerificationCoverage.
+
+        Args:
+            path: Location of the SQLite coverage file
+        """
+        self.path: Path = path
+        self._records: dict[str, CoverageRecord] = {}
+        self._dirty: set[str] = set()
+        self._loaded: bool = False
+        self._replace_all: bool = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return number of recorded files."""
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._records)
+
+    def load(self) -> None:
+        """
+        Read the coverage table into memory.
+
+        A missing file yields empty coverage. An unreadable or outdated file
+        is logged and replaced on the next save.
+        """
+        with self._lock:
+            self._loaded = False
+            self._ensure_loaded()
+
+    def save(self) -> bool:
+        """
+        Write pending changes back and prune records older than the max age.
+
+        Returns:
+            True if the coverage file is up to date, False if writing failed
+        """
+        cutoff = time.time_ns() - COVERAGE_MAX_AGE_DAYS * 86_400 * 10**9
+        with self._lock:
+            if not (self._dirty or self._replace_all):
+                return True
+            replace_all = self._replace_all
+            keys = self._records.keys() if replace_all else self._dirty
+            dirty = [(key, *self._records[key]) for key in keys]
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if replace_all:
+                # Recreate from scratch (also recovers from a corrupt file)
+                self.path.unlink(missing_ok=True)
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO coverage "
+                    "(path, size, mtime_ns, ctime_ns, verified_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    dirty,
+                )
+                conn.execute("DELETE FROM coverage WHERE verified_at < ?", (cutoff,))
+            conn.close()
+        except sqlite3.Error, OSError:
+            logger.exception("Failed to write verification coverage %s", self.path)
+            return False
+
+        with self._lock:
+            self._dirty.clear()
+            self._replace_all = False
+            self._records = {
+                key: rec
+                for key, rec in self._records.items()
+                if rec.verified_at >= cutoff
+            }
+        return True
+
+    def lookup(self, backup_path: Path) -> CoverageRecord | None:
+        """
+        Get the coverage record of a backup file.
+
+        Args:
+            backup_path: Backup file path
+
+        Returns:
+            CoverageRecord if the file was verified before, None otherwise
+        """
+        with self._lock:
+            self._ensure_loaded()
+            return self._records.get(os.fspath(backup_path))
+
+    def is_current(self, backup_path: Path, st: os.stat_result) -> bool:
+        """
+        Check whether a file is unchanged since its last verification.
+
+        Args:
+            backup_path: Backup file path
+            st: Current stat result of the backup file
+
+        Returns:
+            True if verified before and size, mtime_ns, and ctime_ns still match
+        """
+        rec = self.lookup(backup_path)
+        return rec is not None and (rec.size, rec.mtime_ns, rec.ctime_ns) == (
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_ctime_ns,
+        )
+
+    def record(
+        self, backup_path: Path, st: os.stat_result, verified_at: int | None = None
+    ) -> None:
+        """
+        Record a successful hash verification.
+
+        Args:
+            backup_path: Backup file path
+            st: Stat result of the backup file that was hashed
+            verified_at: Verification time in nanoseconds (default: now)
+        """
+        key = os.fspath(backup_path)
+        rec = CoverageRecord(
+            st.st_size,
+            st.st_mtime_ns,
+            st.st_ctime_ns,
+            time.time_ns() if verified_at is None else verified_at,
+        )
+        with self._lock:
+            self._ensure_loaded()
+            self._records[key] = rec
+            self._dirty.add(key)
+
+    def _ensure_loaded(self) -> None:
+        """Load the coverage file on first use (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._records.clear()
+        self._dirty.clear()
+        self._replace_all = False
+
+        if not self.path.exists():
+            return
+
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT path, size, mtime_ns, ctime_ns, verified_at FROM coverage"
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(
+                "Discarding unreadable verification coverage %s: %s", self.path, e
+            )
+            self._replace_all = True
+            return
+
+        self._records = {path: CoverageRecord(*rest) for path, *rest in rows}
+        logger.debug("Loaded %d entries from %s", len(self._records), self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the coverage database and ensure the schema.
+
+        Returns:
+            Open SQLite connection
+
+        Raises:
+            sqlite3.DatabaseError: If the file is not a usable coverage table
+        """
+        conn = sqlite3.connect(self.path)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, COVERAGE_SCHEMA_VERSION):
+            conn.close()
+            # Unknown layout from another release: start over
+            self.path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS coverage ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, ctime_ns INTEGER NOT NULL, "
+            "verified_at INTEGER NOT NULL)"
+        )
+        conn.execute(f"PRAGMA user_version = {COVERAGE_SCHEMA_VERSION}")
+        return conn
@@ -5,18 +5,29 @@ DFBU VerificationManager - Backup Verification Component
 Description:
     Verifies integrity of backup files by comparing against source files.
     Supports size verification and optional SHA-256 hash comparison.
-    Generates reports for display in the log viewer.
+    Archives are verified in one sequential streaming pass without
+    extracting anything to disk. Generates reports for display in the log
+    viewer.
 
 Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 2026-02-01
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
     - Size verification (fast, catches truncation)
     - SHA-256 hash verification (thorough, catches corruption)
+    - Digests recorded while copying: only the backup file is hashed
+    - Parallel verification on a bounded worker pool (verify_workers option)
+    - Streaming progress callback as each file finishes
+    - Optional persistent hash cache: unchanged files cost only a stat
+    - Large backup files hashed through mmap, others with pooled buffers
+    - Streaming archive verification against the archive index or sources
+    - Sampling mode: hash new/changed files plus a rotating slice of the rest
+    - Merkle tree mode: hash only subtrees changed since the last verification
+    - Failures-only reports, failure callback, and optional JSONL result files
     - Structured verification reports
     - Human-readable log output formatting
 
@@ -24,6 +35,10 @@ Requirements:
     - Linux environment
     - Python 3.14+
     - No Qt dependencies (pure model layer)
+    - copy_engine module for the bounded worker pool
+    - verification_coverage module for sampled verification
+    - verification_results module for streaming result collection
+    - archive_index and chunk_store modules for archive verification
 
 Classes:
     - VerificationManager: Manages backup verification operations
@@ -31,15 +46,39 @@ Classes:
 
 import hashlib
 import logging
+import math
+import os
 import sys
+import tarfile
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Final
+from typing import IO, Final
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.common_types import VerificationReportDict, VerificationResultDict
 
+from gui.archive_compression import DEDUP_ARCHIVE_FORMAT, archive_format_of
+from gui.archive_index import (
+    ARCHIVE_READ_ERRORS,
+    ArchiveIndex,
+    decompressor,
+    index_path,
+)
+from gui.archive_snapshot import SNAPSHOT_MEMBER_NAME
+from gui.chunk_store import CHUNK_STORE_DIR, ChunkStore, DedupManifest
+from gui.copy_engine import CopyEngine
+from gui.file_hasher import file_digest
+from gui.hash_cache import HashCache
+from gui.merkle_tree import VERIFIED_MERKLE_FILENAME, MerkleTree
+from gui.verification_coverage import VerificationCoverage
+from gui.verification_results import (
+    FailureCallback,
+    VerificationResults,
+    new_results_file,
+)
+
 
 # Setup logger for this module
 logger = logging.getLogger(__name__)
@@ -49,9 +88,35 @@ logger = logging.getLogger(__name__)
 # Constants
 # =============================================================================
 
-HASH_CHUNK_SIZE: Final[int] = 65536  # 64KB chunks for hash calculation
+HASH_CHUNK_SIZE: Final[int] = 65536  # 64KB chunks for hashing archive streams
 TIMESTAMP_FORMAT: Final[str] = "%Y-%m-%dT%H:%M:%S"
 
+# Default verification threads; hashlib releases the GIL on large buffers
+DEFAULT_VERIFY_WORKERS: Final[int] = 4
+
+# Percentage of unchanged files hashed per run; 100 disables sampling
+DEFAULT_SAMPLE_PERCENT: Final[int] = 100
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def _forget_stream_members(tar: tarfile.TarFile) -> None:
+    """
+    Drop the TarInfo list a stream-mode TarFile keeps.
+
+    TarFile.next() appends every member to tar.members, so a long stream
+    would hold one TarInfo per member. Stream mode never revisits members,
+    so clearing the list is safe.
+
+    Args:
+        tar: TarFile opened in stream mode ("r|")
+    """
+    # members is an undocumented instance attribute missing from typeshed
+    tar.members.clear()  # type: ignore[attr-defined]
+
 
 # =============================================================================
 # VerificationManager Class
@@ -64,25 +129,59 @@ class VerificationManager:
 
     Compares backup files against source files to verify successful backup.
     Supports both fast size verification and thorough hash verification.
+    Files are verified on a bounded worker pool; results keep input order.
+    With coverage tracking and a sample percentage or byte budget set, hash
+    verification is limited to new or changed files plus the least recently
+    verified unchanged ones; all other files get the size check only.
+    Results stream through a VerificationResults collector, which can keep
+    only failures and write every result to a JSONL file.
     Generates formatted reports for display in the application log viewer.
 
     Attributes:
         hash_verification_enabled: Whether to perform SHA-256 hash comparison
+        workers: Number of verification threads (1 verifies serially)
+        hash_cache: Persistent digest cache consulted before hashing, or None
+        coverage: Persistent last-verified table for sampling, or None
+        sample_percent: Percentage of unchanged files hashed per run (1-100)
+        sample_budget_bytes: Byte budget for unchanged files per run (0: none)
+        sampling_enabled: Whether hash verification is limited to a sample
+        failures_only: Keep only failed results in reports (OK files counted)
+        results_dir: Directory for JSONL files of all results, or None
 
     Public methods:
         verify_backup: Verify all files in a backup
+        verify_archive: Verify all files in an archive in one streaming pass
         verify_file: Verify a single file's integrity
         format_report_for_log: Format report for log viewer display
+
+    Private methods:
+        _new_results: Create the result collector for a run
+        _build_report: Build a report from a finished collector
+        _plan_hashing: Choose the backup files hashed in this run
+        _changed_since_verified: Check a file against the mirror's Merkle tree
+        _advance_verified_tree: Record verified files in the verified tree
     """
 
-    def __init__(self, hash_verification_enabled: bool = False) -> None:
+    def __init__(
+        self,
+        hash_verification_enabled: bool = False,
+        workers: int = DEFAULT_VERIFY_WORKERS,
+    ) -> None:
         """
         Initialize VerificationManager.
 
         Args:
             hash_verification_enabled: Enable SHA-256 hash verification (default: False)
+            workers: Number of verification threads (default: DEFAULT_VERIFY_WORKERS)
         """
         self._hash_verification_enabled = hash_verification_enabled
+        self._engine = CopyEngine(workers, thread_name_prefix="dfbu-verify")
+        self.hash_cache: HashCache | None = None
+        self.coverage: VerificationCoverage | None = None
+        self.sample_percent: int = DEFAULT_SAMPLE_PERCENT
+        self.sample_budget_bytes: int = 0
+        self.failures_only: bool = False
+        self.results_dir: Path | None = None
 
     @property
     def hash_verification_enabled(self) -> bool:
@@ -94,52 +193,209 @@ class VerificationManager:
         """Set whether SHA-256 hash verification is enabled."""
         self._hash_verification_enabled = value
 
+    @property
+    def sampling_enabled(self) -> bool:
+        """Get whether hash verification is limited to a sample of files."""
+        return (
+            self._hash_verification_enabled
+            and self.coverage is not None
+            and (self.sample_percent < 100 or self.sample_budget_bytes > 0)
+        )
+
+    @property
+    def workers(self) -> int:
+        """Get number of verification threads."""
+        return self._engine.max_workers
+
+    @workers.setter
+    def workers(self, value: int) -> None:
+        """Set number of verification threads (clamped like copy_workers)."""
+        self._engine.max_workers = value
+
     def verify_backup(
         self,
         backup_path: Path,
         source_paths: list[tuple[Path, Path]],
         backup_type: str = "mirror",
+        digests: dict[Path, str] | None = None,
+        progress_callback: Callable[[int], None] | None = None,
+        *,
+        tree: MerkleTree | None = None,
+        failure_callback: FailureCallback | None = None,
     ) -> VerificationReportDict:
         """
         Verify integrity of a backup by comparing files against sources.
 
+        Files are verified on the worker pool and results are collected in
+        the order of source_paths. When hash verification is enabled and a
+        digest of the copied bytes was recorded for a backup file, only the
+        backup file is hashed and compared with it; the source is not read
+        again. In sampling mode only the files chosen by _plan_hashing are
+        hashed; every file still gets the size check. With the mirror's
+        Merkle tree, only files in subtrees whose digests changed since the
+        last verification (or whose backup stat changed) are hashed.
+        With failures_only set, files that pass are only counted; with
+        results_dir set, every result is also written to a JSONL file.
+
         Args:
             backup_path: Base path of the backup to verify
             source_paths: List of (source_path, backup_file_path) tuples to verify
             backup_type: Type of backup ("mirror" or "archive")
+            digests: "<algorithm>:<hex digest>" recorded at copy time, by backup path
+            progress_callback: Optional callback for progress updates (0-100),
+                called on the calling thread as results arrive
+            tree: Merkle tree stored with the mirror, to skip unchanged subtrees
+            failure_callback: Called on the calling thread with each failed
+                result as it arrives
 
         Returns:
             VerificationReportDict with verification results
         """
-        results: list[VerificationResultDict] = []
-        verified_ok = 0
-        verified_failed = 0
+        collected = self._new_results(backup_type, failure_callback)
+        # Backup files that passed hash verification, for coverage and the tree
+        hash_passed: list[Path] = []
+        recorded = digests or {}
+        total = len(source_paths)
+        last_progress = -1
+        track_coverage = self._hash_verification_enabled and self.coverage is not None
+        hashed, stats = (
+            self._plan_hashing(source_paths) if track_coverage else (None, {})
+        )
+        verified_tree: MerkleTree | None = None
+        changed: set[str] = set()
+        if tree is not None and self._hash_verification_enabled:
+            # One digest comparison per unchanged subtree
+            verified_tree = MerkleTree.load(tree.root, VERIFIED_MERKLE_FILENAME)
+            changed = set(tree.diff(verified_tree))
+
+        def needs_hash(backup_file_path: Path) -> bool:
+            if hashed is not None and backup_file_path in hashed:
+                return True
+            if tree is not None and verified_tree is not None:
+                return self._changed_since_verified(tree, changed, backup_file_path)
+            return hashed is None
+
+        def verify(pair: tuple[Path, Path]) -> VerificationResultDict:
+            source_path, backup_file_path = pair
+            return self._verify_single_file(
+                source_path,
+                backup_file_path,
+                recorded.get(backup_file_path),
+                hash_contents=needs_hash(backup_file_path),
+            )
 
-        for source_path, backup_file_path in source_paths:
-            result = self._verify_single_file(source_path, backup_file_path)
-            results.append(result)
+        try:
+            for (_, backup_file_path), result in zip(
+                source_paths, self._engine.run(source_paths, verify), strict=True
+            ):
+                collected.add(result)
+                if result["hash_match"]:
+                    hash_passed.append(backup_file_path)
+
+                # Only report whole-percent changes to keep UI signal traffic low
+                if progress_callback is not None:
+                    progress = len(collected) * 100 // total
+                    if progress != last_progress:
+                        last_progress = progress
+                        progress_callback(progress)
+        finally:
+            collected.close()
+
+        report = self._build_report(
+            collected, backup_type, backup_path, self._hash_verification_enabled
+        )
 
-            if result["status"] == "ok":
-                verified_ok += 1
-            else:
-                verified_failed += 1
+        if track_coverage and self.coverage is not None:
+            # Remember what was hashed so later runs rotate to other files
+            for backup_file_path in hash_passed:
+                st = stats.get(backup_file_path)
+                if st is not None:
+                    self.coverage.record(backup_file_path, st)
+            current = sum(
+                1
+                for backup_file_path, st in stats.items()
+                if self.coverage.is_current(backup_file_path, st)
+            )
+            self.coverage.save()
+            if self.sampling_enabled:
+                report["coverage_percent"] = current * 100 / total if total else 100.0
 
-        report: VerificationReportDict = {
-            "timestamp": datetime.now(UTC).strftime(TIMESTAMP_FORMAT),
-            "backup_type": backup_type,
-            "backup_path": str(backup_path),
-            "total_files": len(source_paths),
-            "verified_ok": verified_ok,
-            "verified_failed": verified_failed,
-            "hash_verified": self._hash_verification_enabled,
-            "results": results,
-        }
+        if tree is not None and verified_tree is not None:
+            self._advance_verified_tree(tree, verified_tree, changed, hash_passed)
+
+        if self.sampling_enabled or verified_tree is not None:
+            report["hash_checked"] = collected.hash_checked
 
         logger.info(
-            f"Verification complete: {verified_ok}/{len(source_paths)} files OK, "
-            f"{verified_failed} failed"
+            f"Verification complete: {collected.verified_ok}/{len(source_paths)} "
+            f"files OK, {collected.verified_failed} failed"
         )
 
+        # Persist digests computed during this run for the next verification
+        if self.hash_cache is not None:
+            self.hash_cache.save()
+
+        return report
+
+    def verify_archive(
+        self,
+        archive_path: Path,
+        progress_callback: Callable[[int], None] | None = None,
+        *,
+        failure_callback: FailureCallback | None = None,
+    ) -> VerificationReportDict:
+        """
+        Verify all files in an archive in one streaming pass.
+
+        Members are decompressed and hashed sequentially without being
+        extracted, so memory stays bounded regardless of archive size. Each
+        file is checked against the archive index (size and SHA-256) when
+        one exists, otherwise against its source file (size, plus SHA-256
+        when hash verification is enabled). Dedup archives are checked
+        against their manifest; every chunk is verified against its hash.
+        failures_only and results_dir apply as in verify_backup.
+
+        Args:
+            archive_path: Archive file or dedup manifest to verify
+            progress_callback: Optional callback for progress updates (0-100)
+            failure_callback: Called with each failed result as it arrives
+
+        Returns:
+            VerificationReportDict with one result per archived file
+        """
+        collected = self._new_results("archive", failure_callback)
+        indexed = False
+        try:
+            if archive_format_of(archive_path) == DEDUP_ARCHIVE_FORMAT:
+                indexed = True
+                self._verify_manifest_members(
+                    archive_path, collected, progress_callback
+                )
+            else:
+                indexed = self._verify_tar_members(
+                    archive_path, collected, progress_callback
+                )
+        except ARCHIVE_READ_ERRORS as e:
+            collected.add(self._archive_error(archive_path, f"Archive unreadable: {e}"))
+            logger.error(f"Verification error for archive {archive_path}: {e}")
+        finally:
+            collected.close()
+
+        report = self._build_report(
+            collected,
+            "archive",
+            archive_path,
+            indexed or self._hash_verification_enabled,
+        )
+
+        logger.info(
+            f"Archive verification complete: {collected.verified_ok}/"
+            f"{len(collected)} files OK, {collected.verified_failed} failed"
+        )
+
+        if self.hash_cache is not None:
+            self.hash_cache.save()
+
         return report
 
     def verify_file(
@@ -182,7 +438,7 @@ class VerificationManager:
         if self._hash_verification_enabled:
             try:
                 source_hash = self._calculate_hash(source_path)
-                backup_hash = self._calculate_hash(backup_path)
+                backup_hash = self._calculate_hash(backup_path, backup=True)
                 hash_match = source_hash == backup_hash
             except OSError as e:
                 return size_match, None, f"Hash calculation failed: {e}"
@@ -214,6 +470,19 @@ class VerificationManager:
         lines.append(
             f"Hash Check:   {'Enabled' if report['hash_verified'] else 'Disabled'}"
         )
+        if "coverage_percent" in report:
+            lines.append(
+                f"Sampling:     {report.get('hash_checked', 0)} of "
+                f"{report['total_files']} files hashed, "
+                f"{report['coverage_percent']:.1f}% verified since last change"
+            )
+        elif "hash_checked" in report:
+            lines.append(
+                f"Hash Scope:   {report['hash_checked']} of {report['total_files']} "
+                "files hashed (changed since last verification)"
+            )
+        if "results_file" in report:
+            lines.append(f"Results File: {report['results_file']}")
         lines.append("")
 
         # Results summary
@@ -256,10 +525,71 @@ class VerificationManager:
 
         return "\n".join(lines)
 
+    def _new_results(
+        self, backup_type: str, failure_callback: FailureCallback | None
+    ) -> VerificationResults:
+        """
+        Create the result collector for a verification run.
+
+        Args:
+            backup_type: Type of backup verified ("mirror" or "archive")
+            failure_callback: Called with each failed result as it arrives
+
+        Returns:
+            Collector honoring failures_only and results_dir
+        """
+        spill_path = (
+            new_results_file(backup_type, self.results_dir)
+            if self.results_dir is not None
+            else None
+        )
+        return VerificationResults(
+            failures_only=self.failures_only,
+            failure_callback=failure_callback,
+            spill_path=spill_path,
+        )
+
+    @staticmethod
+    def _build_report(
+        collected: VerificationResults,
+        backup_type: str,
+        backup_path: Path,
+        hash_verified: bool,
+    ) -> VerificationReportDict:
+        """
+        Build a verification report from a finished collector.
+
+        Args:
+            collected: Collector holding the counters and kept results
+            backup_type: Type of backup verified ("mirror" or "archive")
+            backup_path: Backup base path or archive path
+            hash_verified: Whether contents were hash-verified
+
+        Returns:
+            VerificationReportDict without the optional mode-specific fields
+        """
+        report: VerificationReportDict = {
+            "timestamp": datetime.now(UTC).strftime(TIMESTAMP_FORMAT),
+            "backup_type": backup_type,
+            "backup_path": str(backup_path),
+            "total_files": len(collected),
+            "verified_ok": collected.verified_ok,
+            "verified_failed": collected.verified_failed,
+            "hash_verified": hash_verified,
+            "results": collected.results,
+        }
+        if collected.failures_only:
+            report["failures_only"] = True
+        if collected.spill_path is not None:
+            report["results_file"] = str(collected.spill_path)
+        return report
+
     def _verify_single_file(
         self,
         source_path: Path,
         backup_path: Path,
+        recorded_digest: str | None = None,
+        hash_contents: bool = True,
     ) -> VerificationResultDict:
         """
         Verify a single file and return structured result.
@@ -267,6 +597,9 @@ class VerificationManager:
         Args:
             source_path: Original source file path
             backup_path: File path in the backup
+            recorded_digest: "<algorithm>:<hex digest>" of the bytes copied, if known
+            hash_contents: Hash the file if hash verification is enabled
+                (False for files left out of a sampled run)
 
         Returns:
             VerificationResultDict with verification details
@@ -282,32 +615,36 @@ class VerificationManager:
             "error": "",
         }
 
-        # Check backup file exists
-        if not backup_path.exists():
+        # One stat per side: a missing file surfaces as FileNotFoundError
+        try:
+            backup_size = backup_path.stat().st_size
+        except FileNotFoundError:
             result["status"] = "missing"
             result["error"] = "Backup file does not exist"
             logger.warning(f"Verification failed: {backup_path} missing")
             return result
-
-        # Check source file exists
-        if not source_path.exists():
+        except OSError as e:
             result["status"] = "error"
-            result["error"] = "Source file no longer exists for comparison"
-            logger.warning(f"Verification skipped: {source_path} no longer exists")
+            result["error"] = f"Cannot read file stats: {e}"
+            logger.error(f"Verification error for {source_path}: {e}")
             return result
 
-        # Get file sizes
         try:
             source_size = source_path.stat().st_size
-            backup_size = backup_path.stat().st_size
-            result["expected_size"] = source_size
-            result["actual_size"] = backup_size
+        except FileNotFoundError:
+            result["status"] = "error"
+            result["error"] = "Source file no longer exists for comparison"
+            logger.warning(f"Verification skipped: {source_path} no longer exists")
+            return result
         except OSError as e:
             result["status"] = "error"
             result["error"] = f"Cannot read file stats: {e}"
             logger.error(f"Verification error for {source_path}: {e}")
             return result
 
+        result["expected_size"] = source_size
+        result["actual_size"] = backup_size
+
         # Size verification
         result["size_match"] = source_size == backup_size
         if not result["size_match"]:
@@ -318,11 +655,18 @@ class VerificationManager:
             )
             return result
 
-        # Hash verification (if enabled)
-        if self._hash_verification_enabled:
+        # Hash verification (if enabled and the file is in this run's sample)
+        if self._hash_verification_enabled and hash_contents:
             try:
-                source_hash = self._calculate_hash(source_path)
-                backup_hash = self._calculate_hash(backup_path)
+                if recorded_digest is not None:
+                    # Hashed while copying: compare the backup with the copied bytes
+                    algorithm, _, source_hash = recorded_digest.partition(":")
+                    backup_hash = self._calculate_hash(
+                        backup_path, algorithm, backup=True
+                    )
+                else:
+                    source_hash = self._calculate_hash(source_path)
+                    backup_hash = self._calculate_hash(backup_path, backup=True)
                 result["hash_match"] = source_hash == backup_hash
 
                 if not result["hash_match"]:
@@ -330,7 +674,7 @@ class VerificationManager:
                     logger.warning(f"Hash mismatch: {source_path}")
                     return result
 
-            except OSError as e:
+            except (OSError, ValueError) as e:
                 result["status"] = "error"
                 result["error"] = f"Hash calculation failed: {e}"
                 logger.error(f"Hash calculation error for {source_path}: {e}")
@@ -339,21 +683,438 @@ class VerificationManager:
         logger.debug(f"Verification OK: {source_path}")
         return result
 
-    def _calculate_hash(self, file_path: Path) -> str:
+    def _plan_hashing(
+        self, source_paths: list[tuple[Path, Path]]
+    ) -> tuple[set[Path] | None, dict[Path, os.stat_result]]:
         """
-        Calculate SHA-256 hash of a file.
+        Choose the backup files hashed in this run.
+
+        Files never verified or changed since their last verification are
+        always hashed. Of the unchanged files, the least recently verified
+        are added up to sample_percent of their count and, if set, up to
+        sample_budget_bytes; at least one is always added so every run
+        advances the rotation. Without a byte budget, every unchanged file
+        is hashed at least once every ceil(100 / sample_percent) runs.
+
+        Args:
+            source_paths: List of (source_path, backup_file_path) tuples
+
+        Returns:
+            Tuple of (backup files to hash or None for all, stat results of
+            the backup files that could be stat'd)
+        """
+        stats: dict[Path, os.stat_result] = {}
+        for _, backup_file_path in source_paths:
+            try:
+                stats[backup_file_path] = backup_file_path.stat()
+            except OSError:
+                # Reported as missing or unreadable by the verification itself
+                continue
+        if not self.sampling_enabled or self.coverage is None:
+            return None, stats
+
+        # Last verification time of files unchanged since then
+        verified_at: dict[Path, int] = {}
+        for path, st in stats.items():
+            record = self.coverage.lookup(path)
+            if record is not None and self.coverage.is_current(path, st):
+                verified_at[path] = record.verified_at
+        hashed = {
+            backup_file_path
+            for _, backup_file_path in source_paths
+            if backup_file_path not in verified_at
+        }
+        unchanged = sorted(verified_at, key=verified_at.__getitem__)
+
+        quota = math.ceil(len(unchanged) * min(self.sample_percent, 100) / 100)
+        budget = self.sample_budget_bytes
+        spent = 0
+        for count, path in enumerate(unchanged[:quota]):
+            size = stats[path].st_size
+            if count and budget > 0 and spent + size > budget:
+                break
+            hashed.add(path)
+            spent += size
+        if unchanged and hashed.isdisjoint(unchanged):
+            hashed.add(unchanged[0])
+
+        logger.info(
+            f"Sampled verification: hashing {len(hashed)} of {len(source_paths)} "
+            f"files ({len(source_paths) - len(unchanged)} new or changed)"
+        )
+        return hashed, stats
+
+    def _changed_since_verified(
+        self, tree: MerkleTree, changed: set[str], backup_file_path: Path
+    ) -> bool:
+        """
+        Check whether a backup file changed since the last verification.
+
+        Args:
+            tree: Merkle tree stored with the mirror
+            changed: Tree keys that differ from the last verified tree
+            backup_file_path: Backup file to check
+
+        Returns:
+            True if the file must be hashed: outside or missing from the
+            tree, in a changed subtree, or modified since its leaf was recorded
+        """
+        key = tree.key(backup_file_path)
+        if key is None or key in changed:
+            return True
+        leaf = tree.leaf(key)
+        try:
+            return leaf is None or not leaf.matches(backup_file_path.stat())
+        except OSError:
+            # Reported as missing or unreadable by the verification itself
+            return True
+
+    def _advance_verified_tree(
+        self,
+        tree: MerkleTree,
+        verified_tree: MerkleTree,
+        changed: set[str],
+        hash_passed: list[Path],
+    ) -> None:
+        """
+        Move files that passed hash verification into the verified tree.
+
+        Files that failed or were not checked keep their old verified leaf,
+        so they are hashed again next time. Files no longer in the mirror's
+        tree are dropped.
+
+        Args:
+            tree: Merkle tree stored with the mirror
+            verified_tree: Tree as of the last verification, updated in place
+            changed: Tree keys that differed before this run
+            hash_passed: Backup files that passed hash verification
+        """
+        for backup_file_path in hash_passed:
+            key = tree.key(backup_file_path)
+            leaf = tree.leaf(key) if key is not None else None
+            if key is not None and leaf is not None:
+                verified_tree.set_leaf(key, leaf)
+        for key in changed:
+            if tree.leaf(key) is None:
+                verified_tree.remove(key)
+        verified_tree.save()
+
+    def _verify_tar_members(
+        self,
+        archive_path: Path,
+        results: VerificationResults,
+        progress_callback: Callable[[int], None] | None,
+    ) -> bool:
+        """
+        Stream through a tar archive once and verify every regular member.
+
+        Args:
+            archive_path: Archive file path
+            results: Collector receiving one result per archived file
+            progress_callback: Optional callback for progress updates (0-100)
+
+        Returns:
+            True if members were checked against an archive index
+
+        Raises:
+            ValueError: If the archive format is unknown or unavailable
+            OSError, tarfile.TarError, EOFError: If the archive is unreadable
+        """
+        archive_format = archive_format_of(archive_path)
+        if archive_format is None:
+            raise ValueError(f"Unknown archive format: {archive_path.name}")
+        index = ArchiveIndex.load(archive_path)
+        pending = dict(index.members) if index is not None else {}
+        if index is None and index_path(archive_path).exists():
+            # The index is written last, so a stale one means the archive changed
+            results.add(
+                self._archive_error(
+                    archive_path,
+                    "Archive does not match its index (modified or truncated)",
+                )
+            )
+            logger.warning(f"Archive {archive_path} does not match its index")
+        total = max(1, archive_path.stat().st_size)
+        last_progress = -1
+
+        with (
+            archive_path.open("rb") as raw,
+            decompressor(raw, archive_format) as stream,
+            tarfile.open(fileobj=stream, mode="r|") as tar,
+        ):
+            while (member := tar.next()) is not None:
+                _forget_stream_members(tar)
+                entry = pending.pop(member.name, None)
+                if member.isreg() and member.name != SNAPSHOT_MEMBER_NAME:
+                    data = tar.extractfile(member)
+                    if data is None:
+                        continue
+                    digest, size = self._hash_stream(data)
+                    if entry is not None:
+                        result = self._check_recorded(
+                            archive_path,
+                            member.name,
+                            size,
+                            entry.size,
+                            digest,
+                            recorded_digest=entry.digest,
+                        )
+                    else:
+                        result = self._check_source(
+                            archive_path, member.name, size, digest
+                        )
+                    results.add(result)
+
+                if progress_callback is not None:
+                    progress = min(100, raw.tell() * 100 // total)
+                    if progress != last_progress:
+                        last_progress = progress
+                        progress_callback(progress)
+
+        # Indexed files the archive stream never reached
+        for name, entry in pending.items():
+            if entry.digest is None or name == SNAPSHOT_MEMBER_NAME:
+                continue
+            result = self._archive_result(archive_path, name, entry.size)
+            result["status"] = "missing"
+            result["error"] = "Indexed file is missing from the archive"
+            results.add(result)
+            logger.warning(f"Verification failed: {name} missing from {archive_path}")
+
+        return index is not None
+
+    def _verify_manifest_members(
+        self,
+        manifest_path: Path,
+        results: VerificationResults,
+        progress_callback: Callable[[int], None] | None,
+    ) -> None:
+        """
+        Verify every file of a dedup archive through the chunk store.
+
+        Each chunk is checked against its content hash while it is read, and
+        the reassembled size against the manifest.
+
+        Args:
+            manifest_path: Dedup manifest path
+            results: Collector receiving one result per archived file
+            progress_callback: Optional callback for progress updates (0-100)
+
+        Raises:
+            ValueError: If the manifest is unreadable
+            OSError: If the manifest cannot be read
+        """
+        manifest = DedupManifest.load(manifest_path)
+        store = ChunkStore(manifest_path.parent / CHUNK_STORE_DIR)
+        total = len(manifest.entries)
+        last_progress = -1
+
+        for position, entry in enumerate(manifest.entries.values(), 1):
+            name = entry.path.lstrip("/")
+            file_hash = hashlib.sha256()
+            size = 0
+            try:
+                for chunk_id in entry.chunks:
+                    chunk = store.get(chunk_id)
+                    file_hash.update(chunk)
+                    size += len(chunk)
+            except (OSError, ValueError) as e:
+                result = self._archive_result(manifest_path, name, entry.size)
+                result["status"] = "error"
+                result["error"] = f"Chunk verification failed: {e}"
+                results.add(result)
+                logger.error(f"Verification error for {entry.path}: {e}")
+            else:
+                results.add(
+                    self._check_recorded(
+                        manifest_path, name, size, entry.size, file_hash.hexdigest()
+                    )
+                )
+
+            if progress_callback is not None:
+                progress = position * 100 // total
+                if progress != last_progress:
+                    last_progress = progress
+                    progress_callback(progress)
+
+    def _check_recorded(
+        self,
+        archive_path: Path,
+        name: str,
+        actual_size: int,
+        recorded_size: int,
+        digest: str,
+        *,
+        recorded_digest: str | None = None,
+    ) -> VerificationResultDict:
+        """
+        Compare an archived file with the size and digest recorded at backup time.
+
+        Args:
+            archive_path: Archive file path
+            name: Member name (original path without the leading slash)
+            actual_size: Size of the archived data
+            recorded_size: Size recorded in the index or manifest
+            digest: SHA-256 of the archived data
+            recorded_digest: SHA-256 recorded in the index, if any
+
+        Returns:
+            VerificationResultDict for the file
+        """
+        result = self._archive_result(archive_path, name, recorded_size)
+        result["actual_size"] = actual_size
+        result["size_match"] = actual_size == recorded_size
+        if not result["size_match"]:
+            result["status"] = "size_mismatch"
+            logger.warning(f"Size mismatch in {archive_path}: {name}")
+            return result
+        if recorded_digest is not None:
+            result["hash_match"] = digest == recorded_digest
+            if not result["hash_match"]:
+                result["status"] = "hash_mismatch"
+                logger.warning(f"Hash mismatch in {archive_path}: {name}")
+        return result
+
+    def _check_source(
+        self, archive_path: Path, name: str, actual_size: int, digest: str
+    ) -> VerificationResultDict:
+        """
+        Compare an archived file with its source file.
+
+        Args:
+            archive_path: Archive file path
+            name: Member name (original path without the leading slash)
+            actual_size: Size of the archived data
+            digest: SHA-256 of the archived data
+
+        Returns:
+            VerificationResultDict for the file
+        """
+        source_path = Path("/") / name
+        result = self._archive_result(archive_path, name, 0)
+        result["actual_size"] = actual_size
+        try:
+            source_size = source_path.stat().st_size
+        except FileNotFoundError:
+            result["status"] = "error"
+            result["error"] = "Source file no longer exists for comparison"
+            logger.warning(f"Verification skipped: {source_path} no longer exists")
+            return result
+        except OSError as e:
+            result["status"] = "error"
+            result["error"] = f"Cannot read file stats: {e}"
+            logger.error(f"Verification error for {source_path}: {e}")
+            return result
+
+        result["expected_size"] = source_size
+        result["size_match"] = source_size == actual_size
+        if not result["size_match"]:
+            result["status"] = "size_mismatch"
+            logger.warning(f"Size mismatch: {source_path} vs {archive_path}: {name}")
+            return result
+
+        if self._hash_verification_enabled:
+            try:
+                result["hash_match"] = self._calculate_hash(source_path) == digest
+            except (OSError, ValueError) as e:
+                result["status"] = "error"
+                result["error"] = f"Hash calculation failed: {e}"
+                logger.error(f"Hash calculation error for {source_path}: {e}")
+                return result
+            if not result["hash_match"]:
+                result["status"] = "hash_mismatch"
+                logger.warning(f"Hash mismatch: {source_path}")
+        return result
+
+    @staticmethod
+    def _archive_result(
+        archive_path: Path, name: str, expected_size: int
+    ) -> VerificationResultDict:
+        """
+        Initial result for an archived file.
+
+        Args:
+            archive_path: Archive file path
+            name: Member name (original path without the leading slash)
+            expected_size: Size the file is expected to have
+
+        Returns:
+            VerificationResultDict with status "ok" and nothing checked yet
+        """
+        return {
+            "path": f"/{name}",
+            "backup_path": f"{archive_path}:{name}",
+            "status": "ok",
+            "size_match": False,
+            "hash_match": None,
+            "expected_size": expected_size,
+            "actual_size": None,
+            "error": "",
+        }
+
+    @staticmethod
+    def _archive_error(archive_path: Path, message: str) -> VerificationResultDict:
+        """
+        Error result for the archive as a whole.
+
+        Args:
+            archive_path: Archive file path
+            message: Error message
+
+        Returns:
+            VerificationResultDict with status "error"
+        """
+        return {
+            "path": str(archive_path),
+            "backup_path": str(archive_path),
+            "status": "error",
+            "size_match": False,
+            "hash_match": None,
+            "expected_size": 0,
+            "actual_size": None,
+            "error": message,
+        }
+
+    @staticmethod
+    def _hash_stream(stream: IO[bytes]) -> tuple[str, int]:
+        """
+        SHA-256 and length of a stream, read in bounded chunks.
+
+        Args:
+            stream: Binary stream to consume
+
+        Returns:
+            Tuple of (hex digest, number of bytes read)
+        """
+        file_hash = hashlib.sha256()
+        size = 0
+        for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+            size += len(chunk)
+        return file_hash.hexdigest(), size
+
+    def _calculate_hash(
+        self, file_path: Path, algorithm: str = "sha256", *, backup: bool = False
+    ) -> str:
+        """
+        Calculate the hash of a file, via the hash cache when one is set.
+
+        Large backup files are hashed through a memory mapping. Source files
+        are always read, since an application truncating one while it is
+        mapped would crash the process with SIGBUS.
 
         Args:
             file_path: Path to file to hash
+            algorithm: hashlib algorithm name (default: SHA-256)
+            backup: file_path is a backup file only DFBU writes to
 
         Returns:
-            Hex digest of SHA-256 hash
+            Hex digest of the file
 
         Raises:
             OSError: If file cannot be read
+            ValueError: If the algorithm is unknown
         """
-        sha256_hash = hashlib.sha256()
-        with Path(file_path).open("rb") as f:
-            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
-                sha256_hash.update(chunk)
-        return sha256_hash.hexdigest()
+        if self.hash_cache is not None:
+            return self.hash_cache.file_digest(file_path, algorithm, allow_mmap=backup)
+        return file_digest(file_path, algorithm, allow_mmap=backup)
@@ -0,0 +1,207 @@
+"""
+DFBU VerificationResults - Streaming Collector for Verification Results
+
+Description:
+    Collects per-file verification results as they arrive. In full mode
+    every result is kept for the report, as before. In failures-only mode
+    files that passed are reduced to counters, so a 100k-file backup holds
+    only its failures in memory. Failures can be streamed to a callback as
+    they are found, and the complete per-file results can be spilled to a
+    JSONL file on disk for later inspection.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+Date Changed: 10-16-2026
+License: MIT
+
+Features:
+    - Counters for passed, failed, and hash-checked files
+    - Failures-only mode keeps no per-file dicts for passed files
+    - Failure callback invoked on the calling thread as failures arrive
+    - Optional JSONL spill of every result, one JSON object per line
+    - Spill files in ~/.local/share/dfbu/verify-results, oldest pruned
+
+Requirements:
+    - Linux environment
+    - Python 3.14+ for latest language features
+    - Standard library: json
+
+Classes:
+    - VerificationResults: Streaming collector for verification results
+
+Functions:
+    - new_results_file: Path for the spill file of a new verification run
+"""
+
+import json
+import logging
+import sys
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Final
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from core.common_types import VerificationResultDict
+
+
+# Setup logger for this module
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_RESULTS_DIR: Final[Path] = (
+    Path.home() / ".local" / "share" / "dfbu" / "verify-results"
+)
+
+# Spill files kept in the results directory; older ones are deleted
+RESULTS_FILES_KEPT: Final[int] = 10
+
+RESULTS_FILE_SUFFIX: Final[str] = ".jsonl"
+
+type FailureCallback = Callable[[VerificationResultDict], None]
+
+
+# =============================================================================
+# VerificationResults Class
+# =============================================================================
+
+
+class VerificationResults:
+    """
+    Streaming collector for per-file verification results.
+
+    Call close() when the run ends, also on errors. A spill file that
+    cannot be written is logged and disabled; the verification continues.
+
+    Attributes:
+        results: Kept results (all, or failures only in failures-only mode)
+        verified_ok: Number of files that passed verification
+        verified_failed: Number of files that failed verification
+        hash_checked: Number of files whose contents were hashed
+        failures_only: Whether results of passed files are discarded
+        spill_path: JSONL file receiving every result, or None
+
+    Public methods:
+        add: Count a result, keep it if needed, and stream it
+        close: Close the spill file
+    """
+
+    def __init__(
+        self,
+        *,
+        failures_only: bool = False,
+        failure_callback: FailureCallback | None = None,
+        spill_path: Path | None = None,
+    ) -> None:
+        """
+        Initialize VerificationResults.
+
+        Args:
+            failures_only: Keep only failed results (default: keep all)
+            failure_callback: Called with each failed result as it arrives
+            spill_path: JSONL file receiving every result (default: none)
+        """
+        self.results: list[VerificationResultDict] = []
+        self.verified_ok: int = 0
+        self.verified_failed: int = 0
+        self.hash_checked: int = 0
+        self.failures_only: bool = failures_only
+        self.spill_path: Path | None = spill_path
+        self._failure_callback = failure_callback
+        self._spill: IO[str] | None = None
+        if spill_path is not None:
+            try:
+                spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill = spill_path.open("w", encoding="utf-8")
+            except OSError as e:
+                logger.warning(f"Cannot write verification results {spill_path}: {e}")
+                self.spill_path = None
+
+    def __len__(self) -> int:
+        """Return number of results added."""
+        return self.verified_ok + self.verified_failed
+
+    def add(self, result: VerificationResultDict) -> None:
+        """
+        Count a result, keep it if needed, and stream it.
+
+        Args:
+            result: Verification result of one file
+        """
+        if result["hash_match"] is not None:
+            self.hash_checked += 1
+        if result["status"] == "ok":
+            self.verified_ok += 1
+            if not self.failures_only:
+                self.results.append(result)
+        else:
+            self.verified_failed += 1
+            self.results.append(result)
+            if self._failure_callback is not None:
+                self._failure_callback(result)
+
+        if self._spill is not None:
+            try:
+                self._spill.write(json.dumps(result, separators=(",", ":")) + "\n")
+            except OSError as e:
+                logger.warning(
+                    f"Stopped writing verification results {self.spill_path}: {e}"
+                )
+                self.close()
+                self.spill_path = None
+
+    def close(self) -> None:
+        """Close the spill file, if open."""
+        if self._spill is None:
+            return
+        try:
+            self._spill.close()
+        except OSError as e:
+            logger.warning(f"Cannot write verification results {self.spill_path}: {e}")
+            self.spill_path = None
+        self._spill = None
+
+
+# =============================================================================
+# Module Functions
+# =============================================================================
+
+
+def new_results_file(
+    backup_type: str,
+    results_dir: Path = DEFAULT_RESULTS_DIR,
+    keep: int = RESULTS_FILES_KEPT,
+) -> Path:
+    """
+    Path for the spill file of a new verification run.
+
+    Deletes the oldest spill files so that, with the new one, at most keep
+    files remain.
+
+    Args:
+        backup_type: Type of backup verified ("mirror" or "archive")
+        results_dir: Directory holding spill files
+        keep: Number of spill files to retain, including the new one
+
+    Returns:
+        Path of a new, not yet created JSONL file in results_dir
+    """
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
+    try:
+        # Names start with a UTC timestamp, so they sort oldest first
+        existing = sorted(results_dir.glob(f"*{RESULTS_FILE_SUFFIX}"))
+    except OSError:
+        existing = []
+    for old in existing[: max(0, len(existing) - keep + 1)]:
+        try:
+            old.unlink()
+        except OSError as e:
+            logger.warning(f"Cannot remove old verification results {old}: {e}")
+    return results_dir / f"{stamp}-{backup_type}{RESULTS_FILE_SUFFIX}"
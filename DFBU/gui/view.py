@@ -446,9 +446,12 @@ class MainWindow(QMainWindow):
         config_archive_checkbox: Checkbox for archive backup mode
         config_hostname_checkbox: Checkbox for hostname subdirectory
         config_date_checkbox: Checkbox for date subdirectory
+        config_hardlink_checkbox: Checkbox for hardlink snapshots of dated mirrors
+        config_change_journal_checkbox: Checkbox for the watcher-driven change journal
         config_compression_spinbox: SpinBox for compression level
         config_rotate_checkbox: Checkbox for archive rotation
         config_max_archives_spinbox: SpinBox for max archives
+        config_incremental_checkbox: Checkbox for incremental archives
         config_mirror_path_edit: Line edit for mirror directory path
         config_archive_path_edit: Line edit for archive directory path
         save_config_btn: Button to save configuration changes
@@ -491,6 +494,9 @@ class MainWindow(QMainWindow):
         # Track skipped items for operation summary
         self._skipped_count: int = 0
 
+        # Buttons a running verification disabled, re-enabled when it ends
+        self._verify_disabled_buttons: list[QPushButton] = []
+
         # Track log entries for filtering
         self._log_entries: list[tuple[str, str]] = []
 
@@ -705,6 +711,12 @@ class MainWindow(QMainWindow):
         self.config_date_checkbox: QCheckBox = ui_widget.findChild(
             QCheckBox, "config_date_checkbox"
         )  # type: ignore[assignment]
+        self.config_hardlink_checkbox: QCheckBox | None = ui_widget.findChild(
+            QCheckBox, "config_hardlink_checkbox"
+        )
+        self.config_change_journal_checkbox: QCheckBox | None = ui_widget.findChild(
+            QCheckBox, "config_change_journal_checkbox"
+        )
         self.config_compression_spinbox: QSpinBox = ui_widget.findChild(
             QSpinBox, "config_compression_spinbox"
         )  # type: ignore[assignment]
@@ -714,6 +726,9 @@ class MainWindow(QMainWindow):
         self.config_max_archives_spinbox: QSpinBox = ui_widget.findChild(
             QSpinBox, "config_max_archives_spinbox"
         )  # type: ignore[assignment]
+        self.config_incremental_checkbox: QCheckBox | None = ui_widget.findChild(
+            QCheckBox, "config_incremental_checkbox"
+        )
         # Pre-restore safety widgets (v0.6.0)
         self.config_pre_restore_checkbox: QCheckBox = ui_widget.findChild(
             QCheckBox, "config_pre_restore_checkbox"
@@ -847,18 +862,33 @@ class MainWindow(QMainWindow):
         )  # type: ignore[assignment]
         browse_mirror_btn.clicked.connect(self._on_browse_mirror_dir)
         browse_archive_btn.clicked.connect(self._on_browse_archive_dir)
+        rebuild_index_btn: QPushButton | None = self.central_widget.findChild(
+            QPushButton, "rebuild_mirror_index_btn"
+        )
+        if rebuild_index_btn:
+            rebuild_index_btn.clicked.connect(self._on_rebuild_mirror_index)
         self.config_mirror_path_edit.textChanged.connect(self._on_config_changed)
         self.config_archive_path_edit.textChanged.connect(self._on_config_changed)
         self.config_mirror_checkbox.stateChanged.connect(self._on_config_changed)
         self.config_archive_checkbox.stateChanged.connect(self._on_config_changed)
         self.config_hostname_checkbox.stateChanged.connect(self._on_config_changed)
         self.config_date_checkbox.stateChanged.connect(self._on_config_changed)
+        if self.config_hardlink_checkbox:
+            self.config_hardlink_checkbox.stateChanged.connect(self._on_config_changed)
+        if self.config_change_journal_checkbox:
+            self.config_change_journal_checkbox.stateChanged.connect(
+                self._on_config_changed
+            )
         self.config_compression_spinbox.valueChanged.connect(self._on_config_changed)
         self.config_rotate_checkbox.stateChanged.connect(
             self._on_rotate_checkbox_changed
         )
         self.config_rotate_checkbox.stateChanged.connect(self._on_config_changed)
         self.config_max_archives_spinbox.valueChanged.connect(self._on_config_changed)
+        if self.config_incremental_checkbox:
+            self.config_incremental_checkbox.stateChanged.connect(
+                self._on_config_changed
+            )
         # Pre-restore safety signal connections (v0.6.0)
         self.config_pre_restore_checkbox.stateChanged.connect(
             self._on_pre_restore_checkbox_changed
@@ -949,6 +979,8 @@ class MainWindow(QMainWindow):
         self.viewmodel.recovery_dialog_requested.connect(self._show_recovery_dialog)
         self.viewmodel.size_warning_requested.connect(self._show_size_warning_dialog)
         self.viewmodel.size_scan_progress.connect(self._on_size_scan_progress)
+        self.viewmodel.verify_progress.connect(self._on_verify_progress)
+        self.viewmodel.verify_finished.connect(self._on_verify_finished)
 
     def _load_settings(self) -> None:
         """Load persisted settings."""
@@ -970,6 +1002,10 @@ class MainWindow(QMainWindow):
 
     def _on_start_backup(self) -> None:
         """Handle start backup button click."""
+        # Ignore the shortcut while a verification, backup, or restore is running
+        if self.viewmodel.is_verifying() or self.viewmodel.is_operation_running():
+            return
+
         if self.viewmodel.get_dotfile_count() == 0:
             QMessageBox.warning(
                 self, "No Configuration", "Please load a configuration file first."
@@ -995,6 +1031,7 @@ class MainWindow(QMainWindow):
 
             # Disable buttons during operation
             self.backup_btn.setEnabled(False)
+            self.verify_backup_btn.setEnabled(False)
 
             # Show progress bar
             self.progress_bar.setVisible(True)
@@ -1019,6 +1056,7 @@ class MainWindow(QMainWindow):
             if not success:
                 # Re-enable buttons if backup failed to start
                 self.backup_btn.setEnabled(True)
+                self.verify_backup_btn.setEnabled(True)
                 self.progress_bar.setVisible(False)
                 self._append_log("✗ Failed to start backup operation", "error")
 
@@ -1094,6 +1132,10 @@ class MainWindow(QMainWindow):
 
     def _on_start_restore(self) -> None:
         """Handle start restore button click."""
+        # Ignore the shortcut while a verification, backup, or restore is running
+        if self.viewmodel.is_verifying() or self.viewmodel.is_operation_running():
+            return
+
         if not self.restore_source_edit.text():
             QMessageBox.warning(
                 self, "No Source", "Please select a restore source directory first."
@@ -1118,6 +1160,7 @@ class MainWindow(QMainWindow):
             # Disable buttons during operation
             self.restore_btn.setEnabled(False)
             self.browse_restore_btn.setEnabled(False)
+            self.verify_backup_btn.setEnabled(False)
 
             # Show progress bar
             self.progress_bar.setVisible(True)
@@ -1158,6 +1201,7 @@ class MainWindow(QMainWindow):
         self.backup_btn.setEnabled(True)
         self.restore_btn.setEnabled(True)
         self.browse_restore_btn.setEnabled(True)
+        self.verify_backup_btn.setEnabled(True)
 
         # Determine which operation completed and update the appropriate log
         if (
@@ -1201,6 +1245,7 @@ class MainWindow(QMainWindow):
         self.backup_btn.setEnabled(True)
         self.restore_btn.setEnabled(True)
         self.browse_restore_btn.setEnabled(True)
+        self.verify_backup_btn.setEnabled(True)
 
     def _on_config_loaded(self, dotfile_count: int) -> None:
         """Handle configuration loaded signal."""
@@ -1415,9 +1460,24 @@ class MainWindow(QMainWindow):
         self.config_archive_checkbox.setChecked(options["archive"])
         self.config_hostname_checkbox.setChecked(options["hostname_subdir"])
         self.config_date_checkbox.setChecked(options["date_subdir"])
+        # Hardlink snapshots for dated mirrors (v1.3.0)
+        if self.config_hardlink_checkbox:
+            self.config_hardlink_checkbox.setChecked(
+                options.get("hardlink_snapshots", True)
+            )
+        # Watcher-driven change journal (v1.3.0)
+        if self.config_change_journal_checkbox:
+            self.config_change_journal_checkbox.setChecked(
+                options.get("change_journal", False)
+            )
         self.config_compression_spinbox.setValue(options["archive_compression_level"])
         self.config_rotate_checkbox.setChecked(options["rotate_archives"])
         self.config_max_archives_spinbox.setValue(options["max_archives"])
+        # Incremental archive chains (v1.3.0)
+        if self.config_incremental_checkbox:
+            self.config_incremental_checkbox.setChecked(
+                options.get("incremental_archives", False)
+            )
 
         # Update path displays
         mirror_path = str(self.viewmodel.model.mirror_base_dir)
@@ -1598,6 +1658,7 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.backup_btn.setEnabled(True)
         self.restore_btn.setEnabled(True)
+        self.verify_backup_btn.setEnabled(True)
 
     def _on_browse_mirror_dir(self) -> None:
         """Handle browse mirror directory button click."""
@@ -1608,6 +1669,24 @@ class MainWindow(QMainWindow):
         if directory:
             self.config_mirror_path_edit.setText(directory)
 
+    def _on_rebuild_mirror_index(self) -> None:
+        """Handle rebuild mirror index button click."""
+        count = self.viewmodel.command_rebuild_mirror_index()
+
+        if count < 0:
+            QMessageBox.warning(
+                self,
+                "Rebuild Index Failed",
+                "The mirror index could not be written. Check that the mirror "
+                "directory exists and is writable.",
+            )
+            return
+
+        self._append_log(f"Mirror index rebuilt: {count} files indexed", "info")
+        self.status_bar.showMessage(
+            f"Mirror index rebuilt ({count} files)", STATUS_MESSAGE_TIMEOUT_MS
+        )
+
     def _on_browse_archive_dir(self) -> None:
         """Handle browse archive directory button click."""
         directory = QFileDialog.getExistingDirectory(
@@ -1673,6 +1752,14 @@ class MainWindow(QMainWindow):
             self.viewmodel.command_update_option(
                 "date_subdir", self.config_date_checkbox.isChecked()
             )
+            if self.config_hardlink_checkbox:
+                self.viewmodel.command_update_option(
+                    "hardlink_snapshots", self.config_hardlink_checkbox.isChecked()
+                )
+            if self.config_change_journal_checkbox:
+                self.viewmodel.command_update_option(
+                    "change_journal", self.config_change_journal_checkbox.isChecked()
+                )
             self.viewmodel.command_update_option(
                 "archive_compression_level", self.config_compression_spinbox.value()
             )
@@ -1682,6 +1769,11 @@ class MainWindow(QMainWindow):
             self.viewmodel.command_update_option(
                 "max_archives", self.config_max_archives_spinbox.value()
             )
+            if self.config_incremental_checkbox:
+                self.viewmodel.command_update_option(
+                    "incremental_archives",
+                    self.config_incremental_checkbox.isChecked(),
+                )
             self.viewmodel.command_update_option(
                 "pre_restore_backup", self.config_pre_restore_checkbox.isChecked()
             )
@@ -2212,16 +2304,59 @@ class MainWindow(QMainWindow):
 
     def _on_verify_backup(self) -> None:
         """Handle verify backup button/menu action click."""
-        # Get verification report from viewmodel
-        report = self.viewmodel.command_verify_backup()
+        # Ignore the shortcut while a verification, backup, or restore is running
+        if not self.verify_backup_btn.isEnabled():
+            return
+        if self.viewmodel.is_operation_running():
+            return
 
-        if report is None:
-            QMessageBox.information(
-                self,
-                "No Backup to Verify",
-                "No backup has been performed yet in this session.\n\n"
-                "Run a backup operation first, then verify.",
+        # Start verification in the background
+        if not self.viewmodel.command_verify_backup():
+            self._show_no_backup_to_verify()
+            return
+
+        # Backup and restore would change the files being verified
+        self._verify_disabled_buttons = [
+            button
+            for button in (
+                self.verify_backup_btn,
+                self.backup_btn,
+                self.restore_btn,
+                self.browse_restore_btn,
             )
+            if button.isEnabled()
+        ]
+        for button in self._verify_disabled_buttons:
+            button.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+
+    def _on_verify_progress(self, progress: int) -> None:
+        """
+        Handle verification progress updates.
+
+        Args:
+            progress: Progress percentage (0-100)
+        """
+        self.progress_bar.setValue(progress)
+        self.status_bar.showMessage(f"Verifying backup... {progress}%")
+
+    def _on_verify_finished(self, report: str | None) -> None:
+        """
+        Handle verification completion.
+
+        Args:
+            report: Formatted verification report, or None if nothing was verified
+        """
+        # Leave the progress bar and buttons to a backup or restore in progress
+        if not self.viewmodel.is_operation_running():
+            self.progress_bar.setVisible(False)
+        for button in self._verify_disabled_buttons:
+            button.setEnabled(True)
+        self._verify_disabled_buttons = []
+
+        if report is None:
+            self._show_no_backup_to_verify()
             return
 
         # Append verification report to log
@@ -2236,6 +2371,15 @@ class MainWindow(QMainWindow):
             STATUS_MESSAGE_TIMEOUT_MS,
         )
 
+    def _show_no_backup_to_verify(self) -> None:
+        """Tell the user there is no backup from this session to verify."""
+        QMessageBox.information(
+            self,
+            "No Backup to Verify",
+            "No backup has been performed yet in this session.\n\n"
+            "Run a backup operation first, then verify.",
+        )
+
     def _on_save_log(self) -> None:
         """Handle save log button click."""
         # Get current log content
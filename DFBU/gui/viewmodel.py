@@ -10,7 +10,7 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 10-30-2025
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
@@ -33,12 +33,14 @@ Requirements:
 Classes:
     - BackupWorker: Worker thread for backup operations
     - RestoreWorker: Worker thread for restore operations
+    - VerifyWorker: Worker thread for backup verification
     - DFBUViewModel: ViewModel mediating between Model and View
 
 Functions:
     None
 """
 
+import os
 import shutil
 import time
 from pathlib import Path
@@ -58,6 +60,7 @@ from ruamel.yaml.error import YAMLError
 
 from gui.config_manager import create_rotating_backup
 from gui.config_workers import ConfigLoadWorker, ConfigSaveWorker
+from gui.fs_walker import walk_files
 from gui.input_validation import InputValidator
 from gui.model import DFBUModel
 
@@ -85,6 +88,9 @@ class BackupWorker(QThread):
 
     Private methods:
         _process_mirror_backup: Process mirror backup for all dotfiles
+        _process_mirror_items: Back up each enabled dotfile path into the mirror
+        _process_journaled_changes: Back up only the journaled paths under a dotfile
+        _journal_retry_paths: Source paths that must be retried by the next backup
         _process_archive_backup: Create compressed archive
         _process_file: Process individual file backup
         _process_directory: Process directory backup recursively
@@ -494,6 +500,38 @@ class BackupWorker(QThread):
             self.error_occurred.emit("Mirror Backup", "No items found to backup")
             return
 
+        # Load the mirror index and link unchanged files from the last snapshot
+        self.model.begin_mirror_backup()
+        # Changed paths from the change journal, None for a full walk (v1.3.0)
+        changes = self.model.begin_journaled_backup(self.force_full_backup)
+        try:
+            self._process_mirror_items(total_items, changes)
+        except BaseException:
+            # Interrupted: everything taken from the journal is still pending
+            self.model.end_journaled_backup(
+                None if changes is None else sorted(changes)
+            )
+            raise
+        else:
+            self.model.end_journaled_backup(self._journal_retry_paths())
+        finally:
+            # Persist index updates even if the backup was interrupted
+            self.model.end_mirror_backup()
+
+    def _process_mirror_items(
+        self, total_items: int, changes: set[str] | None = None
+    ) -> None:
+        """
+        Back up every enabled dotfile path into the mirror.
+
+        Args:
+            total_items: Number of existing dotfile entries (progress denominator)
+            changes: Journaled changed paths to back up, or None to walk everything
+        """
+        # Model must be set before running (architectural guarantee)
+        if not self.model:
+            return
+
         # Track number of successfully processed items for progress updates
         processed_count = 0
 
@@ -525,6 +563,11 @@ class BackupWorker(QThread):
                 # Determine if source is directory or file for proper handling
                 is_dir = src_path.is_dir()
 
+                # Paths matching .dfbuignore are not backed up at all
+                if self.model.is_path_excluded(src_path, is_dir):
+                    self.item_skipped.emit(str(src_path), "Excluded by .dfbuignore")
+                    continue
+
                 # Assemble destination path using configured directory structure
                 # Includes hostname and date subdirectories based on options
                 dest_path = self.model.assemble_dest_path(
@@ -539,7 +582,11 @@ class BackupWorker(QThread):
                 # When force_full_backup=True, all files are copied regardless of changes
                 skip_identical = not self.force_full_backup
 
-                if is_dir:
+                if changes is not None:
+                    # Watcher-driven run: only paths changed since the last backup
+                    self._process_journaled_changes(src_path, dest_path, changes)
+                    processed_count += 1
+                elif is_dir:
                     # Process directory recursively - returns count of successfully copied files
                     file_count = self._process_directory(
                         src_path, dest_path, skip_identical=skip_identical
@@ -559,6 +606,66 @@ class BackupWorker(QThread):
                     progress = int((processed_count / total_items) * 100)
                     self.progress_updated.emit(progress)
 
+    def _process_journaled_changes(
+        self, src_path: Path, dest_path: Path, changes: set[str]
+    ) -> None:
+        """
+        Back up only the journaled paths under one dotfile path.
+
+        Journaled directories (new or moved in) are copied recursively;
+        paths that no longer exist are ignored.
+
+        Args:
+            src_path: Configured dotfile source path
+            dest_path: Mirror destination for src_path
+            changes: Journaled changed paths
+        """
+        if not self.model:
+            return
+
+        root = os.fspath(src_path)
+        prefix = f"{root}{os.sep}"
+        covered: str | None = None
+        # Sorted by component so a directory comes right before its contents
+        under_root = [p for p in changes if p == root or p.startswith(prefix)]
+        for changed in sorted(under_root, key=Path):
+            if covered is not None and changed.startswith(covered):
+                continue
+            if changed == root:
+                changed_path, target = src_path, dest_path
+            else:
+                changed_path = Path(changed)
+                target = dest_path / changed[len(prefix) :]
+                # Directory walks never follow directory symlinks
+                if changed_path.is_symlink() and changed_path.is_dir():
+                    continue
+            is_dir = changed_path.is_dir()
+            if self.model.is_path_excluded(changed_path, is_dir):
+                continue
+            if is_dir:
+                self._process_directory(changed_path, target, skip_identical=True)
+                covered = f"{changed}{os.sep}"
+            elif changed_path.exists():
+                self._process_file(changed_path, target, skip_identical=True)
+
+    def _journal_retry_paths(self) -> list[str]:
+        """
+        Source paths that must be retried by the next backup.
+
+        Returns:
+            Paths of failed items and retryable skips from this run
+        """
+        if not self.operation_result:
+            return []
+        return [
+            result["path"]
+            for result in (
+                *self.operation_result["failed"],
+                *self.operation_result["skipped"],
+            )
+            if result["status"] == "failed" or result["can_retry"]
+        ]
+
     def _process_archive_backup(self) -> None:
         """Create compressed archive of configured dotfiles."""
         # Model must be set before running (architectural guarantee)
@@ -602,7 +709,7 @@ class BackupWorker(QThread):
             self.error_occurred.emit("Archive Backup", "No items found to archive")
             return
 
-        # Create compressed TAR.GZ archive with timestamp
+        # Create compressed archive (configured format) with timestamp
         # Returns Path to created archive or None on failure
         archive_path = self.model.create_archive(items_to_archive)
 
@@ -648,7 +755,7 @@ class BackupWorker(QThread):
             self._process_mirror_backup()
 
         # Process archive backup if enabled in configuration
-        # Archive backup = compressed TAR.GZ with timestamped filename
+        # Archive backup = compressed tar with timestamped filename
         if self.archive_mode:
             self._process_archive_backup()
 
@@ -924,6 +1031,60 @@ class PreviewWorker(QThread):
             self.error_occurred.emit("Preview", str(e))
 
 
+class VerifyWorker(QThread):
+    """
+    Worker thread for verifying the last backup.
+
+    Runs verification in background so hashing large backups does not
+    block the UI, and streams progress while files are verified.
+
+    Attributes:
+        progress_updated: Signal for progress percentage
+        verify_finished: Signal emitted with the formatted report (or None)
+        error_occurred: Signal emitted on error
+        model: Reference to DFBUModel for data access
+    """
+
+    # Signal definitions
+    progress_updated = Signal(int)  # progress percentage
+    verify_finished = Signal(object)  # formatted report str or None
+    error_occurred = Signal(str, str)  # context, error_message
+
+    def __init__(self) -> None:
+        """Initialize the VerifyWorker."""
+        super().__init__()
+        self.model: DFBUModel | None = None
+
+    def set_model(self, model: DFBUModel) -> None:
+        """
+        Set the model reference.
+
+        Args:
+            model: DFBUModel instance
+        """
+        self.model = model
+
+    def run(self) -> None:
+        """Main thread execution method for backup verification."""
+        if not self.model:
+            return
+
+        try:
+            # Emit initial progress
+            self.progress_updated.emit(0)
+
+            # Verify with progress callback
+            report = self.model.verify_last_backup(
+                progress_callback=lambda pct: self.progress_updated.emit(pct)
+            )
+
+            # Emit completion with report
+            self.verify_finished.emit(report)
+
+        except Exception as e:
+            self.error_occurred.emit("Verification", str(e))
+
+
 class DFBUViewModel(QObject):
     """
     ViewModel mediating between Model and View in MVVM pattern.
@@ -942,6 +1103,8 @@ class DFBUViewModel(QObject):
         error_occurred: Signal for error notifications
         config_loaded: Signal when configuration loads
         dotfiles_updated: Signal when dotfile list changes
+        verify_progress: Signal for verification progress percentage
+        verify_finished: Signal with the verification report on completion
 
     Public methods:
         command_load_config: Load YAML configuration directory
@@ -954,6 +1117,10 @@ class DFBUViewModel(QObject):
         command_start_backup: Start backup operation
         command_start_restore: Start restore operation
         command_set_restore_source: Set restore source directory
+        command_verify_backup: Verify the last backup in a worker thread
+        is_verifying: Check whether a verification is running
+        is_operation_running: Check whether a backup or restore is running
+        command_rebuild_mirror_index: Rebuild the mirror index from mirror contents
         get_dotfile_count: Get number of configured dotfiles
         get_dotfile_list: Get list of dotfile metadata
         get_dotfile_validation: Get validation status for all dotfiles
@@ -983,6 +1150,8 @@ class DFBUViewModel(QObject):
     recovery_dialog_requested = Signal(object)  # OperationResultDict
     size_warning_requested = Signal(object)  # SizeReportDict
     size_scan_progress = Signal(int)  # progress percentage during size scan
+    verify_progress = Signal(int)  # progress percentage during verification
+    verify_finished = Signal(object)  # formatted report str or None
 
     # Profile signals (v1.1.0)
     profile_switched = Signal(str)  # profile_name (empty string for default)
@@ -1010,6 +1179,7 @@ class DFBUViewModel(QObject):
         self.config_save_worker: ConfigSaveWorker | None = None
         self.size_scan_worker: SizeScanWorker | None = None
         self._preview_worker: PreviewWorker | None = None
+        self._verify_worker: VerifyWorker | None = None
         self.settings: QSettings = QSettings(self.SETTINGS_ORG, self.SETTINGS_APP)
         self.restore_source_directory: Path | None = None
         self._pending_backup_force_full: bool = False  # Track force_full for after scan
@@ -1091,6 +1261,23 @@ class DFBUViewModel(QObject):
             "max_restore_backups": int,
             "verify_after_backup": bool,
             "hash_verification": bool,
+            "copy_workers": int,
+            "mirror_index": bool,
+            "hardlink_snapshots": bool,
+            "delta_sync_threshold_mb": int,
+            "change_journal": bool,
+            "incremental_archives": bool,
+            "verify_workers": int,
+            "hash_cache": bool,
+            "strict_compare": bool,
+            "verify_sample_percent": int,
+            "verify_sample_budget_mb": int,
+            "merkle_tree": bool,
+            "verify_failures_only": bool,
+            "verify_results_file": bool,
+            "scan_snapshot_ttl": int,
+            "size_cache": bool,
+            "size_probe": bool,
         }
 
         # Validate key exists
@@ -1102,7 +1289,10 @@ class DFBUViewModel(QObject):
             return False
 
         # Type is already narrowed by function signature (bool | int | str)
-        return self.model.update_option(key, value)
+        success = self.model.update_option(key, value)
+        if success and key in {"change_journal", "date_subdir"}:
+            self.model.refresh_change_watcher()
+        return success
 
     def command_update_path(self, path_type: str, value: str) -> bool:
         """
@@ -1135,6 +1325,14 @@ class DFBUViewModel(QObject):
             self.error_occurred.emit("Backup", "No configuration loaded")
             return False
 
+        # A backup would reset the tracked files the verification is reading
+        if self.is_verifying():
+            return False
+
+        # A second worker would copy over the files the first is writing
+        if self.is_operation_running():
+            return False
+
         # Store for use after size scan completes
         self._pending_backup_force_full = force_full_backup
 
@@ -1274,6 +1472,14 @@ class DFBUViewModel(QObject):
             self.error_occurred.emit("Restore", "No source directory set")
             return False
 
+        # Restored files would change sources while they are being verified
+        if self.is_verifying():
+            return False
+
+        # A second worker would copy over the files the first is writing
+        if self.is_operation_running():
+            return False
+
         # Create and configure worker
         self.restore_worker = RestoreWorker()
         self.restore_worker.set_model(self.model)
@@ -1346,18 +1552,16 @@ class DFBUViewModel(QObject):
             app_files: list[dict[str, str | int]] = []
             app_size = 0
 
-            for file_path in app_dir.rglob("*"):
-                if file_path.is_file():
-                    size = file_path.stat().st_size
-                    app_files.append(
-                        {
-                            "name": file_path.name,
-                            "path": str(file_path.relative_to(scan_root)),
-                            "size": size,
-                        }
-                    )
-                    app_size += size
-                    total_files += 1
+            for entry in walk_files(app_dir):
+                app_files.append(
+                    {
+                        "name": entry.path.name,
+                        "path": f"{app_dir.name}/{entry.relative}",
+                        "size": entry.size,
+                    }
+                )
+                app_size += entry.size
+                total_files += 1
 
             if app_files:
                 entries.append(
@@ -1403,6 +1607,7 @@ class DFBUViewModel(QObject):
         )
 
         if success:
+            self.model.refresh_change_watcher()
             # Emit signal to update UI
             dotfile_count = self.model.get_dotfile_count()
             self.dotfiles_updated.emit(dotfile_count)
@@ -1437,6 +1642,7 @@ class DFBUViewModel(QObject):
         )
 
         if success:
+            self.model.refresh_change_watcher()
             # Emit signal to update UI
             dotfile_count = self.model.get_dotfile_count()
             self.dotfiles_updated.emit(dotfile_count)
@@ -1456,6 +1662,7 @@ class DFBUViewModel(QObject):
         success: bool = self.model.remove_dotfile(index)
 
         if success:
+            self.model.refresh_change_watcher()
             # Emit signal to update UI
             dotfile_count = self.model.get_dotfile_count()
             self.dotfiles_updated.emit(dotfile_count)
@@ -1475,7 +1682,9 @@ class DFBUViewModel(QObject):
         # Note: Don't emit dotfiles_updated here - the list hasn't changed,
         # only the enabled status of one entry. The View will update locally.
 
-        return self.model.toggle_dotfile_enabled(index)
+        enabled = self.model.toggle_dotfile_enabled(index)
+        self.model.refresh_change_watcher()
+        return enabled
 
     def command_toggle_exclusion(self, application: str) -> None:
         """Toggle exclusion status for a dotfile.
@@ -1486,17 +1695,88 @@ class DFBUViewModel(QObject):
         self.model.get_config_manager().toggle_exclusion(application)
         self.exclusions_changed.emit()
 
-    def command_verify_backup(self) -> str | None:
+    def command_verify_backup(self) -> bool:
         """
-        Command to verify integrity of the last backup operation.
+        Command to verify integrity of the last backup operation asynchronously.
+
+        Uses VerifyWorker to prevent UI blocking; progress is emitted through
+        verify_progress and the report through verify_finished.
 
         Returns:
-            Formatted verification report for log display, or None if no backup to verify
+            True if verification started, False if there is no backup to verify,
+            a verification is already running, or a backup or restore is
+            changing the files it would check
         """
-        file_count = self.model.get_last_backup_file_count()
-        if file_count == 0:
-            return None
-        return self.model.verify_last_backup()
+        if not self.model.has_backup_to_verify():
+            return False
+        if self.is_verifying() or self.is_operation_running():
+            return False
+
+        self._verify_worker = VerifyWorker()
+        self._verify_worker.set_model(self.model)
+        self._verify_worker.progress_updated.connect(self.verify_progress.emit)
+        self._verify_worker.verify_finished.connect(self._on_verify_finished)
+        self._verify_worker.error_occurred.connect(self._on_verify_error)
+        self._verify_worker.start()
+        return True
+
+    def is_verifying(self) -> bool:
+        """
+        Check whether a verification is running.
+
+        Returns:
+            True while the verification worker runs
+        """
+        return self._verify_worker is not None and self._verify_worker.isRunning()
+
+    def is_operation_running(self) -> bool:
+        """
+        Check whether a backup or restore is running.
+
+        Returns:
+            True while the backup or restore worker runs
+        """
+        return any(
+            worker is not None and worker.isRunning()
+            for worker in (self.backup_worker, self.restore_worker)
+        )
+
+    def _on_verify_finished(self, report: str | None) -> None:
+        """
+        Handle verification completion.
+
+        Args:
+            report: Formatted verification report, or None if nothing was verified
+        """
+        self._cleanup_verify_worker()
+        self.verify_finished.emit(report)
+
+    def _on_verify_error(self, context: str, error_message: str) -> None:
+        """
+        Handle verification worker errors with cleanup.
+
+        Args:
+            context: Error context
+            error_message: Error message
+        """
+        self._cleanup_verify_worker()
+        self.error_occurred.emit(context, error_message)
+
+    def _cleanup_verify_worker(self) -> None:
+        """Wait for and release the verification worker."""
+        if self._verify_worker is not None:
+            self._verify_worker.wait()
+            self._verify_worker.deleteLater()
+            self._verify_worker = None
+
+    def command_rebuild_mirror_index(self) -> int:
+        """
+        Command to rebuild the mirror index after external mirror edits.
+
+        Returns:
+            Number of files indexed, or -1 if the index could not be written
+        """
+        return self.model.rebuild_mirror_index()
 
     # =========================================================================
     # Config Editor Commands
@@ -1953,6 +2233,20 @@ class DFBUViewModel(QObject):
                 ]
             )
 
+        # Copy strategies used for file data (v1.3.0)
+        if stats.copy_strategies:
+            strategies = ", ".join(
+                f"{name}: {count}"
+                for name, count in sorted(stats.copy_strategies.items())
+            )
+            message_parts.append(f"  Copy strategy: {strategies}")
+
+        # Bytes skipped by block-level delta updates (v1.3.0)
+        if stats.delta_bytes_saved > 0:
+            message_parts.append(
+                f"  Delta sync saved: {self.format_size(stats.delta_bytes_saved)}"
+            )
+
         return "\n".join(message_parts)
 
     def get_options(self) -> OptionsDict:
@@ -2161,6 +2455,8 @@ class DFBUViewModel(QObject):
             dotfile_count: Number of dotfiles loaded
         """
         if success:
+            # Watch the loaded dotfile paths when the change journal is on (v1.3.0)
+            self.model.refresh_change_watcher()
             self.config_loaded.emit(dotfile_count)
             self.dotfiles_updated.emit(dotfile_count)
         else:
@@ -10,12 +10,14 @@ Author: Chris Purcell
 Email: chris@l3digital.net
 GitHub: https://github.com/L3DigitalNet
 Date Created: 11-02-2025
-Date Changed: 02-01-2026
+Date Changed: 10-16-2026
 License: MIT
 
 Features:
     - QApplication session fixture for Qt testing
     - Temporary directory fixtures for file operations
+    - Persistent caches isolated in tmp_path for every test
+    - Dotfile directory and archive factory fixtures for archive tests
     - Mock service fixtures for ViewModel testing
     - Proper pytest-qt integration
 
@@ -29,7 +31,7 @@ Requirements:
 from __future__ import annotations
 
 import sys
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -40,6 +42,8 @@ from PySide6.QtWidgets import QApplication
 if TYPE_CHECKING:
     from _pytest.config import Config
 
+    from gui.file_operations import FileOperations
+
 
 # =============================================================================
 # Qt Application Fixtures
@@ -168,6 +172,30 @@ def temp_dotfile_dir(tmp_path: Path) -> Path:
     return dotdir
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Keep persistent caches created by DFBUModel inside tmp_path.
+
+    The model opens its hash cache, directory size cache, verification
+    coverage store, and verification results directory at the default
+    ~/.local/share/dfbu locations; tests must never write there.
+
+    Args:
+        tmp_path: pytest built-in temporary directory fixture
+        monkeypatch: pytest monkeypatch fixture
+
+    Returns:
+        Path: Directory standing in for ~/.local/share/dfbu
+    """
+    data_dir = tmp_path / "dfbu-data"
+    monkeypatch.setattr("gui.model.DEFAULT_HASH_CACHE_PATH", data_dir / "hash-cache")
+    monkeypatch.setattr("gui.model.DEFAULT_SIZE_CACHE_PATH", data_dir / "size-cache")
+    monkeypatch.setattr("gui.model.DEFAULT_COVERAGE_PATH", data_dir / "verify-coverage")
+    monkeypatch.setattr("gui.model.DEFAULT_RESULTS_DIR", data_dir / "verify-results")
+    return data_dir
+
+
 # =============================================================================
 # Sample Configuration Fixtures
 # =============================================================================
@@ -323,6 +351,97 @@ enabled = true
 """
 
 
+# =============================================================================
+# Archive Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def unique_archive_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Give archives created within one second distinct names.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+    """
+    monkeypatch.setattr(
+        "gui.file_operations.ARCHIVE_TIMESTAMP_FORMAT", "%Y-%m-%d_%H-%M-%S-%f"
+    )
+
+
+@pytest.fixture
+def archive_dotfiles(request: pytest.FixtureRequest, tmp_path: Path) -> Path:
+    """
+    Create a dotfile directory for archive tests.
+
+    The files come from the closest archive_files marker, a mapping of file
+    name to str or bytes content; without one a single app.conf is created.
+
+    Args:
+        request: pytest fixture request
+        tmp_path: pytest built-in temporary directory fixture
+
+    Returns:
+        Path: Dotfile directory at tmp_path/home/.config
+
+    Example:
+        pytestmark = pytest.mark.archive_files({"a.conf": "a", "b.db": b"..."})
+
+        def test_archive(archive_dotfiles, make_archive):
+            archive = make_archive(archive_dotfiles)
+    """
+    marker = request.node.get_closest_marker("archive_files")
+    files: dict[str, str | bytes] = (
+        marker.args[0] if marker is not None else {"app.conf": "key=value\n"}
+    )
+    root = tmp_path / "home" / ".config"
+    root.mkdir(parents=True)
+    for name, content in files.items():
+        if isinstance(content, bytes):
+            (root / name).write_bytes(content)
+        else:
+            (root / name).write_text(content)
+    return root
+
+
+@pytest.fixture
+def make_archive(tmp_path: Path, unique_archive_names: None) -> Callable[..., Path]:
+    """
+    Provide a factory that archives one dotfile directory.
+
+    The factory takes the directory, an optional FileOperations (default:
+    a fresh one for "testhost"), an optional archive directory (default:
+    tmp_path/archives) and an optional archive_format to set, and returns
+    the new archive path. Archive names include microseconds.
+
+    Args:
+        tmp_path: pytest built-in temporary directory fixture
+        unique_archive_names: Archive timestamp patch
+
+    Returns:
+        Callable: Archive factory
+    """
+    from gui.file_operations import FileOperations
+
+    def make(
+        root: Path,
+        file_ops: FileOperations | None = None,
+        archives: Path | None = None,
+        archive_format: str | None = None,
+    ) -> Path:
+        if file_ops is None:
+            file_ops = FileOperations("testhost")
+        if archive_format is not None:
+            file_ops.archive_format = archive_format
+        archive = file_ops.create_archive(
+            [(root, True, True)], archives or tmp_path / "archives", False
+        )
+        assert archive is not None
+        return archive
+
+    return make
+
+
 # =============================================================================
 # Mock Service Fixtures for MVVM Testing
 # =============================================================================
@@ -407,3 +526,6 @@ def pytest_configure(config: Config) -> None:
     config.addinivalue_line(
         "markers", "gui: Tests requiring GUI components and QApplication"
     )
+    config.addinivalue_line(
+        "markers", "archive_files(files): Files created by archive_dotfiles"
+    )
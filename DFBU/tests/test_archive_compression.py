@@ -0,0 +1,183 @@
+"""
+Tests for ArchiveCompression - Pluggable Multi-Threaded Archive Compression
+
+Description:
+    Unit tests for the block-parallel gzip and zstd writers, format
+    selection and fallback, and FileOperations archives honoring the
+    configured format and compression level.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import gzip
+import io
+import os
+import tarfile
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from gui.archive_compression import (
+    COMPRESSION_BLOCK_SIZE,
+    ParallelCompressor,
+    ParallelGzipWriter,
+    ParallelZstdWriter,
+    resolve_archive_format,
+    zstd_available,
+)
+from gui.file_operations import FileOperations
+
+
+requires_zstd = pytest.mark.skipif(
+    not zstd_available(), reason="compression.zstd requires Python 3.14+"
+)
+
+
+def _compressible(size: int) -> bytes:
+    """Return data that compresses well but is not trivially repetitive."""
+    words = [os.urandom(6).hex().encode() for _ in range(256)]
+    out = bytearray()
+    index = 0
+    while len(out) < size:
+        out += words[(index * 7) % 256] + b" "
+        index += 1
+    return bytes(out[:size])
+
+
+# Dotfile directory spanning several compression blocks
+pytestmark = pytest.mark.archive_files(
+    {
+        "big.db": _compressible(COMPRESSION_BLOCK_SIZE * 3 + 123),
+        "small.conf": "key=value\n",
+    }
+)
+
+
+class TestParallelWriters:
+    """Test suite for the block-parallel stream writers."""
+
+    @pytest.mark.unit
+    def test_gzip_stream_is_single_valid_member(self) -> None:
+        """Blocks compressed in parallel decode as one gzip stream."""
+        data = _compressible(COMPRESSION_BLOCK_SIZE * 4 + 5000)
+        raw = io.BytesIO()
+        writer = ParallelGzipWriter(raw, level=6, workers=4)
+        for offset in range(0, len(data), 70_000):
+            writer.write(data[offset : offset + 70_000])
+        writer.close()
+
+        compressed = raw.getvalue()
+        assert gzip.decompress(compressed) == data
+        assert len(compressed) < len(data) // 2
+
+    @pytest.mark.unit
+    def test_gzip_empty_stream(self) -> None:
+        """Closing without writing still produces a valid gzip file."""
+        raw = io.BytesIO()
+        ParallelGzipWriter(raw, level=9, workers=2).close()
+
+        assert gzip.decompress(raw.getvalue()) == b""
+
+    @pytest.mark.unit
+    def test_base_compressor_is_abstract(self) -> None:
+        """ParallelCompressor needs a codec subclass to be instantiated."""
+        with pytest.raises(TypeError, match="_compress_block"):
+            ParallelCompressor(io.BytesIO(), level=6, workers=1)  # type: ignore[abstract]
+
+    @pytest.mark.unit
+    def test_gzip_level_is_honored(self) -> None:
+        """Higher levels produce smaller output for the same data."""
+        data = _compressible(COMPRESSION_BLOCK_SIZE * 2)
+        sizes = {}
+        for level in (0, 9):
+            raw = io.BytesIO()
+            writer = ParallelGzipWriter(raw, level=level, workers=2)
+            writer.write(data)
+            writer.close()
+            sizes[level] = len(raw.getvalue())
+
+        assert sizes[9] < sizes[0]
+        assert sizes[0] >= len(data)
+
+    @requires_zstd
+    @pytest.mark.unit
+    def test_zstd_frames_decode_as_one_stream(self) -> None:
+        """Concatenated zstd frames decompress to the original data."""
+        from compression import zstd
+
+        data = _compressible(COMPRESSION_BLOCK_SIZE * 3 + 17)
+        raw = io.BytesIO()
+        writer = ParallelZstdWriter(raw, level=3, workers=3)
+        writer.write(data)
+        writer.close()
+
+        assert zstd.decompress(raw.getvalue()) == data
+
+
+class TestArchiveFormats:
+    """Test suite for format selection in FileOperations.create_archive."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("archive_format", ["tar.gz", "tar.xz", "tar.bz2"])
+    def test_archive_round_trips(
+        self,
+        archive_format: str,
+        archive_dotfiles: Path,
+        tmp_path: Path,
+        make_archive: Callable[..., Path],
+    ) -> None:
+        """Each stdlib format produces a readable archive with the right suffix."""
+        file_ops = FileOperations("testhost")
+        file_ops.archive_format = archive_format
+        file_ops.compression_level = 1
+
+        archive = make_archive(archive_dotfiles, file_ops)
+
+        assert archive.name.endswith(f".{archive_format}")
+        with tarfile.open(archive) as tar:
+            member = next(m for m in tar.getmembers() if m.name.endswith("big.db"))
+            extracted = tar.extractfile(member)
+            assert extracted is not None
+            assert extracted.read() == (archive_dotfiles / "big.db").read_bytes()
+
+    @requires_zstd
+    @pytest.mark.unit
+    def test_zstd_archive_round_trips(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """zstd archives are readable with tarfile's zstd support."""
+        file_ops = FileOperations("testhost")
+        file_ops.archive_format = "tar.zst"
+
+        archive = make_archive(archive_dotfiles, file_ops)
+
+        assert archive.name.endswith(".tar.zst")
+        with tarfile.open(archive, "r:zst") as tar:
+            assert any(name.endswith("small.conf") for name in tar.getnames())
+
+    @pytest.mark.unit
+    def test_unknown_format_falls_back_to_gzip(self) -> None:
+        """An unsupported archive_format value uses tar.gz."""
+        assert resolve_archive_format("tar.lz4") == "tar.gz"
+        assert resolve_archive_format("tar.xz") == "tar.xz"
+
+    @pytest.mark.unit
+    def test_rotation_covers_all_formats(self, tmp_path: Path) -> None:
+        """Archives of every format count toward the retention limit."""
+        base = tmp_path / "archives"
+        base.mkdir()
+        for index, suffix in enumerate((".tar.gz", ".tar.xz", ".tar.zst")):
+            archive = base / f"dotfiles-2024-01-0{index + 1}_00-00-00{suffix}"
+            archive.write_bytes(b"")
+            os.utime(archive, (index, index))
+
+        deleted = FileOperations("testhost").rotate_archives(
+            base, hostname_subdir=False, max_archives=1
+        )
+
+        assert sorted(path.suffix for path in deleted) == [".gz", ".xz"]
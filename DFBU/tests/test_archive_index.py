@@ -0,0 +1,240 @@
+"""
+Tests for ArchiveIndex - Seekable Member Index for Compressed Archives
+
+Description:
+    Unit tests for the restartable gzip writer, sidecar index creation
+    during create_archive, single-member restore that seeks to the nearest
+    restart point, fallback without a usable index, and sidecar rotation.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import gzip
+import io
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from gui.archive_compression import COMPRESSION_BLOCK_SIZE, ParallelGzipWriter
+from gui.archive_index import ArchiveIndex, extract_member, index_path
+from gui.file_operations import FileOperations
+
+
+# Dotfile directory whose last file starts several blocks in
+pytestmark = pytest.mark.archive_files(
+    {
+        "a-big.db": os.urandom(COMPRESSION_BLOCK_SIZE * 2 + 999),
+        "z-small.conf": "key=value\n",
+    }
+)
+
+
+class TestRestartableGzip:
+    """Test suite for block-restartable gzip output."""
+
+    @pytest.mark.unit
+    def test_every_restart_point_decodes_independently(self) -> None:
+        """Decompression from any restart point yields the rest of the data."""
+        data = os.urandom(COMPRESSION_BLOCK_SIZE * 3 + 10)
+        raw = io.BytesIO()
+        writer = ParallelGzipWriter(raw, level=1, workers=2, restartable=True)
+        writer.write(data)
+        writer.close()
+        compressed = raw.getvalue()
+
+        assert gzip.decompress(compressed) == data
+        assert [u for u, _ in writer.restart_points] == [
+            i * COMPRESSION_BLOCK_SIZE for i in range(4)
+        ]
+        for uncompressed, offset in writer.restart_points:
+            assert gzip.decompress(compressed[offset:]) == data[uncompressed:]
+
+    @pytest.mark.unit
+    def test_default_gzip_has_no_restart_points(self) -> None:
+        """The pigz-style single-member stream cannot be entered mid-way."""
+        raw = io.BytesIO()
+        writer = ParallelGzipWriter(raw, level=1, workers=2)
+        writer.write(b"x" * (COMPRESSION_BLOCK_SIZE + 1))
+        writer.close()
+
+        assert writer.restart_points == []
+
+
+class TestArchiveIndex:
+    """Test suite for sidecar indexes and single-member restore."""
+
+    @pytest.mark.unit
+    def test_create_archive_writes_index(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Every member is indexed with size, mtime, and SHA-256."""
+        archive = make_archive(archive_dotfiles)
+
+        index = ArchiveIndex.load(archive)
+
+        assert index is not None
+        assert index_path(archive).name == f"{archive.name}.idx"
+        name = str(archive_dotfiles / "z-small.conf").lstrip("/")
+        entry = index.members[name]
+        assert entry.size == len("key=value\n")
+        assert entry.mtime == int((archive_dotfiles / "z-small.conf").stat().st_mtime)
+        assert entry.digest is not None
+        assert index.members[str(archive_dotfiles).lstrip("/")].digest is None
+
+    @pytest.mark.unit
+    def test_restore_seeks_past_earlier_blocks(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A member after large files is reached from a later restart point."""
+        file_ops = FileOperations("testhost")
+        archive = make_archive(archive_dotfiles, file_ops)
+        index = ArchiveIndex.load(archive)
+        assert index is not None
+        member = archive_dotfiles / "z-small.conf"
+        entry = index.members[str(member).lstrip("/")]
+
+        restored = file_ops.restore_archive_member(
+            archive, member, tmp_path / "restore"
+        )
+
+        assert index.restart_point(entry.offset)[1] > 0
+        assert restored == tmp_path / "restore" / str(member).lstrip("/")
+        assert restored.read_text() == "key=value\n"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("archive_format", ["tar.xz", "tar.bz2"])
+    def test_single_stream_formats_restore_from_start(
+        self,
+        archive_format: str,
+        archive_dotfiles: Path,
+        tmp_path: Path,
+        make_archive: Callable[..., Path],
+    ) -> None:
+        """xz and bz2 archives are indexed with a single restart point."""
+        file_ops = FileOperations("testhost")
+        file_ops.archive_format = archive_format
+        archive = make_archive(archive_dotfiles, file_ops)
+        index = ArchiveIndex.load(archive)
+        member = archive_dotfiles / "a-big.db"
+
+        restored = extract_member(archive, member, tmp_path / "restore")
+
+        assert index is not None
+        assert index.restart_points == [(0, 0)]
+        assert restored.read_bytes() == member.read_bytes()
+
+    @pytest.mark.unit
+    def test_missing_or_stale_index_falls_back_to_scan(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Without a usable index the archive is scanned from the start."""
+        archive = make_archive(archive_dotfiles)
+        member = archive_dotfiles / "z-small.conf"
+        sidecar = index_path(archive)
+        sidecar.write_text(
+            sidecar.read_text().replace('"archive_size":', '"archive_size":1')
+        )
+
+        assert ArchiveIndex.load(archive) is None
+        assert extract_member(archive, member, tmp_path / "a").read_text() == (
+            "key=value\n"
+        )
+
+        sidecar.unlink()
+        assert extract_member(archive, member, tmp_path / "b").read_text() == (
+            "key=value\n"
+        )
+
+    @pytest.mark.unit
+    def test_unknown_member_returns_none(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Restoring a path that was never archived fails cleanly."""
+        file_ops = FileOperations("testhost")
+        archive = make_archive(archive_dotfiles, file_ops)
+
+        assert (
+            file_ops.restore_archive_member(
+                archive, archive_dotfiles / "missing.conf", tmp_path / "restore"
+            )
+            is None
+        )
+
+    @pytest.mark.unit
+    def test_digest_mismatch_leaves_existing_file(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A member failing its digest never replaces the file on disk."""
+        archive = make_archive(archive_dotfiles)
+        member = archive_dotfiles / "z-small.conf"
+        index = ArchiveIndex.load(archive)
+        assert index is not None
+        digest = index.members[str(member).lstrip("/")].digest
+        assert digest is not None
+        sidecar = index_path(archive)
+        sidecar.write_text(sidecar.read_text().replace(digest, "0" * 64))
+        target = tmp_path / "restore" / str(member).lstrip("/")
+        target.parent.mkdir(parents=True)
+        target.write_text("live=1\n")
+
+        with pytest.raises(ValueError, match="digest"):
+            extract_member(archive, member, tmp_path / "restore")
+
+        assert target.read_text() == "live=1\n"
+        assert list(target.parent.iterdir()) == [target]
+
+    @pytest.mark.unit
+    def test_restore_leaves_sibling_tmp_file(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A user file named like a temp file beside the target survives."""
+        archive = make_archive(archive_dotfiles)
+        member = archive_dotfiles / "z-small.conf"
+        target = tmp_path / "restore" / str(member).lstrip("/")
+        target.parent.mkdir(parents=True)
+        sibling = target.with_name(f"{target.name}.tmp")
+        sibling.write_text("user data\n")
+
+        extract_member(archive, member, tmp_path / "restore")
+
+        assert target.read_text() == "key=value\n"
+        assert sibling.read_text() == "user data\n"
+        assert sorted(target.parent.iterdir()) == [target, sibling]
+
+    @pytest.mark.unit
+    def test_restore_keeps_mode_and_mtime(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """The renamed-in file carries the archived mode and mtime."""
+        member = archive_dotfiles / "z-small.conf"
+        member.chmod(0o600)
+        os.utime(member, (1_700_000_000, 1_700_000_000))
+        archive = make_archive(archive_dotfiles)
+
+        restored = extract_member(archive, member, tmp_path / "restore")
+
+        assert restored.stat().st_mode & 0o777 == 0o600
+        assert int(restored.stat().st_mtime) == 1_700_000_000
+
+    @pytest.mark.unit
+    def test_rotation_deletes_sidecar(self, tmp_path: Path) -> None:
+        """An archive's index is removed together with the archive."""
+        for day in (1, 2):
+            archive = tmp_path / f"dotfiles-2024-01-0{day}_00-00-00.tar.gz"
+            archive.write_bytes(b"")
+            index_path(archive).write_text("{}")
+            os.utime(archive, (day, day))
+
+        deleted = FileOperations("testhost").rotate_archives(tmp_path, False, 1)
+
+        assert len(deleted) == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "dotfiles-2024-01-02_00-00-00.tar.gz",
+            "dotfiles-2024-01-02_00-00-00.tar.gz.idx",
+        ]
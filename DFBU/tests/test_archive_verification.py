@@ -0,0 +1,164 @@
+"""
+Tests for Streaming Archive Verification
+
+Description:
+    Unit tests for VerificationManager.verify_archive: one sequential pass
+    over tar archives checked against the archive index or the source
+    files, detection of corrupt archives and members, and dedup archives
+    verified through their chunk store.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import json
+import os
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from core.common_types import VerificationReportDict
+
+from gui.archive_compression import COMPRESSION_BLOCK_SIZE
+from gui.archive_index import index_path
+from gui.chunk_store import CHUNK_STORE_DIR
+from gui.verification_manager import VerificationManager
+
+
+# Dotfile directory with a file spanning several blocks
+pytestmark = pytest.mark.archive_files(
+    {"big.db": os.urandom(COMPRESSION_BLOCK_SIZE * 2 + 999), "app.conf": "key=value\n"}
+)
+
+
+def _statuses(report: VerificationReportDict) -> dict[str, str]:
+    """Result status by file name."""
+    return {Path(r["path"]).name: r["status"] for r in report["results"]}
+
+
+class TestTarArchiveVerification:
+    """Test suite for streaming verification of tar archives."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("archive_format", ["tar.gz", "tar.xz", "tar.bz2"])
+    def test_intact_archive_verifies_against_index(
+        self,
+        archive_format: str,
+        archive_dotfiles: Path,
+        tmp_path: Path,
+        make_archive: Callable[..., Path],
+    ) -> None:
+        """Every file matches the index even after the sources are gone."""
+        archive = make_archive(archive_dotfiles, archive_format=archive_format)
+        shutil.rmtree(archive_dotfiles)
+        progress: list[int] = []
+
+        report = VerificationManager().verify_archive(
+            archive, progress_callback=progress.append
+        )
+
+        assert report["backup_type"] == "archive"
+        assert report["hash_verified"]
+        assert _statuses(report) == {"big.db": "ok", "app.conf": "ok"}
+        assert all(r["hash_match"] for r in report["results"])
+        assert progress[-1] == 100
+        assert progress == sorted(progress)
+
+    @pytest.mark.unit
+    def test_index_digest_mismatch_is_reported(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A member whose data differs from its indexed digest fails."""
+        archive = make_archive(archive_dotfiles)
+        sidecar = index_path(archive)
+        data = json.loads(sidecar.read_text())
+        for member in data["members"]:
+            if member[0].endswith("app.conf"):
+                member[4] = "0" * 64
+        sidecar.write_text(json.dumps(data))
+
+        report = VerificationManager().verify_archive(archive)
+
+        assert _statuses(report) == {"big.db": "ok", "app.conf": "hash_mismatch"}
+        assert report["verified_failed"] == 1
+
+    @pytest.mark.unit
+    def test_without_index_compares_sources(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Without an index, sizes and hashes are compared with the sources."""
+        archive = make_archive(archive_dotfiles)
+        index_path(archive).unlink()
+        (archive_dotfiles / "app.conf").write_text("key=other\n")
+        vm = VerificationManager()
+
+        assert _statuses(vm.verify_archive(archive)) == {
+            "big.db": "ok",
+            "app.conf": "ok",
+        }
+
+        vm.hash_verification_enabled = True
+        assert _statuses(vm.verify_archive(archive)) == {
+            "big.db": "ok",
+            "app.conf": "hash_mismatch",
+        }
+
+    @pytest.mark.unit
+    def test_corrupt_archive_is_an_error(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Damaged compressed data is reported instead of raising."""
+        archive = make_archive(archive_dotfiles)
+        data = bytearray(archive.read_bytes())
+        middle = len(data) // 2
+        data[middle : middle + 64] = bytes(64)
+        archive.write_bytes(bytes(data))
+
+        report = VerificationManager().verify_archive(archive)
+
+        assert report["verified_failed"] >= 1
+        assert any(
+            r["error"].startswith("Archive unreadable") for r in report["results"]
+        )
+
+    @pytest.mark.unit
+    def test_truncated_archive_fails_index_check(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A truncated archive no longer matches its index and cannot be read."""
+        archive = make_archive(archive_dotfiles)
+        with archive.open("r+b") as f:
+            f.truncate(COMPRESSION_BLOCK_SIZE // 2)
+
+        report = VerificationManager().verify_archive(archive)
+
+        errors = [r["error"] for r in report["results"] if r["status"] == "error"]
+        assert errors[0].startswith("Archive does not match its index")
+        assert errors[-1].startswith("Archive unreadable")
+
+
+class TestDedupArchiveVerification:
+    """Test suite for verification of dedup archives."""
+
+    @pytest.mark.unit
+    def test_manifest_files_verify_through_chunks(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Intact dedup archives verify; a damaged chunk fails its file."""
+        archive = make_archive(archive_dotfiles, archive_format="dedup")
+        vm = VerificationManager()
+
+        assert _statuses(vm.verify_archive(archive)) == {
+            "big.db": "ok",
+            "app.conf": "ok",
+        }
+
+        chunk = next((archive.parent / CHUNK_STORE_DIR).glob("*/*"))
+        chunk.write_bytes(b"garbage")
+        report = vm.verify_archive(archive)
+        assert report["verified_failed"] == 1
+        assert report["verified_ok"] == 1
@@ -199,6 +199,7 @@ class TestExecuteMirrorBackup:
 
         file_ops = Mock(spec=FileOperations)
         file_ops.expand_path.return_value = src_file
+        file_ops.is_excluded.return_value = False
         file_ops.assemble_dest_path.return_value = dest_dir / "test.txt"
         file_ops.check_readable.return_value = True
         file_ops.files_are_identical.return_value = False
@@ -236,6 +237,7 @@ class TestExecuteMirrorBackup:
 
         file_ops = Mock(spec=FileOperations)
         file_ops.expand_path.return_value = src_dir
+        file_ops.is_excluded.return_value = False
         file_ops.assemble_dest_path.return_value = dest_dir / "mydir"
         file_ops.check_readable.return_value = True
         # Simulate copy_directory returning 2 successful files
@@ -271,6 +273,7 @@ class TestExecuteMirrorBackup:
 
         file_ops = Mock(spec=FileOperations)
         file_ops.expand_path.return_value = src_file
+        file_ops.is_excluded.return_value = False
         file_ops.assemble_dest_path.return_value = tmp_path / "dest" / "test.txt"
         file_ops.check_readable.return_value = True
         file_ops.files_are_identical.return_value = False
@@ -303,6 +306,7 @@ class TestExecuteMirrorBackup:
 
         file_ops = Mock(spec=FileOperations)
         file_ops.expand_path.return_value = src_file
+        file_ops.is_excluded.return_value = False
         file_ops.assemble_dest_path.return_value = tmp_path / "dest" / "test.txt"
         file_ops.check_readable.return_value = True
         file_ops.files_are_identical.return_value = False
@@ -331,6 +335,41 @@ class TestExecuteMirrorBackup:
         # Assert
         processed_callback.assert_called_once()
 
+    def test_mirror_backup_skips_excluded_path(self, tmp_path: Path) -> None:
+        """Test a dotfile path matching .dfbuignore is reported as skipped."""
+        # Arrange
+        src_file = tmp_path / "test.log"
+        src_file.write_text("content")
+
+        file_ops = Mock(spec=FileOperations)
+        file_ops.expand_path.return_value = src_file
+        file_ops.is_excluded.return_value = True
+        file_ops.check_readable.return_value = True
+
+        stats_tracker = Mock(spec=StatisticsTracker)
+
+        orchestrator = BackupOrchestrator(file_ops, stats_tracker, tmp_path, tmp_path)
+
+        dotfiles: list[DotFileDict] = [
+            {"description": "Test file", "paths": [str(src_file)]}
+        ]
+        options = cast(OptionsDict, {"hostname_subdir": False, "date_subdir": False})
+
+        skipped_callback = Mock()
+
+        # Act
+        processed, _total = orchestrator.execute_mirror_backup(
+            dotfiles, options, item_skipped_callback=skipped_callback
+        )
+
+        # Assert
+        assert processed == 0
+        file_ops.is_excluded.assert_called_once_with(src_file, False)
+        file_ops.copy_file.assert_not_called()
+        skipped_callback.assert_called_once_with(
+            str(src_file), "Excluded by .dfbuignore"
+        )
+
 
 class TestExecuteArchiveBackup:
     """Test archive backup execution."""
@@ -843,3 +882,63 @@ class TestRestoreWithPreBackup:
         # Assert
         assert processed == 1
         file_ops.copy_file.assert_called_once()
+
+    def test_archive_member_restore_backs_up_target(self, tmp_path: Path) -> None:
+        """Test single-member restore backs up the file it will overwrite."""
+        # Arrange
+        file_ops = Mock(spec=FileOperations)
+        stats_tracker = Mock(spec=StatisticsTracker)
+        restore_backup_mgr = Mock()
+        restore_backup_mgr.backup_before_restore.return_value = (True, "", None)
+        file_ops.restore_archive_member.return_value = tmp_path / "home/.bashrc"
+
+        orchestrator = BackupOrchestrator(
+            file_ops,
+            stats_tracker,
+            tmp_path,
+            tmp_path,
+            restore_backup_manager=restore_backup_mgr,
+        )
+
+        # Act
+        restored = orchestrator.restore_archive_member(
+            tmp_path / "a.tar.gz", Path("/home/.bashrc"), tmp_path
+        )
+
+        # Assert
+        assert restored == tmp_path / "home/.bashrc"
+        restore_backup_mgr.backup_before_restore.assert_called_once_with(
+            files_to_overwrite=[tmp_path / "home/.bashrc"],
+            source_backup_path=str(tmp_path / "a.tar.gz"),
+        )
+
+    def test_archive_member_restore_aborts_if_pre_backup_fails(
+        self, tmp_path: Path
+    ) -> None:
+        """Test single-member restore is skipped if pre-backup fails."""
+        # Arrange
+        file_ops = Mock(spec=FileOperations)
+        stats_tracker = Mock(spec=StatisticsTracker)
+        restore_backup_mgr = Mock()
+        restore_backup_mgr.backup_before_restore.return_value = (
+            False,
+            "Disk full",
+            None,
+        )
+
+        orchestrator = BackupOrchestrator(
+            file_ops,
+            stats_tracker,
+            tmp_path,
+            tmp_path,
+            restore_backup_manager=restore_backup_mgr,
+        )
+
+        # Act
+        restored = orchestrator.restore_archive_member(
+            tmp_path / "a.tar.gz", Path("/home/.bashrc"), tmp_path
+        )
+
+        # Assert
+        assert restored is None
+        file_ops.restore_archive_member.assert_not_called()
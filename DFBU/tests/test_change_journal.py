@@ -0,0 +1,326 @@
+"""
+Tests for ChangeJournal - Watcher-Driven Change Journal
+
+Description:
+    Unit tests for the in-memory change journal, the inotify watcher, the
+    QFileSystemWatcher fallback, and BackupWorker backing up only journaled
+    paths with full-walk fallback.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from gui import change_journal as change_journal_module
+from gui.change_journal import (
+    ChangeJournal,
+    InotifyWatcher,
+    QtChangeWatcher,
+    inotify_available,
+)
+from gui.model import DFBUModel
+from gui.viewmodel import BackupWorker
+
+
+requires_inotify = pytest.mark.skipif(
+    not inotify_available(), reason="inotify not available"
+)
+
+
+@pytest.fixture
+def qapp():
+    """Create QApplication for Qt signal testing."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+    """Poll condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestChangeJournal:
+    """Test suite for ChangeJournal sync state."""
+
+    @pytest.mark.unit
+    def test_first_checkpoint_requires_full_walk(self, tmp_path: Path) -> None:
+        """An unsynced journal returns None, then tracks changes."""
+        journal = ChangeJournal()
+        journal.reset()
+        journal.append("/home/user/.bashrc")
+
+        assert journal.checkpoint("/mirror") is None
+        journal.append("/home/user/.vimrc")
+        assert journal.checkpoint("/mirror") == {"/home/user/.vimrc"}
+        assert journal.checkpoint("/mirror") == set()
+
+    @pytest.mark.unit
+    def test_overflow_forces_full_walk(self, tmp_path: Path) -> None:
+        """Exceeding the entry cap falls back to a full walk."""
+        journal = ChangeJournal(max_entries=2)
+        journal.reset()
+        journal.checkpoint("/mirror")
+        for name in ("a", "b", "c"):
+            journal.append(f"/home/user/{name}")
+
+        assert journal.overflowed
+        assert journal.checkpoint("/mirror") is None
+        assert journal.checkpoint("/mirror") == set()
+
+    @pytest.mark.unit
+    def test_scope_change_forces_full_walk(self, tmp_path: Path) -> None:
+        """A different mirror root is never backed up from the journal."""
+        journal = ChangeJournal()
+        journal.reset()
+        journal.checkpoint("/mirror")
+
+        assert journal.checkpoint("/other-mirror") is None
+
+    @pytest.mark.unit
+    def test_restore_requeues_paths(self, tmp_path: Path) -> None:
+        """Paths from an interrupted backup are pending again."""
+        journal = ChangeJournal()
+        journal.reset()
+        journal.checkpoint("/mirror")
+        journal.restore(["/home/user/.bashrc"])
+
+        assert journal.checkpoint("/mirror") == {"/home/user/.bashrc"}
+        journal.restore(None)
+        assert journal.checkpoint("/mirror") is None
+
+
+@requires_inotify
+class TestInotifyWatcher:
+    """Test suite for the inotify-backed watcher."""
+
+    @pytest.mark.unit
+    def test_directory_changes_are_journaled(self, tmp_path: Path) -> None:
+        """Files changed anywhere under a watched directory are journaled."""
+        root = tmp_path / ".config"
+        (root / "app").mkdir(parents=True)
+        journal = ChangeJournal()
+        watcher = InotifyWatcher(journal, [root])
+        assert watcher.start()
+        assert _wait_for(lambda: watcher.is_ready)
+        journal.checkpoint("/mirror")
+
+        try:
+            (root / "app" / "settings.ini").write_text("x=1")
+            (root / "new").mkdir()
+            assert _wait_for(lambda: str(root / "new") in journal._pending)
+            (root / "new" / "file.txt").write_text("hello")
+
+            assert _wait_for(lambda: str(root / "new" / "file.txt") in journal._pending)
+        finally:
+            watcher.stop()
+
+        changes = journal.checkpoint("/mirror")
+        assert changes is not None
+        assert str(root / "app" / "settings.ini") in changes
+
+    @pytest.mark.unit
+    def test_file_root_filters_siblings(self, tmp_path: Path) -> None:
+        """A single-file root only journals that file, not its siblings."""
+        bashrc = tmp_path / ".bashrc"
+        bashrc.write_text("old")
+        journal = ChangeJournal()
+        watcher = InotifyWatcher(journal, [bashrc])
+        watcher.start()
+        assert _wait_for(lambda: watcher.is_ready)
+        journal.checkpoint("/mirror")
+
+        try:
+            (tmp_path / "unrelated.txt").write_text("noise")
+            bashrc.write_text("new")
+            assert _wait_for(lambda: str(bashrc) in journal._pending)
+        finally:
+            watcher.stop()
+
+        assert journal.checkpoint("/mirror") == {str(bashrc)}
+
+
+@requires_inotify
+class TestQtChangeWatcher:
+    """Test suite for the QFileSystemWatcher fallback."""
+
+    @staticmethod
+    def _started(qapp: QApplication, root: Path) -> QtChangeWatcher:
+        """Start a watcher on root and wait for its initial scan."""
+        watcher = QtChangeWatcher(ChangeJournal(), [root])
+        assert watcher.start()
+        assert _wait_for(lambda: qapp.processEvents() or watcher.is_ready)
+        return watcher
+
+    @pytest.mark.unit
+    def test_directory_change_lists_only_new_entries(
+        self, qapp: QApplication, tmp_path: Path
+    ) -> None:
+        """A change lists the changed directory and new subdirectories only."""
+        root = tmp_path / ".config"
+        (root / "app" / "deep").mkdir(parents=True)
+        (root / "app" / "deep" / "settings.ini").write_text("x=1")
+        watcher = self._started(qapp, root)
+        (root / "new" / "sub").mkdir(parents=True)
+        (root / "new" / "sub" / "file.txt").write_text("hello")
+        (root / "top.conf").write_text("top")
+        listed: list[str] = []
+        list_directory = change_journal_module._list_directory
+
+        def record(directory: str) -> dict[str, tuple[int, bool]]:
+            listed.append(directory)
+            return list_directory(directory)
+
+        try:
+            with patch.object(change_journal_module, "_list_directory", record):
+                watcher._on_directory_changed(str(root))
+            assert watcher._watcher is not None
+            directories = set(watcher._watcher.directories())
+            files = set(watcher._watcher.files())
+        finally:
+            watcher.stop()
+
+        assert sorted(listed) == [
+            str(root),
+            str(root / "new"),
+            str(root / "new" / "sub"),
+        ]
+        assert {str(root / "new"), str(root / "new" / "sub")} <= directories
+        assert {str(root / "new" / "sub" / "file.txt"), str(root / "top.conf")} <= (
+            files
+        )
+        assert watcher.journal.checkpoint("/mirror") is None
+
+    @pytest.mark.unit
+    def test_recreated_directory_is_watched_again(
+        self, qapp: QApplication, tmp_path: Path
+    ) -> None:
+        """A directory removed and created again is walked and re-watched."""
+        root = tmp_path / ".config"
+        (root / "app").mkdir(parents=True)
+        watcher = self._started(qapp, root)
+        journal = watcher.journal
+        journal.checkpoint("/mirror")
+
+        try:
+            (root / "app").rmdir()
+            watcher._on_directory_changed(str(root))
+            (root / "app").mkdir()
+            (root / "app" / "settings.ini").write_text("x=1")
+            watcher._on_directory_changed(str(root))
+            assert watcher._watcher is not None
+            files = set(watcher._watcher.files())
+        finally:
+            watcher.stop()
+
+        assert str(root / "app" / "settings.ini") in files
+        changes = journal.checkpoint("/mirror")
+        assert changes is not None
+        assert str(root) in changes
+
+
+class TestJournaledBackup:
+    """Test suite for BackupWorker using the change journal."""
+
+    @pytest.mark.unit
+    def test_second_backup_copies_only_journaled_paths(
+        self, qapp: QApplication, tmp_path: Path
+    ) -> None:
+        """After a full walk, only changed files are processed."""
+        src_dir = tmp_path / "home" / ".config"
+        src_dir.mkdir(parents=True)
+        for name in ("a.conf", "b.conf", "c.conf"):
+            (src_dir / name).write_text(name)
+        model = DFBUModel(tmp_path / "config")
+        model._change_journal = ChangeJournal()
+        model.add_dotfile("Test", "App", "Config", [str(src_dir)], enabled=True)
+        model.mirror_base_dir = tmp_path / "mirror"
+        model.update_option("change_journal", True)
+        assert model.refresh_change_watcher()
+        watcher = model._change_watcher
+        assert watcher is not None
+        assert _wait_for(lambda: watcher.is_ready)
+
+        try:
+            worker = BackupWorker()
+            worker.set_model(model)
+            worker.set_modes(mirror=True, archive=False)
+            worker.run()
+
+            (src_dir / "b.conf").write_text("changed")
+            os.utime(src_dir / "b.conf", ns=(0, time.time_ns() + 5_000_000_000))
+            assert _wait_for(lambda: len(model._change_journal) > 0)
+
+            processed: list[str] = []
+            skipped: list[str] = []
+            worker.item_processed.connect(lambda src, _dest: processed.append(src))
+            worker.item_skipped.connect(lambda src, _reason: skipped.append(src))
+            worker.run()
+            qapp.processEvents()
+        finally:
+            model.stop_change_watcher()
+
+        assert processed == [str(src_dir / "b.conf")]
+        assert skipped == []
+        dest = model.assemble_dest_path(model.mirror_base_dir, src_dir, True, False)
+        assert (dest / "b.conf").read_text() == "changed"
+
+    @pytest.mark.unit
+    def test_without_watcher_backup_walks_everything(self, tmp_path: Path) -> None:
+        """No running watcher means no journaled changes."""
+        model = DFBUModel(tmp_path / "config")
+        model._change_journal = ChangeJournal()
+
+        assert model.begin_journaled_backup() is None
+
+    @pytest.mark.unit
+    def test_watcher_not_trusted_before_initial_pass(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """start() returns before the watches exist; the journal stays unsynced."""
+        src_dir = tmp_path / "home" / ".config"
+        src_dir.mkdir(parents=True)
+        model = DFBUModel(tmp_path / "config")
+        model._change_journal = ChangeJournal()
+        model.add_dotfile("Test", "App", "Config", [str(src_dir)], enabled=True)
+        model.mirror_base_dir = tmp_path / "mirror"
+        model.update_option("change_journal", True)
+        release = threading.Event()
+        add_roots = InotifyWatcher._add_roots
+
+        def blocked_add_roots(watcher: InotifyWatcher) -> None:
+            release.wait(5.0)
+            add_roots(watcher)
+
+        monkeypatch.setattr(InotifyWatcher, "_add_roots", blocked_add_roots)
+        assert model.refresh_change_watcher()
+        watcher = model._change_watcher
+        assert watcher is not None
+
+        try:
+            assert not watcher.is_ready
+            assert model.begin_journaled_backup() is None
+            assert not model._change_journal.is_synced(model._journal_scope())
+            release.set()
+            assert _wait_for(lambda: watcher.is_ready)
+        finally:
+            release.set()
+            model.stop_change_watcher()
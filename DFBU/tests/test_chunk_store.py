@@ -0,0 +1,286 @@
+"""
+Tests for ChunkStore - Content-Defined Chunking Deduplicating Archive Store
+
+Description:
+    Unit tests for the content-defined chunker, dedup archives that store
+    unchanged data once, manifest-based single-file restore, and chunk
+    garbage collection driven by rotate_archives.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import hashlib
+import io
+import os
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from gui.chunk_store import (
+    CHUNK_MAX_SIZE,
+    CHUNK_MIN_SIZE,
+    CHUNK_STORE_DIR,
+    ChunkStore,
+    DedupManifest,
+    iter_chunks,
+)
+from gui.file_operations import FileOperations
+
+
+# Dotfile directory with one file spanning many chunks
+pytestmark = pytest.mark.archive_files(
+    {"big.db": random.Random(1).randbytes(256 * 1024), "small.conf": "key=value\n"}
+)
+
+
+def _chunk_ids(data: bytes) -> list[str]:
+    """SHA-256 of each content-defined chunk of data."""
+    return [hashlib.sha256(c).hexdigest() for c in iter_chunks(io.BytesIO(data))]
+
+
+def _stored_chunks(archives: Path) -> set[str]:
+    """Names of all chunk files in the archive directory's store."""
+    return {path.name for path in (archives / CHUNK_STORE_DIR).glob("*/*")}
+
+
+def _dedup_ops() -> FileOperations:
+    """FileOperations writing dedup archives."""
+    file_ops = FileOperations("testhost")
+    file_ops.archive_format = "dedup"
+    return file_ops
+
+
+class TestChunker:
+    """Test suite for content-defined chunking."""
+
+    @pytest.mark.unit
+    def test_chunks_reassemble_within_size_bounds(self) -> None:
+        """Chunks concatenate to the input and respect min and max sizes."""
+        data = random.Random(2).randbytes(3 * 1024 * 1024 + 5)
+
+        chunks = list(iter_chunks(io.BytesIO(data)))
+
+        assert b"".join(chunks) == data
+        assert all(CHUNK_MIN_SIZE <= len(c) <= CHUNK_MAX_SIZE for c in chunks[:-1])
+        assert 0 < len(chunks[-1]) <= CHUNK_MAX_SIZE
+
+    @pytest.mark.unit
+    def test_boundaries_resynchronize_after_insertion(self) -> None:
+        """An insertion near the start only changes the chunks around it."""
+        data = random.Random(3).randbytes(512 * 1024)
+        edited = data[:1000] + b"inserted bytes" + data[1000:]
+
+        original = _chunk_ids(data)
+        shifted = _chunk_ids(edited)
+
+        assert len(set(original) - set(shifted)) <= 2
+        assert len(original) > 20
+
+    @pytest.mark.unit
+    def test_empty_and_small_inputs(self) -> None:
+        """Empty input has no chunks; small input is a single chunk."""
+        assert list(iter_chunks(io.BytesIO(b""))) == []
+        assert list(iter_chunks(io.BytesIO(b"abc"))) == [b"abc"]
+
+
+class TestDedupArchives:
+    """Test suite for dedup archives in FileOperations."""
+
+    @pytest.mark.unit
+    def test_unchanged_files_are_stored_once(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A second archive of unchanged files adds only a manifest."""
+        archives = tmp_path / "archives"
+        file_ops = _dedup_ops()
+        first = make_archive(archive_dotfiles, file_ops, archives)
+        chunks_after_first = _stored_chunks(archives)
+
+        second = make_archive(archive_dotfiles, file_ops, archives)
+
+        assert first.name.endswith(".dedup.json")
+        assert _stored_chunks(archives) == chunks_after_first
+        assert set(DedupManifest.load(second).chunk_ids()) == chunks_after_first
+
+    @pytest.mark.unit
+    def test_unchanged_files_are_not_chunked_again(
+        self,
+        archive_dotfiles: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        make_archive: Callable[..., Path],
+    ) -> None:
+        """Files older than the last manifest reuse its chunks; fresh ones do not."""
+        archives = tmp_path / "archives"
+        file_ops = _dedup_ops()
+        os.utime(archive_dotfiles / "big.db", ns=(0, 1_000_000_000))
+        first = make_archive(archive_dotfiles, file_ops, archives)
+        chunked: list[Path] = []
+        store_file = ChunkStore.store_file
+
+        def record(store: ChunkStore, path: Path) -> tuple[list[str], int]:
+            chunked.append(path)
+            return store_file(store, path)
+
+        monkeypatch.setattr(ChunkStore, "store_file", record)
+        second = make_archive(archive_dotfiles, file_ops, archives)
+
+        # small.conf was written within the racy window of the first archive
+        assert chunked == [archive_dotfiles / "small.conf"]
+        assert DedupManifest.load(second).entries == DedupManifest.load(first).entries
+
+    @pytest.mark.unit
+    def test_parallel_chunking_matches_serial(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Files chunked on several workers give the serial manifest."""
+        for index in range(8):
+            (archive_dotfiles / f"file-{index}.bin").write_bytes(
+                random.Random(index).randbytes(64 * 1024)
+            )
+        serial_ops = _dedup_ops()
+        serial_ops.copy_workers = 1
+        parallel_ops = _dedup_ops()
+        parallel_ops.copy_workers = 4
+
+        serial = make_archive(archive_dotfiles, serial_ops, tmp_path / "serial")
+        parallel = make_archive(archive_dotfiles, parallel_ops, tmp_path / "parallel")
+
+        serial_entries = DedupManifest.load(serial).entries
+        parallel_entries = DedupManifest.load(parallel).entries
+        assert list(parallel_entries) == list(serial_entries)
+        assert parallel_entries == serial_entries
+        assert _stored_chunks(tmp_path / "parallel") == _stored_chunks(
+            tmp_path / "serial"
+        )
+
+    @pytest.mark.unit
+    def test_small_edit_stores_few_new_chunks(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Changing a few bytes of a large file adds only nearby chunks."""
+        archives = tmp_path / "archives"
+        file_ops = _dedup_ops()
+        make_archive(archive_dotfiles, file_ops, archives)
+        before = _stored_chunks(archives)
+
+        big = archive_dotfiles / "big.db"
+        data = bytearray(big.read_bytes())
+        data[100_000:100_004] = b"edit"
+        big.write_bytes(bytes(data))
+        make_archive(archive_dotfiles, file_ops, archives)
+
+        assert 1 <= len(_stored_chunks(archives) - before) <= 2
+
+    @pytest.mark.unit
+    def test_restore_member_from_manifest(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A single file is rebuilt from its chunks with mode and mtime."""
+        file_ops = _dedup_ops()
+        big = archive_dotfiles / "big.db"
+        big.chmod(0o600)
+        archive = make_archive(archive_dotfiles, file_ops, tmp_path / "archives")
+
+        restored = file_ops.restore_archive_member(archive, big, tmp_path / "out")
+
+        assert restored is not None
+        assert restored.read_bytes() == big.read_bytes()
+        assert restored.stat().st_mode & 0o777 == 0o600
+        assert restored.stat().st_mtime_ns == big.stat().st_mtime_ns
+
+    @pytest.mark.unit
+    def test_restore_keeps_sibling_tmp_member(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Restoring foo never clobbers an already restored foo.tmp."""
+        (archive_dotfiles / "app.conf.tmp").write_text("user data\n")
+        (archive_dotfiles / "app.conf").write_text("key=value\n")
+        file_ops = _dedup_ops()
+        archive = make_archive(archive_dotfiles, file_ops, tmp_path / "archives")
+        out = tmp_path / "out"
+
+        sibling = file_ops.restore_archive_member(
+            archive, archive_dotfiles / "app.conf.tmp", out
+        )
+        restored = file_ops.restore_archive_member(
+            archive, archive_dotfiles / "app.conf", out
+        )
+
+        assert sibling is not None
+        assert restored is not None
+        assert sibling.read_text() == "user data\n"
+        assert restored.read_text() == "key=value\n"
+        assert sorted(restored.parent.iterdir()) == [restored, sibling]
+
+    @pytest.mark.unit
+    def test_corrupt_chunk_fails_restore(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A chunk whose content no longer matches its hash is rejected."""
+        archives = tmp_path / "archives"
+        file_ops = _dedup_ops()
+        archive = make_archive(archive_dotfiles, file_ops, archives)
+        small = archive_dotfiles / "small.conf"
+        chunk_id = DedupManifest.load(archive).entries[str(small)].chunks[0]
+        chunk = archives / CHUNK_STORE_DIR / chunk_id[:2] / chunk_id
+        chunk.write_bytes(chunk.read_bytes()[:-1] + b"\x00")
+        target = tmp_path / "out" / str(small).lstrip("/")
+        target.parent.mkdir(parents=True)
+        target.write_text("live=1\n")
+
+        assert file_ops.restore_archive_member(archive, small, tmp_path / "out") is None
+        assert target.read_text() == "live=1\n"
+        assert list(target.parent.iterdir()) == [target]
+
+
+class TestChunkGarbageCollection:
+    """Test suite for reference-counted chunk cleanup during rotation."""
+
+    @pytest.mark.unit
+    def test_rotation_removes_only_unreferenced_chunks(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Chunks only the deleted manifest used are removed; shared ones stay."""
+        archives = tmp_path / "archives"
+        file_ops = _dedup_ops()
+        first = make_archive(archive_dotfiles, file_ops, archives)
+        first_chunks = set(DedupManifest.load(first).chunk_ids())
+        (archive_dotfiles / "big.db").write_bytes(os.urandom(64 * 1024))
+        second = make_archive(archive_dotfiles, file_ops, archives)
+        os.utime(first, (1, 1))
+
+        deleted = file_ops.rotate_archives(archives, False, 1)
+
+        assert deleted == [first]
+        assert _stored_chunks(archives) == set(DedupManifest.load(second).chunk_ids())
+        assert _stored_chunks(archives) & first_chunks  # small.conf is shared
+        restored = file_ops.restore_archive_member(
+            second, archive_dotfiles / "big.db", tmp_path / "out"
+        )
+        assert restored is not None
+        assert restored.read_bytes() == (archive_dotfiles / "big.db").read_bytes()
+
+    @pytest.mark.unit
+    def test_unreadable_manifest_blocks_collection(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """No chunk is deleted if a surviving manifest cannot be read."""
+        archives = tmp_path / "archives"
+        file_ops = _dedup_ops()
+        first = make_archive(archive_dotfiles, file_ops, archives)
+        (archive_dotfiles / "big.db").write_bytes(os.urandom(64 * 1024))
+        second = make_archive(archive_dotfiles, file_ops, archives)
+        before = _stored_chunks(archives)
+        os.utime(first, (1, 1))
+        second.write_text("not json")
+
+        file_ops.rotate_archives(archives, False, 1)
+
+        assert _stored_chunks(archives) == before
@@ -229,3 +229,91 @@ class TestConfigTabSizeOptions:
         assert model2.options["size_warning_threshold_mb"] == 50
         assert model2.options["size_alert_threshold_mb"] == 500
         assert model2.options["size_critical_threshold_mb"] == 5000
+
+
+@pytest.mark.integration
+class TestConfigTabPerformanceOptions:
+    """Test performance options in Configuration tab."""
+
+    def test_copy_workers_defaults_when_missing(
+        self, yaml_config_with_size_options: Path
+    ) -> None:
+        """Copy workers option falls back to default when absent from config."""
+        # Arrange - pass directory path, not file path
+        model = DFBUModel(yaml_config_with_size_options)
+
+        # Act
+        success, _ = model.load_config()
+
+        # Assert
+        assert success
+        assert model.options.get("copy_workers") == 4
+
+    def test_copy_workers_update_applies_to_file_operations(
+        self, yaml_config_with_size_options: Path
+    ) -> None:
+        """Updating copy workers resizes the copy engine."""
+        # Arrange - pass directory path, not file path
+        model = DFBUModel(yaml_config_with_size_options)
+        model.load_config()
+
+        # Act
+        success = model.update_option("copy_workers", 8)
+
+        # Assert
+        assert success
+        assert model.options["copy_workers"] == 8
+        assert model._file_ops.copy_workers == 8
+
+    def test_verify_workers_update_applies_to_verification(
+        self, yaml_config_with_size_options: Path
+    ) -> None:
+        """Updating verify workers resizes the verification pool."""
+        # Arrange - pass directory path, not file path
+        model = DFBUModel(yaml_config_with_size_options)
+        model.load_config()
+
+        # Act
+        success = model.update_option("verify_workers", 2)
+
+        # Assert
+        assert success
+        assert model.options["verify_workers"] == 2
+        assert model._verification_manager.workers == 2
+
+    def test_verify_sampling_options_apply_to_verification(
+        self, yaml_config_with_size_options: Path
+    ) -> None:
+        """Sampling options set the sample size and byte budget, clamped."""
+        # Arrange - pass directory path, not file path
+        model = DFBUModel(yaml_config_with_size_options)
+        model.load_config()
+
+        # Act
+        assert model.update_option("verify_sample_percent", 15)
+        assert model.update_option("verify_sample_budget_mb", 64)
+
+        # Assert
+        assert model._verification_manager.sample_percent == 15
+        assert model._verification_manager.sample_budget_bytes == 64 * 1024 * 1024
+        assert model.update_option("verify_sample_percent", 0)
+        assert model._verification_manager.sample_percent == 1
+
+    def test_verify_report_options_apply_to_verification(
+        self, yaml_config_with_size_options: Path, isolated_data_dir: Path
+    ) -> None:
+        """Report options switch to failures-only and enable JSONL results."""
+        # Arrange - pass directory path, not file path
+        model = DFBUModel(yaml_config_with_size_options)
+        model.load_config()
+        assert model._verification_manager.failures_only is False
+        assert model._verification_manager.results_dir is None
+
+        # Act
+        assert model.update_option("verify_failures_only", True)
+        assert model.update_option("verify_results_file", True)
+
+        # Assert
+        manager = model._verification_manager
+        assert manager.failures_only is True
+        assert manager.results_dir == isolated_data_dir / "verify-results"
@@ -0,0 +1,116 @@
+"""
+Tests for CopyEngine - Bounded Parallel Copy Component
+
+Description:
+    Unit tests for the bounded worker pool used by FileOperations.copy_directory,
+    covering ordering, worker clamping, and the parallel directory copy contract.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from gui.copy_engine import MAX_COPY_WORKERS, CopyEngine
+from gui.file_operations import FileOperations
+
+
+class TestCopyEngine:
+    """Test suite for CopyEngine."""
+
+    @pytest.mark.unit
+    def test_results_keep_submission_order(self) -> None:
+        """Parallel results are yielded in the order jobs were submitted."""
+        engine = CopyEngine(max_workers=8)
+
+        results = list(engine.run(range(200), lambda n: n * 2))
+
+        assert results == [n * 2 for n in range(200)]
+
+    @pytest.mark.unit
+    def test_single_worker_runs_on_calling_thread(self) -> None:
+        """A single worker runs jobs serially without a thread pool."""
+        engine = CopyEngine(max_workers=1)
+        caller = threading.get_ident()
+
+        threads = list(engine.run(range(5), lambda _n: threading.get_ident()))
+
+        assert threads == [caller] * 5
+
+    @pytest.mark.unit
+    def test_multiple_workers_use_pool_threads(self) -> None:
+        """Jobs run on pool threads when more than one worker is configured."""
+        engine = CopyEngine(max_workers=4)
+        caller = threading.get_ident()
+
+        threads = set(engine.run(range(20), lambda _n: threading.get_ident()))
+
+        assert caller not in threads
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("requested", "expected"),
+        [(0, 1), (-3, 1), (6, 6), (MAX_COPY_WORKERS + 10, MAX_COPY_WORKERS)],
+    )
+    def test_worker_count_is_clamped(self, requested: int, expected: int) -> None:
+        """Worker count is clamped to the supported range."""
+        engine = CopyEngine()
+
+        engine.max_workers = requested
+
+        assert engine.max_workers == expected
+
+
+class TestParallelCopyDirectory:
+    """Test suite for copy_directory on the worker pool."""
+
+    @pytest.mark.unit
+    def test_parallel_copy_matches_serial_contract(self, tmp_path: Path) -> None:
+        """Parallel copy returns one (src, dest, success, skipped) per file."""
+        src_dir = tmp_path / "source"
+        for i in range(30):
+            sub = src_dir / f"dir{i % 3}"
+            sub.mkdir(parents=True, exist_ok=True)
+            (sub / f"file{i}.txt").write_text(f"content {i}")
+        dest_dir = tmp_path / "dest"
+        file_ops = FileOperations("testhost", copy_workers=8)
+
+        results = file_ops.copy_directory(src_dir, dest_dir)
+
+        assert len(results) == 30
+        for src_file, dest_file, success, skipped in results:
+            assert success is True
+            assert skipped is False
+            assert dest_file == dest_dir / src_file.relative_to(src_dir)
+            assert dest_file.read_text() == src_file.read_text()
+
+    @pytest.mark.unit
+    def test_parallel_copy_skips_identical_files(self, tmp_path: Path) -> None:
+        """Unchanged files are reported as skipped on the second run."""
+        src_dir = tmp_path / "source"
+        src_dir.mkdir()
+        for i in range(10):
+            (src_dir / f"file{i}.txt").write_text(f"content {i}")
+        dest_dir = tmp_path / "dest"
+        file_ops = FileOperations("testhost", copy_workers=4)
+        file_ops.copy_directory(src_dir, dest_dir)
+
+        results = file_ops.copy_directory(src_dir, dest_dir, skip_identical=True)
+
+        assert len(results) == 10
+        assert all(success and skipped for _s, _d, success, skipped in results)
+
+    @pytest.mark.unit
+    def test_copy_workers_property_updates_engine(self) -> None:
+        """copy_workers property reads and writes the engine worker count."""
+        file_ops = FileOperations("testhost")
+
+        file_ops.copy_workers = 2
+
+        assert file_ops.copy_workers == 2
@@ -0,0 +1,230 @@
+"""
+Tests for CopyStrategy - Kernel-Accelerated File Copy Layer
+
+Description:
+    Unit tests for KernelCopier strategy fallback, per device-pair caching,
+    metadata preservation, and strategy reporting in statistics.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import errno
+import hashlib
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gui.copy_strategy import (
+    STRATEGY_HASHED,
+    STRATEGY_ORDER,
+    STRATEGY_SENDFILE,
+    STRATEGY_USERSPACE,
+    KernelCopier,
+)
+from gui.file_operations import FileOperations
+from gui.statistics_tracker import StatisticsTracker
+
+
+def _unsupported(*_args: object, **_kwargs: object) -> int:
+    """Raise the errno a filesystem returns for an unsupported operation."""
+    raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+
+class TestKernelCopier:
+    """Test suite for KernelCopier."""
+
+    @pytest.mark.unit
+    def test_copy_preserves_content_and_metadata(self, tmp_path: Path) -> None:
+        """Copied file has identical content, mode, and mtime."""
+        src = tmp_path / "src.bin"
+        src.write_bytes(os.urandom(300_000))
+        src.chmod(0o640)
+        os.utime(src, ns=(1_000_000_000, 1_500_000_000_123))
+        dest = tmp_path / "dest.bin"
+
+        strategy = KernelCopier().copy(src, dest)
+
+        assert strategy in STRATEGY_ORDER
+        assert dest.read_bytes() == src.read_bytes()
+        assert dest.stat().st_mode == src.stat().st_mode
+        assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    @pytest.mark.unit
+    def test_strategy_cached_per_device_pair(self, tmp_path: Path) -> None:
+        """The first working strategy is cached for the device pair."""
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+        copier = KernelCopier()
+        dev = src.stat().st_dev
+
+        strategy = copier.copy(src, tmp_path / "dest.txt")
+
+        assert copier.cached_strategy(dev, dev) == strategy
+
+    @pytest.mark.unit
+    def test_falls_back_when_kernel_paths_unsupported(self, tmp_path: Path) -> None:
+        """Unsupported reflink/copy_file_range fall through to sendfile."""
+        src = tmp_path / "src.txt"
+        src.write_text("fallback data")
+        dest = tmp_path / "dest.txt"
+        copier = KernelCopier()
+
+        with (
+            patch("gui.copy_strategy.fcntl.ioctl", side_effect=_unsupported),
+            patch(
+                "gui.copy_strategy.os.copy_file_range",
+                side_effect=_unsupported,
+                create=True,
+            ),
+        ):
+            strategy = copier.copy(src, dest)
+
+        assert strategy == STRATEGY_SENDFILE
+        assert dest.read_text() == "fallback data"
+
+    @pytest.mark.unit
+    def test_userspace_copy_is_last_resort(self, tmp_path: Path) -> None:
+        """The userspace copy runs when no kernel mechanism works."""
+        src = tmp_path / "src.txt"
+        src.write_text("userspace data")
+        dest = tmp_path / "dest.txt"
+        copier = KernelCopier()
+
+        with (
+            patch("gui.copy_strategy.fcntl.ioctl", side_effect=_unsupported),
+            patch(
+                "gui.copy_strategy.os.copy_file_range",
+                side_effect=_unsupported,
+                create=True,
+            ),
+            patch("gui.copy_strategy.os.sendfile", side_effect=_unsupported),
+        ):
+            strategy = copier.copy(src, dest)
+
+        assert strategy == STRATEGY_USERSPACE
+        assert dest.read_text() == "userspace data"
+
+    @pytest.mark.unit
+    def test_cached_pair_skips_failed_strategies(self, tmp_path: Path) -> None:
+        """After fallback, later copies start at the cached strategy."""
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+        copier = KernelCopier()
+        with (
+            patch("gui.copy_strategy.fcntl.ioctl", side_effect=_unsupported),
+            patch(
+                "gui.copy_strategy.os.copy_file_range",
+                side_effect=_unsupported,
+                create=True,
+            ),
+        ):
+            copier.copy(src, tmp_path / "first.txt")
+
+        with patch("gui.copy_strategy.fcntl.ioctl") as mock_ioctl:
+            strategy = copier.copy(src, tmp_path / "second.txt")
+
+        assert strategy == STRATEGY_SENDFILE
+        mock_ioctl.assert_not_called()
+
+    @pytest.mark.unit
+    def test_real_errors_are_raised(self, tmp_path: Path) -> None:
+        """A missing source raises instead of being treated as unsupported."""
+        with pytest.raises(OSError):
+            KernelCopier().copy(tmp_path / "missing", tmp_path / "dest")
+
+
+class TestHashWhileCopy:
+    """Test suite for copies that hash the data they move."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("algorithm", ["sha256", "blake2b"])
+    def test_copy_hashed_returns_digest_of_data(
+        self, algorithm: str, tmp_path: Path
+    ) -> None:
+        """The digest matches the copied content and metadata is preserved."""
+        data = os.urandom(2_500_000)
+        src = tmp_path / "src.bin"
+        src.write_bytes(data)
+        os.utime(src, ns=(1_000_000_000, 1_500_000_000_123))
+        dest = tmp_path / "dest.bin"
+
+        strategy, digest = KernelCopier().copy_hashed(src, dest, algorithm)
+
+        assert strategy in STRATEGY_ORDER or strategy == STRATEGY_HASHED
+        assert digest == hashlib.new(algorithm, data).hexdigest()
+        assert dest.read_bytes() == data
+        assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+    @pytest.mark.unit
+    def test_copy_hashed_without_reflink_streams_once(self, tmp_path: Path) -> None:
+        """Without reflinks the data is copied through the hash."""
+        src = tmp_path / "src.txt"
+        src.write_text("hashed content")
+        copier = KernelCopier()
+
+        with patch("gui.copy_strategy.fcntl.ioctl", side_effect=_unsupported):
+            strategy, digest = copier.copy_hashed(src, tmp_path / "dest.txt")
+
+        assert strategy == STRATEGY_HASHED
+        assert digest == hashlib.sha256(b"hashed content").hexdigest()
+        assert (tmp_path / "dest.txt").read_text() == "hashed content"
+
+    @pytest.mark.unit
+    def test_unsupported_algorithm_rejected(self, tmp_path: Path) -> None:
+        """Only the configured algorithms are accepted."""
+        src = tmp_path / "src.txt"
+        src.write_text("x")
+
+        with pytest.raises(ValueError, match="md5"):
+            KernelCopier().copy_hashed(src, tmp_path / "dest.txt", "md5")
+
+    @pytest.mark.unit
+    def test_file_operations_records_copy_digest(self, tmp_path: Path) -> None:
+        """Copies record a digest once; skipped copies record none."""
+        src = tmp_path / "src.txt"
+        src.write_text("payload")
+        dest = tmp_path / "out" / "src.txt"
+        file_ops = FileOperations("testhost")
+        file_ops.hash_while_copy = True
+
+        assert file_ops.copy_file(src, dest)
+        assert file_ops.pop_copy_digest(dest) == (
+            f"sha256:{hashlib.sha256(b'payload').hexdigest()}"
+        )
+        assert file_ops.pop_copy_digest(dest) is None
+
+        assert file_ops.copy_file(src, dest, skip_identical=True)
+        assert file_ops.pop_copy_digest(dest) is None
+
+
+class TestCopyStrategyStatistics:
+    """Test suite for copy strategy reporting."""
+
+    @pytest.mark.unit
+    def test_copy_file_records_strategy(self, tmp_path: Path) -> None:
+        """Each copied file increments its strategy counter."""
+        tracker = StatisticsTracker()
+        file_ops = FileOperations("testhost", stats_tracker=tracker)
+        for i in range(3):
+            (tmp_path / f"f{i}.txt").write_text(str(i))
+
+        for i in range(3):
+            file_ops.copy_file(tmp_path / f"f{i}.txt", tmp_path / "out" / f"f{i}.txt")
+
+        assert sum(tracker.statistics.copy_strategies.values()) == 3
+
+    @pytest.mark.unit
+    def test_reset_clears_strategy_counts(self) -> None:
+        """Resetting statistics clears strategy counters."""
+        tracker = StatisticsTracker()
+        tracker.record_copy_strategy("reflink")
+
+        tracker.reset_statistics()
+
+        assert tracker.statistics.copy_strategies == {}
@@ -0,0 +1,168 @@
+"""
+Tests for DeltaSync - Block-Level Updates for Large Changed Files
+
+Description:
+    Unit tests for delta_update block rewriting, growth and truncation, and
+    the FileOperations delta path with bytes-saved statistics.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from gui.delta_sync import delta_update
+from gui.file_operations import STRATEGY_DELTA, FileOperations
+from gui.statistics_tracker import StatisticsTracker
+
+
+BLOCK = 4096
+
+
+class TestDeltaUpdate:
+    """Test suite for the delta_update function."""
+
+    @pytest.mark.unit
+    def test_appended_data_writes_only_new_blocks(self, tmp_path: Path) -> None:
+        """A grown file only writes the blocks past the old end."""
+        base = os.urandom(BLOCK * 8)
+        src = tmp_path / "history"
+        dest = tmp_path / "mirror_history"
+        dest.write_bytes(base)
+        src.write_bytes(base + b"new command\n")
+
+        result = delta_update(src, dest, block_size=BLOCK)
+
+        assert dest.read_bytes() == src.read_bytes()
+        assert result.bytes_written == len(b"new command\n")
+        assert result.bytes_saved == BLOCK * 8
+
+    @pytest.mark.unit
+    def test_changed_block_is_rewritten_in_place(self, tmp_path: Path) -> None:
+        """Only the block containing a change is written."""
+        data = bytearray(os.urandom(BLOCK * 4))
+        dest = tmp_path / "dest.db"
+        dest.write_bytes(bytes(data))
+        inode = dest.stat().st_ino
+        data[BLOCK * 2 + 10] ^= 0xFF
+        src = tmp_path / "src.db"
+        src.write_bytes(bytes(data))
+
+        result = delta_update(src, dest, block_size=BLOCK)
+
+        assert dest.read_bytes() == bytes(data)
+        assert result.bytes_written == BLOCK
+        assert dest.stat().st_ino == inode
+
+    @pytest.mark.unit
+    def test_shrunk_file_is_truncated(self, tmp_path: Path) -> None:
+        """A destination longer than the source is truncated."""
+        data = os.urandom(BLOCK * 3)
+        dest = tmp_path / "dest"
+        dest.write_bytes(data)
+        src = tmp_path / "src"
+        src.write_bytes(data[:BLOCK])
+
+        result = delta_update(src, dest, block_size=BLOCK)
+
+        assert dest.read_bytes() == data[:BLOCK]
+        assert result.bytes_written == 0
+
+    @pytest.mark.unit
+    def test_metadata_is_copied(self, tmp_path: Path) -> None:
+        """Mode and mtime follow the source after the update."""
+        src = tmp_path / "src"
+        src.write_bytes(b"abc" * 1000)
+        src.chmod(0o600)
+        os.utime(src, ns=(1_000_000_000, 1_700_000_000_000_000_000))
+        dest = tmp_path / "dest"
+        dest.write_bytes(b"xyz")
+
+        delta_update(src, dest, block_size=BLOCK)
+
+        assert dest.stat().st_mode == src.stat().st_mode
+        assert dest.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+class TestFileOperationsDelta:
+    """Test suite for delta updates through FileOperations.copy_file."""
+
+    @pytest.mark.unit
+    def test_large_changed_file_uses_delta(self, tmp_path: Path) -> None:
+        """Files above the threshold are delta-updated and savings recorded."""
+        base = os.urandom(256 * 1024)
+        src = tmp_path / ".zsh_history"
+        src.write_bytes(base)
+        dest = tmp_path / "mirror" / ".zsh_history"
+        tracker = StatisticsTracker()
+        file_ops = FileOperations("testhost", stats_tracker=tracker)
+        file_ops.delta_threshold = 64 * 1024
+        file_ops.copy_file(src, dest)
+        tracker.reset_statistics()
+
+        with src.open("ab") as f:
+            f.write(b": 1700000000:0;ls\n")
+        assert file_ops.copy_file(src, dest)
+
+        assert dest.read_bytes() == src.read_bytes()
+        assert tracker.statistics.copy_strategies == {STRATEGY_DELTA: 1}
+        assert tracker.statistics.delta_bytes_saved >= len(base) - 128 * 1024
+
+    @pytest.mark.unit
+    def test_small_file_uses_full_copy(self, tmp_path: Path) -> None:
+        """Files below the threshold are copied normally."""
+        src = tmp_path / "small.txt"
+        src.write_text("old")
+        dest = tmp_path / "mirror" / "small.txt"
+        tracker = StatisticsTracker()
+        file_ops = FileOperations("testhost", stats_tracker=tracker)
+        file_ops.copy_file(src, dest)
+
+        src.write_text("new")
+        file_ops.copy_file(src, dest)
+
+        assert dest.read_text() == "new"
+        assert STRATEGY_DELTA not in tracker.statistics.copy_strategies
+        assert tracker.statistics.delta_bytes_saved == 0
+
+    @pytest.mark.unit
+    def test_hard_linked_destination_is_not_updated_in_place(
+        self, tmp_path: Path
+    ) -> None:
+        """A destination shared with another snapshot gets a fresh copy."""
+        src = tmp_path / "big.db"
+        src.write_bytes(os.urandom(128 * 1024))
+        older = tmp_path / "older.db"
+        older.write_bytes(src.read_bytes())
+        dest = tmp_path / "dest.db"
+        os.link(older, dest)
+        file_ops = FileOperations("testhost")
+        file_ops.delta_threshold = 1
+
+        src.write_bytes(os.urandom(128 * 1024))
+        file_ops.copy_file(src, dest)
+
+        assert dest.read_bytes() == src.read_bytes()
+        assert older.read_bytes() != src.read_bytes()
+
+    @pytest.mark.unit
+    def test_zero_threshold_disables_delta(self, tmp_path: Path) -> None:
+        """A threshold of 0 turns delta updates off."""
+        src = tmp_path / "src"
+        src.write_bytes(os.urandom(64 * 1024))
+        dest = tmp_path / "dest"
+        dest.write_bytes(os.urandom(64 * 1024))
+        tracker = StatisticsTracker()
+        file_ops = FileOperations("testhost", stats_tracker=tracker)
+        file_ops.delta_threshold = 0
+
+        file_ops.copy_file(src, dest)
+
+        assert dest.read_bytes() == src.read_bytes()
+        assert STRATEGY_DELTA not in tracker.statistics.copy_strategies
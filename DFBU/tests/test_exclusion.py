@@ -0,0 +1,217 @@
+"""
+Tests for Exclusion - Compiled gitignore-Style Exclusion Matcher
+
+Description:
+    Unit tests for ExclusionMatcher pattern semantics (anchoring, **,
+    directory-only patterns, negation) and for exclusions pruning the
+    copy, archive, size, and preview walks.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from gui.exclusion import ExclusionMatcher
+from gui.file_operations import FileOperations
+from gui.fs_walker import walk_files
+from gui.preview_generator import PreviewGenerator
+
+
+@pytest.fixture
+def source_tree(tmp_path: Path) -> Path:
+    """Create a dotfile directory with cache, log, and node_modules clutter."""
+    root = tmp_path / "home" / ".config"
+    for relative in (
+        "app/settings.ini",
+        "app/Cache/blob",
+        "app/debug.log",
+        "app/keep.log",
+        "tool/node_modules/pkg/index.js",
+        "tool/config.json",
+    ):
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative)
+    return root
+
+
+PATTERNS = ["**/Cache/", "*.log", "!keep.log", "node_modules/"]
+
+
+class TestExclusionMatcher:
+    """Test suite for ExclusionMatcher pattern semantics."""
+
+    @pytest.mark.unit
+    def test_unanchored_pattern_matches_name_at_any_depth(self) -> None:
+        """A pattern without a slash matches the basename anywhere."""
+        matcher = ExclusionMatcher(["*.log"])
+
+        assert matcher.matches("/var/log/app/test.log", is_dir=False)
+        assert not matcher.matches("/var/log/app/test.txt", is_dir=False)
+
+    @pytest.mark.unit
+    def test_anchored_pattern_matches_from_root(self) -> None:
+        """A pattern with a slash only matches the full path."""
+        matcher = ExclusionMatcher(["/etc/hosts", "home/*/secret"])
+
+        assert matcher.matches("/etc/hosts", is_dir=False)
+        assert not matcher.matches("/backup/etc/hosts", is_dir=False)
+        assert matcher.matches("/home/user/secret", is_dir=False)
+        assert not matcher.matches("/home/user/nested/secret", is_dir=False)
+
+    @pytest.mark.unit
+    def test_double_star_positions(self) -> None:
+        """Leading, middle, and trailing ** follow gitignore semantics."""
+        matcher = ExclusionMatcher(
+            ["**/.mozilla/firefox/*/cache2/", "/a/**/b", "/c/**"]
+        )
+
+        assert matcher.matches(
+            "/home/user/.mozilla/firefox/x.default/cache2", is_dir=True
+        )
+        assert matcher.matches("/a/b", is_dir=False)
+        assert matcher.matches("/a/x/y/b", is_dir=False)
+        assert matcher.matches("/c/anything/below", is_dir=False)
+        assert not matcher.matches("/c", is_dir=True)
+
+    @pytest.mark.unit
+    def test_directory_only_pattern_ignores_files(self) -> None:
+        """A trailing slash restricts the pattern to directories."""
+        matcher = ExclusionMatcher(["node_modules/"])
+
+        assert matcher.matches("/src/node_modules", is_dir=True)
+        assert not matcher.matches("/src/node_modules", is_dir=False)
+
+    @pytest.mark.unit
+    def test_negation_last_match_wins(self) -> None:
+        """A later ! pattern re-includes a path; a later exclude wins again."""
+        matcher = ExclusionMatcher(["*.log", "!keep.log", "/var/keep.log"])
+
+        assert matcher.matches("/tmp/debug.log", is_dir=False)
+        assert not matcher.matches("/tmp/keep.log", is_dir=False)
+        assert matcher.matches("/var/keep.log", is_dir=False)
+
+    @pytest.mark.unit
+    def test_excluded_parent_cannot_be_negated(self) -> None:
+        """Files inside an excluded directory stay excluded."""
+        matcher = ExclusionMatcher(["**/Cache/", "!important"])
+
+        assert matcher.is_excluded("/home/user/.config/app/Cache/important")
+        assert not matcher.is_excluded("/home/user/.config/app/important")
+
+    @pytest.mark.unit
+    def test_home_expansion_and_comments(self) -> None:
+        """~/ expands to the home directory; comments and blanks are ignored."""
+        matcher = ExclusionMatcher(["# comment", "", "~/.cache/"])
+
+        assert matcher.patterns == ("~/.cache/",)
+        assert matcher.is_excluded(Path.home() / ".cache" / "thumbnails" / "x.png")
+        assert not matcher.is_excluded("/srv/.cache/x")
+
+    @pytest.mark.unit
+    def test_empty_matcher_excludes_nothing(self) -> None:
+        """A matcher without patterns is falsy and matches nothing."""
+        matcher = ExclusionMatcher()
+
+        assert not matcher
+        assert not matcher.is_excluded("/any/path", is_dir=True)
+
+
+class TestExclusionWalks:
+    """Test suite for exclusions applied to backup walks."""
+
+    @pytest.mark.unit
+    def test_walker_prunes_excluded_directories(self, source_tree: Path) -> None:
+        """Excluded directories are never descended into."""
+        visited: list[str] = []
+        matcher = ExclusionMatcher(PATTERNS)
+
+        def exclude(path: str, is_dir: bool) -> bool:
+            visited.append(path)
+            return matcher.matches(path, is_dir)
+
+        relatives = {entry.relative for entry in walk_files(source_tree, exclude)}
+
+        assert relatives == {"app/settings.ini", "app/keep.log", "tool/config.json"}
+        assert not any("node_modules/" in path for path in visited)
+        assert not any("Cache/" in path for path in visited)
+
+    @pytest.mark.unit
+    def test_copy_directory_skips_excluded(
+        self, source_tree: Path, tmp_path: Path
+    ) -> None:
+        """Mirror copies leave excluded files and trees out."""
+        file_ops = FileOperations("testhost", copy_workers=1)
+        file_ops.exclusions = ExclusionMatcher(PATTERNS)
+        dest = tmp_path / "mirror"
+
+        results = file_ops.copy_directory(source_tree, dest)
+
+        assert len(results) == 3
+        assert (dest / "app" / "keep.log").exists()
+        assert not (dest / "app" / "debug.log").exists()
+        assert not (dest / "app" / "Cache").exists()
+        assert not (dest / "tool" / "node_modules").exists()
+
+    @pytest.mark.unit
+    def test_archive_skips_excluded(self, source_tree: Path, tmp_path: Path) -> None:
+        """Archives contain no excluded members."""
+        file_ops = FileOperations("testhost")
+        file_ops.exclusions = ExclusionMatcher(PATTERNS)
+
+        archive = file_ops.create_archive(
+            [(source_tree, True, True)], tmp_path / "archives", hostname_subdir=False
+        )
+
+        assert archive is not None
+        with tarfile.open(archive) as tar:
+            names = tar.getnames()
+        assert any(name.endswith("app/settings.ini") for name in names)
+        assert not any("Cache" in name or "node_modules" in name for name in names)
+        assert not any(name.endswith("debug.log") for name in names)
+
+    @pytest.mark.unit
+    def test_excluded_root_is_not_archived(
+        self, source_tree: Path, tmp_path: Path
+    ) -> None:
+        """A configured path that is itself excluded is skipped entirely."""
+        file_ops = FileOperations("testhost")
+        file_ops.exclusions = ExclusionMatcher([".config/"])
+
+        archive = file_ops.create_archive(
+            [(source_tree, True, True)], tmp_path / "archives", hostname_subdir=False
+        )
+
+        assert archive is not None
+        with tarfile.open(archive) as tar:
+            assert tar.getnames() == []
+
+    @pytest.mark.unit
+    def test_size_and_preview_skip_excluded(
+        self, source_tree: Path, tmp_path: Path
+    ) -> None:
+        """Size totals and previews count only files that would be backed up."""
+        file_ops = FileOperations("testhost")
+        file_ops.exclusions = ExclusionMatcher(PATTERNS)
+        expected = sum(
+            len(relative)
+            for relative in ("app/settings.ini", "app/keep.log", "tool/config.json")
+        )
+
+        assert file_ops.calculate_path_size(source_tree) == expected
+
+        preview = PreviewGenerator(
+            file_ops=file_ops, mirror_base_dir=tmp_path / "mirror"
+        ).generate_preview(
+            [{"application": "Test", "paths": [str(source_tree)]}],
+            hostname_subdir=False,
+            date_subdir=False,
+        )
+        assert len(preview["items"]) == 3
@@ -0,0 +1,127 @@
+"""
+Tests for FileHasher - Buffer-Pooled and Memory-Mapped File Hashing
+
+Description:
+    Unit tests for the mmap hashing path above the size threshold, the
+    pooled-buffer path below it, the fallback when a file cannot be
+    mapped, and buffer reuse in BufferPool.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+
+import pytest
+
+from gui import file_hasher as file_hasher_module
+from gui.file_hasher import BufferPool, file_digest
+
+
+@pytest.fixture
+def small_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Map files of 256 KiB and more, in 64 KiB slices."""
+    monkeypatch.setattr(file_hasher_module, "MMAP_HASH_THRESHOLD", 256 * 1024)
+    monkeypatch.setattr(file_hasher_module, "MMAP_HASH_SLICE", 64 * 1024)
+
+
+def _count_mappings(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Record every mmap.mmap call made by the hasher."""
+    calls: list[int] = []
+    real_mmap = mmap.mmap
+
+    def counting_mmap(fileno: int, *args: object, **kwargs: object) -> mmap.mmap:
+        calls.append(fileno)
+        return real_mmap(fileno, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr("gui.file_hasher.mmap.mmap", counting_mmap)
+    return calls
+
+
+class TestFileDigest:
+    """Test suite for file_digest on both hashing paths."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("size", [0, 1, 256 * 1024 - 1, 256 * 1024, 1_000_003])
+    @pytest.mark.usefixtures("small_threshold")
+    def test_digest_matches_hashlib(self, tmp_path: Path, size: int) -> None:
+        """Both paths produce the same digest as hashlib for any size."""
+        path = tmp_path / "data.bin"
+        data = os.urandom(size)
+        path.write_bytes(data)
+
+        for algorithm in ("sha256", "blake2b"):
+            expected = hashlib.new(algorithm, data).hexdigest()
+            assert file_digest(path, algorithm) == expected
+            assert file_digest(path, algorithm, allow_mmap=True) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("small_threshold")
+    def test_only_large_files_are_mapped_on_request(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files at the threshold are mapped only when mapping is allowed."""
+        calls = _count_mappings(monkeypatch)
+        small = tmp_path / "small.bin"
+        small.write_bytes(b"x" * 1024)
+        large = tmp_path / "large.bin"
+        large.write_bytes(b"x" * 256 * 1024)
+
+        file_digest(small, allow_mmap=True)
+        file_digest(large)
+        assert calls == []
+
+        file_digest(large, allow_mmap=True)
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.usefixtures("small_threshold")
+    def test_unmappable_file_falls_back_to_reads(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A mapping failure falls back to the buffered path."""
+
+        def refuse(*_args: object, **_kwargs: object) -> None:
+            raise OSError("mmap not supported")
+
+        monkeypatch.setattr("gui.file_hasher.mmap.mmap", refuse)
+        path = tmp_path / "large.bin"
+        data = os.urandom(300 * 1024)
+        path.write_bytes(data)
+
+        assert file_digest(path, allow_mmap=True) == hashlib.sha256(data).hexdigest()
+
+
+class TestBufferPool:
+    """Test suite for the reusable buffer pool."""
+
+    @pytest.mark.unit
+    def test_released_buffers_are_reused(self) -> None:
+        """A released buffer is handed out again instead of a new one."""
+        pool = BufferPool(buffer_size=16, max_idle=1)
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+        concurrent = pool.acquire()
+
+        assert second is first
+        assert concurrent is not first
+        assert len(second) == 16
+
+    @pytest.mark.unit
+    def test_idle_buffers_are_bounded(self) -> None:
+        """At most max_idle buffers are kept after a burst of readers."""
+        pool = BufferPool(buffer_size=16, max_idle=2)
+
+        views = [pool.acquire() for _ in range(4)]
+        for view in views:
+            pool.release(view)
+
+        assert len(pool._idle) == 2
@@ -0,0 +1,161 @@
+"""
+Tests for FsWalker - Single-Pass Directory Tree Walker
+
+Description:
+    Unit tests for the scandir-based tree walker and the stat-based
+    readability helper, plus the syscall savings in copy_directory.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import os
+import stat
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gui.file_operations import FileOperations
+from gui.fs_walker import stat_is_readable, walk_files, walk_tree
+
+
+@pytest.fixture
+def sample_tree(tmp_path: Path) -> Path:
+    """
+    Create a small directory tree with nested files and a symlink.
+
+    Args:
+        tmp_path: pytest built-in temporary directory fixture
+
+    Returns:
+        Path: Root of the sample tree
+    """
+    root = tmp_path / "tree"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "top.txt").write_text("top")
+    (root / "a" / "mid.txt").write_text("middle")
+    (root / "a" / "b" / "deep.txt").write_text("deepest")
+    (root / "link.txt").symlink_to(root / "top.txt")
+    (root / "dirlink").symlink_to(root / "a")
+    return root
+
+
+class TestWalkTree:
+    """Test suite for walk_tree and walk_files."""
+
+    @pytest.mark.unit
+    def test_walk_files_matches_rglob(self, sample_tree: Path) -> None:
+        """walk_files yields the same files as rglob + is_file."""
+        expected = {p for p in sample_tree.rglob("*") if p.is_file()}
+
+        found = {entry.path for entry in walk_files(sample_tree)}
+
+        assert found == expected
+
+    @pytest.mark.unit
+    def test_entries_carry_relative_path_and_stat(self, sample_tree: Path) -> None:
+        """Entries expose POSIX relative paths and cached stat sizes."""
+        entries = {entry.relative: entry for entry in walk_files(sample_tree)}
+
+        deep = entries["a/b/deep.txt"]
+        assert deep.size == len("deepest")
+        assert deep.is_file is True
+        assert entries["link.txt"].is_symlink is True
+
+    @pytest.mark.unit
+    def test_symlinked_directories_not_followed(self, sample_tree: Path) -> None:
+        """Symlinks to directories are not descended into."""
+        relatives = {entry.relative for entry in walk_tree(sample_tree, True)}
+
+        assert "dirlink" not in relatives
+        assert not any(rel.startswith("dirlink/") for rel in relatives)
+
+    @pytest.mark.unit
+    def test_include_symlinks_yields_links_by_lstat(self, sample_tree: Path) -> None:
+        """Every symlink, dangling or not, is yielded once as the link."""
+        (sample_tree / "dangling").symlink_to(sample_tree / "missing")
+
+        entries = {e.relative: e for e in walk_tree(sample_tree, include_symlinks=True)}
+
+        links = {rel for rel, entry in entries.items() if entry.is_symlink}
+        assert links == {"link.txt", "dirlink", "dangling"}
+        assert stat.S_ISLNK(entries["link.txt"].stat.st_mode)
+        assert not any(rel.startswith("dirlink/") for rel in entries)
+
+    @pytest.mark.unit
+    def test_include_dirs_yields_directories(self, sample_tree: Path) -> None:
+        """Directories are yielded only when include_dirs is set."""
+        dirs = {e.relative for e in walk_tree(sample_tree, True) if e.is_dir}
+
+        assert dirs == {"a", "a/b"}
+
+    @pytest.mark.unit
+    def test_missing_root_yields_nothing(self, tmp_path: Path) -> None:
+        """A missing root produces an empty walk instead of raising."""
+        assert list(walk_files(tmp_path / "missing")) == []
+
+
+class TestStatIsReadable:
+    """Test suite for stat_is_readable."""
+
+    @pytest.mark.unit
+    def test_owner_readable_file(self, tmp_path: Path) -> None:
+        """Owner-readable file is reported readable."""
+        test_file = tmp_path / "file.txt"
+        test_file.write_text("data")
+
+        assert stat_is_readable(test_file.stat()) is True
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(os.geteuid() == 0, reason="root bypasses mode bits")
+    def test_unreadable_file(self, tmp_path: Path) -> None:
+        """File without read bits is reported unreadable."""
+        test_file = tmp_path / "secret.txt"
+        test_file.write_text("data")
+        test_file.chmod(stat.S_IWUSR)
+
+        try:
+            assert stat_is_readable(test_file.stat()) is False
+        finally:
+            test_file.chmod(stat.S_IRUSR | stat.S_IWUSR)
+
+
+class TestWalkerConsumers:
+    """Test suite for FileOperations traversals built on the walker."""
+
+    @pytest.mark.unit
+    def test_unchanged_copy_stats_destination_once(self, sample_tree: Path) -> None:
+        """Skipping an unchanged file stats only the destination."""
+        file_ops = FileOperations("testhost", copy_workers=1)
+        dest = sample_tree.parent / "dest"
+        file_ops.copy_directory(sample_tree, dest)
+        original_stat = Path.stat
+
+        with patch.object(Path, "stat", autospec=True, side_effect=original_stat) as m:
+            results = file_ops.copy_directory(sample_tree, dest, skip_identical=True)
+
+        assert all(skipped for _s, _d, _ok, skipped in results)
+        # One destination stat per file; source stats come from the walk
+        assert m.call_count == len(results)
+
+    @pytest.mark.unit
+    def test_calculate_path_size_sums_walk(self, sample_tree: Path) -> None:
+        """Directory size equals the sum of file sizes (symlink target counted)."""
+        file_ops = FileOperations("testhost")
+
+        size = file_ops.calculate_path_size(sample_tree)
+
+        assert size == len("top") * 2 + len("middle") + len("deepest")
+
+    @pytest.mark.unit
+    def test_discover_restore_files_lists_files(self, sample_tree: Path) -> None:
+        """Restore discovery returns every file path under the directory."""
+        file_ops = FileOperations("testhost")
+
+        files = file_ops.discover_restore_files(sample_tree)
+
+        assert set(files) == {p for p in sample_tree.rglob("*") if p.is_file()}
@@ -0,0 +1,174 @@
+"""
+Tests for Hardlink Snapshots - Linking Unchanged Files Between Dated Mirrors
+
+Description:
+    Unit tests for FileOperations snapshot linking: unchanged files are
+    hard-linked from the previous dated snapshot, changed files are copied,
+    and rewriting a linked file never modifies the older snapshot.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from gui import merkle_tree
+from gui.file_operations import STRATEGY_HARDLINK, FileOperations
+from gui.statistics_tracker import StatisticsTracker
+
+
+def _make_previous_snapshot(
+    mirror: Path, src: Path, date_name: str = "2020-01-01"
+) -> Path:
+    """Back up src into a dated snapshot the way an earlier run would."""
+    previous = mirror / "testhost" / date_name
+    FileOperations("testhost").copy_file(src, previous / "home" / src.name)
+    return previous
+
+
+class TestHardlinkSnapshots:
+    """Test suite for hard-linking unchanged files from the previous snapshot."""
+
+    @pytest.mark.unit
+    def test_unchanged_file_is_hard_linked(self, tmp_path: Path) -> None:
+        """An unchanged source shares its inode with the previous snapshot."""
+        src = tmp_path / ".bashrc"
+        src.write_text("alias ll='ls -l'")
+        mirror = tmp_path / "mirror"
+        previous = _make_previous_snapshot(mirror, src)
+        today = mirror / "testhost" / time.strftime("%Y-%m-%d")
+        file_ops = FileOperations("testhost")
+
+        assert file_ops.open_snapshot_link(mirror, hostname_subdir=True) == previous
+        assert file_ops.copy_file(src, today / "home" / ".bashrc", skip_identical=True)
+        file_ops.close_snapshot_link()
+
+        linked = (today / "home" / ".bashrc").stat()
+        assert linked.st_ino == (previous / "home" / ".bashrc").stat().st_ino
+        assert linked.st_nlink == 2
+
+    @pytest.mark.unit
+    def test_changed_file_is_copied(self, tmp_path: Path) -> None:
+        """A source changed since the previous snapshot gets its own copy."""
+        src = tmp_path / ".bashrc"
+        src.write_text("old")
+        mirror = tmp_path / "mirror"
+        previous = _make_previous_snapshot(mirror, src)
+        src.write_text("new content")
+        os.utime(src, ns=(0, src.stat().st_mtime_ns + 5_000_000_000))
+        dest = mirror / "testhost" / time.strftime("%Y-%m-%d") / "home" / ".bashrc"
+        file_ops = FileOperations("testhost")
+
+        file_ops.open_snapshot_link(mirror, hostname_subdir=True)
+        file_ops.copy_file(src, dest, skip_identical=True)
+        file_ops.close_snapshot_link()
+
+        assert dest.read_text() == "new content"
+        assert dest.stat().st_nlink == 1
+        assert (previous / "home" / ".bashrc").read_text() == "old"
+
+    @pytest.mark.unit
+    def test_copy_over_link_keeps_previous_snapshot(self, tmp_path: Path) -> None:
+        """Overwriting a linked file breaks the link instead of writing through."""
+        src = tmp_path / ".bashrc"
+        src.write_text("original")
+        mirror = tmp_path / "mirror"
+        previous = _make_previous_snapshot(mirror, src)
+        dest = mirror / "testhost" / time.strftime("%Y-%m-%d") / "home" / ".bashrc"
+        file_ops = FileOperations("testhost")
+        file_ops.open_snapshot_link(mirror, hostname_subdir=True)
+        file_ops.copy_file(src, dest, skip_identical=True)
+        file_ops.close_snapshot_link()
+
+        src.write_text("rewritten")
+        file_ops.copy_file(src, dest)
+
+        assert dest.read_text() == "rewritten"
+        assert (previous / "home" / ".bashrc").read_text() == "original"
+        assert (previous / "home" / ".bashrc").stat().st_nlink == 1
+
+    @pytest.mark.unit
+    def test_copy_directory_links_unchanged_files(self, tmp_path: Path) -> None:
+        """Directory mirrors link unchanged files and report them as processed."""
+        src_dir = tmp_path / ".config"
+        src_dir.mkdir()
+        (src_dir / "a.conf").write_text("a")
+        (src_dir / "b.conf").write_text("b")
+        mirror = tmp_path / "mirror"
+        previous = mirror / "testhost" / "2020-01-01" / "home" / ".config"
+        FileOperations("testhost").copy_directory(src_dir, previous)
+        today = mirror / "testhost" / time.strftime("%Y-%m-%d") / "home" / ".config"
+        tracker = StatisticsTracker()
+        file_ops = FileOperations("testhost", copy_workers=1, stats_tracker=tracker)
+
+        file_ops.open_snapshot_link(mirror, hostname_subdir=True)
+        results = file_ops.copy_directory(src_dir, today, skip_identical=True)
+        file_ops.close_snapshot_link()
+
+        assert all(ok for _s, _d, ok, _skipped in results)
+        assert (today / "a.conf").stat().st_ino == (previous / "a.conf").stat().st_ino
+        assert tracker.statistics.copy_strategies == {STRATEGY_HARDLINK: 2}
+
+    @pytest.mark.unit
+    def test_find_previous_snapshot_picks_newest_earlier(self, tmp_path: Path) -> None:
+        """Only date-named directories older than today are considered."""
+        root = tmp_path / "testhost"
+        for name in ("2024-01-01", "2024-03-15", "2024-02-10", "2099-01-01", "misc"):
+            (root / name).mkdir(parents=True)
+
+        previous = FileOperations("testhost")._find_previous_snapshot(
+            root, "2025-01-01"
+        )
+
+        assert previous == root / "2024-03-15"
+
+    @pytest.mark.unit
+    def test_no_previous_snapshot(self, tmp_path: Path) -> None:
+        """Without an earlier snapshot, files are copied normally."""
+        src = tmp_path / ".vimrc"
+        src.write_text("set nu")
+        mirror = tmp_path / "mirror"
+        dest = mirror / "testhost" / time.strftime("%Y-%m-%d") / "home" / ".vimrc"
+        file_ops = FileOperations("testhost")
+
+        assert file_ops.open_snapshot_link(mirror, hostname_subdir=True) is None
+        assert file_ops.copy_file(src, dest, skip_identical=True)
+        assert dest.read_text() == "set nu"
+
+    @pytest.mark.unit
+    def test_linked_file_reuses_previous_leaf(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A linked file takes the previous leaf's digest and is not rehashed."""
+        src = tmp_path / ".bashrc"
+        src.write_text("alias ll='ls -l'")
+        mirror = tmp_path / "mirror"
+        previous = _make_previous_snapshot(mirror, src)
+        today = mirror / "testhost" / time.strftime("%Y-%m-%d")
+        file_ops = FileOperations("testhost")
+        file_ops.update_merkle_tree(mirror, True, {previous / "home" / ".bashrc": None})
+        tree = file_ops.load_merkle_tree(mirror, True)
+        digest = tree.digest(f"{previous.name}/home/.bashrc")
+
+        def no_hashing(*_args: object, **_kwargs: object) -> str:
+            raise AssertionError("linked file hashed again")
+
+        monkeypatch.setattr(merkle_tree, "file_digest", no_hashing)
+        file_ops.open_snapshot_link(mirror, hostname_subdir=True, tree=tree)
+        assert file_ops.copy_file(src, today / "home" / ".bashrc", skip_identical=True)
+        file_ops.close_snapshot_link()
+        copy_digest = file_ops.pop_copy_digest(today / "home" / ".bashrc")
+        file_ops.update_merkle_tree(
+            mirror, True, {today / "home" / ".bashrc": copy_digest}
+        )
+
+        assert copy_digest == f"sha256:{digest}"
+        stored = file_ops.load_merkle_tree(mirror, True)
+        assert stored.digest(f"{today.name}/home/.bashrc") == digest
@@ -0,0 +1,175 @@
+"""
+Tests for HashCache - Persistent Content-Hash Cache
+
+Description:
+    Unit tests for the stat-keyed digest cache: persistence across
+    instances, LRU eviction, invalidation on content changes, cached
+    re-verification, and strict content comparison in FileOperations.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+
+from gui import hash_cache as hash_cache_module
+from gui.file_operations import FileOperations
+from gui.hash_cache import HashCache
+from gui.verification_manager import VerificationManager
+
+
+@pytest.fixture(autouse=True)
+def no_racy_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cache files written moments ago by the tests."""
+    monkeypatch.setattr(hash_cache_module, "RACY_WINDOW_NS", 0)
+
+
+def _forbid_hashing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make any cache miss fail the test."""
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("file was hashed despite a cached digest")
+
+    monkeypatch.setattr(hash_cache_module, "digest_open_file", fail)
+
+
+class TestHashCache:
+    """Test suite for the persistent digest cache."""
+
+    @pytest.mark.unit
+    def test_digest_persists_across_instances(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A saved digest is served to a new cache without reading the file."""
+        data = tmp_path / "data.bin"
+        data.write_bytes(os.urandom(10_000))
+        cache_path = tmp_path / "cache" / "hash-cache"
+        first = HashCache(cache_path)
+        digest = first.file_digest(data)
+        assert first.save()
+
+        _forbid_hashing(monkeypatch)
+        second = HashCache(cache_path)
+
+        assert second.file_digest(data) == digest
+        assert digest == hashlib.sha256(data.read_bytes()).hexdigest()
+
+    @pytest.mark.unit
+    def test_changed_file_is_hashed_again(self, tmp_path: Path) -> None:
+        """Rewriting a file with the same size and mtime changes its key."""
+        data = tmp_path / "data.txt"
+        data.write_text("original")
+        cache = HashCache(tmp_path / "hash-cache")
+        cache.file_digest(data)
+        mtime_ns = data.stat().st_mtime_ns
+
+        data.write_text("modified")
+        os.utime(data, ns=(mtime_ns, mtime_ns))
+
+        assert cache.file_digest(data) == hashlib.sha256(b"modified").hexdigest()
+
+    @pytest.mark.unit
+    def test_recently_changed_file_is_not_cached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A file changed within the racy window is hashed but not stored."""
+        monkeypatch.setattr(hash_cache_module, "RACY_WINDOW_NS", 60 * 10**9)
+        data = tmp_path / "data.txt"
+        data.write_text("fresh")
+        cache = HashCache(tmp_path / "hash-cache")
+
+        assert cache.file_digest(data) == hashlib.sha256(b"fresh").hexdigest()
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        """Entries beyond max_entries are dropped oldest-use first."""
+        cache_path = tmp_path / "hash-cache"
+        files = [tmp_path / f"f{i}" for i in range(3)]
+        for path in files:
+            path.write_text(path.name)
+        cache = HashCache(cache_path, max_entries=2)
+        cache.file_digest(files[0])
+        cache.file_digest(files[1])
+        cache.file_digest(files[0])  # f1 is now least recently used
+
+        cache.file_digest(files[2])
+        cache.save()
+        reloaded = HashCache(cache_path, max_entries=2)
+
+        assert len(reloaded) == 2
+        assert reloaded.lookup(files[0].stat()) is not None
+        assert reloaded.lookup(files[1].stat()) is None
+        assert reloaded.lookup(files[2].stat()) is not None
+
+    @pytest.mark.unit
+    def test_corrupt_cache_file_is_replaced(self, tmp_path: Path) -> None:
+        """An unreadable cache starts empty and is rewritten on save."""
+        cache_path = tmp_path / "hash-cache"
+        cache_path.write_bytes(b"not a database" * 100)
+        data = tmp_path / "data.txt"
+        data.write_text("content")
+        cache = HashCache(cache_path)
+
+        assert len(cache) == 0
+        cache.file_digest(data)
+        assert cache.save()
+        assert len(HashCache(cache_path)) == 1
+
+
+class TestCachedVerification:
+    """Test suite for hash verification and strict comparison with the cache."""
+
+    @pytest.mark.unit
+    def test_reverification_only_stats_unchanged_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second verification of unchanged files serves every digest from disk."""
+        pairs: list[tuple[Path, Path]] = []
+        for i in range(5):
+            source = tmp_path / f"src{i}"
+            backup = tmp_path / f"bak{i}"
+            source.write_bytes(os.urandom(4096))
+            backup.write_bytes(source.read_bytes())
+            pairs.append((source, backup))
+        cache_path = tmp_path / "hash-cache"
+        vm = VerificationManager(hash_verification_enabled=True)
+        vm.hash_cache = HashCache(cache_path)
+        vm.verify_backup(tmp_path, pairs)
+
+        _forbid_hashing(monkeypatch)
+        vm.hash_cache = HashCache(cache_path)
+        report = vm.verify_backup(tmp_path, pairs)
+
+        assert report["verified_ok"] == 5
+
+    @pytest.mark.unit
+    def test_strict_compare_detects_same_metadata_different_content(
+        self, tmp_path: Path
+    ) -> None:
+        """Strict mode rejects files whose size and mtime match but contents differ."""
+        src = tmp_path / "src.conf"
+        dest = tmp_path / "dest.conf"
+        src.write_text("value=1")
+        dest.write_text("value=2")
+        mtime_ns = src.stat().st_mtime_ns
+        os.utime(dest, ns=(mtime_ns, mtime_ns))
+        file_ops = FileOperations("testhost")
+
+        assert file_ops.files_are_identical(src, dest)
+
+        file_ops.strict_compare = True
+        assert not file_ops.files_are_identical(src, dest)
+        file_ops.hash_cache = HashCache(tmp_path / "hash-cache")
+        assert not file_ops.files_are_identical(src, dest)
+
+        dest.write_text("value=1")
+        os.utime(dest, ns=(mtime_ns, mtime_ns))
+        assert file_ops.files_are_identical(src, dest)
@@ -0,0 +1,311 @@
+"""
+Tests for Incremental Archives - Snapshot Chains and Chain-Aware Rotation
+
+Description:
+    Unit tests for incremental archive mode: a full base archive followed
+    by archives holding only changed files plus tombstones, new chains at
+    the length limit, rotation that never deletes a base a retained
+    incremental depends on, and single-file restore that follows a chain
+    back to the archive holding the file.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import os
+import tarfile
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from gui.archive_snapshot import (
+    SNAPSHOT_MEMBER_NAME,
+    is_incremental_archive,
+    read_archive_metadata,
+)
+from gui.file_operations import FileOperations
+
+
+# Small dotfile directory created by archive_dotfiles
+pytestmark = pytest.mark.archive_files(
+    {"a.conf": "a.conf", "b.conf": "b.conf", "c.conf": "c.conf"}
+)
+
+
+def _file_members(archive: Path) -> list[str]:
+    """Names of regular file members, without the metadata member."""
+    with tarfile.open(archive) as tar:
+        return sorted(
+            Path(m.name).name
+            for m in tar.getmembers()
+            if m.isfile() and m.name != SNAPSHOT_MEMBER_NAME
+        )
+
+
+class TestIncrementalArchives:
+    """Test suite for incremental archive creation."""
+
+    @pytest.mark.unit
+    def test_second_archive_holds_only_changes(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Changed files are archived and deletions become tombstones."""
+        archives = tmp_path / "archives"
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        base = make_archive(archive_dotfiles, file_ops, archives)
+
+        (archive_dotfiles / "b.conf").write_text("changed content")
+        (archive_dotfiles / "c.conf").unlink()
+        (archive_dotfiles / "d.conf").write_text("new")
+        incremental = make_archive(archive_dotfiles, file_ops, archives)
+
+        assert not is_incremental_archive(base)
+        assert is_incremental_archive(incremental)
+        assert _file_members(base) == ["a.conf", "b.conf", "c.conf"]
+        assert _file_members(incremental) == ["b.conf", "d.conf"]
+        metadata = read_archive_metadata(incremental)
+        assert metadata is not None
+        assert metadata["base"] == base.name
+        assert metadata["parent"] == base.name
+        assert metadata["deleted"] == [str(archive_dotfiles / "c.conf")]
+
+    @pytest.mark.unit
+    def test_symlinked_directory_root_is_one_member(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A symlinked root is tracked as the link, as tar stores it."""
+        archives = tmp_path / "archives"
+        link = tmp_path / "home" / ".config-link"
+        link.symlink_to(archive_dotfiles, target_is_directory=True)
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        base = make_archive(link, file_ops, archives)
+
+        (archive_dotfiles / "b.conf").write_text("changed content")
+        incremental = make_archive(link, file_ops, archives)
+
+        with tarfile.open(base) as tar:
+            member = tar.getmember(str(link).lstrip("/"))
+            assert member.issym()
+        assert is_incremental_archive(incremental)
+        assert _file_members(incremental) == []
+
+    @pytest.mark.unit
+    def test_symlinks_added_inside_tree_reach_the_incremental(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Directory and dangling links created after the base are archived."""
+        archives = tmp_path / "archives"
+        (archive_dotfiles / "themes").mkdir()
+        (archive_dotfiles / "themes" / "dark.conf").write_text("dark")
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        make_archive(archive_dotfiles, file_ops, archives)
+
+        (archive_dotfiles / "current").symlink_to("themes")
+        (archive_dotfiles / "stale").symlink_to("missing.conf")
+        incremental = make_archive(archive_dotfiles, file_ops, archives)
+        restored = file_ops.restore_archive_member(
+            incremental, archive_dotfiles / "current", tmp_path / "out"
+        )
+
+        with tarfile.open(incremental) as tar:
+            links = sorted(Path(m.name).name for m in tar.getmembers() if m.issym())
+        assert links == ["current", "stale"]
+        assert restored is not None
+        assert restored.is_symlink()
+        assert restored.readlink() == Path("themes")
+
+    @pytest.mark.unit
+    def test_file_symlink_is_tracked_by_the_link(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Editing a symlink's target does not re-archive the link."""
+        archives = tmp_path / "archives"
+        (archive_dotfiles / "alias.conf").symlink_to("a.conf")
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        make_archive(archive_dotfiles, file_ops, archives)
+
+        (archive_dotfiles / "a.conf").write_text("changed content")
+        incremental = make_archive(archive_dotfiles, file_ops, archives)
+
+        with tarfile.open(incremental) as tar:
+            names = sorted(
+                Path(m.name).name
+                for m in tar.getmembers()
+                if m.name != SNAPSHOT_MEMBER_NAME
+            )
+        assert names == ["a.conf"]
+
+    @pytest.mark.unit
+    def test_unchanged_run_produces_empty_incremental(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Nothing changed means an incremental with no file members."""
+        archives = tmp_path / "archives"
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        make_archive(archive_dotfiles, file_ops, archives)
+
+        incremental = make_archive(archive_dotfiles, file_ops, archives)
+
+        assert is_incremental_archive(incremental)
+        assert _file_members(incremental) == []
+
+    @pytest.mark.unit
+    def test_chain_limit_starts_new_full_archive(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A chain at its length limit is followed by a new full archive."""
+        archives = tmp_path / "archives"
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        file_ops.incremental_chain_limit = 2
+
+        created = [make_archive(archive_dotfiles, file_ops, archives) for _ in range(3)]
+
+        assert [is_incremental_archive(a) for a in created] == [False, True, False]
+        assert _file_members(created[2]) == ["a.conf", "b.conf", "c.conf"]
+
+    @pytest.mark.unit
+    def test_missing_base_starts_new_full_archive(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """If the chain's base was removed, the next archive is full."""
+        archives = tmp_path / "archives"
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        make_archive(archive_dotfiles, file_ops, archives).unlink()
+
+        archive = make_archive(archive_dotfiles, file_ops, archives)
+
+        assert not is_incremental_archive(archive)
+
+    @pytest.mark.unit
+    def test_disabled_mode_writes_full_archives(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """Without incremental mode every archive is full and no state is kept."""
+        archives = tmp_path / "archives"
+        file_ops = FileOperations("testhost")
+
+        first = make_archive(archive_dotfiles, file_ops, archives)
+        second = make_archive(archive_dotfiles, file_ops, archives)
+
+        assert not is_incremental_archive(first)
+        assert not is_incremental_archive(second)
+        assert _file_members(second) == ["a.conf", "b.conf", "c.conf"]
+
+    @pytest.mark.unit
+    def test_non_object_metadata_is_ignored(self, tmp_path: Path) -> None:
+        """A metadata member that is not a JSON object reads as no metadata."""
+        archive = tmp_path / "foreign.tar.gz"
+        member = tmp_path / "metadata.json"
+        member.write_text("[1, 2, 3]")
+        with tarfile.open(archive, "w:gz") as tar:
+            tar.add(member, arcname=SNAPSHOT_MEMBER_NAME)
+
+        assert read_archive_metadata(archive) is None
+
+
+class TestChainAwareRotation:
+    """Test suite for rotate_archives with incremental chains."""
+
+    @staticmethod
+    def _make_archives(base: Path, names: list[str]) -> None:
+        """Create empty archive files with increasing modification times."""
+        base.mkdir(parents=True, exist_ok=True)
+        for index, name in enumerate(names):
+            path = base / name
+            path.write_bytes(b"")
+            os.utime(path, (1000 + index, 1000 + index))
+
+    @pytest.mark.unit
+    def test_whole_oldest_chain_is_deleted(self, tmp_path: Path) -> None:
+        """The oldest base is deleted together with its incrementals."""
+        names = [
+            "dotfiles-1.tar.gz",
+            "dotfiles-2.incr.tar.gz",
+            "dotfiles-3.incr.tar.gz",
+            "dotfiles-4.tar.gz",
+            "dotfiles-5.incr.tar.gz",
+        ]
+        self._make_archives(tmp_path, names)
+
+        deleted = FileOperations("testhost").rotate_archives(tmp_path, False, 2)
+
+        assert sorted(p.name for p in deleted) == sorted(names[:3])
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names[3:])
+
+    @pytest.mark.unit
+    def test_base_with_retained_incremental_is_kept(self, tmp_path: Path) -> None:
+        """A chain is kept when deleting it would drop below max_archives."""
+        names = [
+            "dotfiles-1.tar.gz",
+            "dotfiles-2.incr.tar.gz",
+            "dotfiles-3.tar.gz",
+            "dotfiles-4.incr.tar.gz",
+        ]
+        self._make_archives(tmp_path, names)
+
+        deleted = FileOperations("testhost").rotate_archives(tmp_path, False, 3)
+
+        assert deleted == []
+
+
+class TestIncrementalRestore:
+    """Test suite for restoring single files from incremental archives."""
+
+    @pytest.mark.unit
+    def test_unchanged_file_is_restored_from_older_archive(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A file absent from an incremental comes from its chain."""
+        archives = tmp_path / "archives"
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        make_archive(archive_dotfiles, file_ops, archives)
+        (archive_dotfiles / "b.conf").write_text("changed content")
+        make_archive(archive_dotfiles, file_ops, archives)
+        (archive_dotfiles / "d.conf").write_text("new")
+        latest = make_archive(archive_dotfiles, file_ops, archives)
+        out = tmp_path / "out"
+
+        restored_a = file_ops.restore_archive_member(
+            latest, archive_dotfiles / "a.conf", out
+        )
+        restored_b = file_ops.restore_archive_member(
+            latest, archive_dotfiles / "b.conf", out
+        )
+
+        assert _file_members(latest) == ["d.conf"]
+        assert restored_a is not None
+        assert restored_a.read_text() == "a.conf"
+        assert restored_b is not None
+        assert restored_b.read_text() == "changed content"
+
+    @pytest.mark.unit
+    def test_tombstone_stops_the_chain_walk(
+        self, archive_dotfiles: Path, tmp_path: Path, make_archive: Callable[..., Path]
+    ) -> None:
+        """A file deleted within the chain is not restored from the base."""
+        archives = tmp_path / "archives"
+        file_ops = FileOperations("testhost")
+        file_ops.incremental_archives = True
+        base = make_archive(archive_dotfiles, file_ops, archives)
+        (archive_dotfiles / "c.conf").unlink()
+        make_archive(archive_dotfiles, file_ops, archives)
+        latest = make_archive(archive_dotfiles, file_ops, archives)
+        out = tmp_path / "out"
+
+        assert (
+            file_ops.restore_archive_member(latest, archive_dotfiles / "c.conf", out)
+            is None
+        )
+        assert file_ops.restore_archive_member(base, archive_dotfiles / "c.conf", out)
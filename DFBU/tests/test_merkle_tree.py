@@ -0,0 +1,247 @@
+"""
+Tests for MerkleTree - Directory Digest Tree of a Mirror
+
+Description:
+    Unit tests for Merkle tree leaves and directory digests, diffs that
+    only descend into changed subtrees, persistence next to the mirror,
+    host-to-host mirror diffs, and verification that hashes only files
+    changed since the last verified tree.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import hashlib
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gui.file_operations import FileOperations
+from gui.merkle_tree import (
+    MERKLE_FILENAME,
+    VERIFIED_MERKLE_FILENAME,
+    MerkleTree,
+    diff_mirrors,
+)
+from gui.verification_manager import VerificationManager
+
+
+def _populate(root: Path, dirs: int = 8, files: int = 8) -> list[Path]:
+    """Create dirs x files small files under root and return their paths."""
+    paths: list[Path] = []
+    for d in range(dirs):
+        for f in range(files):
+            path = root / "home" / f".app{d}" / f"file{f}.conf"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"app{d} setting {f}\n")
+            paths.append(path)
+    return paths
+
+
+def _tree(root: Path, paths: list[Path]) -> MerkleTree:
+    """Tree of root with a leaf for every path."""
+    tree = MerkleTree(root)
+    for path in paths:
+        assert tree.update(path)
+    return tree
+
+
+def _sha256(data: bytes) -> str:
+    """SHA-256 hex digest of data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class TestMerkleTree:
+    """Test suite for Merkle tree digests and diffs."""
+
+    @pytest.mark.unit
+    def test_leaf_change_propagates_only_to_ancestors(self, tmp_path: Path) -> None:
+        """Editing one file changes its ancestors' digests and nothing else."""
+        paths = _populate(tmp_path)
+        tree = _tree(tmp_path, paths)
+        before = {key: tree.digest(key) for key in ("", "home", "home/.app0")}
+        untouched = tree.digest("home/.app1")
+
+        paths[0].write_text("edited\n")
+        tree.update(paths[0])
+
+        assert all(tree.digest(key) != digest for key, digest in before.items())
+        assert tree.digest("home/.app1") == untouched
+        assert tree.digest("home/.app0/file0.conf") == _sha256(b"edited\n")
+
+    @pytest.mark.unit
+    def test_diff_descends_only_into_changed_subtrees(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """One changed file is found by visiting one path, not the whole tree."""
+        paths = _populate(tmp_path)
+        original = _tree(tmp_path, paths)
+        original.save()
+        changed = MerkleTree.load(tmp_path)
+        paths[-1].write_text("edited\n")
+        changed.update(paths[-1])
+
+        visited: list[str] = []
+        node = MerkleTree._node
+
+        def spy(self: MerkleTree, key: str) -> tuple[str, str] | None:
+            visited.append(key)
+            return node(self, key)
+
+        monkeypatch.setattr(MerkleTree, "_node", spy)
+        diff = changed.diff(original)
+
+        assert diff == ["home/.app7/file7.conf"]
+        # root, home, the 8 app dirs, and the 8 files of the changed dir only
+        assert len(set(visited)) == 2 + 8 + 8
+        assert "home/.app0/file0.conf" not in visited
+
+    @pytest.mark.unit
+    def test_diff_reports_added_and_removed_files(self, tmp_path: Path) -> None:
+        """Files on one side only, including whole directories, are reported."""
+        paths = _populate(tmp_path, dirs=2, files=2)
+        first = _tree(tmp_path, paths)
+        second = _tree(tmp_path, paths)
+        second.discard(paths[0])
+        second.discard(paths[1])
+        extra = tmp_path / "home" / ".new" / "rc"
+        extra.parent.mkdir()
+        extra.write_text("new\n")
+        second.update(extra)
+
+        assert second.diff(first) == [
+            "home/.app0/file0.conf",
+            "home/.app0/file1.conf",
+            "home/.new/rc",
+        ]
+        assert second.digest("home/.app0") is None
+
+    @pytest.mark.unit
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Stored trees load with identical digests and no differences."""
+        paths = _populate(tmp_path, dirs=3, files=3)
+        tree = _tree(tmp_path, paths)
+        assert tree.save()
+
+        loaded = MerkleTree.load(tmp_path)
+
+        assert (tmp_path / MERKLE_FILENAME).exists()
+        assert loaded.digest() == tree.digest()
+        assert len(loaded) == 9
+        assert loaded.diff(tree) == []
+
+    @pytest.mark.unit
+    def test_unreadable_tree_loads_empty(self, tmp_path: Path) -> None:
+        """A corrupt tree file is ignored."""
+        (tmp_path / MERKLE_FILENAME).write_text("not json")
+
+        assert len(MerkleTree.load(tmp_path)) == 0
+
+    @pytest.mark.unit
+    def test_update_reuses_copy_digest_and_unchanged_leaves(
+        self, tmp_path: Path
+    ) -> None:
+        """Copy digests are taken as is; unchanged files are not rehashed."""
+        path = tmp_path / "home" / ".rc"
+        path.parent.mkdir()
+        path.write_text("data\n")
+        tree = MerkleTree(tmp_path)
+
+        tree.update(path, f"sha256:{'a' * 64}")
+        assert tree.digest("home/.rc") == "a" * 64
+        tree.update(path)
+        assert tree.digest("home/.rc") == "a" * 64
+
+        path.write_text("other\n")
+        tree.update(path)
+        assert tree.digest("home/.rc") == _sha256(b"other\n")
+
+    @pytest.mark.unit
+    def test_update_without_hash_missing_drops_leaf(self, tmp_path: Path) -> None:
+        """Without hash_missing a changed file leaves the tree unhashed."""
+        path = tmp_path / "home" / ".rc"
+        path.parent.mkdir()
+        path.write_text("data\n")
+        tree = MerkleTree(tmp_path)
+        tree.update(path)
+
+        path.write_text("other\n")
+
+        assert tree.update(path, hash_missing=False) is False
+        assert tree.leaf("home/.rc") is None
+
+    @pytest.mark.unit
+    def test_diff_mirrors_between_hosts(self, tmp_path: Path) -> None:
+        """Mirrors of two hosts are compared through their stored trees."""
+        for host in ("alpha", "beta"):
+            _populate(tmp_path / host, dirs=2, files=2)
+        (tmp_path / "beta" / "home" / ".app1" / "file0.conf").write_text("beta\n")
+        file_ops = FileOperations("alpha")
+        for host in ("alpha", "beta"):
+            backed_up = dict.fromkeys((tmp_path / host).rglob("*.conf"))
+            file_ops.update_merkle_tree(tmp_path / host, False, backed_up)
+
+        assert diff_mirrors(tmp_path / "alpha", tmp_path / "beta") == [
+            "home/.app1/file0.conf"
+        ]
+
+
+class TestMerkleVerification:
+    """Test suite for verification limited to changed subtrees."""
+
+    @pytest.mark.unit
+    def test_only_changed_files_are_hashed(self, tmp_path: Path) -> None:
+        """After a verified run, only files changed in the tree are hashed."""
+        mirror = tmp_path / "mirror"
+        sources = _populate(tmp_path / "src", dirs=2, files=3)
+        pairs = []
+        for source in sources:
+            backup = mirror / source.relative_to(tmp_path / "src")
+            backup.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, backup)
+            pairs.append((source, backup))
+        file_ops = FileOperations("testhost")
+        vm = VerificationManager(hash_verification_enabled=True, workers=1)
+
+        def verify() -> int:
+            file_ops.update_merkle_tree(
+                mirror, False, dict.fromkeys(b for _, b in pairs)
+            )
+            report = vm.verify_backup(
+                mirror, pairs, tree=file_ops.load_merkle_tree(mirror, False)
+            )
+            assert report["verified_failed"] == 0
+            return report["hash_checked"]
+
+        assert verify() == 6
+        assert (mirror / VERIFIED_MERKLE_FILENAME).exists()
+        assert verify() == 0
+
+        sources[4].write_text("changed\n")
+        shutil.copy2(sources[4], pairs[4][1])
+        assert verify() == 1
+        assert verify() == 0
+
+    @pytest.mark.unit
+    def test_failed_file_stays_unverified(self, tmp_path: Path) -> None:
+        """A file failing hash verification is hashed again on the next run."""
+        mirror = tmp_path / "mirror"
+        source = tmp_path / "src" / ".rc"
+        source.parent.mkdir()
+        source.write_text("source\n")
+        backup = mirror / ".rc"
+        mirror.mkdir()
+        backup.write_text("backup\n")
+        tree = MerkleTree(mirror)
+        tree.update(backup)
+        vm = VerificationManager(hash_verification_enabled=True, workers=1)
+
+        first = vm.verify_backup(mirror, [(source, backup)], tree=tree)
+        second = vm.verify_backup(mirror, [(source, backup)], tree=tree)
+
+        assert first["verified_failed"] == second["verified_failed"] == 1
+        assert second["hash_checked"] == 1
@@ -0,0 +1,203 @@
+"""
+Tests for MirrorIndex - Persistent Mirror Manifest
+
+Description:
+    Unit tests for the SQLite mirror index and its use by FileOperations
+    to skip unchanged files without stat-ing the mirror.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gui.file_operations import FileOperations
+from gui.mirror_index import INDEX_FILENAME, MirrorIndex
+
+
+class TestMirrorIndex:
+    """Test suite for MirrorIndex persistence and matching."""
+
+    @pytest.mark.unit
+    def test_record_save_and_reload(self, tmp_path: Path) -> None:
+        """Recorded entries survive a save/load cycle."""
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+        root = tmp_path / "mirror"
+        index = MirrorIndex(root)
+        index.record(root / "home" / "src.txt", src.stat(), digest="abc")
+
+        assert index.save() is True
+        reloaded = MirrorIndex(root)
+        reloaded.load()
+
+        rec = reloaded.lookup(root / "home" / "src.txt")
+        assert rec is not None
+        assert rec.size == 4
+        assert rec.mtime_ns == src.stat().st_mtime_ns
+        assert rec.inode == src.stat().st_ino
+        assert rec.digest == "abc"
+        assert (root / INDEX_FILENAME).exists()
+
+    @pytest.mark.unit
+    def test_matches_detects_changes(self, tmp_path: Path) -> None:
+        """matches returns True/False for indexed files and None otherwise."""
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+        root = tmp_path / "mirror"
+        dest = root / "src.txt"
+        index = MirrorIndex(root)
+        index.record(dest, src.stat())
+
+        assert index.matches(dest, src.stat()) is True
+        src.write_text("changed data")
+        assert index.matches(dest, src.stat()) is False
+        assert index.matches(root / "other.txt", src.stat()) is None
+
+    @pytest.mark.unit
+    def test_discard_removes_entry_on_save(self, tmp_path: Path) -> None:
+        """Discarded entries are deleted from the manifest."""
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+        root = tmp_path / "mirror"
+        index = MirrorIndex(root)
+        index.record(root / "a.txt", src.stat())
+        index.record(root / "b.txt", src.stat())
+        index.save()
+
+        index.discard(root / "a.txt")
+        index.save()
+        reloaded = MirrorIndex(root)
+        reloaded.load()
+
+        assert reloaded.lookup(root / "a.txt") is None
+        assert reloaded.lookup(root / "b.txt") is not None
+
+    @pytest.mark.unit
+    def test_corrupt_index_is_replaced(self, tmp_path: Path) -> None:
+        """An unreadable manifest loads empty and is recreated on save."""
+        root = tmp_path / "mirror"
+        root.mkdir()
+        (root / INDEX_FILENAME).write_bytes(b"not a database" * 100)
+        src = tmp_path / "src.txt"
+        src.write_text("data")
+        index = MirrorIndex(root)
+
+        index.load()
+        index.record(root / "src.txt", src.stat())
+
+        assert len(index) == 1
+        assert index.save() is True
+        reloaded = MirrorIndex(root)
+        reloaded.load()
+        assert len(reloaded) == 1
+
+    @pytest.mark.unit
+    def test_rebuild_indexes_mirror_files(self, tmp_path: Path) -> None:
+        """rebuild records every mirror file except the index itself."""
+        root = tmp_path / "mirror"
+        (root / "home" / ".config").mkdir(parents=True)
+        (root / "home" / ".bashrc").write_text("bash")
+        (root / "home" / ".config" / "app.conf").write_text("conf")
+        MirrorIndex(root).save()
+
+        index = MirrorIndex(root)
+        count = index.rebuild()
+
+        assert count == 2
+        assert index.lookup(root / "home" / ".bashrc") is not None
+        assert index.lookup(root / INDEX_FILENAME) is None
+
+
+class TestFileOperationsMirrorIndex:
+    """Test suite for FileOperations skip decisions backed by the index."""
+
+    @pytest.mark.unit
+    def test_unchanged_files_skip_destination_stat(self, tmp_path: Path) -> None:
+        """With the index open, unchanged files need no stat on the mirror."""
+        src_dir = tmp_path / "source"
+        src_dir.mkdir()
+        for i in range(5):
+            (src_dir / f"file{i}.txt").write_text(f"content {i}")
+        mirror = tmp_path / "mirror"
+        dest_dir = mirror / "testhost" / "home" / "source"
+        file_ops = FileOperations("testhost", copy_workers=1)
+        file_ops.open_mirror_index(mirror, hostname_subdir=True)
+        file_ops.copy_directory(src_dir, dest_dir)
+        file_ops.close_mirror_index()
+
+        file_ops.open_mirror_index(mirror, hostname_subdir=True)
+        with patch.object(Path, "stat", autospec=True) as mock_stat:
+            results = file_ops.copy_directory(src_dir, dest_dir, skip_identical=True)
+        file_ops.close_mirror_index()
+
+        assert all(skipped for _s, _d, _ok, skipped in results)
+        mock_stat.assert_not_called()
+
+    @pytest.mark.unit
+    def test_changed_file_is_copied(self, tmp_path: Path) -> None:
+        """A source change recorded against the index triggers a copy."""
+        src = tmp_path / "source.txt"
+        src.write_text("old")
+        mirror = tmp_path / "mirror"
+        dest = mirror / "home" / "source.txt"
+        file_ops = FileOperations("testhost")
+        file_ops.open_mirror_index(mirror, hostname_subdir=False)
+        file_ops.copy_file(src, dest)
+
+        src.write_text("new content")
+        os.utime(src, ns=(0, src.stat().st_mtime_ns + 5_000_000_000))
+
+        assert file_ops.files_are_identical(src, dest) is False
+        assert file_ops.copy_file(src, dest, skip_identical=True) is True
+        assert dest.read_text() == "new content"
+        file_ops.close_mirror_index()
+
+    @pytest.mark.unit
+    def test_unindexed_mirror_file_is_adopted(self, tmp_path: Path) -> None:
+        """Identical files already in the mirror are added to the index."""
+        src = tmp_path / "source.txt"
+        src.write_text("data")
+        mirror = tmp_path / "mirror"
+        dest = mirror / "source.txt"
+        FileOperations("testhost").copy_file(src, dest)
+        file_ops = FileOperations("testhost")
+        file_ops.open_mirror_index(mirror, hostname_subdir=False)
+
+        assert file_ops.files_are_identical(src, dest) is True
+        index = file_ops.mirror_index
+        assert index is not None
+        assert index.lookup(dest) is not None
+
+    @pytest.mark.unit
+    def test_rebuild_mirror_index_returns_count(self, tmp_path: Path) -> None:
+        """rebuild_mirror_index indexes the host mirror directory."""
+        host_dir = tmp_path / "mirror" / "testhost" / "home"
+        host_dir.mkdir(parents=True)
+        (host_dir / ".vimrc").write_text("set nu")
+        file_ops = FileOperations("testhost")
+
+        count = file_ops.rebuild_mirror_index(tmp_path / "mirror", True)
+
+        assert count == 1
+        assert (tmp_path / "mirror" / "testhost" / INDEX_FILENAME).exists()
+
+    @pytest.mark.unit
+    def test_restore_discovery_ignores_index(self, tmp_path: Path) -> None:
+        """The index file is never offered for restore."""
+        host_dir = tmp_path / "mirror" / "testhost"
+        (host_dir / "home").mkdir(parents=True)
+        (host_dir / "home" / ".vimrc").write_text("set nu")
+        file_ops = FileOperations("testhost")
+        file_ops.rebuild_mirror_index(tmp_path / "mirror", True)
+
+        files = file_ops.discover_restore_files(host_dir)
+
+        assert files == [host_dir / "home" / ".vimrc"]
@@ -0,0 +1,177 @@
+"""
+Tests for ScanSnapshot - Shared Source Tree Snapshot
+
+Description:
+    Unit tests for the scan snapshot shared by size analysis, preview,
+    path validation, and the mirror copy: consumers read a fresh snapshot
+    instead of walking again, and the snapshot is dropped when its TTL
+    expires, its generation is invalidated, or exclusions change.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+from pathlib import Path
+
+import pytest
+
+from gui import file_operations, preview_generator, scan_snapshot
+from gui.backup_orchestrator import BackupOrchestrator
+from gui.exclusion import compile_exclusions
+from gui.file_operations import FileOperations
+from gui.model import DFBUModel
+from gui.preview_generator import PreviewGenerator
+from gui.scan_snapshot import ScanCache
+from gui.statistics_tracker import StatisticsTracker
+
+
+def _no_walk(*_args: object, **_kwargs: object) -> None:
+    """Fail the test if a consumer walks the tree again."""
+    raise AssertionError("tree walked despite a fresh scan snapshot")
+
+
+@pytest.fixture
+def source_tree(tmp_path: Path) -> Path:
+    """Create a small config directory with a nested file and a cache dir."""
+    root = tmp_path / "src" / ".config" / "app"
+    (root / "sub").mkdir(parents=True)
+    (root / "cache").mkdir()
+    (root / "app.conf").write_text("a = 1\n")
+    (root / "sub" / "theme.conf").write_text("dark\n")
+    (root / "cache" / "blob.bin").write_bytes(b"\0" * 64)
+    return root
+
+
+class TestScanConsumers:
+    """Test suite for consumers reading the shared snapshot."""
+
+    @pytest.mark.unit
+    def test_consumers_do_not_walk_again(
+        self, tmp_path: Path, source_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Size, preview, validation, and copy all reuse one walk."""
+        file_ops = FileOperations(hostname="testhost")
+        snapshot = file_ops.scan_paths([source_tree])
+        assert snapshot is not None
+        assert snapshot.file_count == 3
+        monkeypatch.setattr(file_operations, "walk_files", _no_walk)
+        monkeypatch.setattr(preview_generator, "walk_files", _no_walk)
+
+        size = file_ops.calculate_path_size(source_tree)
+        preview = PreviewGenerator(file_ops, tmp_path / "mirror").generate_preview(
+            [{"application": "App", "paths": [str(source_tree)], "enabled": True}],
+            hostname_subdir=False,
+            date_subdir=False,
+        )
+        orchestrator = BackupOrchestrator(
+            file_ops, StatisticsTracker(), tmp_path / "mirror", tmp_path / "archive"
+        )
+        validation = orchestrator.validate_dotfile_paths(
+            [{"description": "App", "paths": [str(source_tree)]}],
+            snapshot,
+        )
+        results = file_ops.copy_directory(source_tree, tmp_path / "dest")
+
+        assert size == 6 + 5 + 64
+        assert preview["new_count"] == 3
+        assert validation[0] == (True, True, "Directory")
+        assert all(copied for _, _, copied, _ in results)
+        assert (tmp_path / "dest" / "sub" / "theme.conf").read_text() == "dark\n"
+
+    @pytest.mark.unit
+    def test_other_exclusions_do_not_use_snapshot(self, source_tree: Path) -> None:
+        """A snapshot walked with other exclusions is not handed out."""
+        file_ops = FileOperations(hostname="testhost")
+        file_ops.scan_paths([source_tree])
+
+        file_ops.exclusions = compile_exclusions(("cache/",))
+
+        assert file_ops.scanned(source_tree) is None
+        assert file_ops.calculate_path_size(source_tree) == 6 + 5
+
+    @pytest.mark.unit
+    def test_excluded_root_is_not_walked(self, source_tree: Path) -> None:
+        """An excluded dotfile path is recorded without a ScanRoot."""
+        file_ops = FileOperations(hostname="testhost")
+        file_ops.exclusions = compile_exclusions(("cache/",))
+
+        snapshot = file_ops.scan_paths([source_tree, source_tree / "cache"])
+
+        assert snapshot is not None
+        assert snapshot.excluded == frozenset({source_tree / "cache"})
+        assert snapshot.get(source_tree / "cache") is None
+        assert snapshot.file_count == 2
+
+
+class TestScanCache:
+    """Test suite for snapshot expiry and invalidation."""
+
+    @pytest.mark.unit
+    def test_snapshot_expires_after_ttl(
+        self, source_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A snapshot older than ttl is dropped and the next scan walks again."""
+        clock = [100.0]
+        monkeypatch.setattr("gui.scan_snapshot.time.monotonic", lambda: clock[0])
+        cache = ScanCache(ttl=30)
+        exclusions = compile_exclusions(())
+        first = cache.scan([source_tree], exclusions)
+
+        clock[0] += 29
+        assert cache.scan([source_tree], exclusions) is first
+        clock[0] += 2
+        assert cache.current(exclusions) is None
+        assert cache.scan([source_tree], exclusions) is not first
+
+    @pytest.mark.unit
+    def test_invalidate_during_scan_discards_result(
+        self, source_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A walk that races invalidate() is returned but not kept."""
+        cache = ScanCache()
+        exclusions = compile_exclusions(())
+        real_scan_root = scan_snapshot.scan_root
+
+        def racing_scan_root(*args: object) -> object:
+            cache.invalidate()
+            return real_scan_root(*args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(scan_snapshot, "scan_root", racing_scan_root)
+
+        snapshot = cache.scan([source_tree], exclusions)
+
+        assert snapshot is not None
+        assert cache.generation == 1
+        assert cache.current(exclusions) is None
+
+    @pytest.mark.unit
+    def test_zero_ttl_disables_cache(self, source_tree: Path) -> None:
+        """With ttl 0 nothing is scanned up front."""
+        cache = ScanCache(ttl=0)
+
+        assert cache.scan([source_tree], compile_exclusions(())) is None
+
+
+class TestModelScan:
+    """Test suite for the model's scan lifecycle."""
+
+    @pytest.mark.unit
+    def test_size_scan_snapshot_is_invalidated_by_edits(
+        self, tmp_path: Path, source_tree: Path
+    ) -> None:
+        """The size scan leaves a snapshot; editing dotfiles drops it."""
+        model = DFBUModel(tmp_path / "config.toml")
+        model.add_dotfile("Test", "App", "", [str(source_tree)])
+
+        report = model.analyze_backup_size()
+
+        assert report["total_size_bytes"] == 6 + 5 + 64
+        assert model.validate_dotfile_paths()[0][0] is True
+        assert model._file_ops.scanned(source_tree) is not None
+
+        model.add_dotfile("Test", "Other", "", [str(tmp_path / "missing")])
+
+        assert model._file_ops.scanned(source_tree) is None
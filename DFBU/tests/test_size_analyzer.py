@@ -23,6 +23,12 @@ from gui.size_analyzer import (
     DEFAULT_WARNING_THRESHOLD_MB,
     SizeAnalyzer,
 )
+from gui.size_calculator import DiskUsage
+
+
+def _usage(size_bytes: int) -> DiskUsage:
+    """Disk usage of a fully allocated path of size_bytes."""
+    return DiskUsage(apparent=size_bytes, allocated=size_bytes, files=1)
 
 
 @pytest.fixture
@@ -30,7 +36,7 @@ def mock_file_ops() -> MagicMock:
     """Create a mock FileOperationsProtocol."""
     mock = MagicMock()
     mock.expand_path.side_effect = lambda p: Path(p).expanduser()
-    mock.calculate_path_size.return_value = 0
+    mock.calculate_disk_usage.return_value = _usage(0)
     return mock
 
 
@@ -233,7 +239,7 @@ class TestAnalyzeDotfiles:
         test_path = tmp_path / ".bashrc"
         test_path.touch()
         mock_file_ops.expand_path.return_value = test_path
-        mock_file_ops.calculate_path_size.return_value = 1 * BYTES_PER_MB
+        mock_file_ops.calculate_disk_usage.return_value = _usage(1 * BYTES_PER_MB)
 
         dotfiles: list[DotFileDict] = [
             {"description": "Bash", "paths": [str(test_path)]}
@@ -254,7 +260,7 @@ class TestAnalyzeDotfiles:
         test_path = tmp_path / ".config/bigapp"
         test_path.mkdir(parents=True)
         mock_file_ops.expand_path.return_value = test_path
-        mock_file_ops.calculate_path_size.return_value = 50 * BYTES_PER_MB
+        mock_file_ops.calculate_disk_usage.return_value = _usage(50 * BYTES_PER_MB)
 
         dotfiles: list[DotFileDict] = [
             {"description": "BigApp", "paths": [str(test_path)]}
@@ -275,7 +281,7 @@ class TestAnalyzeDotfiles:
         test_path = tmp_path / ".mozilla"
         test_path.mkdir(parents=True)
         mock_file_ops.expand_path.return_value = test_path
-        mock_file_ops.calculate_path_size.return_value = 2048 * BYTES_PER_MB
+        mock_file_ops.calculate_disk_usage.return_value = _usage(2048 * BYTES_PER_MB)
 
         dotfiles: list[DotFileDict] = [
             {"description": "Firefox", "paths": [str(test_path)]}
@@ -293,7 +299,7 @@ class TestAnalyzeDotfiles:
         test_path = tmp_path / ".bashrc"
         test_path.touch()
         mock_file_ops.expand_path.return_value = test_path
-        mock_file_ops.calculate_path_size.return_value = 1000
+        mock_file_ops.calculate_disk_usage.return_value = _usage(1000)
 
         progress_values: list[int] = []
         callback = lambda p: progress_values.append(p)
@@ -317,13 +323,13 @@ class TestAnalyzeDotfiles:
         path2.touch()
 
         # Mock different sizes for each path
-        def mock_size(path: Path) -> int:
+        def mock_size(path: Path) -> DiskUsage:
             if "large" in str(path):
-                return int(200 * BYTES_PER_MB)  # Alert level
-            return int(50 * BYTES_PER_MB)  # Warning level
+                return _usage(200 * BYTES_PER_MB)  # Alert level
+            return _usage(50 * BYTES_PER_MB)  # Warning level
 
         mock_file_ops.expand_path.side_effect = lambda p: Path(p)
-        mock_file_ops.calculate_path_size.side_effect = mock_size
+        mock_file_ops.calculate_disk_usage.side_effect = mock_size
 
         dotfiles: list[DotFileDict] = [
             {"description": "Small", "paths": [str(path1)]},
@@ -358,7 +364,7 @@ class TestFormatReport:
         test_path = tmp_path / ".bigdir"
         test_path.mkdir()
         mock_file_ops.expand_path.return_value = test_path
-        mock_file_ops.calculate_path_size.return_value = 150 * BYTES_PER_MB
+        mock_file_ops.calculate_disk_usage.return_value = _usage(150 * BYTES_PER_MB)
 
         dotfiles: list[DotFileDict] = [
             {"description": "BigDir", "paths": [str(test_path)]}
@@ -392,7 +398,7 @@ class TestEdgeCases:
     ) -> None:
         """Non-existent paths are skipped gracefully."""
         mock_file_ops.expand_path.return_value = Path("/nonexistent/path")
-        mock_file_ops.calculate_path_size.return_value = 0
+        mock_file_ops.calculate_disk_usage.return_value = _usage(0)
 
         dotfiles: list[DotFileDict] = [
             {"description": "Missing", "paths": ["/nonexistent/path"]}
@@ -410,7 +416,7 @@ class TestEdgeCases:
         test_path = tmp_path / ".bashrc"
         test_path.touch()
         mock_file_ops.expand_path.return_value = test_path
-        mock_file_ops.calculate_path_size.return_value = 1000
+        mock_file_ops.calculate_disk_usage.return_value = _usage(1000)
 
         # Use 'path' instead of 'paths'
         dotfiles: list[DotFileDict] = [{"description": "Bash", "path": str(test_path)}]
@@ -0,0 +1,148 @@
+"""
+Tests for SizeCache - Persistent Per-Directory Size Cache
+
+Description:
+    Unit tests for the directory size cache: unchanged directories are
+    answered from their records, changed directories are listed again,
+    records survive a save/load round trip, and changed exclusion
+    patterns or racy directories are never served from the cache.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from gui import size_cache
+from gui.exclusion import compile_exclusions
+from gui.file_operations import FileOperations
+from gui.size_cache import DirSizeCache
+from gui.size_calculator import disk_usage
+
+
+NO_EXCLUSIONS = compile_exclusions(())
+
+
+@pytest.fixture(autouse=True)
+def no_racy_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Cache directories created moments ago, as if they were old."""
+    monkeypatch.setattr(size_cache, "RACY_WINDOW_NS", 0)
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Create a config tree with nested directories and a hardlink."""
+    root = tmp_path / ".config"
+    for name in ("app/themes", "tool", "cache"):
+        (root / name).mkdir(parents=True)
+    (root / "app" / "app.conf").write_bytes(b"a" * 100)
+    (root / "app" / "themes" / "dark.css").write_bytes(b"d" * 1000)
+    (root / "tool" / "tool.ini").write_bytes(b"t" * 10)
+    (root / "cache" / "blob.bin").write_bytes(b"c" * 5000)
+    os.link(root / "app" / "app.conf", root / "tool" / "app.conf")
+    return root
+
+
+class TestDirSizeCache:
+    """Test suite for DirSizeCache."""
+
+    @pytest.mark.unit
+    def test_unchanged_tree_is_answered_from_records(
+        self, tmp_path: Path, tree: Path
+    ) -> None:
+        """A second calculation lists no directory and matches disk_usage."""
+        cache = DirSizeCache(tmp_path / "size-cache")
+        first = cache.disk_usage(tree, NO_EXCLUSIONS, workers=4)
+        listed = cache.misses
+
+        second = cache.disk_usage(tree, NO_EXCLUSIONS, workers=4)
+
+        assert first == second == disk_usage(tree)
+        assert first.apparent == 6110
+        assert listed == 5
+        assert cache.misses == listed
+        assert cache.hits == 5
+
+    @pytest.mark.unit
+    def test_only_changed_directory_is_listed(self, tmp_path: Path, tree: Path) -> None:
+        """Adding a file re-lists its directory only; removed subtrees vanish."""
+        cache = DirSizeCache(tmp_path / "size-cache")
+        cache.disk_usage(tree, NO_EXCLUSIONS)
+        (tree / "app" / "themes" / "light.css").write_bytes(b"l" * 400)
+        for child in (tree / "cache").iterdir():
+            child.unlink()
+        (tree / "cache").rmdir()
+        misses = cache.misses
+
+        usage = cache.disk_usage(tree, NO_EXCLUSIONS)
+
+        assert usage == disk_usage(tree)
+        assert usage.apparent == 6110 + 400 - 5000
+        # The root (cache removed) and themes (light.css added) changed
+        assert cache.misses - misses == 2
+
+    @pytest.mark.unit
+    def test_records_survive_save_and_load(self, tmp_path: Path, tree: Path) -> None:
+        """A new cache instance reuses the records written by save()."""
+        cache = DirSizeCache(tmp_path / "size-cache")
+        expected = cache.disk_usage(tree, NO_EXCLUSIONS)
+        assert cache.save() is True
+
+        reloaded = DirSizeCache(tmp_path / "size-cache")
+
+        assert reloaded.disk_usage(tree, NO_EXCLUSIONS) == expected
+        assert expected.largest_files[0] == (5000, str(tree / "cache" / "blob.bin"))
+        assert reloaded.misses == 0
+        assert len(reloaded) == 5
+
+    @pytest.mark.unit
+    def test_changed_patterns_clear_records(self, tmp_path: Path, tree: Path) -> None:
+        """Records built with other exclusions are not reused."""
+        cache = DirSizeCache(tmp_path / "size-cache")
+        cache.disk_usage(tree, NO_EXCLUSIONS)
+        exclusions = compile_exclusions(("cache/",))
+
+        usage = cache.disk_usage(tree, exclusions)
+
+        assert usage == disk_usage(tree, exclusions.matches)
+        assert usage.apparent == 1110
+        assert cache.hits == 0
+
+    @pytest.mark.unit
+    def test_racy_directories_are_not_cached(
+        self, tmp_path: Path, tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Directories changed within the racy window are listed every time."""
+        monkeypatch.setattr(size_cache, "RACY_WINDOW_NS", 3600 * 10**9)
+        cache = DirSizeCache(tmp_path / "size-cache")
+
+        cache.disk_usage(tree, NO_EXCLUSIONS)
+
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_corrupt_cache_file_is_replaced(self, tmp_path: Path, tree: Path) -> None:
+        """An unreadable cache file is discarded and rewritten."""
+        path = tmp_path / "size-cache"
+        path.write_bytes(b"not a database")
+        cache = DirSizeCache(path)
+
+        assert cache.disk_usage(tree, NO_EXCLUSIONS) == disk_usage(tree)
+        assert cache.save() is True
+        assert len(DirSizeCache(path)) == 5
+
+    @pytest.mark.unit
+    def test_file_operations_use_the_cache(self, tmp_path: Path, tree: Path) -> None:
+        """calculate_path_size goes through the size cache when one is set."""
+        file_ops = FileOperations(hostname="testhost")
+        file_ops.size_cache = DirSizeCache(tmp_path / "size-cache")
+
+        assert file_ops.calculate_path_size(tree) == 6110
+        assert file_ops.calculate_path_size(tree) == 6110
+        assert file_ops.size_cache.hits == 5
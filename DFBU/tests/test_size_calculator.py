@@ -0,0 +1,185 @@
+"""
+Tests for SizeCalculator - Parallel du-Style Size Calculation
+
+Description:
+    Unit tests for the parallel size calculator: apparent and allocated
+    sizes, hardlinks counted once across worker threads, exclusions and
+    symlinked directories, sparse files no longer reaching the critical
+    size threshold, and the largest files and subdirectories reported
+    for large items.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from core.common_types import DotFileDict
+
+from gui.exclusion import compile_exclusions
+from gui.file_operations import FileOperations
+from gui.scan_snapshot import scan_root
+from gui.size_analyzer import BYTES_PER_MB, SizeAnalyzer
+from gui.size_calculator import TOP_ENTRIES, DiskUsage, disk_usage
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Create a tree with files in the root and in three subdirectories."""
+    root = tmp_path / "tree"
+    for name in ("a", "b", "c/deep"):
+        (root / name).mkdir(parents=True)
+    (root / "top.txt").write_bytes(b"t" * 10)
+    (root / "a" / "one.txt").write_bytes(b"1" * 100)
+    (root / "b" / "two.txt").write_bytes(b"2" * 1000)
+    (root / "c" / "deep" / "three.txt").write_bytes(b"3" * 10000)
+    return root
+
+
+class TestDiskUsage:
+    """Test suite for disk_usage."""
+
+    @pytest.mark.unit
+    def test_parallel_matches_serial(self, tree: Path) -> None:
+        """Fanning out subdirectories gives the same totals as a serial walk."""
+        parallel = disk_usage(tree, workers=4)
+
+        assert parallel == disk_usage(tree, workers=1)
+        assert parallel.apparent == 11110
+        assert parallel.files == 4
+        assert parallel.allocated == sum(
+            p.stat().st_blocks * 512 for p in tree.rglob("*") if p.is_file()
+        )
+
+    @pytest.mark.unit
+    def test_hardlinks_counted_once_across_subtrees(self, tree: Path) -> None:
+        """An inode linked from two subtrees (two threads) is counted once."""
+        os.link(tree / "a" / "one.txt", tree / "b" / "one-link.txt")
+        os.link(tree / "a" / "one.txt", tree / "one-link.txt")
+
+        usage = disk_usage(tree, workers=4)
+
+        assert usage.apparent == 11110
+        assert usage.files == 4
+
+    @pytest.mark.unit
+    def test_exclusions_and_symlinked_dirs_are_skipped(
+        self, tmp_path: Path, tree: Path
+    ) -> None:
+        """Excluded subtrees and symlinked directories are not counted."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "big.bin").write_bytes(b"x" * 50000)
+        (tree / "linked").symlink_to(outside, target_is_directory=True)
+        exclusions = compile_exclusions(("c/",))
+
+        usage = disk_usage(tree, exclusions.matches, workers=4)
+
+        assert (usage.apparent, usage.files) == (1110, 3)
+        assert all("/c/" not in path for _, path in usage.largest_files)
+
+    @pytest.mark.unit
+    def test_missing_path_is_empty(self, tmp_path: Path) -> None:
+        """A path that does not exist has no usage."""
+        assert disk_usage(tmp_path / "missing") == DiskUsage()
+
+
+class TestLargestEntries:
+    """Test suite for the largest files and subdirectories."""
+
+    @pytest.mark.unit
+    def test_largest_files_and_dirs(self, tree: Path) -> None:
+        """Files and top-level subdirectories are ranked largest first."""
+        usage = disk_usage(tree, workers=4)
+
+        assert usage == disk_usage(tree, workers=1)
+        assert [size for size, _ in usage.largest_files] == [10000, 1000, 100, 10]
+        assert usage.largest_files[0][1] == str(tree / "c" / "deep" / "three.txt")
+        assert usage.largest_dirs == (
+            (10000, str(tree / "c")),
+            (1000, str(tree / "b")),
+            (100, str(tree / "a")),
+        )
+
+    @pytest.mark.unit
+    def test_heap_is_bounded(self, tree: Path) -> None:
+        """Only TOP_ENTRIES files are kept, the smallest ones dropped."""
+        for i in range(TOP_ENTRIES + 5):
+            (tree / "a" / f"extra{i}.bin").write_bytes(b"x" * (200 + i))
+
+        usage = disk_usage(tree, workers=4)
+
+        assert len(usage.largest_files) == TOP_ENTRIES
+        # three.txt, two.txt, then the eight largest extras (214 down to 207)
+        assert usage.largest_files[-1][0] == 207
+        assert usage.files == 4 + TOP_ENTRIES + 5
+
+    @pytest.mark.unit
+    def test_snapshot_matches_walk(self, tree: Path) -> None:
+        """A scan snapshot reports the same usage as a fresh walk."""
+        root = scan_root(tree, compile_exclusions(()))
+
+        assert root is not None
+        assert root.usage == disk_usage(tree)
+
+    @pytest.mark.unit
+    def test_report_lists_largest_entries(self, tmp_path: Path) -> None:
+        """Large directories carry their largest files and subdirectories."""
+        cache = tmp_path / ".cache"
+        (cache / "thumbs").mkdir(parents=True)
+        (cache / "thumbs" / "big.bin").write_bytes(b"b" * 2 * BYTES_PER_MB)
+        (cache / "small.txt").write_bytes(b"s" * 10)
+        analyzer = SizeAnalyzer(
+            FileOperations(hostname="testhost"),
+            warning_threshold_mb=1,
+            alert_threshold_mb=100,
+            critical_threshold_mb=1000,
+        )
+        dotfiles: list[DotFileDict] = [{"description": "Cache", "paths": [str(cache)]}]
+
+        report = analyzer.analyze_dotfiles(dotfiles)
+        log_text = analyzer.format_report_for_log(report)
+
+        item = report["large_items"][0]
+        assert item["largest_dirs"] == [
+            {"path": str(cache / "thumbs"), "size_bytes": 2 * BYTES_PER_MB}
+        ]
+        assert item["largest_files"][0]["path"] == str(cache / "thumbs" / "big.bin")
+        assert "Largest folders:" in log_text
+        assert str(cache / "thumbs" / "big.bin") in log_text
+
+
+class TestSparseFiles:
+    """Test suite for sparse files in size analysis."""
+
+    @pytest.mark.unit
+    def test_sparse_file_is_not_critical(self, tmp_path: Path) -> None:
+        """A sparse file is judged by its allocated blocks, not st_size."""
+        sparse = tmp_path / ".local" / "disk.img"
+        sparse.parent.mkdir()
+        with sparse.open("wb") as f:
+            f.truncate(64 * BYTES_PER_MB)
+        if sparse.stat().st_blocks * 512 >= BYTES_PER_MB:
+            pytest.skip("filesystem does not support sparse files")
+        file_ops = FileOperations(hostname="testhost")
+        analyzer = SizeAnalyzer(
+            file_ops,
+            warning_threshold_mb=1,
+            alert_threshold_mb=2,
+            critical_threshold_mb=4,
+        )
+        dotfiles: list[DotFileDict] = [
+            {"description": "VM", "paths": [str(sparse.parent)]}
+        ]
+
+        report = analyzer.analyze_dotfiles(dotfiles)
+
+        assert report["total_size_bytes"] == 64 * BYTES_PER_MB
+        assert report["total_allocated_bytes"] < BYTES_PER_MB
+        assert report["has_critical"] is False
+        assert report["large_items"] == []
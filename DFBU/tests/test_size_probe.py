@@ -0,0 +1,126 @@
+"""
+Tests for Size Probes - Early-Terminating Threshold Checks
+
+Description:
+    Unit tests for bounded size probes: a walk stops once the files
+    counted so far prove the limit is exceeded, the result is marked
+    truncated with the largest entries found so far, and SizeAnalyzer
+    reports such entries as critical lower bounds ("> N MB").
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+from pathlib import Path
+
+import pytest
+from core.common_types import DotFileDict
+
+from gui import size_cache
+from gui.file_operations import FileOperations
+from gui.model import DFBUModel
+from gui.size_analyzer import BYTES_PER_MB, SizeAnalyzer
+from gui.size_cache import DirSizeCache
+from gui.size_calculator import disk_usage
+
+
+DIRS: int = 16
+FILE_SIZE: int = 256 * 1024
+
+
+@pytest.fixture
+def big_tree(tmp_path: Path) -> Path:
+    """Create a cache tree of DIRS subdirectories holding one file each."""
+    root = tmp_path / ".cache"
+    for i in range(DIRS):
+        (root / f"d{i:02}").mkdir(parents=True)
+        (root / f"d{i:02}" / "blob.bin").write_bytes(b"x" * FILE_SIZE)
+    return root
+
+
+class TestBoundedDiskUsage:
+    """Test suite for disk_usage with a limit."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_walk_stops_at_limit(self, big_tree: Path, workers: int) -> None:
+        """Once the limit is proven, remaining subdirectories are skipped."""
+        usage = disk_usage(big_tree, workers=workers, limit=2 * FILE_SIZE)
+
+        assert usage.truncated is True
+        assert usage.billable >= 2 * FILE_SIZE
+        assert usage.files < DIRS
+        assert usage.largest_files[0][0] == FILE_SIZE
+
+    @pytest.mark.unit
+    def test_limit_not_reached_is_complete(self, big_tree: Path) -> None:
+        """A tree below the limit is sized exactly as without one."""
+        usage = disk_usage(big_tree, limit=DIRS * FILE_SIZE * 2)
+
+        assert usage == disk_usage(big_tree)
+        assert usage.truncated is False
+
+    @pytest.mark.unit
+    def test_probe_bypasses_size_cache(
+        self, tmp_path: Path, big_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A file grown in place is seen by a probe despite a cached record."""
+        monkeypatch.setattr(size_cache, "RACY_WINDOW_NS", 0)
+        file_ops = FileOperations(hostname="testhost")
+        file_ops.size_cache = DirSizeCache(tmp_path / "size-cache")
+        file_ops.calculate_disk_usage(big_tree)
+        with (big_tree / "d00" / "blob.bin").open("ab") as f:
+            f.write(b"y" * DIRS * FILE_SIZE)
+
+        limit = DIRS * FILE_SIZE * 3 // 2
+        usage = file_ops.calculate_disk_usage(big_tree, limit=limit)
+
+        # The cached record alone would still say DIRS * FILE_SIZE
+        assert usage.billable >= limit
+        assert usage.largest_files[0][0] == FILE_SIZE + DIRS * FILE_SIZE
+
+
+class TestProbeMode:
+    """Test suite for SizeAnalyzer probe mode."""
+
+    @pytest.mark.unit
+    def test_critical_entry_reported_as_lower_bound(self, big_tree: Path) -> None:
+        """A probed entry is critical, truncated, and logged as "> N MB"."""
+        analyzer = SizeAnalyzer(
+            FileOperations(hostname="testhost"),
+            warning_threshold_mb=1,
+            alert_threshold_mb=1,
+            critical_threshold_mb=1,
+            size_probe_enabled=True,
+        )
+        dotfiles: list[DotFileDict] = [
+            {"description": "Cache", "paths": [str(big_tree)]}
+        ]
+
+        report = analyzer.analyze_dotfiles(dotfiles)
+        log_text = analyzer.format_report_for_log(report)
+
+        item = report["large_items"][0]
+        assert report["truncated"] is True
+        assert report["has_critical"] is True
+        assert item["truncated"] is True
+        assert BYTES_PER_MB <= item["size_bytes"] < DIRS * FILE_SIZE
+        assert item["largest_files"]
+        assert "> " in log_text
+
+    @pytest.mark.unit
+    def test_probe_mode_skips_full_scan(self, tmp_path: Path, big_tree: Path) -> None:
+        """With size_probe the size check does not walk a shared snapshot."""
+        model = DFBUModel(tmp_path / "config.toml")
+        model.add_dotfile("Test", "Cache", "", [str(big_tree)])
+        model._config_manager.options["size_probe"] = True
+        model._apply_performance_options()
+
+        report = model.analyze_backup_size()
+
+        assert report["total_size_bytes"] == DIRS * FILE_SIZE
+        assert report["truncated"] is False
+        assert model._file_ops.current_scan() is None
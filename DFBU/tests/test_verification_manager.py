@@ -7,6 +7,7 @@ Covers:
     - Report generation
     - Error handling
     - Log formatting
+    - Parallel verification and progress reporting
 """
 
 import hashlib
@@ -240,6 +241,41 @@ class TestVerifyBackup:
         assert report["hash_verified"] is True
         assert report["results"][0]["hash_match"] is True
 
+    @pytest.mark.unit
+    def test_verify_backup_uses_recorded_digest(self, tmp_path: Path) -> None:
+        """A digest recorded at copy time replaces re-hashing the source."""
+        vm = VerificationManager(hash_verification_enabled=True)
+        source = tmp_path / "source.txt"
+        backup = tmp_path / "backup.txt"
+        source.write_text("copied\n")
+        backup.write_text("copied\n")
+        digest = f"blake2b:{hashlib.blake2b(b'copied\n').hexdigest()}"
+        # Same size, different content: only a source re-read would notice
+        source.write_text("edited\n")
+
+        report = vm.verify_backup(
+            tmp_path, [(source, backup)], "mirror", digests={backup: digest}
+        )
+
+        assert report["results"][0]["status"] == "ok"
+        assert report["results"][0]["hash_match"] is True
+
+    @pytest.mark.unit
+    def test_verify_backup_recorded_digest_mismatch(self, tmp_path: Path) -> None:
+        """A backup that differs from the copied bytes fails verification."""
+        vm = VerificationManager(hash_verification_enabled=True)
+        source = tmp_path / "source.txt"
+        backup = tmp_path / "backup.txt"
+        source.write_text("copied\n")
+        backup.write_text("rotted\n")
+        digest = f"sha256:{hashlib.sha256(b'copied\n').hexdigest()}"
+
+        report = vm.verify_backup(
+            tmp_path, [(source, backup)], "mirror", digests={backup: digest}
+        )
+
+        assert report["results"][0]["status"] == "hash_mismatch"
+
     @pytest.mark.unit
     def test_verify_backup_empty_list(self, tmp_path: Path) -> None:
         """Empty file list produces valid report with zero counts."""
@@ -533,3 +569,66 @@ class TestEdgeCases:
         report = vm.verify_backup(backup_dir, [(source, backup)], "mirror")
 
         assert report["backup_path"] == str(backup_dir)
+
+
+class TestParallelVerification:
+    """Tests for worker-pool verification and streaming progress."""
+
+    @pytest.mark.unit
+    def test_results_keep_input_order(self, tmp_path: Path) -> None:
+        """Parallel results match the order of the source pairs."""
+        vm = VerificationManager(hash_verification_enabled=True, workers=4)
+        pairs: list[tuple[Path, Path]] = []
+        for i in range(40):
+            source = tmp_path / f"src{i}.txt"
+            backup = tmp_path / f"bak{i}.txt"
+            source.write_text(f"content {i}\n" * (i + 1))
+            if i % 7 != 0:
+                backup.write_text(f"content {i}\n" * (i + 1))
+            pairs.append((source, backup))
+
+        report = vm.verify_backup(tmp_path, pairs, "mirror")
+
+        assert [r["path"] for r in report["results"]] == [str(s) for s, _ in pairs]
+        assert report["verified_failed"] == 6
+        assert all(
+            (r["status"] == "missing") == (i % 7 == 0)
+            for i, r in enumerate(report["results"])
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_progress_streams_to_completion(self, tmp_path: Path, workers: int) -> None:
+        """Progress rises monotonically to 100 without repeating a value."""
+        vm = VerificationManager(workers=workers)
+        pairs: list[tuple[Path, Path]] = []
+        for i in range(250):
+            source = tmp_path / f"src{i}.txt"
+            source.write_text("x")
+            pairs.append((source, source))
+        progress: list[int] = []
+
+        vm.verify_backup(tmp_path, pairs, "mirror", progress_callback=progress.append)
+
+        assert progress == list(range(101))
+
+    @pytest.mark.unit
+    def test_workers_are_clamped(self) -> None:
+        """Worker count is kept within the copy engine's supported range."""
+        vm = VerificationManager(workers=0)
+        assert vm.workers == 1
+
+        vm.workers = 1000
+        assert vm.workers == 32
+
+    @pytest.mark.unit
+    def test_empty_backup_reports_no_progress(self, tmp_path: Path) -> None:
+        """Nothing to verify means no progress callbacks and an empty report."""
+        progress: list[int] = []
+
+        report = VerificationManager().verify_backup(
+            tmp_path, [], "mirror", progress_callback=progress.append
+        )
+
+        assert progress == []
+        assert report["total_files"] == 0
@@ -0,0 +1,159 @@
+"""
+Tests for VerificationResults - Failure-Only Streaming Reports
+
+Description:
+    Unit tests for failures-only verification reports: passed files are
+    only counted, failures reach the callback as they are found, every
+    result can be spilled to a JSONL file, and sampled coverage still
+    advances when passed results are not kept.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from core.common_types import VerificationResultDict
+
+from gui.verification_coverage import VerificationCoverage
+from gui.verification_manager import VerificationManager
+from gui.verification_results import new_results_file
+
+
+@pytest.fixture
+def backup_pairs(tmp_path: Path) -> list[tuple[Path, Path]]:
+    """Create ten backed-up files, two of which no longer match."""
+    pairs: list[tuple[Path, Path]] = []
+    for i in range(10):
+        source = tmp_path / "src" / f"file{i}.txt"
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text(f"content {i}\n")
+        backup = tmp_path / "backup" / source.name
+        backup.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, backup)
+        pairs.append((source, backup))
+    pairs[3][1].write_text("truncated")
+    pairs[7][1].unlink()
+    return pairs
+
+
+class TestFailuresOnlyReports:
+    """Test suite for failures-only verification reports."""
+
+    @pytest.mark.unit
+    def test_passed_files_are_only_counted(
+        self, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """Only failed results are kept; counters cover every file."""
+        vm = VerificationManager(hash_verification_enabled=True, workers=2)
+        vm.failures_only = True
+
+        report = vm.verify_backup(backup_pairs[0][1].parent, backup_pairs)
+
+        assert report["total_files"] == 10
+        assert report["verified_ok"] == 8
+        assert report["verified_failed"] == 2
+        assert report["failures_only"] is True
+        assert [r["status"] for r in report["results"]] == [
+            "size_mismatch",
+            "missing",
+        ]
+        log = vm.format_report_for_log(report)
+        assert "8 files verified OK" in log
+        assert "file7.txt" in log
+
+    @pytest.mark.unit
+    def test_failures_stream_to_callback(
+        self, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """The callback receives each failure before the report is built."""
+        vm = VerificationManager(workers=2)
+        vm.failures_only = True
+        streamed: list[VerificationResultDict] = []
+
+        report = vm.verify_backup(
+            backup_pairs[0][1].parent, backup_pairs, failure_callback=streamed.append
+        )
+
+        assert [r["path"] for r in streamed] == [
+            str(backup_pairs[3][0]),
+            str(backup_pairs[7][0]),
+        ]
+        assert streamed == report["results"]
+
+    @pytest.mark.unit
+    def test_all_results_spill_to_jsonl(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """Every result is written to the JSONL file named in the report."""
+        vm = VerificationManager(workers=2)
+        vm.failures_only = True
+        vm.results_dir = tmp_path / "verify-results"
+
+        report = vm.verify_backup(backup_pairs[0][1].parent, backup_pairs)
+
+        results_file = Path(report["results_file"])
+        lines = results_file.read_text(encoding="utf-8").splitlines()
+        statuses = [json.loads(line)["status"] for line in lines]
+        assert results_file.parent == vm.results_dir
+        assert statuses.count("ok") == 8
+        assert len(statuses) == 10
+        assert f"Results File: {results_file}" in vm.format_report_for_log(report)
+
+    @pytest.mark.unit
+    def test_unwritable_results_dir_does_not_fail_verification(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """A results directory that cannot be created disables the spill."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        vm = VerificationManager(workers=1)
+        vm.results_dir = blocker / "verify-results"
+
+        report = vm.verify_backup(backup_pairs[0][1].parent, backup_pairs)
+
+        assert "results_file" not in report
+        assert len(report["results"]) == 10
+
+    @pytest.mark.unit
+    def test_sampled_coverage_advances_without_kept_results(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """Passed files are recorded in the coverage table in failures-only mode."""
+        vm = VerificationManager(hash_verification_enabled=True, workers=1)
+        vm.coverage = VerificationCoverage(tmp_path / "verify-coverage")
+        vm.sample_percent = 50
+        vm.failures_only = True
+
+        first = vm.verify_backup(backup_pairs[0][1].parent, backup_pairs)
+        second = vm.verify_backup(backup_pairs[0][1].parent, backup_pairs)
+
+        # The eight matching files are hashed once, then half of them per run
+        assert first["hash_checked"] == 8
+        assert second["hash_checked"] == 4
+        assert first["coverage_percent"] == 80.0
+
+
+class TestResultsFiles:
+    """Test suite for spill file naming and pruning."""
+
+    @pytest.mark.unit
+    def test_oldest_results_files_are_pruned(self, tmp_path: Path) -> None:
+        """At most keep files remain once the new one is written."""
+        for stamp in ("20260101", "20260102", "20260103"):
+            (tmp_path / f"{stamp}T000000000000Z-mirror.jsonl").write_text("")
+
+        path = new_results_file("mirror", tmp_path, keep=2)
+        path.write_text("")
+
+        assert sorted(p.name[:8] for p in tmp_path.iterdir()) == [
+            "20260103",
+            path.name[:8],
+        ]
+        assert path.name.endswith("-mirror.jsonl")
@@ -0,0 +1,149 @@
+"""
+Tests for Sampled Verification - Rotating Hash Coverage
+
+Description:
+    Unit tests for VerificationManager's sampling mode: new and changed
+    files are always hashed, unchanged files rotate so every file is
+    covered within ceil(100 / sample_percent) runs, the byte budget caps
+    each run, and coverage persists across manager instances.
+
+Author: Chris Purcell
+Email: chris@l3digital.net
+GitHub: https://github.com/L3DigitalNet
+Date Created: 10-16-2026
+License: MIT
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from gui.verification_coverage import VerificationCoverage
+from gui.verification_manager import VerificationManager
+
+
+@pytest.fixture
+def backup_pairs(tmp_path: Path) -> list[tuple[Path, Path]]:
+    """Create ten source files of 1 KiB each and their backup copies."""
+    pairs: list[tuple[Path, Path]] = []
+    for i in range(10):
+        source = tmp_path / "src" / f"file{i}.txt"
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_bytes(bytes([i]) * 1024)
+        backup = tmp_path / "backup" / source.name
+        backup.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, backup)
+        pairs.append((source, backup))
+    return pairs
+
+
+def _sampling_manager(tmp_path: Path, percent: int) -> VerificationManager:
+    """VerificationManager sampling with a coverage file under tmp_path."""
+    vm = VerificationManager(hash_verification_enabled=True, workers=1)
+    vm.coverage = VerificationCoverage(tmp_path / "verify-coverage")
+    vm.sample_percent = percent
+    return vm
+
+
+def _hashed(vm: VerificationManager, pairs: list[tuple[Path, Path]]) -> set[str]:
+    """Run a verification and return the backup paths that were hashed."""
+    report = vm.verify_backup(pairs[0][1].parent, pairs)
+    assert report["verified_failed"] == 0
+    return {r["backup_path"] for r in report["results"] if r["hash_match"]}
+
+
+class TestSampledVerification:
+    """Test suite for rotating sampled hash verification."""
+
+    @pytest.mark.unit
+    def test_rotation_covers_all_files(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """New files are all hashed, then 25% per run covers the rest in 4 runs."""
+        vm = _sampling_manager(tmp_path, 25)
+        assert len(_hashed(vm, backup_pairs)) == 10
+
+        runs = [_hashed(vm, backup_pairs) for _ in range(4)]
+
+        assert all(len(run) == 3 for run in runs)
+        assert set().union(*runs) == {str(backup) for _, backup in backup_pairs}
+        # The oldest verifications go first: no file repeats before all are covered
+        assert runs[0].isdisjoint(runs[1]) and runs[0].isdisjoint(runs[2])
+
+    @pytest.mark.unit
+    def test_changed_files_are_always_hashed(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """A rewritten backup file is hashed even if outside the rotation."""
+        vm = _sampling_manager(tmp_path, 10)
+        _hashed(vm, backup_pairs)
+        changed = backup_pairs[-1][1]
+        shutil.copy2(backup_pairs[-1][0], changed)
+
+        hashed = _hashed(vm, backup_pairs)
+
+        assert str(changed) in hashed
+        assert len(hashed) == 2
+
+    @pytest.mark.unit
+    def test_corruption_in_sample_is_detected(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """Changed content with the same size fails the hash check."""
+        vm = _sampling_manager(tmp_path, 10)
+        _hashed(vm, backup_pairs)
+        corrupt = backup_pairs[0][1]
+        corrupt.write_bytes(b"x" * 1024)
+
+        report = vm.verify_backup(corrupt.parent, backup_pairs)
+
+        failed = [r for r in report["results"] if r["status"] != "ok"]
+        assert [r["backup_path"] for r in failed] == [str(corrupt)]
+        assert failed[0]["status"] == "hash_mismatch"
+
+    @pytest.mark.unit
+    def test_byte_budget_limits_rotation(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """A byte budget caps the rotating slice, but never below one file."""
+        vm = _sampling_manager(tmp_path, 100)
+        vm.sample_budget_bytes = 2 * 1024
+        assert len(_hashed(vm, backup_pairs)) == 10
+
+        assert len(_hashed(vm, backup_pairs)) == 2
+        vm.sample_budget_bytes = 1
+        assert len(_hashed(vm, backup_pairs)) == 1
+
+    @pytest.mark.unit
+    def test_report_tracks_coverage_across_instances(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """Coverage is saved and reported; a new manager picks it up."""
+        vm = _sampling_manager(tmp_path, 50)
+        report = vm.verify_backup(tmp_path / "backup", backup_pairs)
+        assert report["hash_checked"] == 10
+        assert report["coverage_percent"] == 100.0
+
+        backup_pairs[0][1].write_bytes(bytes([0]) * 1024)
+        fresh = _sampling_manager(tmp_path, 50)
+        report = fresh.verify_backup(tmp_path / "backup", backup_pairs)
+
+        assert report["hash_checked"] == 1 + 5
+        assert report["coverage_percent"] == 100.0
+        assert "Sampling:     6 of 10 files hashed" in fresh.format_report_for_log(
+            report
+        )
+
+    @pytest.mark.unit
+    def test_full_verification_without_sampling(
+        self, tmp_path: Path, backup_pairs: list[tuple[Path, Path]]
+    ) -> None:
+        """At 100% without a budget every file is hashed on every run."""
+        vm = _sampling_manager(tmp_path, 100)
+        _hashed(vm, backup_pairs)
+
+        report = vm.verify_backup(tmp_path / "backup", backup_pairs)
+
+        assert all(r["hash_match"] for r in report["results"])
+        assert "hash_checked" not in report
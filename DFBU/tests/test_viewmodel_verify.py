@@ -0,0 +1,127 @@
+"""Tests for ViewModel verification isolation from backup and restore."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from gui.model import DFBUModel
+from gui.viewmodel import DFBUViewModel
+
+
+class _RunningWorker:
+    """Stand-in for a worker thread that is still running."""
+
+    def isRunning(self) -> bool:  # noqa: N802 - mirrors QThread.isRunning
+        """Report the worker as running."""
+        return True
+
+
+@pytest.mark.gui
+def test_backup_and_restore_refused_while_verifying(
+    qapp: QApplication, yaml_config_dir: Path, tmp_path: Path
+) -> None:
+    """Backup and restore do not start while a verification runs."""
+    model = DFBUModel(yaml_config_dir)
+    model.load_config()
+    vm = DFBUViewModel(model)
+    vm.restore_source_directory = tmp_path
+    vm._verify_worker = _RunningWorker()  # type: ignore[assignment]
+
+    assert vm.is_verifying() is True
+    assert vm.command_start_backup() is False
+    assert vm.command_start_restore() is False
+    assert vm.backup_worker is None
+    assert vm.restore_worker is None
+
+
+@pytest.mark.gui
+def test_verify_refused_while_backup_or_restore_runs(
+    qapp: QApplication, yaml_config_dir: Path, tmp_path: Path
+) -> None:
+    """A verification does not start while a backup or restore runs."""
+    model = DFBUModel(yaml_config_dir)
+    model.load_config()
+    source = tmp_path / "a.conf"
+    source.write_text("a")
+    model.register_backed_up_file(source, tmp_path / "mirror" / "a.conf")
+    vm = DFBUViewModel(model)
+
+    for attr in ("backup_worker", "restore_worker"):
+        setattr(vm, attr, _RunningWorker())
+        assert vm.is_operation_running() is True
+        assert vm.command_verify_backup() is False
+        assert vm._verify_worker is None
+        setattr(vm, attr, None)
+
+
+@pytest.mark.gui
+def test_second_backup_or_restore_refused_while_one_runs(
+    qapp: QApplication, yaml_config_dir: Path, tmp_path: Path
+) -> None:
+    """Backup and restore do not start while either worker is running."""
+    model = DFBUModel(yaml_config_dir)
+    model.load_config()
+    vm = DFBUViewModel(model)
+    vm.restore_source_directory = tmp_path
+    running: Any = _RunningWorker()
+    vm.backup_worker = running
+
+    assert vm.command_start_backup() is False
+    assert vm.command_start_restore() is False
+    assert vm.backup_worker is running
+    assert vm.restore_worker is None
+
+
+@pytest.mark.gui
+def test_verify_finished_leaves_running_backup_ui(
+    qapp: QApplication, yaml_config_dir: Path
+) -> None:
+    """Finishing a verification keeps a running backup's button and progress."""
+    from gui.view import MainWindow
+
+    model = DFBUModel(yaml_config_dir)
+    model.load_config()
+    vm = DFBUViewModel(model)
+    window = MainWindow(vm, "0.0.0-test")
+    window.backup_btn.setEnabled(False)
+    window.progress_bar.setVisible(True)
+    window._verify_disabled_buttons = [window.verify_backup_btn]
+    window.verify_backup_btn.setEnabled(False)
+    vm.backup_worker = _RunningWorker()  # type: ignore[assignment]
+
+    window._on_verify_finished("report")
+
+    assert window.verify_backup_btn.isEnabled() is True
+    assert window.backup_btn.isEnabled() is False
+    assert window.progress_bar.isHidden() is False
+
+
+@pytest.mark.unit
+def test_verification_reads_copies_of_tracking(
+    yaml_config_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """verify_last_backup hands the verifier copies, not the live tracking."""
+    model = DFBUModel(yaml_config_dir)
+    model.load_config()
+    source = tmp_path / "a.conf"
+    source.write_text("a")
+    model.register_backed_up_file(source, tmp_path / "mirror" / "a.conf")
+    model._last_backup_digests[tmp_path / "mirror" / "a.conf"] = "sha256:00"
+    seen: dict[str, Any] = {}
+    verify_backup = model._verification_manager.verify_backup
+
+    def capture(**kwargs: Any) -> Any:
+        seen.update(kwargs)
+        # A backup started meanwhile resets the live tracking
+        model.clear_backup_tracking()
+        return verify_backup(**kwargs)
+
+    monkeypatch.setattr(model._verification_manager, "verify_backup", capture)
+
+    assert model.verify_last_backup() is not None
+    assert seen["source_paths"] == [(source, tmp_path / "mirror" / "a.conf")]
+    assert seen["source_paths"] is not model._last_backup_files
+    assert seen["digests"] is not model._last_backup_digests
+    assert seen["digests"] == {tmp_path / "mirror" / "a.conf": "sha256:00"}